@@ -15,6 +15,7 @@ let
     babel
     bcrypt
     beautifulsoup4
+    brotli
     nh3
     cryptography
     curl-cffi
@@ -23,8 +24,10 @@ let
     httpx
     httptools
     jinja2
+    lxml
     markdown
     openai
+    orjson
     pillow
     pymupdf
     pypdf
@@ -44,6 +47,7 @@ let
     watchfiles
     websockets
   ];
+  buildPython = python.withPackages (_: pythonDeps);
 in
 python.pkgs.buildPythonApplication {
   pname = "stricknani";
@@ -69,6 +73,14 @@ python.pkgs.buildPythonApplication {
   # request time.
   preBuild = ''
     ${python.pkgs.babel}/bin/pybabel compile -d stricknani/locales
+
+    # Content-hash static asset URLs so browsers can cache them immutably,
+    # and precompress text assets so /static serves .br/.gz (the same build
+    # steps as the Dockerfile).
+    ${buildPython}/bin/python -m stricknani.scripts.cli static manifest \
+      --directory stricknani/static
+    ${buildPython}/bin/python -m stricknani.scripts.cli static precompress \
+      --directory stricknani/static
   '';
 
   postFixup = ''
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Benchmark JSON encoding of a large project sync payload.
+
+Builds an unbounded ``/api/v1/sync/projects`` response with ``--projects``
+full project details (steps, images, attachments) and times how long each
+response path takes to turn it into bytes, through a real FastAPI route:
+
+* ``fastapi``: ``response_model`` with the default ``JSONResponse``
+  (re-validate, dump to Python, stdlib ``json``) - the previous behaviour;
+* ``orjson``: the same, encoded with ``ORJSONResponse`` (the API default
+  for anything that is not a ``ModelResponse``);
+* ``model``: ``ModelResponse`` (pydantic-core straight to bytes).
+
+    uv run python scripts/bench_api_json.py [--projects 1000] [-n 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import UTC, datetime
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from httpx import ASGITransport, AsyncClient
+from starlette.responses import Response
+
+from stricknani.routes.api.responses import ModelResponse
+from stricknani.routes.api.schemas import (
+    AttachmentResponse,
+    ImageResponse,
+    ProjectResponse,
+    ProjectSyncResponse,
+    StepResponse,
+)
+
+
+def _payload(projects: int) -> ProjectSyncResponse:
+    now = datetime.now(UTC)
+    text = "Stricke 4 Runden glatt rechts, dann im Rippenmuster weiter. " * 4
+    return ProjectSyncResponse(
+        updated=[
+            ProjectResponse(
+                id=project_id,
+                name=f"Pullover {project_id}",
+                category="Pullover",
+                needles="4.0 mm",
+                description=text,
+                notes=text,
+                tags=["winter", "raglan"],
+                is_ai_enhanced=False,
+                is_favorite=project_id % 3 == 0,
+                created_at=now,
+                updated_at=now,
+                yarn_ids=[1, 2],
+                steps=[
+                    StepResponse(
+                        id=project_id * 10 + step,
+                        title=f"Schritt {step}",
+                        description=text,
+                        step_number=step,
+                    )
+                    for step in range(1, 6)
+                ],
+                images=[
+                    ImageResponse(
+                        id=project_id * 10 + image,
+                        url=f"/media/projects/{project_id}/img{image}.jpg",
+                        thumbnail_url=(
+                            f"/media/thumbnails/projects/{project_id}/img{image}.jpg"
+                        ),
+                        alt_text="Foto",
+                        image_type="photo",
+                        is_title_image=image == 0,
+                        is_stitch_sample=False,
+                    )
+                    for image in range(4)
+                ],
+                attachments=[
+                    AttachmentResponse(
+                        id=project_id,
+                        filename="anleitung.pdf",
+                        original_filename="Anleitung.pdf",
+                        content_type="application/pdf",
+                        size_bytes=123456,
+                        url=f"/media/projects/{project_id}/anleitung.pdf",
+                    )
+                ],
+            )
+            for project_id in range(1, projects + 1)
+        ],
+        deleted_ids=[],
+        server_time=now,
+    )
+
+
+def _app(payload: ProjectSyncResponse) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/fastapi", response_model=ProjectSyncResponse)
+    async def default_path() -> ProjectSyncResponse:
+        return payload
+
+    @app.get(
+        "/orjson", response_model=ProjectSyncResponse, response_class=ORJSONResponse
+    )
+    async def orjson_path() -> ProjectSyncResponse:
+        return payload
+
+    @app.get("/model", response_model=ProjectSyncResponse)
+    async def model_path() -> Response:
+        return ModelResponse(payload)
+
+    return app
+
+
+async def _run(projects: int, runs: int) -> None:
+    app = _app(_payload(projects))
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        bodies: dict[str, object] = {}
+        for path in ("fastapi", "orjson", "model"):
+            bodies[path] = (await client.get(f"/{path}")).json()
+            start = time.perf_counter()
+            for _ in range(runs):
+                await client.get(f"/{path}")
+            per_request = (time.perf_counter() - start) / runs
+            size = len((await client.get(f"/{path}")).content)
+            print(f"{path:8} {per_request * 1000:8.1f} ms/request  {size} bytes")
+        assert bodies["fastapi"] == bodies["orjson"] == bodies["model"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=1000)
+    parser.add_argument("-n", "--runs", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(_run(args.projects, args.runs))
+
+
+if __name__ == "__main__":
+    main()
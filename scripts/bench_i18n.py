@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Microbenchmark for template gettext overhead.
+
+Renders a translated template repeatedly and reports the per-render cost of
+the ``_``/``gettext`` lookups with the process-wide catalog cache versus
+loading the catalog from disk on every lookup (the previous behaviour).
+
+    uv run python scripts/bench_i18n.py [--template auth/login.html] [-n 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+from starlette.requests import Request
+
+from stricknani.main import app
+from stricknani.utils import i18n
+from stricknani.web.templating import templates
+
+REQUEST = Request(
+    {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "scheme": "http",
+        "headers": [],
+        "server": ("bench", 80),
+        "app": app,
+        "router": app.router,
+    }
+)
+CONTEXT: dict[str, Any] = {
+    "request": REQUEST,
+    "current_user": None,
+    "csrf_token": "bench",
+    "signup_enabled": True,
+    "is_dev_instance": False,
+}
+
+
+def _time_renders(render: Callable[[], str], renders: int) -> float:
+    render()
+    start = time.perf_counter()
+    for _ in range(renders):
+        render()
+    return (time.perf_counter() - start) / renders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--template", default="auth/login.html")
+    parser.add_argument("--language", default="de")
+    parser.add_argument("-n", "--renders", type=int, default=200)
+    args = parser.parse_args()
+
+    template = templates.env.get_template(args.template)
+    lookups = 0
+    translate: Callable[..., str] = templates.env.globals["_"]  # type: ignore[assignment]
+
+    def _counting(message: str, *a: Any, **kw: Any) -> str:
+        nonlocal lookups
+        lookups += 1
+        return translate(message, *a, **kw)
+
+    def render() -> str:
+        with i18n.language_context(args.language):
+            return template.render(CONTEXT)
+
+    templates.env.globals["_"] = templates.env.globals["gettext"] = _counting
+    render()
+    per_render_lookups = lookups
+
+    i18n.preload_translations()
+    cached = _time_renders(render, args.renders)
+
+    original = i18n.get_translations
+    i18n.get_translations = i18n._load_translations
+    try:
+        uncached = _time_renders(render, args.renders)
+    finally:
+        i18n.get_translations = original
+
+    print(f"template:            {args.template} ({per_render_lookups} lookups)")
+    print(f"cached catalogs:     {cached * 1000:8.3f} ms/render")
+    print(f"load per lookup:     {uncached * 1000:8.3f} ms/render")
+    print(f"gettext overhead:    {(uncached - cached) * 1000:8.3f} ms/render saved")
+
+
+if __name__ == "__main__":
+    main()
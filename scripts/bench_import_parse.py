@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark parsing and extracting saved pattern pages.
+
+Runs ``PatternImporter.fetch_and_parse`` over saved pages (the Garnstudio
+fixtures in ``tests/fixtures/garnstudio`` by default) with the fetch replaced
+by the file contents, once per HTML parser, and reports per page:
+
+* ``parse``: building the BeautifulSoup tree alone;
+* ``import``: the whole extraction, parse and document index included.
+
+Both parsers must extract the same data; the script fails if they do not.
+
+    uv run python scripts/bench_import_parse.py [-n 5] [page.html ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from stricknani.importing import fetch
+from stricknani.importing.dom import parse_html
+from stricknani.importing.fetch import FetchResponse
+from stricknani.importing.importer import GarnstudioPatternImporter
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests/fixtures/garnstudio"
+PARSERS = ("html.parser", "lxml")
+
+
+def _url(page: Path) -> str:
+    kind, _, ident = page.stem.partition("_")
+    if kind == "yarn":
+        return f"https://www.garnstudio.com/yarn.php?show={ident}&cid=9"
+    return f"https://www.garnstudio.com/pattern.php?id={ident}&cid=9"
+
+
+async def _import(page: Path, html: str, parser: str) -> dict[str, Any]:
+    from stricknani.config import config
+
+    async def _serve(url: str, **kwargs: Any) -> FetchResponse:
+        return FetchResponse(
+            text=html, content=html.encode(), status_code=200, headers={}
+        )
+
+    config.IMPORT_HTML_PARSER = parser
+    with patch.object(fetch, "fetch_url", _serve):
+        return await GarnstudioPatternImporter(_url(page)).fetch_and_parse()
+
+
+def _best(runs: int, func: Any) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _bench(page: Path, html: str, parser: str, runs: int) -> dict[str, Any]:
+    parse = _best(runs, lambda: parse_html(html, parser))
+    total = _best(runs, lambda: asyncio.run(_import(page, html, parser)))
+    print(f"{page.stem:24} {parser:12} {parse * 1000:8.1f}ms {total * 1000:8.1f}ms")
+    return asyncio.run(_import(page, html, parser))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", type=Path)
+    parser.add_argument("-n", "--runs", type=int, default=5)
+    args = parser.parse_args()
+    pages = args.pages or sorted(FIXTURES.glob("*.html"))
+
+    print(f"{'page':24} {'parser':12} {'parse':>10} {'import':>10}")
+    for page in pages:
+        html = page.read_text(encoding="utf-8")
+        results = {name: _bench(page, html, name, args.runs) for name in PARSERS}
+        assert results["html.parser"] == results["lxml"], f"{page}: parsers differ"
+
+
+if __name__ == "__main__":
+    main()
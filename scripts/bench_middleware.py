@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Throughput of the full middleware stack on cheap routes.
+
+Drives the app in-process (httpx over ASGI, no sockets) against ``/healthz``
+and an authorized media file, so the numbers are dominated by per-request
+middleware and routing overhead rather than by I/O.
+
+    uv run python scripts/bench_middleware.py [-n 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from stricknani.config import config
+from stricknani.database import get_db
+from stricknani.main import app
+from stricknani.models import Base, Project, User
+from stricknani.routes.auth import require_auth_or_api_token
+
+# Small enough that a single body chunk carries it, like most thumbnails.
+_IMAGE = b"\x89PNG\r\n\x1a\n" + b"\0" * 16 * 1024
+
+
+async def _setup(media_root: Path) -> tuple[str, User]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:?cache=shared")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as db:
+        user = User(email="bench@example.com", hashed_password="x")
+        db.add(user)
+        await db.flush()
+        project = Project(name="Bench", owner_id=user.id)
+        db.add(project)
+        await db.commit()
+
+    config.MEDIA_ROOT = media_root
+    image = media_root / "projects" / str(project.id) / "bench.png"
+    image.parent.mkdir(parents=True)
+    image.write_bytes(_IMAGE)
+
+    async def override_get_db() -> AsyncGenerator[AsyncSession]:
+        async with session_factory() as session:
+            yield session
+
+    async def override_auth() -> User:
+        return user
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[require_auth_or_api_token] = override_auth
+    return f"/media/projects/{project.id}/bench.png", user
+
+
+async def _requests_per_second(client: AsyncClient, url: str, requests: int) -> float:
+    for _ in range(20):
+        (await client.get(url)).raise_for_status()
+    start = time.perf_counter()
+    for _ in range(requests):
+        await client.get(url)
+    return requests / (time.perf_counter() - start)
+
+
+async def _run(requests: int) -> None:
+    with tempfile.TemporaryDirectory() as media_root:
+        media_url, _ = await _setup(Path(media_root))
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://localhost"
+        ) as client:
+            for label, url in (("healthz", "/healthz"), ("media", media_url)):
+                rate = await _requests_per_second(client, url, requests)
+                print(f"{label:8} {rate:8.0f} req/s  ({requests} requests)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--requests", type=int, default=2000)
+    args = parser.parse_args()
+    # Access-log records are still built, but writing thousands of lines to
+    # the terminal would dwarf the middleware cost being measured.
+    logging.getLogger("stricknani").handlers[:] = [logging.NullHandler()]
+    asyncio.run(_run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Microbenchmark for the fixed per-render cost of ``render_template``.
+
+Renders an empty template for a request that already carries a CSRF cookie,
+an ``Accept-Language`` header and a theme cookie, so what is timed is the
+work ``render_template`` does around the template itself: language
+negotiation, the CSRF token and cookie, and the shared context.
+
+    uv run python scripts/bench_render_template.py [-n 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from jinja2 import ChoiceLoader, DictLoader
+from starlette.requests import Request
+
+from stricknani.main import app
+from stricknani.web.templating import render_template, templates
+
+
+def _request(cookie: str | None = None) -> Request:
+    headers = [(b"accept-language", b"de-DE,de;q=0.9,en;q=0.8")]
+    if cookie:
+        headers.append((b"cookie", cookie.encode()))
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "scheme": "http",
+            "headers": headers,
+            "query_string": b"",
+            "server": ("bench", 80),
+            "client": ("127.0.0.1", 12345),
+            "app": app,
+            "router": app.router,
+        }
+    )
+
+
+async def _bench(renders: int) -> float:
+    loader = templates.env.loader
+    assert loader is not None
+    templates.env.loader = ChoiceLoader([DictLoader({"_empty.html": ""}), loader])
+
+    first = await render_template("_empty.html", _request(), {"current_user": None})
+    cookie = first.headers["set-cookie"].split(";", 1)[0]
+    request = _request(f"{cookie}; theme=dark")
+
+    await render_template("_empty.html", request, {"current_user": None})
+    start = time.perf_counter()
+    for _ in range(renders):
+        await render_template("_empty.html", request, {"current_user": None})
+    return (time.perf_counter() - start) / renders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--renders", type=int, default=2000)
+    args = parser.parse_args()
+
+    per_render = asyncio.run(_bench(args.renders))
+    print(f"render_template overhead: {per_render * 1e6:8.1f} us per render")
+
+
+if __name__ == "__main__":
+    main()
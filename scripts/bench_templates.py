@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Measure first-use template cost in a freshly started process.
+
+Each scenario runs in its own interpreter, like a worker right after a
+deploy, and times loading the templates a first page view needs:
+
+* ``cold``: no bytecode cache, templates parsed and compiled on first use
+* ``bytecode``: compiled bytecode loaded from the on-disk cache
+* ``warmed``: startup warm-up already compiled everything (the cost moves
+  into startup, shown separately)
+
+    uv run python scripts/bench_templates.py [--template projects/detail.html]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PAGE_TEMPLATES = ["projects/list.html", "projects/detail.html", "yarn/list.html"]
+
+
+def _scenario(mode: str, cache_dir: str, names: list[str]) -> dict[str, float]:
+    from stricknani.web.templating import (
+        enable_bytecode_cache,
+        templates,
+        warm_templates,
+    )
+
+    startup = 0.0
+    if mode != "cold":
+        enable_bytecode_cache(Path(cache_dir))
+    if mode == "warmed":
+        start = time.perf_counter()
+        warm_templates()
+        startup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for name in names:
+        templates.env.get_template(name)
+    first_use = time.perf_counter() - start
+    return {"startup": startup, "first_use": first_use}
+
+
+def _with_dependencies(names: list[str]) -> list[str]:
+    """Add the parent/included/imported templates a render would load."""
+    from jinja2 import meta
+
+    from stricknani.web.templating import templates
+
+    env = templates.env
+    assert env.loader is not None
+    seen: list[str] = []
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.append(name)
+        source = env.loader.get_source(env, name)[0]
+        pending.extend(
+            ref
+            for ref in meta.find_referenced_templates(env.parse(source))
+            if ref is not None
+        )
+    return seen
+
+
+def _run(mode: str, cache_dir: str, names: list[str]) -> dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", mode, cache_dir, *names],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    result: dict[str, float] = json.loads(output.splitlines()[-1])
+    return result
+
+
+def main() -> None:
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        mode, cache_dir, *names = sys.argv[2:]
+        print(json.dumps(_scenario(mode, cache_dir, names)))
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--template", action="append", dest="templates")
+    args = parser.parse_args()
+    pages = args.templates or PAGE_TEMPLATES
+    names = _with_dependencies(pages)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cold = _run("cold", cache_dir, names)
+        # Populate the bytecode cache the way a previous worker would.
+        _run("warmed", cache_dir, names)
+        bytecode = _run("bytecode", cache_dir, names)
+        warmed = _run("warmed", cache_dir, names)
+
+    print(f"pages: {', '.join(pages)} ({len(names)} templates incl. dependencies)")
+    for label, result in (("cold", cold), ("bytecode", bytecode), ("warmed", warmed)):
+        print(
+            f"{label:<9} first use {result['first_use'] * 1000:8.1f} ms"
+            f"   startup warm-up {result['startup'] * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""add library_version to users
+
+Revision ID: a9c4e2f7b3d1
+Revises: e7a3c5d9b1f2
+Create Date: 2026-10-18 15:22:07.614093
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a9c4e2f7b3d1"
+down_revision: str | None = "e7a3c5d9b1f2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("users", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "library_version",
+                sa.Integer(),
+                nullable=False,
+                server_default="0",
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("users", schema=None) as batch_op:
+        batch_op.drop_column("library_version")
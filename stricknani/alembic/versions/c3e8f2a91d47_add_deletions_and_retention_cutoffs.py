@@ -0,0 +1,72 @@
+"""add deletions tombstones and retention cutoffs
+
+Revision ID: c3e8f2a91d47
+Revises: 9bbac92505be
+Create Date: 2026-10-18 09:12:31.204518
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e8f2a91d47"
+down_revision: str | None = "9bbac92505be"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "deletions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("entity_type", sa.String(length=20), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_deletions_owner_entity_deleted_at",
+        "deletions",
+        ["owner_id", "entity_type", "deleted_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_deletions_deleted_at"), "deletions", ["deleted_at"], unique=False
+    )
+    op.create_table(
+        "retention_cutoffs",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("cutoff", sa.DateTime(), nullable=False),
+        sa.Column("pruned_rows", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+    # Seed tombstones from the deletions already recorded in the audit log so
+    # clients syncing across the upgrade keep seeing them. Users that have
+    # since been removed are skipped (their tombstones would cascade anyway).
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO deletions (owner_id, entity_type, entity_id, deleted_at)
+            SELECT a.actor_user_id, a.entity_type, a.entity_id, a.created_at
+            FROM audit_logs a
+            JOIN users u ON u.id = a.actor_user_id
+            WHERE a.action = 'deleted'
+              AND a.entity_type IN ('project', 'yarn')
+            ORDER BY a.created_at ASC, a.id ASC
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("retention_cutoffs")
+    op.drop_index(op.f("ix_deletions_deleted_at"), table_name="deletions")
+    op.drop_index("ix_deletions_owner_entity_deleted_at", table_name="deletions")
+    op.drop_table("deletions")
@@ -0,0 +1,160 @@
+"""add card summary columns to projects and yarns
+
+Revision ID: d4f1b7c2e9a0
+Revises: c3e8f2a91d47
+Create Date: 2026-10-18 11:40:12.318204
+
+"""
+
+import json
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4f1b7c2e9a0"
+down_revision: str | None = "c3e8f2a91d47"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_CARD_IMAGE_LIMIT = 3
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("projects", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("card_images", sa.Text(), nullable=True))
+        batch_op.add_column(
+            sa.Column("image_count", sa.Integer(), nullable=False, server_default="0")
+        )
+        batch_op.add_column(
+            sa.Column("yarn_count", sa.Integer(), nullable=False, server_default="0")
+        )
+        batch_op.add_column(sa.Column("yarn_names", sa.Text(), nullable=True))
+
+    with op.batch_alter_table("yarns", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("preview_photo_id", sa.Integer(), nullable=True))
+        batch_op.add_column(
+            sa.Column("preview_photo_filename", sa.String(length=255), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column("photo_count", sa.Integer(), nullable=False, server_default="0")
+        )
+        batch_op.add_column(
+            sa.Column("project_count", sa.Integer(), nullable=False, server_default="0")
+        )
+
+    _backfill()
+
+
+def _backfill() -> None:
+    # Mirrors stricknani.services.summaries at the time of this revision;
+    # `stricknani-cli summaries rebuild` recomputes with the current rules.
+    bind = op.get_bind()
+
+    images: dict[int, list[sa.Row[Any]]] = defaultdict(list)
+    for row in bind.execute(
+        sa.text(
+            "SELECT project_id, id, filename, alt_text, is_title_image "
+            "FROM images ORDER BY project_id, id"
+        )
+    ):
+        images[row.project_id].append(row)
+    yarn_names: dict[int, list[str]] = defaultdict(list)
+    for row in bind.execute(
+        sa.text(
+            "SELECT py.project_id, y.name FROM project_yarns py "
+            "JOIN yarns y ON y.id = py.yarn_id"
+        )
+    ):
+        yarn_names[row.project_id].append(row.name)
+
+    project_rows = []
+    for project_id in set(images) | set(yarn_names):
+        project_images = images.get(project_id, [])
+        candidates = [
+            img for img in project_images if img.is_title_image
+        ] or project_images[:1]
+        card_images = [
+            {"id": img.id, "filename": img.filename, "alt_text": img.alt_text}
+            for img in candidates[:_CARD_IMAGE_LIMIT]
+        ]
+        names = yarn_names.get(project_id, [])
+        project_rows.append(
+            {
+                "project_id": project_id,
+                "card_images": json.dumps(card_images) if card_images else None,
+                "image_count": len(project_images),
+                "yarn_count": len(names),
+                "yarn_names": json.dumps(
+                    sorted({name for name in names if name}, key=str.casefold)
+                )
+                if names
+                else None,
+            }
+        )
+    if project_rows:
+        bind.execute(
+            sa.text(
+                "UPDATE projects SET card_images = :card_images, "
+                "image_count = :image_count, yarn_count = :yarn_count, "
+                "yarn_names = :yarn_names WHERE id = :project_id"
+            ),
+            project_rows,
+        )
+
+    photos: dict[int, list[sa.Row[Any]]] = defaultdict(list)
+    for row in bind.execute(
+        sa.text(
+            "SELECT yarn_id, id, filename FROM yarn_images "
+            "ORDER BY yarn_id, is_primary DESC, created_at DESC, id DESC"
+        )
+    ):
+        photos[row.yarn_id].append(row)
+    project_counts = {
+        row.yarn_id: row.links
+        for row in bind.execute(
+            sa.text(
+                "SELECT yarn_id, COUNT(*) AS links FROM project_yarns GROUP BY yarn_id"
+            )
+        )
+    }
+
+    yarn_rows = [
+        {
+            "yarn_id": yarn_id,
+            "preview_photo_id": photos[yarn_id][0].id if photos.get(yarn_id) else None,
+            "preview_photo_filename": photos[yarn_id][0].filename
+            if photos.get(yarn_id)
+            else None,
+            "photo_count": len(photos.get(yarn_id, [])),
+            "project_count": project_counts.get(yarn_id, 0),
+        }
+        for yarn_id in set(photos) | set(project_counts)
+    ]
+    if yarn_rows:
+        bind.execute(
+            sa.text(
+                "UPDATE yarns SET preview_photo_id = :preview_photo_id, "
+                "preview_photo_filename = :preview_photo_filename, "
+                "photo_count = :photo_count, project_count = :project_count "
+                "WHERE id = :yarn_id"
+            ),
+            yarn_rows,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("yarns", schema=None) as batch_op:
+        batch_op.drop_column("project_count")
+        batch_op.drop_column("photo_count")
+        batch_op.drop_column("preview_photo_filename")
+        batch_op.drop_column("preview_photo_id")
+
+    with op.batch_alter_table("projects", schema=None) as batch_op:
+        batch_op.drop_column("yarn_names")
+        batch_op.drop_column("yarn_count")
+        batch_op.drop_column("image_count")
+        batch_op.drop_column("card_images")
@@ -0,0 +1,38 @@
+"""add owner/lower(name)/id keyset indexes for navigation
+
+Revision ID: e7a3c5d9b1f2
+Revises: d4f1b7c2e9a0
+Create Date: 2026-10-18 13:05:44.902116
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a3c5d9b1f2"
+down_revision: str | None = "d4f1b7c2e9a0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_projects_owner_id_lower_name_id",
+        "projects",
+        ["owner_id", sa.text("lower(name)"), "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_yarns_owner_id_lower_name_id",
+        "yarns",
+        ["owner_id", sa.text("lower(name)"), "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_yarns_owner_id_lower_name_id", table_name="yarns")
+    op.drop_index("ix_projects_owner_id_lower_name_id", table_name="projects")
@@ -47,6 +47,28 @@ class Config:
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./stricknani.db")
 
+    # Per-request SQL instrumentation: log a warning when one request runs the
+    # same statement shape at least this many times (likely an N+1 query).
+    # 0 disables the check; statement counts are still collected.
+    SQL_REPEATED_STATEMENT_THRESHOLD: int = int(
+        os.getenv("SQL_REPEATED_STATEMENT_THRESHOLD", "10")
+    )
+
+    # Rendered markdown (descriptions, notes, step text) is cached in memory
+    # for this many distinct texts; 0 disables the cache.
+    MARKDOWN_CACHE_SIZE: int = int(os.getenv("MARKDOWN_CACHE_SIZE", "2048"))
+
+    # Rendered project/yarn card and search row fragments kept in memory
+    # (keyed by card content and language); 0 disables the cache.
+    CARD_FRAGMENT_CACHE_SIZE: int = int(os.getenv("CARD_FRAGMENT_CACHE_SIZE", "5000"))
+
+    # brotli/gzip compression of text responses at least this many bytes
+    # long; COMPRESSION_MIN_SIZE=0 compresses everything compressible.
+    COMPRESSION_ENABLED: bool = (
+        os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    )
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+
     # Media Storage
     MEDIA_ROOT: Path = Path(os.getenv("MEDIA_ROOT", "./media"))
     IMPORT_TRACE_ENABLED: bool = bool(os.getenv("IMPORT_TRACE_ENABLED"))
@@ -54,6 +76,72 @@ class Config:
         os.getenv("IMPORT_TRACE_DIR", str(MEDIA_ROOT / "import-traces"))
     )
     IMPORT_TRACE_MAX_CHARS: int = int(os.getenv("IMPORT_TRACE_MAX_CHARS", "12000"))
+    # Images of one import are downloaded this many at a time, and at most
+    # IMPORT_IMAGE_PER_HOST_CONCURRENCY at a time from the same host.
+    IMPORT_IMAGE_CONCURRENCY: int = int(os.getenv("IMPORT_IMAGE_CONCURRENCY", "6"))
+    IMPORT_IMAGE_PER_HOST_CONCURRENCY: int = int(
+        os.getenv("IMPORT_IMAGE_PER_HOST_CONCURRENCY", "4")
+    )
+    # Imports share one keep-alive connection pool per HTTP library for the
+    # life of the app, holding up to IMPORT_HTTP_MAX_CONNECTIONS connections
+    # (IMPORT_HTTP_MAX_HOST_CONNECTIONS to one host) that are closed after
+    # IMPORT_HTTP_KEEPALIVE seconds idle.
+    IMPORT_HTTP_MAX_CONNECTIONS: int = int(
+        os.getenv("IMPORT_HTTP_MAX_CONNECTIONS", "20")
+    )
+    IMPORT_HTTP_MAX_HOST_CONNECTIONS: int = int(
+        os.getenv("IMPORT_HTTP_MAX_HOST_CONNECTIONS", "6")
+    )
+    IMPORT_HTTP_KEEPALIVE: int = int(os.getenv("IMPORT_HTTP_KEEPALIVE", "60"))
+    # Import host names are resolved (and SSRF-checked) again after this many
+    # seconds.
+    IMPORT_DNS_CACHE_TTL: int = int(os.getenv("IMPORT_DNS_CACHE_TTL", "60"))
+    # Compiled Jinja template bytecode persists here across restarts, and the
+    # app compiles every template at startup so the first requests after a
+    # deploy skip template parsing. An empty TEMPLATE_CACHE_DIR disables the
+    # bytecode cache.
+    _TEMPLATE_CACHE_DIR: str = os.getenv(
+        "TEMPLATE_CACHE_DIR", str(MEDIA_ROOT / "cache" / "templates")
+    )
+    TEMPLATE_CACHE_DIR: Path | None = (
+        Path(_TEMPLATE_CACHE_DIR) if _TEMPLATE_CACHE_DIR else None
+    )
+    TEMPLATE_WARMUP: bool = os.getenv("TEMPLATE_WARMUP", "true").lower() == "true"
+    # Pattern page fetches are cached here (gzip-compressed), honouring the
+    # origin's Cache-Control/ETag/Last-Modified; the least recently used
+    # entries are evicted beyond IMPORT_HTTP_CACHE_MAX_BYTES. An empty
+    # IMPORT_HTTP_CACHE_DIR disables the cache.
+    _IMPORT_HTTP_CACHE_DIR: str = os.getenv(
+        "IMPORT_HTTP_CACHE_DIR", str(MEDIA_ROOT / "cache" / "http")
+    )
+    IMPORT_HTTP_CACHE_DIR: Path | None = (
+        Path(_IMPORT_HTTP_CACHE_DIR) if _IMPORT_HTTP_CACHE_DIR else None
+    )
+    IMPORT_HTTP_CACHE_MAX_BYTES: int = int(
+        os.getenv("IMPORT_HTTP_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+    )
+    # BeautifulSoup tree builder for imported pattern pages. "lxml" is several
+    # times faster than the pure-Python "html.parser", which is used when lxml
+    # is not installed.
+    IMPORT_HTML_PARSER: str = os.getenv("IMPORT_HTML_PARSER", "lxml")
+    # Import pages are parsed and extracted in IMPORT_PARSE_WORKERS worker
+    # processes (0 parses in the request's process); a page that takes longer
+    # than IMPORT_PARSE_TIMEOUT seconds fails the import and its worker is
+    # killed.
+    IMPORT_PARSE_WORKERS: int = int(os.getenv("IMPORT_PARSE_WORKERS", "2"))
+    IMPORT_PARSE_TIMEOUT: float = float(os.getenv("IMPORT_PARSE_TIMEOUT", "30"))
+    # Background imports (``background=true``) run IMPORT_JOB_WORKERS at a
+    # time; a user may have IMPORT_JOB_MAX_PENDING unfinished, and finished
+    # jobs are forgotten after IMPORT_JOB_RETENTION seconds.
+    IMPORT_JOB_WORKERS: int = int(os.getenv("IMPORT_JOB_WORKERS", "4"))
+    IMPORT_JOB_MAX_PENDING: int = int(os.getenv("IMPORT_JOB_MAX_PENDING", "10"))
+    IMPORT_JOB_RETENTION: int = int(os.getenv("IMPORT_JOB_RETENTION", "3600"))
+    # ``stricknani-cli ... import --batch`` imports IMPORT_BATCH_CONCURRENCY
+    # items at a time, at most IMPORT_BATCH_PER_HOST from one host, started at
+    # least IMPORT_BATCH_HOST_DELAY seconds apart.
+    IMPORT_BATCH_CONCURRENCY: int = int(os.getenv("IMPORT_BATCH_CONCURRENCY", "4"))
+    IMPORT_BATCH_PER_HOST: int = int(os.getenv("IMPORT_BATCH_PER_HOST", "2"))
+    IMPORT_BATCH_HOST_DELAY: float = float(os.getenv("IMPORT_BATCH_HOST_DELAY", "1.0"))
     # Uploaded source files and images are read in bounded chunks. Keep the
     # default high enough for a pattern PDF while preventing an unbounded
     # request body from being copied into process memory.
@@ -97,6 +185,20 @@ class Config:
     OPENAI_API_KEY: str | None = os.getenv("OPENAI_API_KEY")
     OPENROUTER_API_KEY: str | None = os.getenv("OPENROUTER_API_KEY")
     GROQ_API_KEY: str | None = os.getenv("GROQ_API_KEY")
+    # Structured AI extraction results are cached here, keyed by provider,
+    # model, schema, system prompt and the normalized source content; entries
+    # expire after AI_CACHE_TTL seconds and the least recently used are
+    # evicted beyond AI_CACHE_MAX_BYTES. An empty AI_CACHE_DIR disables it.
+    _AI_CACHE_DIR: str = os.getenv("AI_CACHE_DIR", str(MEDIA_ROOT / "cache" / "ai"))
+    AI_CACHE_DIR: Path | None = Path(_AI_CACHE_DIR) if _AI_CACHE_DIR else None
+    AI_CACHE_TTL: int = int(os.getenv("AI_CACHE_TTL", str(7 * 24 * 3600)))
+    AI_CACHE_MAX_BYTES: int = int(
+        os.getenv("AI_CACHE_MAX_BYTES", str(32 * 1024 * 1024))
+    )
+    # Source text longer than AI_CHUNK_CHARS is split at page markers and
+    # section headers and extracted in parts, AI_CHUNK_CONCURRENCY at a time.
+    AI_CHUNK_CHARS: int = int(os.getenv("AI_CHUNK_CHARS", "12000"))
+    AI_CHUNK_CONCURRENCY: int = int(os.getenv("AI_CHUNK_CONCURRENCY", "4"))
 
     # Sentry
     SENTRY_DSN_BACKEND: str | None = os.getenv("SENTRY_DSN_BACKEND")
@@ -112,6 +214,12 @@ class Config:
     # Internationalization
     DEFAULT_LANGUAGE: str = os.getenv("DEFAULT_LANGUAGE", "de")
     SUPPORTED_LANGUAGES: list[str] = ["en", "de"]
+    # Loaded translation catalogs are cached per process; their .po/.mo
+    # mtimes are re-checked at most this often (seconds) to pick up edits.
+    # 0 never re-checks (catalogs are precompiled at build/startup).
+    TRANSLATIONS_RELOAD_INTERVAL: float = float(
+        os.getenv("TRANSLATIONS_RELOAD_INTERVAL", "5")
+    )
 
     # Auth
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 1 week
@@ -153,6 +261,15 @@ class Config:
         os.getenv("RATE_LIMIT_IMPORT_WINDOW_SECONDS", "3600")
     )
 
+    # History retention: `stricknani-cli audit compact` prunes audit log rows
+    # and sync deletion tombstones older than these many days. 0 keeps them
+    # forever. Sync clients whose `since` predates the tombstone cutoff are
+    # told to do a full resync.
+    AUDIT_LOG_RETENTION_DAYS: int = int(os.getenv("AUDIT_LOG_RETENTION_DAYS", "0"))
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = int(
+        os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "0")
+    )
+
     # Initial admin bootstrap
     INITIAL_ADMIN_EMAIL: str | None = os.getenv(
         "INITIAL_ADMIN_EMAIL", os.getenv("INITIAL_ADMIN_USERNAME")
@@ -5,15 +5,24 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import re
 import time
-from collections.abc import AsyncGenerator
+from collections import Counter
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from alembic import command
 from alembic.config import Config as AlembicConfig
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+import stricknani.services.library_version  # noqa: F401  (registers version hooks)
+import stricknani.services.summaries  # noqa: F401  (registers card summary hooks)
 from stricknani.config import config
 
 logger = logging.getLogger(__name__)
@@ -48,6 +57,109 @@ def _to_sync_url(url: str) -> str:
     return url
 
 
+# Per-request SQL instrumentation. Listeners are attached to the `Engine`
+# class (not just the app engine below) so test engines are counted too.
+# Active collectors live in a context variable; SQLAlchemy's async layer runs
+# the sync cursor events in a greenlet that shares the caller's context, so
+# each request (or `track_queries()` block) only sees its own statements.
+# Collectors nest: every active collector records each statement, which lets
+# a test budget wrap a request that the middleware is also tracking.
+
+_WHITESPACE_RE = re.compile(r"\s+")
+# Expanding IN parameters render one placeholder per value; collapse them so
+# `IN (?, ?)` and `IN (?, ?, ?)` count as the same statement shape.
+_PLACEHOLDER_LIST_RE = re.compile(
+    r"\((?:\s*(?:\?|%s|:\w+|\$\d+)\s*,)+\s*(?:\?|%s|:\w+|\$\d+)\s*\)"
+)
+
+
+@dataclass
+class QueryStats:
+    """Statements executed (and time spent in the database) within one scope."""
+
+    statements: int = 0
+    duration: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def repeated_shapes(self, threshold: int) -> list[tuple[str, int]]:
+        """Return statement shapes executed at least ``threshold`` times."""
+        if threshold <= 0:
+            return []
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+_active_query_stats: ContextVar[tuple[QueryStats, ...]] = ContextVar(
+    "stricknani_query_stats", default=()
+)
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so repeated executions group together."""
+    collapsed = _WHITESPACE_RE.sub(" ", statement).strip()
+    return _PLACEHOLDER_LIST_RE.sub("(?)", collapsed)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count statements executed in the current context while the block runs."""
+    stats = QueryStats()
+    token = _active_query_stats.set((*_active_query_stats.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active_query_stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    if _active_query_stats.get():
+        conn.info.setdefault("stricknani_query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    collectors = _active_query_stats.get()
+    if not collectors:
+        return
+    starts = conn.info.get("stricknani_query_start")
+    elapsed = time.perf_counter() - starts.pop() if starts else 0.0
+    shape = statement_shape(statement)
+    for stats in collectors:
+        stats.statements += 1
+        stats.duration += elapsed
+        stats.shapes[shape] += 1
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context: Any) -> None:
+    # `after_cursor_execute` never fires for a failed statement; drop its
+    # start time so the per-connection stack doesn't grow across the pool.
+    connection = exception_context.connection
+    if connection is None or not _active_query_stats.get():
+        return
+    starts = connection.info.get("stricknani_query_start")
+    if starts:
+        starts.pop()
+
+
 database_url = _to_async_url(config.DATABASE_URL)
 
 engine = create_async_engine(database_url, echo=config.DEBUG)
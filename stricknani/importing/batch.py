@@ -0,0 +1,277 @@
+"""Bulk imports from a list of URLs and files.
+
+``stricknani-cli project import --batch FILE`` (and ``yarn import``) imports
+every URL or file path listed in ``FILE`` (or on stdin) in one process, so a
+library of thousands of patterns pays for startup, the HTTP connection pools
+(:data:`~stricknani.importing.clients.import_http`) and the parse workers
+(:data:`~stricknani.importing.parsing.parse_pool`) once instead of per item.
+
+Each item runs through :class:`~stricknani.importing.pipeline.ImportPipeline`
+into a :class:`~stricknani.importing.targets.projects.ProjectTarget` or
+:class:`~stricknani.importing.targets.yarns.YarnTarget`, with its own database
+session. At most ``concurrency`` items run at once, and at most ``per_host``
+of them from the same host, started at least ``host_delay`` seconds apart, so
+a batch does not hammer one site.
+
+Every outcome is reported as one JSON object and appended to a state file
+(JSON lines). Run again with the same state file, a batch skips the items
+that were imported and retries the ones that failed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+from urllib.parse import urlsplit
+
+from stricknani.config import config
+from stricknani.importing.extractors.html import HTMLExtractor
+from stricknani.importing.extractors.pdf import PDFExtractor
+from stricknani.importing.pipeline import ImportPipeline
+from stricknani.importing.sources.file import FileSource
+from stricknani.importing.sources.url import URLSource
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from stricknani.importing.extractors import ContentExtractor
+    from stricknani.importing.sources import ImportSource
+    from stricknani.importing.targets import ImportTarget
+
+logger = logging.getLogger("stricknani.imports")
+
+# Item statuses reported per outcome.
+IMPORTED = "imported"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+BatchKind = Literal["project", "yarn"]
+
+
+def read_batch_items(lines: Iterable[str]) -> list[str]:
+    """Return the items listed in ``lines``, without blanks, comments and repeats."""
+    items: dict[str, None] = {}
+    for line in lines:
+        item = line.strip()
+        if item and not item.startswith("#"):
+            items.setdefault(item)
+    return list(items)
+
+
+def _is_url(item: str) -> bool:
+    return urlsplit(item).scheme in ("http", "https")
+
+
+class BatchState:
+    """The outcomes of earlier runs of a batch, kept in a JSON lines file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.outcomes: dict[str, dict[str, Any]] = {}
+        if path.exists():
+            with path.open(encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        outcome = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # a line cut short by an interrupted run
+                    if isinstance(outcome, dict) and "item" in outcome:
+                        self.outcomes[outcome["item"]] = outcome
+
+    def imported(self, item: str) -> dict[str, Any] | None:
+        """Return the earlier outcome of ``item`` if it was imported."""
+        outcome = self.outcomes.get(item)
+        if outcome is not None and outcome.get("status") == IMPORTED:
+            return outcome
+        return None
+
+    def record(self, outcome: dict[str, Any]) -> None:
+        """Append ``outcome`` to the state file."""
+        self.outcomes[outcome["item"]] = outcome
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(outcome) + "\n")
+
+
+class HostLimiter:
+    """Limit how many items run against one host, and how often they start."""
+
+    def __init__(self, per_host: int, delay: float) -> None:
+        self.per_host = max(1, per_host)
+        self.delay = max(0.0, delay)
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._last_start: dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str | None) -> AsyncIterator[None]:
+        """Hold one of ``host``'s slots; ``None`` (local files) is unlimited."""
+        if host is None:
+            yield
+            return
+        slots = self._slots.setdefault(host, asyncio.Semaphore(self.per_host))
+        async with slots:
+            async with self._locks.setdefault(host, asyncio.Lock()):
+                wait = self._last_start.get(host, -self.delay) + self.delay
+                wait -= time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._last_start[host] = time.monotonic()
+            yield
+
+
+class BatchImporter:
+    """Import many URLs or files as projects or yarns of one owner."""
+
+    def __init__(
+        self,
+        kind: BatchKind,
+        owner_id: int,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        use_ai: bool = False,
+        import_images: bool = False,
+        concurrency: int | None = None,
+        per_host: int | None = None,
+        host_delay: float | None = None,
+        state: BatchState | None = None,
+    ) -> None:
+        """Initialize the batch.
+
+        Args:
+            kind: Whether items become projects or yarns
+            owner_id: ID of the user who will own the imported entities
+            session_factory: Opens one database session per item
+            use_ai: Extract with the configured AI provider first
+            import_images: Download and attach project images
+            concurrency: Items imported at once
+                (default: ``IMPORT_BATCH_CONCURRENCY``)
+            per_host: Items from one host imported at once
+                (default: ``IMPORT_BATCH_PER_HOST``)
+            host_delay: Seconds between item starts on one host
+                (default: ``IMPORT_BATCH_HOST_DELAY``)
+            state: Where outcomes are recorded and earlier imports skipped
+        """
+        self.kind = kind
+        self.owner_id = owner_id
+        self.session_factory = session_factory
+        self.use_ai = use_ai
+        self.import_images = import_images
+        self.concurrency = max(
+            1,
+            concurrency if concurrency is not None else config.IMPORT_BATCH_CONCURRENCY,
+        )
+        self.hosts = HostLimiter(
+            per_host if per_host is not None else config.IMPORT_BATCH_PER_HOST,
+            host_delay if host_delay is not None else config.IMPORT_BATCH_HOST_DELAY,
+        )
+        self.state = state
+
+    async def run(
+        self, items: Iterable[str], emit: Callable[[dict[str, Any]], None]
+    ) -> Counter[str]:
+        """Import ``items``, passing each outcome to ``emit`` as it finishes.
+
+        Returns:
+            How many items were imported, failed and skipped.
+        """
+        counts: Counter[str] = Counter()
+        pending = iter(items)
+
+        async def worker() -> None:
+            for item in pending:
+                outcome = await self.import_item(item)
+                counts[outcome["status"]] += 1
+                if self.state is not None and outcome["status"] != SKIPPED:
+                    self.state.record(outcome)
+                emit(outcome)
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        return counts
+
+    async def import_item(self, item: str) -> dict[str, Any]:
+        """Import one URL or file path and return its outcome."""
+        earlier = self.state.imported(item) if self.state is not None else None
+        if earlier is not None:
+            return {
+                "item": item,
+                "status": SKIPPED,
+                "entity_type": earlier.get("entity_type"),
+                "entity_id": earlier.get("entity_id"),
+            }
+
+        is_url = _is_url(item)
+        started = time.monotonic()
+        async with self.hosts.slot(urlsplit(item).hostname if is_url else None):
+            try:
+                async with self.session_factory() as session:
+                    result = await ImportPipeline(session, self.owner_id).run(
+                        source=self._source(item, is_url),
+                        extractors=self._extractors(item if is_url else None),
+                        target=self._target(session),
+                    )
+            except Exception as exc:
+                logger.exception("Batch import of %s failed", item)
+                return {"item": item, "status": FAILED, "errors": [str(exc)]}
+
+        return {
+            "item": item,
+            "status": IMPORTED if result.success else FAILED,
+            "entity_type": result.entity_type,
+            "entity_id": result.entity_id,
+            "imported_images": result.imported_images,
+            "errors": result.errors,
+            "warnings": result.warnings,
+            "seconds": round(time.monotonic() - started, 3),
+        }
+
+    def _source(self, item: str, is_url: bool) -> ImportSource:
+        if is_url:
+            return URLSource(item, source_id=item)
+        return FileSource(Path(item).expanduser(), source_id=item)
+
+    def _extractors(self, url: str | None) -> list[ContentExtractor]:
+        extractors: list[ContentExtractor] = []
+        if self.use_ai:
+            from stricknani.utils.ai_provider import has_ai_api_key
+
+            if has_ai_api_key():
+                from stricknani.importing.extractors.ai import AIExtractor
+
+                extractors.append(AIExtractor(url=url))
+        extractors += [HTMLExtractor(url=url), PDFExtractor()]
+        return extractors
+
+    def _target(self, session: AsyncSession) -> ImportTarget:
+        if self.kind == "yarn":
+            from stricknani.importing.targets.yarns import YarnTarget
+
+            return YarnTarget(session, self.owner_id, audit_source="cli_import")
+
+        from stricknani.importing.targets.projects import ProjectTarget
+
+        return ProjectTarget(
+            session,
+            self.owner_id,
+            import_images=self.import_images,
+            audit_source="cli_import",
+        )
+
+
+__all__ = [
+    "FAILED",
+    "IMPORTED",
+    "SKIPPED",
+    "BatchImporter",
+    "BatchKind",
+    "BatchState",
+    "HostLimiter",
+    "read_batch_items",
+]
@@ -0,0 +1,222 @@
+"""Split long pattern text for AI extraction and merge the parts' results.
+
+A multi-size pattern or a long PDF easily runs past what fits one prompt, and
+cutting it off loses the later steps, while one huge prompt is also the slowest
+way to ask. :func:`split_text` cuts the text into parts of at most
+``max_chars``, preferring ``--- Page N ---`` markers (as
+:class:`~stricknani.importing.extractors.pdf.PDFExtractor` writes them), then
+section headers, then paragraphs. :func:`run_chunks` extracts the parts
+concurrently under a cap, callers report each part's :func:`token_usage` and
+a :func:`failed_part_warning` for each part that failed, and
+:func:`merge_chunk_results` folds the parts' JSON objects into one, in part
+order, however the calls finished:
+
+* ``steps`` are concatenated and renumbered from 1; repeated instructions
+  (the same ribbing for back and front) are kept, only a step that ends one
+  part and starts the next is taken once;
+* ``description`` joins the distinct descriptions of all parts;
+* other lists (yarns, image URLs) are concatenated without repeats;
+* every other field keeps the first part's non-empty value.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from collections.abc import Awaitable, Callable, Sequence
+from itertools import pairwise
+from typing import Any
+
+_PAGE_MARKER = re.compile(r"^--- Page \d+ ---$", re.MULTILINE)
+# Markdown headers, and the short all-caps headings ("RÜCKENTEIL:",
+# "SIZE M") that print patterns use.
+_SECTION_HEADER = re.compile(
+    r"^(?:#{1,6}\s+\S.*|(?=[^a-zäöüß\n]*[A-ZÄÖÜ]{3})[^a-zäöüß\n]{3,60}:?)$",
+    re.MULTILINE,
+)
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+def _split_before(pattern: re.Pattern[str], text: str) -> list[str]:
+    starts = sorted({0, *(match.start() for match in pattern.finditer(text))})
+    return [text[start:end] for start, end in pairwise([*starts, len(text)])]
+
+
+def _split_oversized(section: str, max_chars: int) -> list[str]:
+    """Split one section that is longer than ``max_chars`` on its own."""
+    pieces: list[str] = []
+    for paragraph in _PARAGRAPH_BREAK.split(section):
+        while len(paragraph) > max_chars:
+            # Break at a line, else a word, in the second half of the part.
+            cut = paragraph.rfind("\n", max_chars // 2, max_chars)
+            if cut < 0:
+                cut = paragraph.rfind(" ", max_chars // 2, max_chars)
+            if cut < 0:
+                cut = max_chars
+            pieces.append(paragraph[:cut])
+            paragraph = paragraph[cut:]
+        pieces.append(paragraph)
+    return [piece for piece in pieces if piece.strip()]
+
+
+def split_text(text: str, max_chars: int) -> list[str]:
+    """Cut ``text`` into parts of at most ``max_chars`` at natural boundaries.
+
+    Text that fits is returned whole, as the only part. Consecutive pages or
+    sections are packed into a part as long as they fit.
+    """
+    text = text.strip()
+    if len(text) <= max_chars or max_chars <= 0:
+        return [text]
+
+    boundary = _PAGE_MARKER if _PAGE_MARKER.search(text) else _SECTION_HEADER
+    sections: list[str] = []
+    for section in _split_before(boundary, text):
+        if len(section) > max_chars:
+            sections.extend(_split_oversized(section, max_chars))
+        elif section.strip():
+            sections.append(section)
+
+    chunks: list[str] = []
+    current = ""
+    for section in sections:
+        section = section.strip()
+        if current and len(current) + 2 + len(section) > max_chars:
+            chunks.append(current)
+            current = ""
+        current = f"{current}\n\n{section}" if current else section
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def run_chunks(
+    extract: Callable[[int, str], Awaitable[Any]],
+    chunks: Sequence[str],
+    concurrency: int,
+) -> list[Any]:
+    """Run ``extract(index, chunk)`` for every part, ``concurrency`` at a time.
+
+    Returns each part's result, or the exception it raised, in part order.
+    """
+    slots = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(index: int, chunk: str) -> Any:
+        async with slots:
+            try:
+                return await extract(index, chunk)
+            except Exception as exc:
+                return exc
+
+    return await asyncio.gather(
+        *(run(index, chunk) for index, chunk in enumerate(chunks))
+    )
+
+
+def token_usage(response: Any) -> dict[str, int]:
+    """Return the token counts a chat completion reported."""
+    usage = getattr(response, "usage", None)
+    counts = {
+        name: getattr(usage, name, None)
+        for name in ("prompt_tokens", "completion_tokens", "total_tokens")
+    }
+    return {name: value for name, value in counts.items() if isinstance(value, int)}
+
+
+def chunk_prompt_note(index: int, total: int) -> str:
+    """Tell the model that it sees one part of a longer pattern."""
+    return (
+        f"This is part {index + 1} of {total} of a longer pattern. Extract only "
+        "what this part contains, use null for fields it does not mention, and "
+        "number its steps from 1."
+    )
+
+
+def failed_part_warning(index: int, total: int) -> str:
+    """Tell the user that a part is missing from the merged result."""
+    return (
+        f"Part {index + 1}/{total} of the pattern could not be extracted; "
+        "its steps may be missing."
+    )
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def _fingerprint(value: Any) -> str:
+    if isinstance(value, str):
+        return " ".join(value.split()).casefold()
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def _step_fingerprint(step: dict[str, Any]) -> str:
+    return _fingerprint([step.get("title"), step.get("description")])
+
+
+def _merge_steps(parts: list[list[Any]]) -> list[Any]:
+    steps: list[Any] = []
+    for part in parts:
+        part_steps = [step for step in part if isinstance(step, dict)]
+        # The model may repeat the step a part was cut in; anything else that
+        # repeats is a real instruction.
+        if (
+            steps
+            and part_steps
+            and _step_fingerprint(part_steps[0]) == _step_fingerprint(steps[-1])
+        ):
+            part_steps = part_steps[1:]
+        for step in part_steps:
+            steps.append({**step, "step_number": len(steps) + 1})
+    return steps
+
+
+def _merge_descriptions(parts: list[Any]) -> str | None:
+    merged: list[str] = []
+    for part in parts:
+        if not isinstance(part, str) or not part.strip():
+            continue
+        part = part.strip()
+        if not any(_fingerprint(part) in _fingerprint(kept) for kept in merged):
+            merged.append(part)
+    return "\n\n".join(merged) or None
+
+
+def _merge_lists(parts: list[list[Any]]) -> list[Any]:
+    items: list[Any] = []
+    seen: set[str] = set()
+    for part in parts:
+        for item in part:
+            key = _fingerprint(item)
+            if key not in seen:
+                seen.add(key)
+                items.append(item)
+    return items
+
+
+def merge_chunk_results(results: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    """Fold the JSON objects extracted from each part into one, in part order."""
+    merged: dict[str, Any] = {}
+    for key in dict.fromkeys(key for result in results for key in result):
+        values = [result[key] for result in results if key in result]
+        present = [value for value in values if not _is_empty(value)]
+        if key == "steps":
+            merged[key] = _merge_steps([v for v in present if isinstance(v, list)])
+        elif key == "description":
+            merged[key] = _merge_descriptions(present)
+        elif present and all(isinstance(value, list) for value in present):
+            merged[key] = _merge_lists(present)
+        else:
+            merged[key] = present[0] if present else values[0]
+    return merged
+
+
+__all__ = [
+    "chunk_prompt_note",
+    "failed_part_warning",
+    "merge_chunk_results",
+    "run_chunks",
+    "split_text",
+    "token_usage",
+]
@@ -0,0 +1,321 @@
+"""App-lifetime outbound HTTP clients for imports.
+
+Imports used to open fresh connections for every call: a curl_cffi session per
+:func:`~stricknani.importing.fetch.fetch_url`, an httpx client per image batch.
+Importing several patterns from one shop therefore repeated the DNS lookup,
+TCP and TLS handshakes to the same host each time.
+
+:data:`import_http` keeps one curl_cffi session and one httpx client with
+keep-alive connection pools for the life of the app; the FastAPI lifespan
+starts it and closes it on shutdown. Both are limited to
+``IMPORT_HTTP_MAX_CONNECTIONS`` connections. curl caps connections per host at
+``IMPORT_HTTP_MAX_HOST_CONNECTIONS`` itself; httpx has no such limit, so its
+callers bound per-host concurrency (see ``ImageDownloader``).
+
+Neither client follows redirects. Callers follow them by hand and check every
+hop with :func:`~stricknani.importing.ssrf.resolve_public_url`. The clients
+then connect to the address that check resolved instead of looking the name
+up again, so a DNS answer that changes in between cannot point them at an
+internal host: the httpx transport resolves through the same SSRF-checked
+cache when it opens a connection, and curl is handed the address through
+``CURLOPT_RESOLVE`` (:meth:`ImportHTTPClients.curl_pinned`).
+
+The shared clients belong to the event loop they were started on. Code running
+without them (CLI commands, tests, another loop) gets a short-lived client per
+call from the same context managers.
+
+:meth:`ImportHTTPClients.stats` reports how many requests through the shared
+clients reused a pooled connection instead of opening a new one, and how
+often the DNS cache answered a lookup.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing
+from collections import Counter
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urljoin, urlsplit
+
+import httpcore
+import httpx
+
+from stricknani.config import config
+from stricknani.importing.ssrf import (
+    dns_cache,
+    resolve_public_host,
+    resolve_public_url,
+)
+
+if TYPE_CHECKING:
+    from curl_cffi.requests import AsyncSession, Response
+
+logger = logging.getLogger("stricknani.imports")
+
+# HTTP status codes that indicate a redirect (with a Location header).
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Cap manual redirect following to avoid loops / redirect chains.
+_MAX_REDIRECTS = 5
+
+
+class _PinnedNetworkBackend(httpcore.AsyncNetworkBackend):
+    """Connect to the SSRF-checked address of a host, never a fresh lookup."""
+
+    def __init__(self) -> None:
+        self._backend = httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        address = await resolve_public_host(host)
+        return await self._backend.connect_tcp(
+            address or host,
+            port,
+            timeout=timeout,
+            local_address=local_address,
+            socket_options=socket_options,
+        )
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class _PinnedTransport(httpx.AsyncHTTPTransport):
+    """httpx transport whose connections go through :class:`_PinnedNetworkBackend`."""
+
+    def __init__(self) -> None:
+        limits = httpx.Limits(
+            max_connections=config.IMPORT_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.IMPORT_HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=config.IMPORT_HTTP_KEEPALIVE,
+        )
+        super().__init__(limits=limits)
+        # httpx does not expose the network backend, so rebuild its pool with
+        # the same settings plus ours.
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=_PinnedNetworkBackend(),
+        )
+
+
+@dataclass
+class ConnectionStats:
+    """Requests sent by one client and the connections opened for them."""
+
+    requests: int = 0
+    connections: int = 0
+
+    @property
+    def reused(self) -> int:
+        """Requests served over an already open connection."""
+        return max(0, self.requests - self.connections)
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a plain dict (for logs)."""
+        return {
+            "requests": self.requests,
+            "connections": self.connections,
+            "reused": self.reused,
+        }
+
+
+class ImportHTTPClients:
+    """Shared curl_cffi and httpx clients for outbound import requests."""
+
+    def __init__(self) -> None:
+        self.curl_stats = ConnectionStats()
+        self.httpx_stats = ConnectionStats()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._curl: AsyncSession[Response] | None = None
+        self._httpx: httpx.AsyncClient | None = None
+        self._curl_pins: dict[str, str] = {}
+        self._curl_pin_users: Counter[str] = Counter()
+
+    @property
+    def started(self) -> bool:
+        """Whether the shared clients are open."""
+        return self._loop is not None
+
+    async def start(self) -> None:
+        """Open the shared clients on the running event loop."""
+        if self.started:
+            await self.close()
+        self._curl = self._new_curl_session()
+        self._httpx = self._new_httpx_client()
+        self._loop = asyncio.get_running_loop()
+
+    async def close(self) -> None:
+        """Close the shared clients and their pooled connections."""
+        curl, client = self._curl, self._httpx
+        self._loop = self._curl = self._httpx = None
+        if client is not None:
+            await client.aclose()
+        if curl is not None:
+            await curl.close()
+        logger.info("Import HTTP client stats: %s", self.stats())
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return request/connection/reuse counters per client and DNS cache hits."""
+        return {
+            "curl": self.curl_stats.as_dict(),
+            "httpx": self.httpx_stats.as_dict(),
+            "dns": dns_cache.stats(),
+        }
+
+    def _is_current(self) -> bool:
+        try:
+            return self._loop is asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+    @asynccontextmanager
+    async def curl_session(self) -> AsyncIterator[AsyncSession[Response]]:
+        """Yield the shared curl_cffi session, or a one-off one without it."""
+        if self._curl is not None and self._is_current():
+            yield self._curl
+            return
+        from curl_cffi.requests import AsyncSession
+
+        async with AsyncSession() as session:
+            yield session
+
+    @asynccontextmanager
+    async def httpx_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared httpx client, or a one-off one without it."""
+        if self._httpx is not None and self._is_current():
+            yield self._httpx
+            return
+        async with httpx.AsyncClient(
+            follow_redirects=False, transport=_PinnedTransport()
+        ) as client:
+            yield client
+
+    @contextmanager
+    def curl_pinned(
+        self, session: AsyncSession[Response], url: str, address: str | None
+    ) -> Iterator[None]:
+        """Make ``session`` connect to ``address`` for ``url``'s host meanwhile.
+
+        ``address`` comes from :func:`resolve_public_url`; ``None`` (private
+        hosts allowed) leaves resolving to curl, and IP-literal URLs need no
+        pin. curl_cffi only takes curl
+        options per session, so every request in flight shares one
+        ``CURLOPT_RESOLVE`` list.
+        """
+        parts = urlsplit(url)
+        if address is None or address == parts.hostname:
+            yield
+            return
+        from curl_cffi import CurlOpt
+
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = f"{parts.hostname}:{port}"
+        # curl wants IPv6 addresses in brackets.
+        pinned = f"[{address}]" if ":" in address else address
+        self._curl_pins[key] = f"{key}:{pinned}"
+        self._curl_pin_users[key] += 1
+        options: dict[Any, Any] = dict(session.curl_options)
+        options[CurlOpt.RESOLVE] = list(self._curl_pins.values())
+        session.curl_options = options
+        try:
+            yield
+        finally:
+            self._curl_pin_users[key] -= 1
+            if not self._curl_pin_users[key]:
+                del self._curl_pin_users[key]
+                del self._curl_pins[key]
+
+    def record_curl_response(self, response: Response) -> None:
+        """Count a response from the shared :meth:`curl_session`."""
+        from curl_cffi import CurlInfo
+
+        if self._curl is None or not self._is_current():
+            return
+        self.curl_stats.requests += 1
+        infos: dict[Any, Any] = response.infos
+        self.curl_stats.connections += int(infos.get(CurlInfo.NUM_CONNECTS) or 0)
+
+    def _new_curl_session(self) -> AsyncSession[Response]:
+        from curl_cffi import CurlInfo, CurlMOpt, CurlOpt
+        from curl_cffi.requests import AsyncSession
+
+        session: AsyncSession[Response] = AsyncSession(
+            max_clients=config.IMPORT_HTTP_MAX_CONNECTIONS,
+            curl_options={CurlOpt.MAXAGE_CONN: config.IMPORT_HTTP_KEEPALIVE},
+            curl_infos=[CurlInfo.NUM_CONNECTS],
+        )
+        session.acurl.setopt(  # type: ignore[no-untyped-call]
+            CurlMOpt.MAX_HOST_CONNECTIONS, config.IMPORT_HTTP_MAX_HOST_CONNECTIONS
+        )
+        return session
+
+    def _new_httpx_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            follow_redirects=False,
+            transport=_PinnedTransport(),
+            event_hooks={"request": [self._trace_httpx_request]},
+        )
+
+    async def _trace_httpx_request(self, request: httpx.Request) -> None:
+        self.httpx_stats.requests += 1
+        request.extensions["trace"] = self._trace_httpx_event
+
+    async def _trace_httpx_event(self, name: str, info: dict[str, Any]) -> None:
+        if name == "connection.connect_tcp.complete":
+            self.httpx_stats.connections += 1
+
+
+import_http = ImportHTTPClients()
+
+
+async def get_public_url(
+    client: httpx.AsyncClient, url: str, **kwargs: Any
+) -> httpx.Response:
+    """GET ``url`` with ``client``, following redirects with an SSRF check per hop.
+
+    Keyword arguments are passed on to ``client.get``.
+
+    Raises:
+        SSRFError: If the URL or a redirect target resolves to a
+            non-public address.
+        httpx.HTTPError: On transport errors or too many redirects.
+    """
+    current_url = url
+    for _ in range(_MAX_REDIRECTS + 1):
+        await resolve_public_url(current_url)
+        response = await client.get(current_url, **kwargs)
+        location = response.headers.get("location")
+        if response.status_code not in _REDIRECT_STATUSES or not location:
+            return response
+        current_url = urljoin(current_url, location)
+    raise httpx.TooManyRedirects(f"Too many redirects for {url}")
+
+
+__all__ = [
+    "ConnectionStats",
+    "ImportHTTPClients",
+    "get_public_url",
+    "import_http",
+]
@@ -0,0 +1,271 @@
+"""Parse imported pages once and index them for the extractors.
+
+:class:`~stricknani.importing.importer.PatternImporter` runs dozens of
+extractors over the same page, and each used to walk the whole tree again:
+``find_all``/``select`` passes for images, labels, headings, Garnstudio
+sections and the noise selectors, plus ``get_text()`` of the whole document
+for every regular expression. On a 500 KB Garnstudio page that was most of an
+import's CPU time.
+
+:func:`parse_html` builds the tree with ``IMPORT_HTML_PARSER`` (lxml unless
+configured otherwise, ``html.parser`` when lxml is missing).
+:class:`DocumentIndex` then walks it once and files every tag by name, class
+and id, so lookups only look at the tags they can match. Results that still
+need a walk (document text, tag texts for label and heading matching) are
+computed once and kept until the tree changes.
+
+Extractors remove page noise while they run. Removals go through
+:meth:`DocumentIndex.decompose`, which drops the cached results; removed tags
+are skipped by every lookup.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, TypeVar
+
+from bs4 import BeautifulSoup, FeatureNotFound
+from bs4.element import Tag
+
+from stricknani.config import config
+
+logger = logging.getLogger("stricknani.imports")
+
+_T = TypeVar("_T")
+
+# Tags whose own text can be a label ("Gauge:") or a section heading.
+TEXT_TAGS = frozenset(
+    {
+        "b",
+        "div",
+        "dt",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "label",
+        "span",
+        "strong",
+        "td",
+        "th",
+    }
+)
+
+_SIMPLE_SELECTOR = re.compile(r"^([#.]?)([A-Za-z_][\w-]*)$")
+
+AttrFilter = str | re.Pattern[str] | None
+
+# Tags are keyed by identity: ``Tag.__eq__`` compares markup. (``find_all``
+# takes an ``id`` argument like BeautifulSoup's, which shadows the builtin.)
+_key = id
+
+
+def parse_html(markup: str | bytes, parser: str | None = None) -> BeautifulSoup:
+    """Parse ``markup`` with ``parser`` or the configured import parser."""
+    features = parser or config.IMPORT_HTML_PARSER
+    try:
+        return BeautifulSoup(markup, features)
+    except FeatureNotFound:
+        if features == "html.parser":
+            raise
+        logger.warning("HTML parser %r is not available, using html.parser", features)
+        return BeautifulSoup(markup, "html.parser")
+
+
+def _matches(value: Any, rule: str | re.Pattern[str]) -> bool:
+    """Match an attribute value the way BeautifulSoup's ``find`` does.
+
+    Multi-valued attributes (``class``) match if one value matches or, failing
+    that, the values joined with spaces do.
+    """
+    if value is None:
+        return False
+    values = value if isinstance(value, list) else [value]
+
+    def match(candidate: str) -> bool:
+        if isinstance(rule, str):
+            return candidate == rule
+        return rule.search(candidate) is not None
+
+    if any(match(candidate) for candidate in values):
+        return True
+    return len(values) != 1 and match(" ".join(values))
+
+
+class DocumentIndex:
+    """Tags of a parsed page by name, class and id, in document order."""
+
+    def __init__(self, root: Tag) -> None:
+        self.root = root
+        self.version = 0
+        self._tags: list[Tag] = []
+        self._position: dict[int, int] = {}
+        self._by_name: dict[str, list[Tag]] = {}
+        self._by_class: dict[str, list[Tag]] = {}
+        self._by_id: dict[str, list[Tag]] = {}
+        self._memo: dict[Any, Any] = {}
+        self._removed: set[int] = set()
+        for node in root.descendants:
+            if not isinstance(node, Tag):
+                continue
+            self._position[_key(node)] = len(self._tags)
+            self._tags.append(node)
+            self._by_name.setdefault(node.name, []).append(node)
+            classes = node.get("class")
+            if isinstance(classes, list):
+                for cls in classes:
+                    self._by_class.setdefault(cls, []).append(node)
+            tag_id = node.get("id")
+            if isinstance(tag_id, str):
+                self._by_id.setdefault(tag_id, []).append(node)
+
+    def find_all(
+        self,
+        name: str | Iterable[str] | None = None,
+        *,
+        class_: AttrFilter = None,
+        id: AttrFilter = None,
+        attrs: Mapping[str, AttrFilter] | None = None,
+    ) -> list[Tag]:
+        """Return the tags matching every given filter, like ``soup.find_all``.
+
+        ``name`` is a tag name or several; ``class_``, ``id`` and ``attrs``
+        values are exact strings or regular expressions (searched).
+        """
+        names = {name} if isinstance(name, str) else set(name or ())
+        if isinstance(id, str):
+            candidates = self._by_id.get(id, [])
+        elif isinstance(class_, str) and " " not in class_:
+            candidates = self._by_class.get(class_, [])
+        elif names:
+            candidates = self._in_order(
+                tag for tag_name in names for tag in self._by_name.get(tag_name, [])
+            )
+        else:
+            candidates = self._tags
+
+        rules = dict(attrs or {})
+        if class_ is not None:
+            rules["class"] = class_
+        if id is not None:
+            rules["id"] = id
+        return [
+            tag
+            for tag in candidates
+            if _key(tag) not in self._removed
+            and (not names or tag.name in names)
+            and all(
+                rule is None or _matches(tag.get(attr), rule)
+                for attr, rule in rules.items()
+            )
+        ]
+
+    def find(
+        self,
+        name: str | Iterable[str] | None = None,
+        *,
+        class_: AttrFilter = None,
+        id: AttrFilter = None,
+        attrs: Mapping[str, AttrFilter] | None = None,
+    ) -> Tag | None:
+        """Return the first tag :meth:`find_all` would, or ``None``."""
+        found = self.find_all(name, class_=class_, id=id, attrs=attrs)
+        return found[0] if found else None
+
+    def select(self, selector: str) -> list[Tag]:
+        """Return the tags matching a CSS selector, in document order.
+
+        Comma-separated lists of bare tag names, ``.class`` and ``#id`` are
+        answered from the index; anything else goes to soupsieve.
+        """
+        parts = [_SIMPLE_SELECTOR.match(part.strip()) for part in selector.split(",")]
+        if not all(parts):
+            return self.root.select(selector)
+        found: list[Tag] = []
+        for match in parts:
+            assert match is not None
+            kind, value = match.groups()
+            if kind == "#":
+                found.extend(self.find_all(id=value))
+            elif kind == ".":
+                found.extend(self.find_all(class_=value))
+            else:
+                found.extend(self.find_all(value.lower()))
+        return self._in_order(found)
+
+    def find_by_text(
+        self,
+        texts: Iterable[str],
+        names: Iterable[str] = TEXT_TAGS,
+        *,
+        strip_colon: bool = False,
+    ) -> list[Tag]:
+        """Return the :data:`TEXT_TAGS` tags whose text is one of ``texts``.
+
+        Texts compare stripped and lower-cased, and with a trailing colon
+        removed if ``strip_colon`` is set.
+        """
+        by_text, by_label = self.memo("texts", self._index_texts)
+        index = by_label if strip_colon else by_text
+        wanted = set(names)
+        return self._in_order(
+            tag
+            for text in set(texts)
+            for tag in index.get(text, [])
+            if tag.name in wanted and _key(tag) not in self._removed
+        )
+
+    def text(self, separator: str = "", strip: bool = False) -> str:
+        """Return ``root.get_text(separator, strip=strip)``, computed once."""
+        return self.memo(
+            ("text", separator, strip),
+            lambda: self.root.get_text(separator, strip=strip),
+        )
+
+    def memo(self, key: Any, compute: Callable[[], _T]) -> _T:
+        """Return ``compute()``, reusing the result until the tree changes."""
+        try:
+            return self._memo[key]  # type: ignore[no-any-return]
+        except KeyError:
+            pass
+        value = compute()
+        self._memo[key] = value
+        return value
+
+    def is_removed(self, tag: Tag) -> bool:
+        """Whether ``tag`` went with a :meth:`decompose` call."""
+        return _key(tag) in self._removed
+
+    def decompose(self, tag: Tag) -> None:
+        """Remove ``tag`` and everything in it from the page."""
+        if _key(tag) in self._removed:
+            return
+        self._removed.add(_key(tag))
+        self._removed.update(
+            _key(node) for node in tag.descendants if isinstance(node, Tag)
+        )
+        tag.decompose()
+        self.version += 1
+        self._memo = {}
+
+    def _in_order(self, tags: Iterable[Tag]) -> list[Tag]:
+        unique = {_key(tag): tag for tag in tags}
+        return sorted(unique.values(), key=lambda tag: self._position[_key(tag)])
+
+    def _index_texts(self) -> tuple[dict[str, list[Tag]], dict[str, list[Tag]]]:
+        by_text: dict[str, list[Tag]] = {}
+        by_label: dict[str, list[Tag]] = {}
+        for tag in self._tags:
+            if tag.name not in TEXT_TAGS or _key(tag) in self._removed:
+                continue
+            text = tag.get_text().strip().lower()
+            by_text.setdefault(text, []).append(tag)
+            by_label.setdefault(text.rstrip(":"), []).append(tag)
+        return by_text, by_label
+
+
+__all__ = ["TEXT_TAGS", "DocumentIndex", "parse_html"]
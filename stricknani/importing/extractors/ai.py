@@ -14,6 +14,15 @@ from typing import TYPE_CHECKING, Any
 
 from PIL import Image as PilImage
 
+from stricknani.config import config
+from stricknani.importing.chunking import (
+    chunk_prompt_note,
+    failed_part_warning,
+    merge_chunk_results,
+    run_chunks,
+    split_text,
+    token_usage,
+)
 from stricknani.importing.extractors import ContentExtractor, ExtractorError
 from stricknani.importing.models import (
     ContentType,
@@ -57,6 +66,9 @@ class AIExtractor(ContentExtractor):
         model: str | None = None,
         max_tokens: int = 4000,
         temperature: float = 0.1,
+        use_cache: bool = True,
+        chunk_chars: int | None = None,
+        chunk_concurrency: int | None = None,
     ) -> None:
         """Initialize the AI extractor.
 
@@ -66,6 +78,12 @@ class AIExtractor(ContentExtractor):
             model: Model to use for extraction
             max_tokens: Maximum tokens in response
             temperature: Temperature for generation
+            use_cache: Reuse a cached result for an identical request
+                (see :mod:`stricknani.utils.ai_cache`)
+            chunk_chars: Longest text extracted in one request
+                (default: ``AI_CHUNK_CHARS``)
+            chunk_concurrency: Parts of a longer text extracted at once
+                (default: ``AI_CHUNK_CONCURRENCY``)
         """
         self.url = url
         self.provider = resolve_ai_provider()
@@ -76,6 +94,15 @@ class AIExtractor(ContentExtractor):
         )
         self.max_tokens = max_tokens
         self.temperature = temperature
+        self.use_cache = use_cache
+        self.chunk_chars = (
+            chunk_chars if chunk_chars is not None else config.AI_CHUNK_CHARS
+        )
+        self.chunk_concurrency = (
+            chunk_concurrency
+            if chunk_concurrency is not None
+            else config.AI_CHUNK_CONCURRENCY
+        )
 
     @property
     def name(self) -> str:
@@ -173,14 +200,19 @@ class AIExtractor(ContentExtractor):
                                     )
                                 )
 
-                        # Also get text as hint/context
+                        # Also get text as hint/context, or all of it when
+                        # the pages could not be rendered
                         try:
                             text_data = await pdf_extractor.extract(c)
-                            if text_data.description:
+                            pdf_text = (
+                                text_data.description
+                                if page_images
+                                else text_data.extras.get("full_text")
+                            )
+                            if pdf_text:
                                 filename = c.metadata.get("filename")
                                 extra_text.append(
-                                    f"Context from PDF {filename}:\n"
-                                    f"{text_data.description}"
+                                    f"Context from PDF {filename}:\n{pdf_text}"
                                 )
                         except ExtractorError as exc:
                             logger.debug(
@@ -192,6 +224,15 @@ class AIExtractor(ContentExtractor):
                         filename = c.metadata.get("filename")
                         extra_text.append(f"Context from {filename}:\n{c.get_text()}")
 
+                if not final_images and extra_text:
+                    return await self._extract_from_text(
+                        RawContent(
+                            content="\n\n".join(extra_text),
+                            content_type=ContentType.TEXT,
+                        ),
+                        hints,
+                    )
+
                 # Process all images
                 result = await self._extract_from_images(
                     final_images, hints, extra_context="\n\n".join(extra_text)
@@ -248,8 +289,6 @@ class AIExtractor(ContentExtractor):
         extra_context: str = "",
     ) -> ExtractedData:
         """Extract data from images using vision API."""
-        client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
-
         # Build prompt
         system_prompt = self._build_system_prompt()
         base_prompt = self._build_image_prompt(hints)
@@ -280,22 +319,7 @@ class AIExtractor(ContentExtractor):
             )
 
         try:
-            response = await client.chat.completions.create(  # type: ignore[call-overload]
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {
-                        "role": "user",
-                        "content": user_content,
-                    },
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                response_format={"type": "json_object"},
-            )
-
-            raw_content_str = response.choices[0].message.content or "{}"
-            return self._parse_ai_response(raw_content_str)
+            return await self._complete(system_prompt, user_content)
 
         except Exception as exc:
             raise ExtractorError(
@@ -309,41 +333,112 @@ class AIExtractor(ContentExtractor):
         hints: dict[str, Any] | None,
         extra_prompt: str | None = None,
     ) -> ExtractedData:
-        """Extract data from text using GPT."""
-        client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
-
-        text = content.get_text()
-
-        # Limit text length
-        if len(text) > 12000:
-            text = text[:12000] + "\n[Content truncated...]"
+        """Extract data from text using GPT.
 
+        Text longer than ``chunk_chars`` is split at page markers and section
+        headers, and the parts are extracted concurrently and merged (see
+        :mod:`stricknani.importing.chunking`).
+        """
+        chunks = split_text(content.get_text(), self.chunk_chars)
         system_prompt = self._build_system_prompt()
-        user_prompt = self._build_text_prompt(text, hints)
-        if extra_prompt:
-            user_prompt += f"\n\n{extra_prompt}"
-
-        try:
-            response = await client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                response_format={"type": "json_object"},
-            )
-
-            raw_content_str = response.choices[0].message.content or "{}"
-            return self._parse_ai_response(raw_content_str)
 
-        except Exception as exc:
+        async def extract_chunk(
+            index: int, chunk: str
+        ) -> tuple[dict[str, Any], dict[str, Any]]:
+            user_prompt = self._build_text_prompt(chunk, hints)
+            if len(chunks) > 1:
+                user_prompt += f"\n\n{chunk_prompt_note(index, len(chunks))}"
+            if extra_prompt:
+                user_prompt += f"\n\n{extra_prompt}"
+            data, usage = await self._request_json(system_prompt, user_prompt)
+            return data, {"chunk": index + 1, "chars": len(chunk), **usage}
+
+        outcomes = await run_chunks(extract_chunk, chunks, self.chunk_concurrency)
+        parts = [outcome for outcome in outcomes if not isinstance(outcome, Exception)]
+        if not parts:
+            exc: Exception = outcomes[0]
             raise ExtractorError(
                 f"AI text extraction failed: {exc}",
                 extractor_name=self.name,
             ) from exc
 
+        usage: list[dict[str, Any]] = []
+        warnings: list[str] = []
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(
+                    "AI extraction of part %s failed: %s", index + 1, outcome
+                )
+                usage.append({"chunk": index + 1, "error": str(outcome)})
+                warnings.append(failed_part_warning(index, len(chunks)))
+            else:
+                usage.append(outcome[1])
+
+        result = self._extracted_from_dict(
+            merge_chunk_results([data for data, _ in parts])
+        )
+        result.warnings.extend(warnings)
+        result.extras["ai_usage"] = usage
+        return result
+
+    async def _complete(
+        self, system_prompt: str, user_content: str | list[dict[str, Any]]
+    ) -> ExtractedData:
+        """Ask the model for JSON and turn its answer into ExtractedData."""
+        data, usage = await self._request_json(system_prompt, user_content)
+        result = self._extracted_from_dict(data)
+        result.extras["ai_usage"] = [usage]
+        return result
+
+    async def _request_json(
+        self, system_prompt: str, user_content: str | list[dict[str, Any]]
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Ask the model for JSON, or reuse its answer to an identical request.
+
+        Returns the JSON object and the request's token usage.
+        """
+        from stricknani.utils.ai_cache import ai_cache_key, get_ai_cache
+
+        cache = get_ai_cache()
+        key = ai_cache_key(
+            provider=self.provider,
+            model=self.model,
+            schema={"type": "json_object"},
+            system_prompt=system_prompt,
+            content=user_content,
+            options={
+                "api": "chat",
+                "max_tokens": self.max_tokens,
+                "temperature": self.temperature,
+            },
+        )
+        if cache is not None:
+            cached = await cache.lookup(key, use_cache=self.use_cache)
+            if isinstance(cached, dict):
+                logger.info("Reusing cached AI extraction %s", key[:12])
+                return cached, {"cached": True}
+
+        client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        response = await client.chat.completions.create(  # type: ignore[call-overload]
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content},
+            ],
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            response_format={"type": "json_object"},
+        )
+
+        raw_content_str = response.choices[0].message.content or "{}"
+        data = self._load_ai_response(raw_content_str)
+        self._extracted_from_dict(data)  # only cache answers that convert
+        if cache is not None:
+            await cache.put(key, data)
+        usage = token_usage(response)
+        logger.info("AI extraction used %s", usage)
+        return data, usage
+
     async def _prepare_image(self, image_bytes: bytes, max_size: int = 1024) -> bytes:
         """Resize image if needed to reduce token usage."""
         try:
@@ -441,8 +536,8 @@ class AIExtractor(ContentExtractor):
         prompt += "Return the extracted data as JSON."
         return prompt
 
-    def _parse_ai_response(self, raw_content: str) -> ExtractedData:
-        """Parse AI JSON response into ExtractedData."""
+    def _load_ai_response(self, raw_content: str) -> dict[str, Any]:
+        """Decode the JSON object the model returned."""
         try:
             data = json.loads(raw_content)
         except json.JSONDecodeError as exc:
@@ -450,6 +545,15 @@ class AIExtractor(ContentExtractor):
                 f"AI returned invalid JSON: {exc}",
                 extractor_name=self.name,
             ) from exc
+        if not isinstance(data, dict):
+            raise ExtractorError(
+                "AI returned JSON that is not an object",
+                extractor_name=self.name,
+            )
+        return data
+
+    def _extracted_from_dict(self, data: dict[str, Any]) -> ExtractedData:
+        """Turn the model's JSON object into ExtractedData."""
 
         def normalize_to_string(value: Any) -> str | None:
             """Convert AI response values to strings, handling objects/arrays."""
@@ -67,9 +67,8 @@ class HTMLExtractor(ContentExtractor):
         Raises:
             ExtractorError: If extraction fails
         """
-        from stricknani.importing.importer import PatternImporter
+        from stricknani.importing.parsing import parse_pool
 
-        html_text = content.get_text()
         url = content.source_url or self.url or ""
 
         if not url:
@@ -79,23 +78,10 @@ class HTMLExtractor(ContentExtractor):
             )
 
         try:
-            # Use the existing PatternImporter but skip the fetch
-            # by using the HTML we already have
-            importer = PatternImporter(url, timeout=self.timeout)
-
-            # Parse the HTML directly using the importer's methods
-            from bs4 import BeautifulSoup
-
-            soup = BeautifulSoup(html_text, "html.parser")
-            importer._last_soup = soup
-            from stricknani.importing.importer import is_garnstudio_url
-
-            importer.is_garnstudio = is_garnstudio_url(url)
-
-            # Extract all the data
-            data = self._extract_from_soup(importer, soup, url)
-
-            return data
+            # Parsing is CPU-bound; run it in the import parse workers.
+            return await parse_pool.run(
+                extract_html, url, content.get_text(), self.timeout
+            )
 
         except Exception as exc:
             raise ExtractorError(
@@ -103,6 +89,23 @@ class HTMLExtractor(ContentExtractor):
                 extractor_name=self.name,
             ) from exc
 
+    def parse(self, html_text: str, url: str) -> ExtractedData:
+        """Parse ``html_text`` from ``url`` into extracted data."""
+        # Use the existing PatternImporter but skip the fetch
+        # by using the HTML we already have
+        from stricknani.importing.dom import parse_html
+        from stricknani.importing.importer import PatternImporter, is_garnstudio_url
+
+        importer = PatternImporter(url, timeout=self.timeout)
+
+        # Parse the HTML directly using the importer's methods
+        soup = parse_html(html_text)
+        importer._last_soup = soup
+        importer.is_garnstudio = is_garnstudio_url(url)
+
+        # Extract all the data
+        return self._extract_from_soup(importer, soup, url)
+
     def _extract_from_soup(
         self,
         importer: PatternImporter,
@@ -272,4 +275,9 @@ class HTMLExtractor(ContentExtractor):
         return base_description
 
 
-__all__ = ["HTMLExtractor"]
+def extract_html(url: str, html: str, timeout: int = 10) -> ExtractedData:
+    """Extract ``html`` fetched from ``url``; a :data:`parse_pool` job."""
+    return HTMLExtractor(url=url, timeout=timeout).parse(html, url)
+
+
+__all__ = ["HTMLExtractor", "extract_html"]
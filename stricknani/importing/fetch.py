@@ -8,7 +8,9 @@ which passes the check.
 
 All URL imports go through :func:`fetch_url` so the impersonation is applied
 consistently (it is harmless for sites that do not need it and makes imports
-more robust against other Cloudflare-protected shops).
+more robust against other Cloudflare-protected shops). Requests share the
+app's pooled curl_cffi session (:data:`~stricknani.importing.clients.import_http`),
+so repeated imports from one shop reuse its connections.
 """
 
 from __future__ import annotations
@@ -60,6 +62,7 @@ async def fetch_url(
     headers: Mapping[str, str] | None = None,
     follow_redirects: bool = True,
     impersonate: str = DEFAULT_IMPERSONATE,
+    cache: bool = False,
 ) -> FetchResponse:
     """Fetch ``url`` using curl_cffi with a browser TLS fingerprint.
 
@@ -69,6 +72,8 @@ async def fetch_url(
         headers: Optional extra HTTP headers.
         follow_redirects: Whether to follow HTTP redirects.
         impersonate: curl-impersonate browser target (e.g. ``"chrome"``).
+        cache: Serve and store the response through the on-disk HTTP cache
+            (see :mod:`stricknani.importing.http_cache`).
 
     Returns:
         A :class:`FetchResponse` with the decoded body and metadata.
@@ -78,10 +83,56 @@ async def fetch_url(
         SSRFError: If the URL (or a redirect target) resolves to a
             private/loopback/reserved address.
     """
-    from curl_cffi.requests import AsyncSession
+    from stricknani.importing.http_cache import cache_key, get_http_cache
+
+    http_cache = get_http_cache() if cache else None
+    if http_cache is None:
+        return await _fetch(
+            url,
+            timeout=timeout,
+            headers=headers,
+            follow_redirects=follow_redirects,
+            impersonate=impersonate,
+        )
+
+    key = cache_key(
+        url, headers, impersonate=impersonate, follow_redirects=follow_redirects
+    )
+    entry = await http_cache.load(key)
+    if entry is not None and entry.is_fresh():
+        logger.debug("HTTP cache hit for %s", url)
+        return entry.to_response()
+
+    request_headers = dict(headers or {})
+    if entry is not None:
+        request_headers.update(entry.conditional_headers())
+    response = await _fetch(
+        url,
+        timeout=timeout,
+        headers=request_headers,
+        follow_redirects=follow_redirects,
+        impersonate=impersonate,
+    )
+    if entry is not None and response.status_code == 304:
+        logger.debug("HTTP cache entry for %s revalidated", url)
+        entry = await http_cache.revalidated(key, entry, response.headers)
+        return entry.to_response()
+    await http_cache.store(key, url, response)
+    return response
+
+
+async def _fetch(
+    url: str,
+    *,
+    timeout: int,
+    headers: Mapping[str, str] | None,
+    follow_redirects: bool,
+    impersonate: str,
+) -> FetchResponse:
     from curl_cffi.requests.exceptions import RequestException
 
-    from stricknani.importing.ssrf import validate_public_url
+    from stricknani.importing.clients import import_http
+    from stricknani.importing.ssrf import resolve_public_url
 
     request_headers = dict(headers) if headers else None
 
@@ -89,20 +140,22 @@ async def fetch_url(
     # Redirects are followed manually below (curl_cffi's automatic redirect
     # handling would connect to a redirect target before we could inspect it),
     # re-validating each hop's Location so a redirect cannot be used to reach an
-    # internal host.
-    validate_public_url(url)
+    # internal host. curl connects to the address the guard checked.
+    address = await resolve_public_url(url)
 
     current_url = url
     try:
-        async with AsyncSession() as session:
+        async with import_http.curl_session() as session:
             for _ in range(_MAX_REDIRECTS + 1):
-                response = await session.get(
-                    current_url,
-                    timeout=timeout,
-                    headers=request_headers,
-                    allow_redirects=False,
-                    impersonate=impersonate,
-                )
+                with import_http.curl_pinned(session, current_url, address):
+                    response = await session.get(
+                        current_url,
+                        timeout=timeout,
+                        headers=request_headers,
+                        allow_redirects=False,
+                        impersonate=impersonate,
+                    )
+                import_http.record_curl_response(response)
                 location = response.headers.get("location")
                 if (
                     follow_redirects
@@ -110,12 +163,12 @@ async def fetch_url(
                     and location
                 ):
                     current_url = urljoin(current_url, location)
-                    validate_public_url(current_url)
+                    address = await resolve_public_url(current_url)
                     continue
                 break
             else:
                 raise FetchError(f"Too many redirects for {url}")
-            response.raise_for_status()
+            response.raise_for_status()  # type: ignore[no-untyped-call]
     except RequestException as exc:
         status = getattr(getattr(exc, "response", None), "status_code", None)
         raise FetchError(str(exc), status_code=status) from exc
@@ -139,22 +192,25 @@ async def fetch_url(
 
 
 def import_fetch_http_error(exc: Exception) -> tuple[int, str]:
-    """Map a fetch/SSRF failure to an ``(HTTP status, user message)`` pair.
+    """Map a fetch/SSRF/parse failure to an ``(HTTP status, user message)`` pair.
 
     Used at the web import boundary so a fetch failure produces a friendly
     4xx/5xx response instead of an HTTP 500 that leaks the raw exception string.
 
     Args:
-        exc: The exception raised while fetching an import URL.
+        exc: The exception raised while fetching or parsing an import URL.
 
     Returns:
         A ``(status_code, detail)`` tuple with a user-facing message that does
         not echo the raw exception.
     """
+    from stricknani.importing.parsing import ParseTimeoutError
     from stricknani.importing.ssrf import SSRFError
 
     if isinstance(exc, SSRFError):
         return 400, "The URL is not allowed."
+    if isinstance(exc, ParseTimeoutError):
+        return 504, "The page took too long to process."
     if isinstance(exc, FetchError):
         status = exc.status_code
         if status is not None and 400 <= status < 500:
@@ -0,0 +1,235 @@
+"""On-disk cache for pattern page fetches.
+
+People re-import, preview and then import, or retry the same Garnstudio/DROPS
+page within minutes, and every attempt used to go back through Cloudflare to
+the origin. :func:`~stricknani.importing.fetch.fetch_url` callers that pass
+``cache=True`` keep successful responses here, in ``IMPORT_HTTP_CACHE_DIR``:
+
+* entries are keyed by URL plus the request headers and browser fingerprint
+  that shape the response, and bodies are stored gzip-compressed;
+* ``Cache-Control: max-age`` (or ``Expires``) decides how long an entry is
+  served without asking the origin; ``no-store`` and ``Vary: *`` responses are
+  not stored, ``no-cache`` ones are always revalidated;
+* stale entries are revalidated with ``If-None-Match`` / ``If-Modified-Since``,
+  and a ``304 Not Modified`` serves the stored body;
+* the least recently used entries are evicted once the cache grows beyond
+  ``IMPORT_HTTP_CACHE_MAX_BYTES``.
+
+The fetches carry no cookies or credentials, so the pages are the same for
+every user and one cache serves them all.
+"""
+
+from __future__ import annotations
+
+import email.utils
+import gzip
+import hashlib
+import json
+import logging
+import time
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+
+from stricknani.config import config
+from stricknani.importing.fetch import FetchResponse
+from stricknani.utils.disk_cache import DirectoryCache
+
+logger = logging.getLogger("stricknani.imports")
+
+# Response headers that are refreshed from a 304 (RFC 9111 section 4.3.4 asks
+# for all of them; these are the ones the cache or the importers look at).
+_REVALIDATED_HEADERS = ("cache-control", "date", "etag", "expires", "last-modified")
+
+
+@dataclass
+class CachedResponse:
+    """A stored response and how long it may be served without revalidating."""
+
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    encoding: str | None
+    content: bytes
+    fresh_until: float
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Whether the entry may be served without asking the origin."""
+        return (time.time() if now is None else now) < self.fresh_until
+
+    def to_response(self) -> FetchResponse:
+        """Return the entry as if it had just been fetched."""
+        return FetchResponse(
+            text=self.content.decode(self.encoding or "utf-8", errors="replace"),
+            content=self.content,
+            status_code=self.status_code,
+            headers=dict(self.headers),
+            encoding=self.encoding,
+        )
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers that ask the origin whether the entry changed."""
+        headers: dict[str, str] = {}
+        if etag := self.headers.get("etag"):
+            headers["If-None-Match"] = etag
+        if last_modified := self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+
+def _cache_control(headers: Mapping[str, str]) -> dict[str, str]:
+    directives: dict[str, str] = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip().strip('"')
+    return directives
+
+
+def freshness_lifetime(headers: Mapping[str, str], now: float) -> float | None:
+    """Return until when a response may be served from the cache.
+
+    Returns ``now`` for responses that must be revalidated before every use
+    and ``None`` for responses that must not be stored at all.
+    """
+    directives = _cache_control(headers)
+    if "no-store" in directives or headers.get("vary", "").strip() == "*":
+        return None
+    if "no-cache" in directives:
+        return now
+    if "max-age" in directives:
+        try:
+            max_age = int(directives["max-age"])
+            age = int(headers.get("age", "0"))
+        except ValueError:
+            return now
+        return now + max(0, max_age - age)
+    if expires := headers.get("expires"):
+        try:
+            return max(now, email.utils.parsedate_to_datetime(expires).timestamp())
+        except (TypeError, ValueError):
+            return now
+    return now
+
+
+def cache_key(
+    url: str,
+    headers: Mapping[str, str] | None,
+    *,
+    impersonate: str,
+    follow_redirects: bool,
+) -> str:
+    """Hash everything about a fetch that can change the response."""
+    parts = {
+        "url": url,
+        "headers": sorted(
+            (name.lower(), value) for name, value in (headers or {}).items()
+        ),
+        "impersonate": impersonate,
+        "follow_redirects": follow_redirects,
+    }
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+class HTTPCache(DirectoryCache):
+    """gzip-compressed responses in ``directory``, at most ``max_bytes`` of them.
+
+    Each entry is a ``<key>.json`` metadata file next to a ``<key>.gz`` body,
+    kept as :class:`~stricknani.utils.disk_cache.DirectoryCache` describes; an
+    unusable directory only costs the caching, the fetch goes on uncached.
+    """
+
+    name = "HTTP"
+    extra_suffixes = (".gz",)
+
+    async def load(self, key: str) -> CachedResponse | None:
+        """Return the entry for ``key``, or ``None`` if there is none."""
+        entry: CachedResponse | None = await self._in_thread("read", self._load, key)
+        return entry
+
+    async def store(
+        self, key: str, url: str, response: FetchResponse
+    ) -> CachedResponse | None:
+        """Store a fetched response for ``url`` if its headers allow it."""
+        headers = response.headers
+        now = time.time()
+        fresh_until = freshness_lifetime(headers, now)
+        if (
+            response.status_code != 200
+            or fresh_until is None
+            # Stale at once and impossible to revalidate: never useful.
+            or (
+                fresh_until <= now
+                and "etag" not in headers
+                and "last-modified" not in headers
+            )
+        ):
+            await self._in_thread("write", self._remove, key)
+            return None
+        entry = CachedResponse(
+            url=url,
+            status_code=response.status_code,
+            headers=dict(headers),
+            encoding=response.encoding,
+            content=response.content,
+            fresh_until=fresh_until,
+        )
+        return entry if await self._in_thread("write", self._save, key, entry) else None
+
+    async def revalidated(
+        self, key: str, entry: CachedResponse, headers: Mapping[str, str]
+    ) -> CachedResponse:
+        """Refresh ``entry`` from the headers of a ``304 Not Modified``."""
+        for name in _REVALIDATED_HEADERS:
+            if name in headers:
+                entry.headers[name] = headers[name]
+        fresh_until = freshness_lifetime(entry.headers, time.time())
+        if fresh_until is None:
+            await self._in_thread("write", self._remove, key)
+            return entry
+        entry.fresh_until = fresh_until
+        await self._in_thread("write", self._write_meta, key, entry)
+        return entry
+
+    def _load(self, key: str) -> CachedResponse | None:
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text())
+            content = gzip.decompress(body_path.read_bytes())
+        except (OSError, ValueError, EOFError):
+            return None
+        self._touch(key)
+        return CachedResponse(content=content, **meta)
+
+    def _save(self, key: str, entry: CachedResponse) -> bool:
+        body = gzip.compress(entry.content, compresslevel=6)
+        if len(body) > self.max_bytes:
+            return False
+        _, body_path = self._paths(key)
+        self._write(body_path, body)
+        self._write_meta(key, entry)
+        self._evict()
+        return True
+
+    def _write_meta(self, key: str, entry: CachedResponse) -> None:
+        meta = asdict(entry)
+        del meta["content"]
+        meta_path, _ = self._paths(key)
+        self._write(meta_path, json.dumps(meta).encode())
+
+
+def get_http_cache() -> HTTPCache | None:
+    """Return the configured cache, or ``None`` if it is disabled."""
+    if config.IMPORT_HTTP_CACHE_DIR is None or config.IMPORT_HTTP_CACHE_MAX_BYTES <= 0:
+        return None
+    return HTTPCache.shared(
+        config.IMPORT_HTTP_CACHE_DIR, max_bytes=config.IMPORT_HTTP_CACHE_MAX_BYTES
+    )
+
+
+__all__ = [
+    "CachedResponse",
+    "HTTPCache",
+    "cache_key",
+    "freshness_lifetime",
+    "get_http_cache",
+]
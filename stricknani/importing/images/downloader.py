@@ -6,14 +6,17 @@ validating them, deduplicating, and preparing them for storage.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 import httpx
 
+from stricknani.config import config
+from stricknani.importing.clients import import_http
 from stricknani.importing.images.constants import (
     IMPORT_IMAGE_HEADERS,
     IMPORT_IMAGE_MAX_BYTES,
@@ -31,7 +34,7 @@ from stricknani.importing.images.validator import (
     is_allowed_import_image,
     is_valid_import_url,
 )
-from stricknani.importing.ssrf import SSRFError, validate_public_url
+from stricknani.importing.ssrf import SSRFError, resolve_public_url
 
 if TYPE_CHECKING:
     from stricknani.utils.image_similarity import SimilarityImage
@@ -55,6 +58,16 @@ class DownloadedImage:
     similarity: SimilarityImage
 
 
+@dataclass
+class _FetchedImage:
+    """A downloaded, readable image awaiting the in-order dedup decisions."""
+
+    url: str
+    content: bytes
+    content_type: str | None
+    inspection: ImageInspectionResult
+
+
 @dataclass
 class ImageDownloadResult:
     """Result of a batch image download operation."""
@@ -69,6 +82,60 @@ class ImageDownloadResult:
         return len(self.images)
 
 
+class _FetchWindow:
+    """Downloads running ahead of the in-order consumer of a batch.
+
+    At most ``downloader.concurrency`` downloads are started and not yet taken,
+    the one being awaited included: a new URL is started only when the
+    consumer takes one, so downloads never get further ahead of it than that,
+    and none start once the consumer stops taking. At most
+    ``per_host_concurrency`` of them run against one host.
+    """
+
+    def __init__(
+        self,
+        downloader: ImageDownloader,
+        client: httpx.AsyncClient,
+        image_urls: Sequence[str],
+    ) -> None:
+        self._downloader = downloader
+        self._client = client
+        self._urls = image_urls
+        self._next = 0
+        self._tasks: dict[int, asyncio.Task[_FetchedImage | None]] = {}
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+
+    def take(self, index: int) -> asyncio.Task[_FetchedImage | None] | None:
+        """Return the download of URL ``index`` (``None`` if it is invalid).
+
+        URLs must be taken in order.
+        """
+        while self._next < len(self._urls) and (
+            len(self._tasks) < self._downloader.concurrency or self._next <= index
+        ):
+            url = self._urls[self._next]
+            if is_valid_import_url(url):
+                self._tasks[self._next] = asyncio.create_task(self._fetch(url))
+            self._next += 1
+        return self._tasks.pop(index, None)
+
+    async def close(self) -> None:
+        """Cancel the downloads that were started but not taken."""
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch(self, url: str) -> _FetchedImage | None:
+        host = (urlsplit(url).hostname or "").lower()
+        host_slot = self._host_slots.setdefault(
+            host, asyncio.Semaphore(self._downloader.per_host_concurrency)
+        )
+        async with host_slot:
+            return await self._downloader._fetch_image(self._client, url)
+
+
 class ImageDownloader:
     """Downloads and validates images from URLs with deduplication.
 
@@ -81,6 +148,12 @@ class ImageDownloader:
     - Similarity-based deduplication (SSIM)
     - Thumbnail detection
 
+    Images are downloaded and inspected concurrently (at most ``concurrency``
+    ahead of the image being accepted, ``per_host_concurrency`` per host),
+    but accepted, deduplicated
+    and replaced in the order the URLs were given, so the result is the same
+    as downloading them one after another.
+
     Example:
         downloader = ImageDownloader(referer="https://example.com")
         result = await downloader.download_images(
@@ -98,6 +171,8 @@ class ImageDownloader:
         timeout: int = IMPORT_IMAGE_TIMEOUT,
         max_bytes: int = IMPORT_IMAGE_MAX_BYTES,
         max_count: int = IMPORT_IMAGE_MAX_COUNT,
+        concurrency: int | None = None,
+        per_host_concurrency: int | None = None,
     ) -> None:
         """Initialize the downloader.
 
@@ -106,11 +181,19 @@ class ImageDownloader:
             timeout: HTTP request timeout in seconds
             max_bytes: Maximum image size in bytes
             max_count: Maximum number of images to download
+            concurrency: Max simultaneous downloads per batch
+                (defaults to ``IMPORT_IMAGE_CONCURRENCY``)
+            per_host_concurrency: Max simultaneous downloads from one host
+                (defaults to ``IMPORT_IMAGE_PER_HOST_CONCURRENCY``)
         """
         self.referer = referer
         self.timeout = timeout
         self.max_bytes = max_bytes
         self.max_count = max_count
+        self.concurrency = max(1, concurrency or config.IMPORT_IMAGE_CONCURRENCY)
+        self.per_host_concurrency = max(
+            1, per_host_concurrency or config.IMPORT_IMAGE_PER_HOST_CONCURRENCY
+        )
         self._headers = dict(IMPORT_IMAGE_HEADERS)
         if referer:
             self._headers["Referer"] = referer
@@ -142,51 +225,56 @@ class ImageDownloader:
         checksums = existing_checksums or set()
         similarities = list(existing_similarities or [])
 
-        # Redirects are followed manually (see :meth:`_fetch_with_guard`) so the
-        # SSRF guard can re-validate every hop; disable httpx's own handling.
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
-            follow_redirects=False,
-            headers=self._headers,
-        ) as client:
-            for url in image_urls:
-                if result.count >= max_images:
-                    break
-
-                if not is_valid_import_url(url):
-                    result.skipped.append((url, "invalid URL"))
-                    continue
+        # The shared client does not follow redirects: _fetch_with_guard does,
+        # so the SSRF guard can re-validate every hop.
+        async with import_http.httpx_client() as client:
+            window = _FetchWindow(self, client, image_urls)
+            try:
+                for index, url in enumerate(image_urls):
+                    # Stop starting downloads once enough images are in; the
+                    # few still in flight are cancelled on the way out.
+                    if result.count >= max_images:
+                        break
 
-                try:
-                    downloaded, removed = await self._download_single(
-                        client,
-                        url,
-                        checksums,
-                        seen_checksums,
-                        similarities,
-                        accepted_images,
-                    )
-
-                    if downloaded:
-                        for removed_image in removed:
-                            if removed_image in accepted_images:
-                                accepted_images.remove(removed_image)
-                            if removed_image in result.images:
-                                result.images.remove(removed_image)
-
-                        accepted_images.append(downloaded)
-                        result.images.append(downloaded)
-                        seen_checksums.add(downloaded.inspection.checksum)
-
-                except SSRFError as exc:
-                    logger.debug("Blocked SSRF image URL %s: %s", url, exc)
-                    result.skipped.append((url, "blocked host"))
-                    continue
+                    fetch = window.take(index)
+                    if fetch is None:
+                        result.skipped.append((url, "invalid URL"))
+                        continue
+
+                    try:
+                        fetched = await fetch
+                        if fetched is None:
+                            continue
+                        downloaded, removed = self._accept(
+                            fetched,
+                            checksums,
+                            seen_checksums,
+                            similarities,
+                            accepted_images,
+                        )
 
-                except Exception as exc:
-                    error_msg = str(exc)
-                    logger.debug("Failed to download image %s: %s", url, error_msg)
-                    result.errors.append((url, error_msg))
+                        if downloaded:
+                            for removed_image in removed:
+                                if removed_image in accepted_images:
+                                    accepted_images.remove(removed_image)
+                                if removed_image in result.images:
+                                    result.images.remove(removed_image)
+
+                            accepted_images.append(downloaded)
+                            result.images.append(downloaded)
+                            seen_checksums.add(downloaded.inspection.checksum)
+
+                    except SSRFError as exc:
+                        logger.debug("Blocked SSRF image URL %s: %s", url, exc)
+                        result.skipped.append((url, "blocked host"))
+                        continue
+
+                    except Exception as exc:
+                        error_msg = str(exc)
+                        logger.debug("Failed to download image %s: %s", url, error_msg)
+                        result.errors.append((url, error_msg))
+            finally:
+                await window.close()
 
         return result
 
@@ -201,7 +289,7 @@ class ImageDownloader:
 
         httpx's automatic redirect handling would connect to a redirect target
         before we could inspect it, so redirects are followed here and every hop
-        is re-validated through :func:`validate_public_url`.
+        is re-validated through :func:`resolve_public_url`.
 
         Raises:
             SSRFError: If the URL or a redirect target resolves to a
@@ -210,8 +298,10 @@ class ImageDownloader:
         """
         current_url = url
         for _ in range(_MAX_REDIRECTS + 1):
-            validate_public_url(current_url)
-            async with client.stream("GET", current_url) as response:
+            await resolve_public_url(current_url)
+            async with client.stream(
+                "GET", current_url, headers=self._headers, timeout=self.timeout
+            ) as response:
                 location = response.headers.get("location")
                 if response.status_code in _REDIRECT_STATUSES and location:
                     current_url = urljoin(current_url, location)
@@ -248,19 +338,17 @@ class ImageDownloader:
                 )
         raise httpx.HTTPError(f"Too many redirects for {url}")
 
-    async def _download_single(
-        self,
-        client: httpx.AsyncClient,
-        url: str,
-        existing_checksums: set[str],
-        seen_checksums: set[str],
-        existing_similarities: Sequence[SimilarityImage],
-        accepted_images: list[DownloadedImage],
-    ) -> tuple[DownloadedImage | None, list[DownloadedImage]]:
-        """Download and validate a single image.
+    async def _fetch_image(
+        self, client: httpx.AsyncClient, url: str
+    ) -> _FetchedImage | None:
+        """Download, validate and inspect a single image.
+
+        Only looks at the image itself, so it can run concurrently with the
+        rest of the batch; see :meth:`_accept` for the decisions that depend
+        on earlier images.
 
         Returns:
-            DownloadedImage if successful, None if skipped/failed
+            The inspected image, or None if skipped/failed
         """
         # Download (SSRF guard + manual redirect handling in _fetch_with_guard).
         try:
@@ -270,13 +358,13 @@ class ImageDownloader:
             response.raise_for_status()
         except httpx.HTTPError as exc:
             logger.debug("HTTP error for %s: %s", url, exc)
-            return None, []
+            return None
 
         # Check content type
         content_type = response.headers.get("content-type")
         if not is_allowed_import_image(content_type, url):
             logger.debug("Skipping non-image URL: %s", url)
-            return None, []
+            return None
 
         # Check content length header
         content_length = response.headers.get("content-length")
@@ -284,24 +372,48 @@ class ImageDownloader:
             try:
                 if int(content_length) > self.max_bytes:
                     logger.debug("Skipping large image %s (header)", url)
-                    return None, []
+                    return None
             except ValueError:
                 pass
 
         # Check content
         if not response.content:
             logger.debug("Skipping empty image response: %s", url)
-            return None, []
+            return None
 
         if len(response.content) > self.max_bytes:
             logger.debug("Skipping large image %s (content)", url)
-            return None, []
+            return None
 
         # Inspect image
         inspection = await async_inspect_image_content(response.content)
         if inspection is None:
             logger.debug("Skipping unreadable or too small image: %s", url)
-            return None, []
+            return None
+
+        return _FetchedImage(
+            url=url,
+            content=response.content,
+            content_type=content_type,
+            inspection=inspection,
+        )
+
+    def _accept(
+        self,
+        fetched: _FetchedImage,
+        existing_checksums: set[str],
+        seen_checksums: set[str],
+        existing_similarities: Sequence[SimilarityImage],
+        accepted_images: list[DownloadedImage],
+    ) -> tuple[DownloadedImage | None, list[DownloadedImage]]:
+        """Apply dedup and thumbnail decisions against the images so far.
+
+        Returns:
+            The accepted image (None if skipped) and the previously accepted
+            thumbnails it supersedes
+        """
+        url = fetched.url
+        inspection = fetched.inspection
 
         # Check checksum duplicates
         if is_duplicate_by_checksum(inspection.checksum, existing_checksums):
@@ -346,8 +458,8 @@ class ImageDownloader:
         return (
             DownloadedImage(
                 url=url,
-                content=response.content,
-                content_type=content_type,
+                content=fetched.content,
+                content_type=fetched.content_type,
                 inspection=inspection,
                 similarity=inspection.similarity,
             ),
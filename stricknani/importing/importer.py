@@ -13,6 +13,8 @@ from urllib.parse import parse_qs, urljoin, urlparse
 from bs4 import BeautifulSoup
 from bs4.element import AttributeValueList, NavigableString, PageElement, Tag
 
+from stricknani.importing.dom import DocumentIndex, parse_html
+
 if TYPE_CHECKING:
     from stricknani.utils.image_similarity import SimilarityImage
 
@@ -90,9 +92,20 @@ class PatternImporter:
         self.is_garnstudio = is_garnstudio_url(url)
         self._garnstudio_gauge_cache: tuple[int | None, int | None] | None = None
         self._last_soup: BeautifulSoup | None = None
+        self._dom: DocumentIndex | None = None
+
+    def _index(self, soup: Tag) -> DocumentIndex:
+        """Return the :class:`DocumentIndex` of ``soup``, built on first use."""
+        if self._dom is None or self._dom.root is not soup:
+            self._dom = DocumentIndex(soup)
+        return self._dom
 
     async def fetch_and_parse(self, image_limit: int = 10) -> dict[str, Any]:
-        """Fetch URL and extract pattern data."""
+        """Fetch URL and extract pattern data.
+
+        The extraction itself runs in the parse worker pool (see
+        :mod:`stricknani.importing.parsing`).
+        """
         logger.info("Importing pattern from %s", self.url)
         # Use curl_cffi (via fetch_url) with a browser TLS fingerprint. Plain
         # httpx is blocked by Cloudflare bot management on garnstudio.com
@@ -103,6 +116,7 @@ class PatternImporter:
             self.url,
             timeout=self.timeout,
             follow_redirects=True,
+            cache=True,
             headers={
                 "Accept": (
                     "text/html,application/xhtml+xml,application/xml;"
@@ -118,8 +132,17 @@ class PatternImporter:
             response.headers.get("content-type", ""),
         )
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        from stricknani.importing.parsing import parse_pool
+
+        return await parse_pool.run(
+            extract_pattern, type(self), self.url, response.text, image_limit
+        )
+
+    def extract(self, html: str, image_limit: int = 10) -> dict[str, Any]:
+        """Extract pattern data from the fetched page ``html``."""
+        soup = parse_html(html)
         self._last_soup = soup
+        dom = self._index(soup)
 
         yarn_text = self._extract_yarn(soup)
         yarn_details = None
@@ -195,9 +218,8 @@ class PatternImporter:
                 "#yarn-patterns",
                 ".feature-cats",
             ]
-            for selector in noise_selectors:
-                for noise in soup.select(selector):
-                    noise.decompose()
+            for noise in dom.select(", ".join(noise_selectors)):
+                dom.decompose(noise)
 
             # Remove sections by heading
             noise_keywords = [
@@ -216,7 +238,10 @@ class PatternImporter:
                 "andere qualitäten",
                 "other qualities",
             ]
-            for heading in soup.find_all(["h2", "h3", "h4", "h5", "p"]):
+            for heading in dom.find_all(["h2", "h3", "h4", "h5", "p"]):
+                # Removing an earlier heading's row may have taken this one.
+                if dom.is_removed(heading):
+                    continue
                 if heading.name == "p" and not heading.find("strong"):
                     continue
 
@@ -231,10 +256,10 @@ class PatternImporter:
                         if nxt and (
                             nxt.select(".img-rel") or nxt.select(".ratio-16-9")
                         ):
-                            nxt.decompose()
-                        parent.decompose()
+                            dom.decompose(nxt)
+                        dom.decompose(parent)
                     else:
-                        heading.decompose()
+                        dom.decompose(heading)
 
         steps = self._extract_steps(soup)
         images = self._extract_images(soup)
@@ -245,7 +270,7 @@ class PatternImporter:
                 # 1. Subtitle from <title> tag
                 # e.g. DROPS Kid-Silk - Eine wunderbare Mischung aus Kid Mohair und
                 # Seide
-                title_tag = soup.find("title")
+                title_tag = dom.find("title")
                 if title_tag:
                     title_text = title_tag.get_text()
                     if " - " in title_text:
@@ -258,8 +283,8 @@ class PatternImporter:
                     description_parts.append(specs)
 
                 # 3. "About this yarn" section
-                about_container = soup.select_one("#about") or soup.select_one(
-                    ".yarn-description"
+                about_container = dom.find(id="about") or dom.find(
+                    class_="yarn-description"
                 )
                 if about_container:
                     import trafilatura
@@ -278,7 +303,7 @@ class PatternImporter:
                     description = "\n\n".join(description_parts)
             else:
                 # For patterns, try to get the subtitle from the <title> tag
-                title_tag = soup.find("title")
+                title_tag = dom.find("title")
                 if title_tag:
                     title_text = title_tag.get_text()
                     if " - " in title_text:
@@ -366,11 +391,12 @@ class PatternImporter:
     def _extract_title(self, soup: BeautifulSoup) -> str | None:
         """Extract pattern title or yarn name."""
         # Try various title patterns
+        dom = self._index(soup)
         patterns = [
-            soup.find("h1", class_=re.compile(r"pattern|title|name", re.I)),
-            soup.find("h1"),
-            soup.find("meta", property="og:title"),
-            soup.find("title"),
+            dom.find("h1", class_=re.compile(r"pattern|title|name", re.I)),
+            dom.find("h1"),
+            dom.find("meta", attrs={"property": "og:title"}),
+            dom.find("title"),
         ]
 
         title = None
@@ -448,7 +474,7 @@ class PatternImporter:
             r"(US\s*\d+)",
         ]
 
-        text = soup.get_text()
+        text = self._index(soup).text()
         for pattern in patterns:
             match = re.search(pattern, text, re.I)
             if match:
@@ -456,12 +482,17 @@ class PatternImporter:
 
         return None
 
+    def _garnstudio_material(self, soup: BeautifulSoup) -> Tag | None:
+        """Return the material block (yarn, needles, notions) of a pattern."""
+        dom = self._index(soup)
+        return dom.find(id=re.compile(r"material_text(_print)?")) or dom.find(
+            class_="pattern-material"
+        )
+
     def _extract_garnstudio_needles_from_material(
         self, soup: BeautifulSoup
     ) -> str | None:
-        material = soup.find(id=re.compile(r"material_text(_print)?"))
-        if not material:
-            material = soup.select_one(".pattern-material")
+        material = self._garnstudio_material(soup)
         if not material:
             return None
 
@@ -521,7 +552,7 @@ class PatternImporter:
             r"material[s]?\s*[:：]\s*([^\n]+)",
         ]
 
-        text = soup.get_text()
+        text = self._index(soup).text()
         yarn_text = None
         for pattern in patterns:
             match = re.search(pattern, text, re.I)
@@ -672,7 +703,7 @@ class PatternImporter:
         patterns = [
             r"(?:brand|manufacturer|hersteller|marke)\s*[:：]\s*([^\n<]+)",
         ]
-        text = soup.get_text()
+        text = self._index(soup).text()
         for pattern in patterns:
             match = re.search(pattern, text, re.I)
             if match:
@@ -681,7 +712,7 @@ class PatternImporter:
                     return res
 
         # 3. Try meta
-        meta_brand = soup.find("meta", property="product:brand")
+        meta_brand = self._index(soup).find("meta", attrs={"property": "product:brand"})
         if meta_brand:
             content = meta_brand.get("content")
             if isinstance(content, str) and not self._is_ui_text(content):
@@ -707,7 +738,7 @@ class PatternImporter:
             r"(?:fiber content|composition|zusammensetzung|material)"
             r"\s*[:：]\s*([^\n<]+)",
         ]
-        text = soup.get_text()
+        text = self._index(soup).text()
         for pattern in patterns:
             match = re.search(pattern, text, re.I)
             if match:
@@ -725,7 +756,7 @@ class PatternImporter:
         patterns = [
             r"(?:colorway|color|farbe|farbbezeichnung)\s*[:：]\s*([^\n<]+)",
         ]
-        text = soup.get_text()
+        text = self._index(soup).text()
         for pattern in patterns:
             match = re.search(pattern, text, re.I)
             if match:
@@ -762,7 +793,7 @@ class PatternImporter:
             if match:
                 return int(match.group(1))
 
-        text = soup.get_text()
+        text = self._index(soup).text()
 
         # Look for patterns like "300m / 100g" or "300m pro 100g"
         complex_patterns = [
@@ -810,7 +841,7 @@ class PatternImporter:
             if match:
                 return int(match.group(1))
 
-        text = soup.get_text()
+        text = self._index(soup).text()
 
         # Look for patterns like "300m / 100g"
         complex_patterns = [
@@ -870,7 +901,8 @@ class PatternImporter:
     def _find_info_by_label(self, soup: BeautifulSoup, labels: list[str]) -> str | None:
         """Find value associated with labels in the page text/structure."""
         # 1. Search for Label: Value in flat text
-        text = soup.get_text(separator="\n", strip=True)
+        dom = self._index(soup)
+        text = dom.text("\n", strip=True)
         for label in labels:
             # Match label at start of line optionally followed by colon
             # and then capture until end of line
@@ -884,16 +916,14 @@ class PatternImporter:
         # 2. Search for Label followed by Value in DT/DD or Tables or next siblings
         for label in labels:
             # Find element containing label precisely
-            # Use a closure to capture the current label for the lambda
-            def _match_tag(t: Any, lbl: str = label) -> bool:
-                return (
-                    t.name in ["th", "td", "dt", "span", "div", "b", "strong", "label"]
-                    and lbl.lower() == t.get_text().strip().rstrip(":").lower()
-                )
-
-            target = soup.find(_match_tag)
-            if not target:
+            matches = dom.find_by_text(
+                [label.lower()],
+                ["th", "td", "dt", "span", "div", "b", "strong", "label"],
+                strip_colon=True,
+            )
+            if not matches:
                 continue
+            target = matches[0]
 
             # If it's a TH/TD, look for next TD
             if target.name == "th":
@@ -945,75 +975,74 @@ class PatternImporter:
 
         headings = ["maschenprobe", "gauge", "stitch sample", "tension"]
 
-        for heading_tag in soup.find_all(
-            ["h1", "h2", "h3", "h4", "h5", "h6", "strong", "span", "b", "div"]
+        for heading_tag in self._index(soup).find_by_text(
+            headings,
+            ["h1", "h2", "h3", "h4", "h5", "h6", "strong", "span", "b", "div"],
+            strip_colon=True,
         ):
-            h_text = heading_tag.get_text().strip().lower().rstrip(":")
-            if any(h_text == h for h in headings):
-                # 1. Start collecting from siblings
-                collected: list[str] = []
-                curr: PageElement = heading_tag
-                for _ in range(25):
-                    nxt = curr.next_sibling
-                    if not nxt:
-                        # Move up to parent's sibling if it's an inline container
-                        if (
-                            curr.parent
-                            and isinstance(curr.parent, Tag)
-                            and curr.parent.name in ["span", "b", "strong", "i", "a"]
-                            and curr.parent != soup
-                        ):
-                            curr = curr.parent
-                            continue
+            # 1. Start collecting from siblings
+            collected: list[str] = []
+            curr: PageElement = heading_tag
+            for _ in range(25):
+                nxt = curr.next_sibling
+                if not nxt:
+                    # Move up to parent's sibling if it's an inline container
+                    if (
+                        curr.parent
+                        and isinstance(curr.parent, Tag)
+                        and curr.parent.name in ["span", "b", "strong", "i", "a"]
+                        and curr.parent != soup
+                    ):
+                        curr = curr.parent
+                        continue
+                    break
+
+                curr = nxt
+                text = ""
+                is_hard_block = False
+                if isinstance(nxt, NavigableString):
+                    text = str(nxt).strip()
+                elif isinstance(nxt, Tag):
+                    # Stop if we hit another real heading
+                    if nxt.name in ["h1", "h2", "h3", "h4", "h5", "h6", "h7"]:
                         break
 
-                    curr = nxt
-                    text = ""
-                    is_hard_block = False
-                    if isinstance(nxt, NavigableString):
-                        text = str(nxt).strip()
-                    elif isinstance(nxt, Tag):
-                        # Stop if we hit another real heading
-                        if nxt.name in ["h1", "h2", "h3", "h4", "h5", "h6", "h7"]:
-                            break
+                    text = nxt.get_text(" ", strip=True)
+                    is_hard_block = nxt.name in [
+                        "p",
+                        "div",
+                        "section",
+                        "article",
+                        "hr",
+                    ]
 
-                        text = nxt.get_text(" ", strip=True)
-                        is_hard_block = nxt.name in [
-                            "p",
-                            "div",
-                            "section",
-                            "article",
-                            "hr",
-                        ]
-
-                    if not text:
-                        if isinstance(nxt, Tag) and nxt.name == "br":
-                            # We allow crossing one or two BRs
-                            continue
+                if not text:
+                    if isinstance(nxt, Tag) and nxt.name == "br":
+                        # We allow crossing one or two BRs
                         continue
+                    continue
 
-                    # If it's a known other heading, stop
-                    lower_text = text.lower()
-                    if any(
-                        h in lower_text
-                        for h in ["anleitung", "material", "nadeln", "size"]
-                    ):
-                        break
+                # If it's a known other heading, stop
+                lower_text = text.lower()
+                if any(
+                    h in lower_text for h in ["anleitung", "material", "nadeln", "size"]
+                ):
+                    break
 
-                    # If we encounter a hard block and we already have gauge info, stop.
-                    if is_hard_block:
-                        current_combined = " ".join(collected)
-                        if self._looks_like_stitch_sample(current_combined):
-                            break
+                # If we encounter a hard block and we already have gauge info, stop.
+                if is_hard_block:
+                    current_combined = " ".join(collected)
+                    if self._looks_like_stitch_sample(current_combined):
+                        break
 
-                    collected.append(text)
+                collected.append(text)
 
-                if collected:
-                    combined = " ".join(collected).strip()
-                    # Clean up multiple spaces
-                    combined = " ".join(combined.split())
-                    if self._looks_like_stitch_sample(combined):
-                        return combined
+            if collected:
+                combined = " ".join(collected).strip()
+                # Clean up multiple spaces
+                combined = " ".join(combined.split())
+                if self._looks_like_stitch_sample(combined):
+                    return combined
 
         # 3. Fallback to label search
         val = self._find_info_by_label(soup, headings)
@@ -1055,27 +1084,27 @@ class PatternImporter:
             "product description",
             "über das produkt",
         ]
-        for heading_tag in soup.find_all(
-            ["h1", "h2", "h3", "h4", "h5", "h6", "strong", "span"]
+        dom = self._index(soup)
+        for heading_tag in dom.find_by_text(
+            description_headings,
+            ["h1", "h2", "h3", "h4", "h5", "h6", "strong", "span"],
         ):
-            h_text = heading_tag.get_text().strip().lower()
-            if any(h_text == h for h in description_headings):
-                # Try to find the next meaningful sibling
-                curr = heading_tag
-                # Go up a few levels if needed to find siblings
-                for _ in range(3):
-                    next_node = curr.find_next_sibling(["div", "p", "section"])
-                    if next_node:
-                        text = next_node.get_text("\n", strip=True)
-                        if len(text) > 100:
-                            return text
-                    # If no direct sibling, look at children of parent
-                    if curr.parent:
-                        curr = curr.parent
+            # Try to find the next meaningful sibling
+            curr = heading_tag
+            # Go up a few levels if needed to find siblings
+            for _ in range(3):
+                next_node = curr.find_next_sibling(["div", "p", "section"])
+                if next_node:
+                    text = next_node.get_text("\n", strip=True)
+                    if len(text) > 100:
+                        return text
+                # If no direct sibling, look at children of parent
+                if curr.parent:
+                    curr = curr.parent
 
         # Try meta description next - but ONLY if it looks complete
-        meta_desc = soup.find("meta", {"name": "description"}) or soup.find(
-            "meta", property="og:description"
+        meta_desc = dom.find("meta", attrs={"name": "description"}) or dom.find(
+            "meta", attrs={"property": "og:description"}
         )
         if meta_desc:
             content = meta_desc.get("content")
@@ -1090,9 +1119,9 @@ class PatternImporter:
         # Try first long paragraph in article or main content
         # Prioritize specific IDs and classes first
         for tag in ["div", "section", "article", "main"]:
-            container = soup.find(
+            container = dom.find(
                 tag, id=re.compile(r"about|description", re.I)
-            ) or soup.find(
+            ) or dom.find(
                 tag, class_=re.compile(r"yarn-description|product-info", re.I)
             )
 
@@ -1105,7 +1134,7 @@ class PatternImporter:
 
         # Fallback to more generic containers
         for tag in ["article", "main", "div", "section"]:
-            container = soup.find(
+            container = dom.find(
                 tag,
                 class_=re.compile(r"description|content", re.I),
             )
@@ -1150,7 +1179,7 @@ class PatternImporter:
                     return weight.upper()
 
         # Look for explicit labels
-        text = soup.get_text(separator=" ", strip=True)
+        text = self._index(soup).text(" ", strip=True)
         patterns = [
             r"(?:garnstärke|yarn\s*weight|weight|category)\s*[:：]?\s*(\b[a-z0-9-]{1,15}\b)",
         ]
@@ -1206,7 +1235,7 @@ class PatternImporter:
         ]
 
         # Garnstudio typically uses <strong>Label:</strong> Value
-        for p in soup.find_all("p"):
+        for p in self._index(soup).find_all("p"):
             strongs = p.find_all("strong")
             if not strongs:
                 continue
@@ -1250,7 +1279,7 @@ class PatternImporter:
         if self._garnstudio_gauge_cache is not None:
             return self._garnstudio_gauge_cache
 
-        text = soup.get_text(separator=" ", strip=True)
+        text = self._index(soup).text(" ", strip=True)
         patterns = [
             r"(\d+)\s*(?:m|maschen)\s*[x×]\s*(\d+)\s*(?:r|reihen)\s*=\s*10\s*(?:x\s*10\s*)?cm",
             r"(\d+)\s*sts?\s*[x×]\s*(\d+)\s*rows?\s*=\s*10\s*(?:x\s*10\s*)?cm",
@@ -1428,19 +1457,20 @@ class PatternImporter:
                 return steps
 
         # Look for numbered lists or instruction sections
+        dom = self._index(soup)
         candidates = [
             # Specific ID/Class matches first (Garnstudio uses pattern-instructions)
-            soup.find(["div", "section"], class_="pattern-instructions"),
-            soup.find(["div", "section"], class_="instructions"),
-            soup.find(["div", "section"], id="instructions"),
-            soup.find(["div", "section"], id="pattern-instructions"),
+            dom.find(["div", "section"], class_="pattern-instructions"),
+            dom.find(["div", "section"], class_="instructions"),
+            dom.find(["div", "section"], id="instructions"),
+            dom.find(["div", "section"], id="pattern-instructions"),
             # Regex matches (stricter)
-            soup.find(["div", "section"], class_=re.compile(r"instruction(s)?$", re.I)),
-            soup.find(["div", "section"], id=re.compile(r"pattern[_-]?text", re.I)),
-            soup.find(["div", "section"], class_=re.compile(r"pattern[_-]?text", re.I)),
+            dom.find(["div", "section"], class_=re.compile(r"instruction(s)?$", re.I)),
+            dom.find(["div", "section"], id=re.compile(r"pattern[_-]?text", re.I)),
+            dom.find(["div", "section"], class_=re.compile(r"pattern[_-]?text", re.I)),
             # Fallbacks
-            soup.find("article"),
-            soup.find("main"),
+            dom.find("article"),
+            dom.find("main"),
         ]
 
         for instructions_section in [c for c in candidates if c]:
@@ -1993,7 +2023,8 @@ class PatternImporter:
                             return True
             return False
 
-        meta_image = soup.find("meta", property="og:image")
+        dom = self._index(soup)
+        meta_image = dom.find("meta", attrs={"property": "og:image"})
         if meta_image:
             content = meta_image.get("content")
             if isinstance(content, str):
@@ -2002,7 +2033,7 @@ class PatternImporter:
                     extracted.append((resolved, meta_image))
                     seen.add(resolved)
 
-        for source in soup.find_all("source"):
+        for source in dom.find_all("source"):
             if _is_related_pattern(source):
                 continue
             for attr in ["srcset", "data-srcset"]:
@@ -2019,7 +2050,7 @@ class PatternImporter:
                 seen.add(resolved)
 
         # Skip common non-pattern images
-        for img in soup.find_all("img"):
+        for img in dom.find_all("img"):
             if _is_related_pattern(img):
                 continue
             candidates: list[str] = []
@@ -2078,9 +2109,10 @@ class PatternImporter:
 
         if self.is_garnstudio:
             # Check for fancybox/lightbox links which often hold diagrams
-            for anchor in soup.find_all(
-                "a", class_=lambda x: x and "fancybox" in str(x)
-            ):
+            anchors = dom.find_all("a")
+            for anchor in [
+                a for a in anchors if "fancybox" in " ".join(a.get("class") or [])
+            ]:
                 if _is_related_pattern(anchor):
                     continue
                 href = anchor.get("href")
@@ -2099,7 +2131,7 @@ class PatternImporter:
                         extracted.append((resolved, anchor))
                         seen.add(resolved)
 
-            for anchor in soup.find_all("a"):
+            for anchor in anchors:
                 if _is_related_pattern(anchor):
                     continue
                 href = anchor.get("href")
@@ -2382,7 +2414,9 @@ class PatternImporter:
         yarn_data: dict[str, dict[str, str]] = {}
 
         # Look for all yarn links
-        for a in soup.find_all("a", href=re.compile(r"yarn\.php")):
+        for a in self._index(soup).find_all(
+            "a", attrs={"href": re.compile(r"yarn\.php")}
+        ):
             href_raw = a.get("href")
             if not href_raw:
                 continue
@@ -2525,9 +2559,7 @@ class PatternImporter:
 
     def _extract_garnstudio_yarn(self, soup: BeautifulSoup) -> str | None:
         """Extract yarn list from Garnstudio pattern."""
-        material = soup.find(id=re.compile(r"material_text(_print)?"))
-        if not material:
-            material = soup.select_one(".pattern-material")
+        material = self._garnstudio_material(soup)
 
         if not material:
             return None
@@ -2634,9 +2666,7 @@ class PatternImporter:
 
     def _extract_garnstudio_other_materials(self, soup: BeautifulSoup) -> str | None:
         """Extract buttons and other notions from Garnstudio material block."""
-        material = soup.find(id=re.compile(r"material_text(_print)?"))
-        if not material:
-            material = soup.select_one(".pattern-material")
+        material = self._garnstudio_material(soup)
 
         if not material:
             return None
@@ -2724,7 +2754,15 @@ class PatternImporter:
         return "\n".join(notions).strip() or None
 
     def _extract_garnstudio_text(self, soup: BeautifulSoup) -> str:
-        """Extract clean text from Garnstudio pattern page using trafilatura."""
+        """Extract clean text from Garnstudio pattern page using trafilatura.
+
+        Notes, steps and every heading lookup start from this text, so it is
+        extracted once and reused until the page changes.
+        """
+        dom = self._index(soup)
+        return dom.memo("garnstudio_text", lambda: self._garnstudio_text(dom))
+
+    def _garnstudio_text(self, dom: DocumentIndex) -> str:
         import trafilatura
 
         # Targeted noise removal before trafilatura
@@ -2751,17 +2789,17 @@ class PatternImporter:
             ".sn",
             "script",
         ]
-        for noise in soup.select(", ".join(noise_selectors)):
-            noise.decompose()
+        for noise in dom.select(", ".join(noise_selectors)):
+            dom.decompose(noise)
 
         # Garnstudio has content in these IDs/classes
         # #material_text contains GRÖSSE, GARN, NADELN, MASCHENPROBE
         # #instruction_text contains technical notes and the actual pattern
         # #about contains yarn description on yarn pages
-        material = soup.find(id=re.compile(r"material_text(_print)?"))
-        instruction = soup.find(id=re.compile(r"instruction_text(_print)?"))
-        about = soup.select_one("#about")
-        yarn_desc = soup.select_one(".yarn-description")
+        material = dom.find(id=re.compile(r"material_text(_print)?"))
+        instruction = dom.find(id=re.compile(r"instruction_text(_print)?"))
+        about = dom.find(id="about")
+        yarn_desc = dom.find(class_="yarn-description")
 
         parts = []
         if material:
@@ -2809,7 +2847,7 @@ class PatternImporter:
             return "\n\n".join(parts)
 
         # Ultimate fallback
-        return trafilatura.extract(soup.decode(), include_comments=False) or ""
+        return trafilatura.extract(dom.root.decode(), include_comments=False) or ""
 
 
 class GarnstudioPatternImporter(PatternImporter):
@@ -2819,10 +2857,10 @@ class GarnstudioPatternImporter(PatternImporter):
         super().__init__(url, timeout)
         self.is_garnstudio = True
 
-    async def fetch_and_parse(self, image_limit: int = 10) -> dict[str, Any]:
-        """Fetch URL and extract data with Garnstudio post-processing."""
+    def extract(self, html: str, image_limit: int = 10) -> dict[str, Any]:
+        """Extract data with Garnstudio post-processing."""
         # Use -1 to get all images for diagram extraction
-        data = await super().fetch_and_parse(image_limit=-1)
+        data = super().extract(html, image_limit=-1)
 
         # Identify diagrams in image_urls
         diagrams = [
@@ -2911,7 +2949,7 @@ class GarnstudioPatternImporter(PatternImporter):
         if soup is None:
             return None, []
 
-        table = soup.find("table", id="diag_symbols")
+        table = self._index(soup).find("table", id="diag_symbols")
         if not table:
             return None, []
 
@@ -3002,3 +3040,14 @@ class GarnstudioPatternImporter(PatternImporter):
                 lines.append(f"- {label}")
 
         return "\n".join(lines).strip()
+
+
+def extract_pattern(
+    importer_cls: type[PatternImporter], url: str, html: str, image_limit: int
+) -> dict[str, Any]:
+    """Extract pattern data from a fetched page with a fresh ``importer_cls``.
+
+    The parse worker pool entry point for :meth:`PatternImporter.fetch_and_parse`:
+    the page HTML goes in and a dict of plain JSON-compatible values comes out.
+    """
+    return importer_cls(url).extract(html, image_limit)
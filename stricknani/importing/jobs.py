@@ -0,0 +1,213 @@
+"""Background import jobs.
+
+A URL import with AI extraction fetches the page, extracts it, waits for the
+model and downloads and deduplicates the images, which can take a minute.
+Held open as one request, that trips proxy and mobile timeouts.
+
+``POST /projects/import`` and ``POST /yarn/import`` with ``background=true``
+submit the import to :data:`import_jobs` instead and answer ``202`` with the
+job id straight away. At most ``IMPORT_JOB_WORKERS`` jobs run at once; the
+rest wait their turn, and a user may have ``IMPORT_JOB_MAX_PENDING`` jobs
+unfinished.
+
+A job records the events of its import trace as they happen (the stages the
+importers and :class:`~stricknani.importing.pipeline.ImportPipeline` report
+to :class:`~stricknani.utils.import_trace.ImportTrace`), framed by its own
+``queued``, ``started`` and ``succeeded``/``failed`` events. Clients follow
+them on ``/imports/jobs/{id}/events`` (server-sent events) or by polling
+``/imports/jobs/{id}``, which also carries the result, the same JSON the
+synchronous request returns, or the error status and message.
+
+Jobs live in the memory of the process that accepted them and are forgotten
+``IMPORT_JOB_RETENTION`` seconds after they finish. The FastAPI lifespan
+cancels unfinished jobs on shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+from fastapi import HTTPException
+
+from stricknani.config import config
+
+logger = logging.getLogger("stricknani.imports")
+
+# The statuses a job can have; the last two are final.
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class TooManyImportJobsError(Exception):
+    """Raised when a user submits a job with too many unfinished already."""
+
+
+@dataclass
+class ImportJob:
+    """One submitted import, its progress events and its outcome."""
+
+    id: str
+    owner_id: int
+    kind: str
+    status: str = QUEUED
+    events: list[dict[str, Any]] = field(default_factory=list)
+    result: dict[str, Any] | None = None
+    error: dict[str, Any] | None = None
+    finished_at: float | None = None
+    _changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has succeeded or failed."""
+        return self.status in (SUCCEEDED, FAILED)
+
+    def add_event(self, event: dict[str, Any]) -> None:
+        """Record a trace event (``name``, ``at`` and ``payload``)."""
+        self.events.append(event)
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def wait(self, seen: int, timeout: float) -> None:
+        """Wait up to ``timeout`` seconds for an event after the first ``seen``."""
+        changed = self._changed
+        if len(self.events) > seen or self.finished:
+            return
+        try:
+            await asyncio.wait_for(changed.wait(), timeout)
+        except TimeoutError:
+            pass
+
+    def to_dict(self, *, after: int = 0) -> dict[str, Any]:
+        """Return the job as JSON, with the events after the first ``after``."""
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "events": self.events[after:],
+            "event_count": len(self.events),
+            "result": self.result,
+            "error": self.error,
+        }
+
+    def _set_status(self, status: str, payload: dict[str, Any]) -> None:
+        self.status = status
+        if self.finished:
+            self.finished_at = time.monotonic()
+        name = "started" if status == RUNNING else status
+        self.add_event(
+            {"name": name, "at": datetime.now(UTC).isoformat(), "payload": payload}
+        )
+
+
+JobWork = Callable[[ImportJob], Awaitable[dict[str, Any]]]
+
+
+class ImportJobs:
+    """The import jobs of this process and the slots they run in."""
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, ImportJob] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def submit(self, owner_id: int, kind: str, work: JobWork) -> ImportJob:
+        """Queue ``work(job)`` as a new job of ``owner_id`` and return the job.
+
+        ``work`` returns the import result. An :class:`HTTPException` it
+        raises fails the job with that status and detail.
+
+        Raises:
+            TooManyImportJobsError: If the user has ``IMPORT_JOB_MAX_PENDING``
+                unfinished jobs.
+        """
+        self._prune()
+        pending = sum(
+            1
+            for job in self._jobs.values()
+            if job.owner_id == owner_id and not job.finished
+        )
+        if pending >= config.IMPORT_JOB_MAX_PENDING:
+            raise TooManyImportJobsError(f"{pending} imports are still running")
+
+        job = ImportJob(id=uuid4().hex, owner_id=owner_id, kind=kind)
+        job._set_status(QUEUED, {})
+        self._jobs[job.id] = job
+        task = asyncio.create_task(self._run(job, work))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def get(self, job_id: str, owner_id: int) -> ImportJob | None:
+        """Return the job ``job_id`` if it exists and belongs to ``owner_id``."""
+        job = self._jobs.get(job_id)
+        if job is None or job.owner_id != owner_id:
+            return None
+        return job
+
+    async def close(self) -> None:
+        """Cancel the unfinished jobs and wait for them to stop."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._jobs.clear()
+        self._slots = self._loop = None
+
+    async def _run(self, job: ImportJob, work: JobWork) -> None:
+        try:
+            async with self._slots_for_loop():
+                job._set_status(RUNNING, {})
+                result = await work(job)
+        except HTTPException as exc:
+            job.error = {"status_code": exc.status_code, "detail": exc.detail}
+            job._set_status(FAILED, job.error)
+        except asyncio.CancelledError:
+            job.error = {"status_code": 503, "detail": "The import was cancelled."}
+            job._set_status(FAILED, job.error)
+            raise
+        except Exception:
+            logger.exception("Import job %s failed", job.id)
+            job.error = {"status_code": 500, "detail": "Failed to import."}
+            job._set_status(FAILED, job.error)
+        else:
+            job.result = result
+            job._set_status(SUCCEEDED, {})
+
+    def _slots_for_loop(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._slots = asyncio.Semaphore(max(1, config.IMPORT_JOB_WORKERS))
+            self._loop = loop
+        return self._slots
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - config.IMPORT_JOB_RETENTION
+        for job_id, job in list(self._jobs.items()):
+            if job.finished_at is not None and job.finished_at < cutoff:
+                del self._jobs[job_id]
+
+
+import_jobs = ImportJobs()
+
+
+__all__ = [
+    "FAILED",
+    "QUEUED",
+    "RUNNING",
+    "SUCCEEDED",
+    "ImportJob",
+    "ImportJobs",
+    "JobWork",
+    "TooManyImportJobsError",
+    "import_jobs",
+]
@@ -121,6 +121,9 @@ class ExtractedData:
     link: str | None = None
     brand: str | None = None
 
+    # Problems the user should know about, passed on to ImportResult.warnings
+    warnings: list[str] = field(default_factory=list)
+
     # Extra fields for extensibility
     extras: dict[str, Any] = field(default_factory=dict)
 
@@ -0,0 +1,168 @@
+"""Worker processes for parsing and extracting imported pages.
+
+BeautifulSoup and trafilatura are pure CPU work: extracting one large pattern
+page takes a few hundred milliseconds, and done inline in an async handler it
+stalls every other request on the worker for that long.
+
+:data:`parse_pool` runs that work in a pool of ``IMPORT_PARSE_WORKERS``
+processes for the life of the app; the FastAPI lifespan starts it and shuts it
+down. Jobs are module-level functions with a plain-data contract: page HTML
+(and the URL and options it needs) in, a dict of JSON-compatible values out.
+Both sides are pickled across the process boundary, so a job returns exactly
+what it would return in-process.
+
+Jobs wait for a free worker on the event loop, so a job cancelled while it
+waits is simply dropped. A running job that outlives ``IMPORT_PARSE_TIMEOUT``
+raises :class:`ParseTimeoutError`. Once a caller gives up on a running job
+(timeout or cancellation) the only way to stop it is to kill its worker: the
+pool is replaced, and jobs that were running beside it are retried once on
+the new pool.
+
+Code running without the pool (CLI commands, tests, another event loop, or
+``IMPORT_PARSE_WORKERS=0``) runs the job in-process, as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+from stricknani.config import config
+
+logger = logging.getLogger("stricknani.imports")
+
+_T = TypeVar("_T")
+
+
+class ParseTimeoutError(Exception):
+    """Raised when extracting a page takes longer than the configured timeout."""
+
+
+def _warm_worker() -> None:
+    """Import the parsing stack once per worker instead of on its first job."""
+    import stricknani.importing.importer  # noqa: F401
+    import stricknani.utils.ai_ingest  # noqa: F401
+
+
+def _stop(executor: ProcessPoolExecutor) -> None:
+    """Shut ``executor`` down, killing jobs that are still running."""
+    terminate = getattr(executor, "terminate_workers", None)  # Python 3.14+
+    if terminate is not None:
+        terminate()
+        return
+    processes = list((executor._processes or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+class ParsePool:
+    """A process pool for CPU-heavy import extraction."""
+
+    def __init__(self) -> None:
+        self._executor: ProcessPoolExecutor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._slots: asyncio.Semaphore | None = None
+
+    @property
+    def started(self) -> bool:
+        """Whether the worker processes are available."""
+        return self._executor is not None
+
+    async def start(self) -> None:
+        """Start the pool on the running event loop (unless disabled)."""
+        if self.started:
+            await self.close()
+        if config.IMPORT_PARSE_WORKERS <= 0:
+            return
+        self._executor = self._new_executor()
+        self._loop = asyncio.get_running_loop()
+        # The executor takes more jobs than it has workers and cannot cancel
+        # those it has taken; hand it one job per worker at a time.
+        self._slots = asyncio.Semaphore(config.IMPORT_PARSE_WORKERS)
+
+    async def close(self) -> None:
+        """Stop the worker processes, cancelling queued jobs."""
+        executor, self._executor, self._loop = self._executor, None, None
+        self._slots = None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    async def run(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Return ``func(*args)``, computed in a worker process.
+
+        ``func`` must be a module-level function, and its arguments and result
+        picklable.
+
+        Raises:
+            ParseTimeoutError: If the job ran longer than
+                ``IMPORT_PARSE_TIMEOUT`` seconds.
+        """
+        slots = self._slots if self._is_current() else None
+        if slots is None:
+            return func(*args)
+        async with slots:
+            return await self._submit(func, *args)
+
+    async def _submit(self, func: Callable[..., _T], *args: Any) -> _T:
+        timeout = config.IMPORT_PARSE_TIMEOUT or None
+        for attempt in range(2):
+            executor = self._executor
+            if executor is None:  # closed while the job was waiting
+                raise BrokenProcessPool("The parse pool was closed")
+            future = executor.submit(func, *args)
+            try:
+                return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+            except TimeoutError as exc:
+                self._abandon(executor, future)
+                raise ParseTimeoutError(
+                    f"Extraction took longer than {timeout} seconds"
+                ) from exc
+            except asyncio.CancelledError:
+                self._abandon(executor, future)
+                raise
+            except BrokenProcessPool:
+                current = self._executor
+                if attempt or current is None or current is executor:
+                    # A worker died on its own (or the pool was closed).
+                    if current is executor:
+                        self._replace(executor)
+                    raise
+                # Another job's timeout replaced the pool under this one.
+        raise AssertionError("unreachable")
+
+    def _is_current(self) -> bool:
+        try:
+            return self._loop is asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+    def _abandon(self, executor: ProcessPoolExecutor, future: Future[Any]) -> None:
+        if future.cancel() or future.done():
+            return
+        logger.warning("Killing import parse workers to stop an abandoned job")
+        self._replace(executor)
+
+    def _replace(self, executor: ProcessPoolExecutor) -> None:
+        if executor is self._executor:
+            self._executor = self._new_executor()
+        _stop(executor)
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # Forking a process that runs an event loop and threads is unsafe.
+        return ProcessPoolExecutor(
+            max_workers=config.IMPORT_PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+        )
+
+
+parse_pool = ParsePool()
+
+
+__all__ = ["ParsePool", "ParseTimeoutError", "parse_pool"]
@@ -150,6 +150,8 @@ class ImportPipeline:
                             "has_description": extracted_data.description is not None,
                             "steps_count": len(extracted_data.steps),
                             "images_count": len(extracted_data.image_urls),
+                            "warnings": extracted_data.warnings,
+                            "ai_usage": extracted_data.extras.get("ai_usage"),
                         },
                     )
 
@@ -182,6 +184,7 @@ class ImportPipeline:
         # Step 3: Create target entity
         try:
             result = await target.create(extracted_data)
+            result.warnings.extend(extracted_data.warnings)
 
             if self.trace:
                 self.trace.add_event(
@@ -5,23 +5,35 @@ guard this is a Server-Side Request Forgery (SSRF) hole: an attacker could aim
 an import at cloud metadata endpoints (``169.254.169.254``), loopback services
 (``127.0.0.1``/``localhost``), or hosts on the server's private network.
 
-:func:`validate_public_url` resolves the target hostname and rejects any URL
+:func:`resolve_public_url` resolves the target hostname and rejects any URL
 that resolves to a private, loopback, link-local, reserved, multicast or
 unspecified address. It is called before every outbound import request and,
 where feasible, again for each redirect hop so that neither the initial URL nor
 a redirect target can reach internal infrastructure.
 
+It resolves off the event loop through a TTL-bounded :data:`dns_cache` and
+returns the address it checked, so the HTTP client can connect to exactly that
+address instead of resolving the name again (see
+``stricknani.importing.clients``).
+
 Self-hosters who intentionally import from a LAN source can opt out by setting
 ``ALLOW_PRIVATE_IMPORT_HOSTS=true`` (secure by default).
 """
 
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import socket
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any
 from urllib.parse import urlparse
 
 _ALLOWED_SCHEMES = {"http", "https"}
+# Distinct import hosts are few; this only bounds a runaway import.
+_DNS_CACHE_MAX_ENTRIES = 1024
 
 
 class SSRFError(Exception):
@@ -54,22 +66,14 @@ def _allow_private_default() -> bool:
     return config.ALLOW_PRIVATE_IMPORT_HOSTS
 
 
-def validate_public_url(url: str, *, allow_private: bool | None = None) -> None:
-    """Validate that ``url`` is safe to fetch server-side.
+def _dns_cache_ttl() -> float:
+    from stricknani.config import config
 
-    Args:
-        url: The URL about to be fetched.
-        allow_private: Override the ``ALLOW_PRIVATE_IMPORT_HOSTS`` config toggle.
-            When ``None`` (the default) the config value is used.
+    return config.IMPORT_DNS_CACHE_TTL
 
-    Raises:
-        SSRFError: If the scheme is not http/https, the host is missing or
-            cannot be resolved, or any resolved address is
-            private/loopback/link-local/reserved/multicast/unspecified.
-    """
-    if allow_private is None:
-        allow_private = _allow_private_default()
 
+def _url_host(url: str) -> str:
+    """Return the host of ``url`` after checking its scheme."""
     parsed = urlparse(url)
     scheme = parsed.scheme.lower()
     if scheme not in _ALLOWED_SCHEMES:
@@ -78,31 +82,30 @@ def validate_public_url(url: str, *, allow_private: bool | None = None) -> None:
     host = parsed.hostname
     if not host:
         raise SSRFError("URL has no host")
+    return host
 
-    if allow_private:
-        return
 
-    # If the host is already an IP literal, validate it directly instead of
-    # resolving it (getaddrinfo would just echo it back).
+def _literal_ip(host: str) -> str | None:
+    """Return the address of an IP-literal ``host`` (``None`` for names).
+
+    Raises:
+        SSRFError: If the literal is a blocked address.
+    """
     try:
-        literal_ip = ipaddress.ip_address(host)
+        literal_ip = ipaddress.ip_address(host.strip("[]"))
     except ValueError:
-        literal_ip = None
-    if literal_ip is not None:
-        if _is_blocked_ip(literal_ip):
-            raise SSRFError(f"URL host resolves to a non-public address: {host}")
-        return
+        return None
+    if _is_blocked_ip(literal_ip):
+        raise SSRFError(f"URL host resolves to a non-public address: {host}")
+    return str(literal_ip)
 
-    try:
-        addr_infos = socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
-    except socket.gaierror as exc:
-        raise SSRFError(f"Could not resolve host: {host}") from exc
 
-    if not addr_infos:
+def _check_addresses(host: str, addresses: Sequence[str]) -> None:
+    """Reject ``host`` unless every address it resolved to is public."""
+    if not addresses:
         raise SSRFError(f"Could not resolve host: {host}")
 
-    for info in addr_infos:
-        ip_str = info[4][0]
+    for ip_str in addresses:
         try:
             resolved_ip = ipaddress.ip_address(ip_str)
         except ValueError as exc:
@@ -113,4 +116,117 @@ def validate_public_url(url: str, *, allow_private: bool | None = None) -> None:
             )
 
 
-__all__ = ["SSRFError", "validate_public_url"]
+def _addresses(addr_infos: Sequence[tuple[Any, ...]]) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(str(info[4][0]) for info in addr_infos))
+
+
+class DNSCache:
+    """Resolved addresses per host name, kept for ``IMPORT_DNS_CACHE_TTL``.
+
+    Lookups run in the event loop's executor, so a slow resolver only delays
+    the import waiting for it. Only successful lookups are cached; ``hits``
+    and ``misses`` count how often a lookup was saved.
+    """
+
+    def __init__(self, *, max_entries: int = _DNS_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, tuple[str, ...]]] = OrderedDict()
+
+    async def resolve(self, host: str) -> tuple[str, ...]:
+        """Return the addresses ``host`` resolves to.
+
+        Raises:
+            SSRFError: If the host cannot be resolved.
+        """
+        key = host.lower()
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        loop = asyncio.get_running_loop()
+        try:
+            addr_infos = await loop.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
+        except socket.gaierror as exc:
+            raise SSRFError(f"Could not resolve host: {host}") from exc
+
+        addresses = _addresses(addr_infos)
+        if addresses:
+            self._entries[key] = (now + _dns_cache_ttl(), addresses)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return addresses
+
+    def clear(self) -> None:
+        """Forget every cached lookup (the counters are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the number of cached hosts."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+dns_cache = DNSCache()
+
+
+async def resolve_public_host(
+    host: str, *, allow_private: bool | None = None
+) -> str | None:
+    """Resolve ``host`` through :data:`dns_cache` and check its addresses.
+
+    Returns:
+        The checked address to connect to, or ``None`` when private hosts are
+        allowed and the client may resolve the name itself.
+
+    Raises:
+        SSRFError: If the host cannot be resolved or any resolved address is
+            not public.
+    """
+    if allow_private is None:
+        allow_private = _allow_private_default()
+    if allow_private:
+        return None
+
+    literal_ip = _literal_ip(host)
+    if literal_ip is not None:
+        return literal_ip
+
+    addresses = await dns_cache.resolve(host)
+    _check_addresses(host, addresses)
+    return addresses[0]
+
+
+async def resolve_public_url(
+    url: str, *, allow_private: bool | None = None
+) -> str | None:
+    """Check that ``url`` is safe to fetch server-side; return its address.
+
+    HTTP clients must connect to the returned address rather than resolve the
+    host again, or a DNS answer that changed in between (DNS rebinding) could
+    still reach an internal host.
+
+    Returns:
+        The checked address for the URL's host, or ``None`` when private hosts
+        are allowed.
+
+    Raises:
+        SSRFError: If the scheme is not http/https, the host is missing or
+            cannot be resolved, or any resolved address is
+            private/loopback/link-local/reserved/multicast/unspecified.
+    """
+    return await resolve_public_host(_url_host(url), allow_private=allow_private)
+
+
+__all__ = [
+    "DNSCache",
+    "SSRFError",
+    "dns_cache",
+    "resolve_public_host",
+    "resolve_public_url",
+]
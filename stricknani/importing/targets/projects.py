@@ -0,0 +1,119 @@
+"""Project import target.
+
+Persists extracted pattern data as a Project with its steps and, optionally,
+the pattern images.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from stricknani.config import config
+from stricknani.importing.models import ImportResult
+from stricknani.importing.targets import ImportTarget
+from stricknani.models import Project, Step
+from stricknani.services.audit import create_audit_log
+from stricknani.utils.project_import import (
+    import_images_from_urls,
+    sync_project_categories,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from stricknani.importing.models import ExtractedData
+
+logger = logging.getLogger("stricknani.imports")
+
+
+class ProjectTarget(ImportTarget):
+    """Create a Project (with steps and images) from extracted data."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        owner_id: int,
+        *,
+        import_images: bool = False,
+        audit_source: str = "import",
+    ) -> None:
+        """Initialize the target.
+
+        Args:
+            db: Database session
+            owner_id: ID of the user who will own the project
+            import_images: Whether to download and attach the pattern images
+            audit_source: ``source`` recorded in the audit log entry
+        """
+        super().__init__(db, owner_id)
+        self.import_images = import_images
+        self.audit_source = audit_source
+
+    @property
+    def target_type(self) -> str:
+        """Return the type of entity this target creates."""
+        return "project"
+
+    async def create(self, data: ExtractedData) -> ImportResult:
+        """Create the project and commit it.
+
+        Args:
+            data: The extracted data to persist
+
+        Returns:
+            ImportResult with the new project's ID
+        """
+        project = Project(
+            name=data.name or "Imported Project",
+            category=data.category,
+            yarn=data.yarn,
+            needles=data.needles,
+            stitch_sample=data.stitch_sample,
+            other_materials=data.other_materials,
+            description=data.description,
+            link=data.link,
+            owner_id=self.owner_id,
+        )
+        self.db.add(project)
+        await self.db.flush()
+        await create_audit_log(
+            self.db,
+            actor_user_id=self.owner_id,
+            entity_type="project",
+            entity_id=project.id,
+            action="created",
+            details={"name": project.name, "source": self.audit_source},
+        )
+
+        for index, step in enumerate(data.steps, start=1):
+            self.db.add(
+                Step(
+                    title=step.title or f"Step {index}",
+                    description=step.description,
+                    step_number=step.step_number or index,
+                    project_id=project.id,
+                )
+            )
+
+        imported_images = 0
+        if self.import_images and data.image_urls:
+            config.ensure_media_dirs()
+            imported_images = await import_images_from_urls(
+                self.db, project, data.image_urls
+            )
+
+        await self.db.commit()
+        if project.category:
+            await sync_project_categories(self.db, self.owner_id)
+
+        logger.info("Imported project %s (%s)", project.id, project.name)
+        return ImportResult(
+            success=True,
+            entity_id=project.id,
+            entity_type=self.target_type,
+            imported_images=imported_images,
+        )
+
+
+__all__ = ["ProjectTarget"]
@@ -0,0 +1,94 @@
+"""Yarn import target.
+
+Persists extracted yarn data as a Yarn in the owner's stash.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from stricknani.importing.models import ImportResult
+from stricknani.importing.targets import ImportTarget
+from stricknani.models import Yarn
+from stricknani.services.audit import create_audit_log
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from stricknani.importing.models import ExtractedData
+
+logger = logging.getLogger("stricknani.imports")
+
+
+def _int_or_none(value: object) -> int | None:
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+class YarnTarget(ImportTarget):
+    """Create a Yarn from extracted data."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        owner_id: int,
+        *,
+        audit_source: str = "import",
+    ) -> None:
+        """Initialize the target.
+
+        Args:
+            db: Database session
+            owner_id: ID of the user who will own the yarn
+            audit_source: ``source`` recorded in the audit log entry
+        """
+        super().__init__(db, owner_id)
+        self.audit_source = audit_source
+
+    @property
+    def target_type(self) -> str:
+        """Return the type of entity this target creates."""
+        return "yarn"
+
+    async def create(self, data: ExtractedData) -> ImportResult:
+        """Create the yarn and commit it.
+
+        Args:
+            data: The extracted data to persist
+
+        Returns:
+            ImportResult with the new yarn's ID
+        """
+        needles = (data.needles or "").strip() or None
+        yarn = Yarn(
+            name=data.name or "Imported Yarn",
+            brand=data.brand,
+            colorway=data.colorway,
+            fiber_content=data.fiber_content,
+            weight_grams=_int_or_none(data.extras.get("weight_grams")),
+            length_meters=_int_or_none(data.extras.get("length_meters")),
+            weight_category=data.weight_category,
+            recommended_needles=needles,
+            notes=data.description,
+            link=data.link,
+            owner_id=self.owner_id,
+        )
+        self.db.add(yarn)
+        await self.db.flush()
+        await create_audit_log(
+            self.db,
+            actor_user_id=self.owner_id,
+            entity_type="yarn",
+            entity_id=yarn.id,
+            action="created",
+            details={"name": yarn.name, "source": self.audit_source},
+        )
+        await self.db.commit()
+
+        logger.info("Imported yarn %s (%s)", yarn.id, yarn.name)
+        return ImportResult(
+            success=True, entity_id=yarn.id, entity_type=self.target_type
+        )
+
+
+__all__ = ["YarnTarget"]
@@ -1,9 +1,10 @@
 """Main FastAPI application."""
 
 import logging
+import re
 import sys
 import time
-from collections.abc import AsyncGenerator, Awaitable, Callable
+from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Annotated, Any
@@ -17,14 +18,27 @@ from starlette.middleware.trustedhost import TrustedHostMiddleware
 from stricknani import __version__
 from stricknani.config import config
 from stricknani.database import init_db
+from stricknani.importing.clients import import_http
+from stricknani.importing.jobs import import_jobs
+from stricknani.importing.parsing import parse_pool
 from stricknani.logging_config import configure_logging
 from stricknani.models import User
 from stricknani.routes.auth import require_auth
 from stricknani.utils.auth import ensure_initial_admin
+from stricknani.utils.i18n import preload_translations
 from stricknani.utils.markdown import render_markdown
-from stricknani.web.middleware import SecurityHeadersMiddleware
-from stricknani.web.staticfiles import CachedStaticFiles
-from stricknani.web.templating import render_template
+from stricknani.web.compression import CompressionMiddleware
+from stricknani.web.middleware import (
+    AccessLogMiddleware,
+    QueryStatsMiddleware,
+    SecurityHeadersMiddleware,
+)
+from stricknani.web.staticfiles import CachedStaticFiles, static_manifest, static_url
+from stricknani.web.templating import (
+    enable_bytecode_cache,
+    render_template,
+    warm_templates,
+)
 
 
 @asynccontextmanager
@@ -34,9 +48,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     config.validate_secrets()
     await init_db()
     await ensure_initial_admin()
+    preload_translations()
+    if config.TEMPLATE_CACHE_DIR is not None:
+        enable_bytecode_cache(config.TEMPLATE_CACHE_DIR)
+    # Dev servers serve edited assets straight away; a build's manifest
+    # would keep pointing at the old content hashes.
+    if not (config.DEBUG or config.AUTO_RELOAD):
+        static_manifest.load(static_path)
+    if config.TEMPLATE_WARMUP:
+        warm_templates()
+    await import_http.start()
+    await parse_pool.start()
     yield
     # Shutdown
-    pass
+    await import_jobs.close()
+    await parse_pool.close()
+    await import_http.close()
 
 
 configure_logging(debug=config.DEBUG)
@@ -111,6 +138,14 @@ app = FastAPI(
 # Baseline security response headers (T58).
 app.add_middleware(SecurityHeadersMiddleware)
 
+# Per-request SQL statement counts and N+1 warnings (see QueryStatsMiddleware).
+app.add_middleware(QueryStatsMiddleware)
+
+# brotli/gzip for HTML, JSON and uncompressed static assets; precompressed
+# /static siblings already carry a Content-Encoding and pass through.
+if config.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware, minimum_size=config.COMPRESSION_MIN_SIZE)
+
 # Reject requests with an unexpected Host header (T58). Guard against the
 # wildcard / empty configuration so a misconfigured ALLOWED_HOSTS does not turn
 # into a blanket 400 for every request. Skip under pytest, whose ASGI client
@@ -120,6 +155,9 @@ _under_pytest = "pytest" in sys.modules
 if _allowed_hosts and "*" not in _allowed_hosts and not _under_pytest:
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=_allowed_hosts)
 
+# Outermost, so rejected hosts and every other response are logged too.
+app.add_middleware(AccessLogMiddleware)
+
 
 @app.exception_handler(CsrfProtectError)
 async def csrf_protect_exception_handler(
@@ -247,11 +285,18 @@ async def pwa_manifest() -> FileResponse:
     )
 
 
+_STATIC_PATH_LITERAL = re.compile(r'"/static/([^"]+)"')
+
+
 @app.get("/sw.js")
 async def service_worker() -> Response:
     """Serve the service worker with the current build's cache version baked in."""
     content = (static_path / "js" / "sw.js").read_text(encoding="utf-8")
     content = content.replace("__STRICKNANI_BUILD_VERSION__", SW_BUILD_ID)
+    # Precache the same (content-hashed) URLs the pages link to.
+    content = _STATIC_PATH_LITERAL.sub(
+        lambda match: f'"{static_url(match.group(1))}"', content
+    )
     return Response(
         content=content,
         media_type="application/javascript",
@@ -261,27 +306,6 @@ async def service_worker() -> Response:
     )
 
 
-@app.middleware("http")
-async def log_requests(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
-    """Log incoming requests similar to the access log."""
-
-    response = await call_next(request)
-    client_host = "-"
-    if request.client is not None:
-        client_host = request.client.host or "-"
-
-    access_logger.info(
-        '%s - "%s %s" %s',
-        client_host,
-        request.method,
-        request.url.path,
-        response.status_code,
-    )
-    return response
-
-
 # Markdown preview length cap (T106): bounds the cost of nh3 sanitization +
 # python-markdown parsing per request. Comfortably above any legitimate
 # project/yarn description or notes field a user would type.
@@ -327,6 +351,7 @@ from stricknani.routes import (  # noqa: E402
     admin,
     auth,
     gauge,
+    imports,
     legal,
     media,
     projects,
@@ -339,6 +364,7 @@ from stricknani.routes import api as json_api  # noqa: E402
 
 app.include_router(auth.router)
 app.include_router(projects.router)
+app.include_router(imports.router)
 app.include_router(search.router)
 app.include_router(gauge.router)
 app.include_router(legal.router)
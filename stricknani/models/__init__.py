@@ -9,6 +9,7 @@ from stricknani.models.associations import (
 from stricknani.models.audit import AuditLog
 from stricknani.models.base import Base
 from stricknani.models.category import Category
+from stricknani.models.deletion import Deletion, RetentionCutoff
 from stricknani.models.enums import ImageType, ProjectCategory
 from stricknani.models.project import Attachment, Image, Project, Step
 from stricknani.models.user import User
@@ -20,10 +21,12 @@ __all__ = [
     "AuditLog",
     "Base",
     "Category",
+    "Deletion",
     "Image",
     "ImageType",
     "Project",
     "ProjectCategory",
+    "RetentionCutoff",
     "Step",
     "User",
     "Yarn",
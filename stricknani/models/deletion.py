@@ -0,0 +1,59 @@
+"""Deletion tombstone and retention cutoff models."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from stricknani.models.base import Base
+
+
+class Deletion(Base):
+    """Compact tombstone for a deleted project or yarn.
+
+    Written in the same transaction as the delete itself so the delta-sync
+    endpoints can report deletions from a small indexed table instead of
+    scanning the (much larger, prunable) audit history.
+    """
+
+    __tablename__ = "deletions"
+    __table_args__ = (
+        Index(
+            "ix_deletions_owner_entity_deleted_at",
+            "owner_id",
+            "entity_type",
+            "deleted_at",
+            "id",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    owner_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE")
+    )
+    entity_type: Mapped[str] = mapped_column(String(20))
+    entity_id: Mapped[int] = mapped_column(Integer)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC), index=True
+    )
+
+
+class RetentionCutoff(Base):
+    """Most recent cutoff applied by a retention/compaction job.
+
+    One row per pruned table (``audit_logs``, ``deletions``). Rows older than
+    ``cutoff`` may have been removed, so anything that depends on complete
+    history before that point (e.g. a sync delta with an older ``since``)
+    must fall back to a full resync.
+    """
+
+    __tablename__ = "retention_cutoffs"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    cutoff: Mapped[datetime] = mapped_column(DateTime)
+    pruned_rows: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC)
+    )
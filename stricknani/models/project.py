@@ -4,9 +4,18 @@ from __future__ import annotations
 
 import json
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
-
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from stricknani.models.associations import project_yarns, user_favorites
@@ -17,10 +26,26 @@ if TYPE_CHECKING:
     from stricknani.models.yarn import Yarn
 
 
+def _json_list(value: str | None) -> list[Any]:
+    if not value:
+        return []
+    try:
+        data = json.loads(value)
+    except (ValueError, TypeError):
+        return []
+    return data if isinstance(data, list) else []
+
+
 class Project(Base):
     """Project model."""
 
     __tablename__ = "projects"
+    __table_args__ = (
+        # Keyset index for list order / detail prev-next navigation.
+        Index(
+            "ix_projects_owner_id_lower_name_id", "owner_id", text("lower(name)"), "id"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), index=True)
@@ -61,6 +86,15 @@ class Project(Base):
 
     owner_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
+    # Card summary, maintained by stricknani.services.summaries so list views
+    # never have to load images or linked yarns. ``card_images`` holds up to
+    # three preview images as JSON (id, filename, alt_text); ``yarn_names``
+    # holds the sorted linked yarn names as a JSON list.
+    card_images: Mapped[str | None] = mapped_column(Text, nullable=True)
+    image_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    yarn_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    yarn_names: Mapped[str | None] = mapped_column(Text, nullable=True)
+
     owner: Mapped[User] = relationship("User", back_populates="projects")
     images: Mapped[list[Image]] = relationship(
         "Image", back_populates="project", cascade="all, delete-orphan"
@@ -85,6 +119,16 @@ class Project(Base):
         back_populates="projects",
     )
 
+    def card_image_list(self) -> list[dict[str, Any]]:
+        """Return the summarized preview images (title images first)."""
+
+        return _json_list(self.card_images)
+
+    def yarn_name_list(self) -> list[str]:
+        """Return the summarized linked yarn names."""
+
+        return [str(name) for name in _json_list(self.yarn_names)]
+
     def tag_list(self) -> list[str]:
         """Return tags as a list."""
 
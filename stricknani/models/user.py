@@ -32,6 +32,12 @@ class User(Base):
     # server-side (T69). Sessions carry the version they were issued with;
     # a mismatch against the current value means the session is revoked.
     token_version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Bumped whenever anything shown on this user's pages changes (see
+    # stricknani.services.library_version); list and detail responses derive
+    # their ETags from it.
+    library_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=lambda: datetime.now(UTC)
     )
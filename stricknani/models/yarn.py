@@ -20,6 +20,10 @@ class Yarn(Base):
     """Yarn stash entry."""
 
     __tablename__ = "yarns"
+    __table_args__ = (
+        # Keyset index for list order / detail prev-next navigation.
+        Index("ix_yarns_owner_id_lower_name_id", "owner_id", text("lower(name)"), "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -64,6 +68,15 @@ class Yarn(Base):
         Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True
     )
 
+    # Card summary, maintained by stricknani.services.summaries so list views
+    # never have to load photos or linked projects.
+    preview_photo_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    preview_photo_filename: Mapped[str | None] = mapped_column(
+        String(255), nullable=True
+    )
+    photo_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    project_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
     owner: Mapped[User] = relationship("User", back_populates="yarns")
     photos: Mapped[list[YarnImage]] = relationship(
         "YarnImage",
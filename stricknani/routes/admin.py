@@ -16,6 +16,7 @@ from stricknani.config import config
 from stricknani.database import get_db
 from stricknani.models import User
 from stricknani.routes.auth import require_admin
+from stricknani.utils.ai_cache import get_ai_cache
 from stricknani.utils.auth import (
     PasswordPolicyError,
     get_password_hash,
@@ -29,6 +30,7 @@ from stricknani.utils.files import (
 )
 from stricknani.utils.gravatar import gravatar_url
 from stricknani.utils.i18n import gettext, language_context
+from stricknani.web.fragments import card_fragments
 from stricknani.web.templating import get_language, render_template, templates
 
 router: APIRouter = APIRouter(prefix="/admin", tags=["admin"])
@@ -130,6 +132,18 @@ async def admin_users_view(
     )
 
 
+@router.get("/cache-stats")
+async def admin_cache_stats(
+    current_user: User = Depends(require_admin),
+) -> dict[str, dict[str, float]]:
+    """Report render and AI result cache hit rates."""
+    ai_cache = get_ai_cache()
+    return {
+        "card_fragments": card_fragments.stats(),
+        "ai_results": ai_cache.stats() if ai_cache is not None else {},
+    }
+
+
 @router.post("/users/{user_id}/toggle-admin")
 async def toggle_admin_status(
     user_id: int,
@@ -11,8 +11,9 @@ from __future__ import annotations
 from fastapi import APIRouter
 
 from stricknani.routes.api import auth, categories, meta, projects, sync, yarns
+from stricknani.routes.api.responses import ORJSONResponse
 
-router: APIRouter = APIRouter(prefix="/api/v1")
+router: APIRouter = APIRouter(prefix="/api/v1", default_response_class=ORJSONResponse)
 router.include_router(auth.router)
 router.include_router(meta.router)
 router.include_router(categories.router)
@@ -12,6 +12,8 @@ from fastapi import (
     Form,
     HTTPException,
     Query,
+    Request,
+    Response,
     UploadFile,
     status,
 )
@@ -22,6 +24,7 @@ from sqlalchemy.orm import selectinload
 from stricknani.database import get_db
 from stricknani.models import Attachment, Image, Project, Step, User
 from stricknani.models.associations import user_favorites
+from stricknani.routes.api.responses import ModelResponse
 from stricknani.routes.api.schemas import (
     AttachmentResponse,
     ImageResponse,
@@ -32,7 +35,8 @@ from stricknani.routes.api.schemas import (
     StepResponse,
 )
 from stricknani.routes.auth import require_api_token
-from stricknani.services.audit import create_audit_log
+from stricknani.services.audit import create_audit_log, record_deletion
+from stricknani.services.library_version import mark_library_changed
 from stricknani.services.projects.attachments import store_project_attachment
 from stricknani.services.projects.categories import ensure_category
 from stricknani.services.projects.images import upload_step_image, upload_title_image
@@ -40,6 +44,7 @@ from stricknani.services.projects.import_images import (
     import_project_images_from_urls,
     import_step_images_from_urls,
 )
+from stricknani.services.projects.listing import PROJECT_LIST_COLUMNS
 from stricknani.services.projects.tags import (
     deserialize_tags,
     normalize_tags,
@@ -48,6 +53,12 @@ from stricknani.services.projects.tags import (
 from stricknani.services.projects.yarns import load_owned_yarns
 from stricknani.services.yarn.presentation import resolve_project_preview
 from stricknani.utils.files import delete_file, get_file_url, get_thumbnail_url
+from stricknani.web.conditional import (
+    etag_matches,
+    library_etag,
+    not_modified,
+    set_etag,
+)
 
 logger = logging.getLogger("stricknani.api.projects")
 
@@ -160,20 +171,25 @@ def _serialize_project(project: Project, *, is_favorite: bool) -> ProjectRespons
 
 @router.get("", response_model=ProjectPage)
 async def list_projects(
+    request: Request,
     page: int = Query(1, ge=1),
     category: str | None = Query(None),
     tag: str | None = Query(None),
     favorite: bool | None = Query(None),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_api_token),
-) -> ProjectPage:
+) -> Response:
     """List projects for the current user, most recently updated first."""
+    etag = await library_etag(db, request, current_user.id)
+    if etag and etag_matches(request, etag):
+        return not_modified(etag)
+
     favorite_ids = await _favorite_project_ids(db, current_user.id)
 
     query = (
         select(Project)
         .where(Project.owner_id == current_user.id)
-        .options(selectinload(Project.images))
+        .options(PROJECT_LIST_COLUMNS)
         .order_by(Project.updated_at.desc(), Project.id.desc())
     )
     if category:
@@ -203,20 +219,30 @@ async def list_projects(
         )
         for project in projects
     ]
-    return ProjectPage(
-        items=items, page=page, per_page=API_PAGE_SIZE, has_more=has_more
+    response = ModelResponse(
+        ProjectPage(items=items, page=page, per_page=API_PAGE_SIZE, has_more=has_more)
     )
+    set_etag(response, etag)
+    return response
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
+    request: Request,
     project_id: int,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_api_token),
-) -> ProjectResponse:
+) -> Response:
+    etag = await library_etag(db, request, current_user.id)
+    if etag and etag_matches(request, etag):
+        return not_modified(etag)
     project = await _get_owned_project(db, project_id, current_user.id)
     favorite_ids = await _favorite_project_ids(db, current_user.id)
-    return _serialize_project(project, is_favorite=project.id in favorite_ids)
+    response = ModelResponse(
+        _serialize_project(project, is_favorite=project.id in favorite_ids)
+    )
+    set_etag(response, etag)
+    return response
 
 
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
@@ -391,6 +417,9 @@ async def delete_project(
         action="deleted",
         details={"name": project.name},
     )
+    await record_deletion(
+        db, owner_id=current_user.id, entity_type="project", entity_id=project.id
+    )
     await db.delete(project)
     await db.commit()
 
@@ -424,6 +453,7 @@ async def favorite_project(
                 user_id=current_user.id, project_id=project_id
             )
         )
+        mark_library_changed(db, current_user.id)
         await db.commit()
         project = await _get_owned_project(db, project_id, current_user.id)
     return _serialize_project(project, is_favorite=True)
@@ -446,6 +476,7 @@ async def unfavorite_project(
             user_favorites.c.project_id == project_id,
         )
     )
+    mark_library_changed(db, current_user.id)
     await db.commit()
     project = await _get_owned_project(db, project_id, current_user.id)
     return _serialize_project(project, is_favorite=False)
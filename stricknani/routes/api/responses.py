@@ -0,0 +1,38 @@
+"""JSON response classes for the API.
+
+For a route with a ``response_model``, FastAPI re-validates whatever the route
+returns against that model, dumps it back to Python objects and encodes those
+with the stdlib ``json`` module. The API's response models are built from
+already-validated ORM rows, so that second round trip is pure overhead - and
+it scales with the payload, which for an unbounded sync is every project with
+its steps, images and attachments.
+
+Routes therefore wrap their models in :class:`ModelResponse`, which serializes
+straight to bytes with the model's compiled pydantic-core serializer. FastAPI
+passes a returned ``Response`` through untouched; ``response_model`` stays on
+the decorator for the OpenAPI schema. Routes that still return models or
+dicts the usual way are at least encoded with orjson:
+:class:`~fastapi.responses.ORJSONResponse` is the API router's default
+response class.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from starlette.responses import Response
+
+__all__ = ["ModelResponse", "ORJSONResponse"]
+
+
+class ModelResponse(Response):
+    """Render a pydantic model as JSON without re-validating it."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if not isinstance(content, BaseModel):
+            raise TypeError(f"ModelResponse needs a pydantic model, not {content!r}")
+        return content.__pydantic_serializer__.to_json(content)
@@ -3,9 +3,10 @@
 Rather than a naive full refetch on every sync, the app calls these with the
 `since` cursor from its last successful sync (the `server_time` field of
 that response) and gets back only what changed: entities updated since then,
-plus ids deleted since then - sourced from the existing `AuditLog` table
-(which already records project/yarn deletions) rather than a new tombstone
-table.
+plus ids deleted since then - sourced from the compact `deletions` tombstone
+table, which every project/yarn delete writes in the same transaction.
+Earlier versions scanned `AuditLog` for `action == "deleted"`; that table is
+now prunable (see below) and much larger, so sync no longer reads it.
 
 `since` is captured *before* running the queries below, not derived from the
 max `updated_at`/`created_at` seen in the results: a row committed between
@@ -13,16 +14,15 @@ max `updated_at`/`created_at` seen in the results: a row committed between
 idempotent), whereas deriving the cursor from the results themselves could
 skip a row that committed in that same instant.
 
-`full_resync_required` in the response is currently always `False`:
-`AuditLog` has no retention/pruning today, so it never actually has a gap
-that would make a delta unsafe. A naive "is `since` older than the oldest
-`AuditLog` row" check was tried and reverted - it produced false positives
-for the completely ordinary case of a `since` captured before the very
-first `AuditLog` row a fresh account ever creates, which has nothing to do
-with missing deletion coverage. The field is kept in the response shape as
-a forward-compatible hook: if a retention/pruning job is ever added for
-`AuditLog`, it should record its own cutoff timestamp for this endpoint to
-compare `since` against, rather than "oldest row that happens to exist".
+`full_resync_required` is `True` only when `since` predates the cutoff
+recorded by the tombstone retention job (`services.audit.compact_history`,
+run via `stricknani-cli audit compact`): tombstones older than that cutoff
+may be gone, so a delta could silently miss deletions. Without retention
+configured no cutoff exists and the flag stays `False`. A naive "is `since`
+older than the oldest tombstone" check would be wrong - it produces false
+positives for the completely ordinary case of a `since` captured before the
+very first deletion an account ever makes, which has nothing to do with
+missing deletion coverage.
 
 Clients that need to cap response size can add `limit=1..50` to the project
 or yarn endpoint.  The response then includes at most that many combined
@@ -42,19 +42,20 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from stricknani.database import get_db
-from stricknani.models import AuditLog, Project, User, Yarn
+from stricknani.models import Deletion, Project, User, Yarn
 from stricknani.routes.api.categories import _user_categories
 from stricknani.routes.api.projects import (
     _DETAIL_OPTIONS,
     _favorite_project_ids,
     _serialize_project,
 )
+from stricknani.routes.api.responses import ModelResponse
 from stricknani.routes.api.schemas import (
     CategorySyncResponse,
     ProjectSyncResponse,
@@ -62,6 +63,7 @@ from stricknani.routes.api.schemas import (
 )
 from stricknani.routes.api.yarns import _favorite_yarn_ids, _serialize_yarn
 from stricknani.routes.auth import require_api_token
+from stricknani.services.audit import get_retention_cutoff
 
 router: APIRouter = APIRouter(prefix="/sync", tags=["api-sync"])
 
@@ -113,16 +115,48 @@ async def _deleted_entity_ids(
     db: AsyncSession, *, entity_type: str, user_id: int, since: datetime
 ) -> list[int]:
     result = await db.execute(
-        select(AuditLog.entity_id).where(
-            AuditLog.entity_type == entity_type,
-            AuditLog.action == "deleted",
-            AuditLog.actor_user_id == user_id,
-            AuditLog.created_at > since,
+        select(Deletion.entity_id)
+        .where(
+            Deletion.owner_id == user_id,
+            Deletion.entity_type == entity_type,
+            Deletion.deleted_at > since,
         )
+        .order_by(Deletion.deleted_at.asc(), Deletion.id.asc())
     )
     return [row[0] for row in result]
 
 
+async def _deletion_events(
+    db: AsyncSession, *, entity_type: str, user_id: int, page: _SyncCursor
+) -> list[tuple[datetime, int, int]]:
+    """Return up to ``page.limit + 1`` tombstones after the page's position."""
+    query = select(Deletion.deleted_at, Deletion.id, Deletion.entity_id).where(
+        Deletion.owner_id == user_id,
+        Deletion.entity_type == entity_type,
+        Deletion.deleted_at <= _normalize_since(page.snapshot),
+    )
+    if page.deleted is not None:
+        query = query.where(
+            _after_position(Deletion.deleted_at, Deletion.id, page.deleted)
+        )
+    elif page.since is not None:
+        query = query.where(Deletion.deleted_at > page.since)
+    result = await db.execute(
+        query.order_by(Deletion.deleted_at.asc(), Deletion.id.asc()).limit(
+            page.limit + 1
+        )
+    )
+    return [(row[0], row[1], row[2]) for row in result]
+
+
+async def _full_resync_required(db: AsyncSession, since: datetime | None) -> bool:
+    """Whether tombstones a delta from ``since`` would need were pruned."""
+    if since is None:
+        return False
+    cutoff = await get_retention_cutoff(db, "deletions")
+    return cutoff is not None and since < cutoff
+
+
 def _invalid_cursor() -> HTTPException:
     return HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
@@ -347,7 +381,7 @@ async def sync_projects(
     ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_api_token),
-) -> ProjectSyncResponse:
+) -> Response:
     server_time = datetime.now(UTC)
     page = _page_cursor(
         raw_cursor=cursor,
@@ -380,13 +414,16 @@ async def sync_projects(
             else []
         )
 
-        return ProjectSyncResponse(
-            updated=[
-                _serialize_project(project, is_favorite=project.id in favorite_ids)
-                for project in projects
-            ],
-            deleted_ids=deleted_ids,
-            server_time=server_time,
+        return ModelResponse(
+            ProjectSyncResponse(
+                updated=[
+                    _serialize_project(project, is_favorite=project.id in favorite_ids)
+                    for project in projects
+                ],
+                deleted_ids=deleted_ids,
+                server_time=server_time,
+                full_resync_required=await _full_resync_required(db, since),
+            )
         )
 
     query = (
@@ -407,27 +444,9 @@ async def sync_projects(
     result = await db.execute(query)
     projects = list(result.scalars().all())
 
-    deleted_query = select(AuditLog).where(
-        AuditLog.entity_type == "project",
-        AuditLog.action == "deleted",
-        AuditLog.actor_user_id == current_user.id,
-        AuditLog.created_at <= _normalize_since(page.snapshot),
-    )
-    if page.deleted is not None:
-        deleted_query = deleted_query.where(
-            _after_position(AuditLog.created_at, AuditLog.id, page.deleted)
-        )
-    elif page.since is not None:
-        deleted_query = deleted_query.where(AuditLog.created_at > page.since)
-    deleted_result = await db.execute(
-        deleted_query.order_by(AuditLog.created_at.asc(), AuditLog.id.asc()).limit(
-            page.limit + 1
-        )
+    deletion_events = await _deletion_events(
+        db, entity_type="project", user_id=current_user.id, page=page
     )
-    deletion_events = [
-        (entry.created_at, entry.id, entry.entity_id)
-        for entry in deleted_result.scalars().all()
-    ]
     update_events = [(project.updated_at, project.id, project) for project in projects]
     (
         selected_projects,
@@ -452,15 +471,18 @@ async def sync_projects(
 
     favorite_ids = await _favorite_project_ids(db, current_user.id)
 
-    return ProjectSyncResponse(
-        updated=[
-            _serialize_project(project, is_favorite=project.id in favorite_ids)
-            for project in selected_projects
-        ],
-        deleted_ids=selected_deleted_ids,
-        server_time=page.snapshot,
-        has_more=has_more,
-        next_cursor=next_cursor,
+    return ModelResponse(
+        ProjectSyncResponse(
+            updated=[
+                _serialize_project(project, is_favorite=project.id in favorite_ids)
+                for project in selected_projects
+            ],
+            deleted_ids=selected_deleted_ids,
+            server_time=page.snapshot,
+            full_resync_required=await _full_resync_required(db, page.since),
+            has_more=has_more,
+            next_cursor=next_cursor,
+        )
     )
 
 
@@ -482,7 +504,7 @@ async def sync_yarns(
     ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_api_token),
-) -> YarnSyncResponse:
+) -> Response:
     server_time = datetime.now(UTC)
     page = _page_cursor(
         raw_cursor=cursor,
@@ -515,13 +537,16 @@ async def sync_yarns(
             else []
         )
 
-        return YarnSyncResponse(
-            updated=[
-                _serialize_yarn(yarn, is_favorite=yarn.id in favorite_ids)
-                for yarn in yarns
-            ],
-            deleted_ids=deleted_ids,
-            server_time=server_time,
+        return ModelResponse(
+            YarnSyncResponse(
+                updated=[
+                    _serialize_yarn(yarn, is_favorite=yarn.id in favorite_ids)
+                    for yarn in yarns
+                ],
+                deleted_ids=deleted_ids,
+                server_time=server_time,
+                full_resync_required=await _full_resync_required(db, since),
+            )
         )
 
     query = (
@@ -538,27 +563,9 @@ async def sync_yarns(
     result = await db.execute(query)
     yarns = list(result.scalars().all())
 
-    deleted_query = select(AuditLog).where(
-        AuditLog.entity_type == "yarn",
-        AuditLog.action == "deleted",
-        AuditLog.actor_user_id == current_user.id,
-        AuditLog.created_at <= _normalize_since(page.snapshot),
+    deletion_events = await _deletion_events(
+        db, entity_type="yarn", user_id=current_user.id, page=page
     )
-    if page.deleted is not None:
-        deleted_query = deleted_query.where(
-            _after_position(AuditLog.created_at, AuditLog.id, page.deleted)
-        )
-    elif page.since is not None:
-        deleted_query = deleted_query.where(AuditLog.created_at > page.since)
-    deleted_result = await db.execute(
-        deleted_query.order_by(AuditLog.created_at.asc(), AuditLog.id.asc()).limit(
-            page.limit + 1
-        )
-    )
-    deletion_events = [
-        (entry.created_at, entry.id, entry.entity_id)
-        for entry in deleted_result.scalars().all()
-    ]
     update_events = [(yarn.updated_at, yarn.id, yarn) for yarn in yarns]
     (
         selected_yarns,
@@ -583,15 +590,18 @@ async def sync_yarns(
 
     favorite_ids = await _favorite_yarn_ids(db, current_user.id)
 
-    return YarnSyncResponse(
-        updated=[
-            _serialize_yarn(yarn, is_favorite=yarn.id in favorite_ids)
-            for yarn in selected_yarns
-        ],
-        deleted_ids=selected_deleted_ids,
-        server_time=page.snapshot,
-        has_more=has_more,
-        next_cursor=next_cursor,
+    return ModelResponse(
+        YarnSyncResponse(
+            updated=[
+                _serialize_yarn(yarn, is_favorite=yarn.id in favorite_ids)
+                for yarn in selected_yarns
+            ],
+            deleted_ids=selected_deleted_ids,
+            server_time=page.snapshot,
+            full_resync_required=await _full_resync_required(db, page.since),
+            has_more=has_more,
+            next_cursor=next_cursor,
+        )
     )
 
 
@@ -602,11 +612,11 @@ async def sync_categories(
     since: datetime | None = Query(None),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_api_token),
-) -> CategorySyncResponse:
+) -> Response:
     """Category sync always returns the full current list.
 
     Categories have no `updated_at` and (unlike projects/yarns) their
-    deletions aren't recorded in `AuditLog`, so there's no reliable way to
+    deletions aren't recorded as tombstones, so there's no reliable way to
     compute a delta for them. The list is small enough that a full
     "resync" every time is cheap - `since`/`deleted_ids` are accepted for a
     consistent shape with the other two endpoints but are effectively
@@ -614,6 +624,8 @@ async def sync_categories(
     """
     server_time = datetime.now(UTC)
     categories = await _user_categories(db, current_user.id)
-    return CategorySyncResponse(
-        updated=categories, deleted_ids=[], server_time=server_time
+    return ModelResponse(
+        CategorySyncResponse(
+            updated=categories, deleted_ids=[], server_time=server_time
+        )
     )
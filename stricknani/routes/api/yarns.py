@@ -6,7 +6,17 @@ import asyncio
 import logging
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
 from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -15,6 +25,7 @@ from stricknani.config import config
 from stricknani.database import get_db
 from stricknani.models import User, Yarn, YarnImage
 from stricknani.models.associations import user_favorite_yarns
+from stricknani.routes.api.responses import ModelResponse
 from stricknani.routes.api.schemas import (
     YarnListItemResponse,
     YarnPage,
@@ -23,7 +34,9 @@ from stricknani.routes.api.schemas import (
     YarnWriteRequest,
 )
 from stricknani.routes.auth import require_api_token
-from stricknani.services.audit import create_audit_log
+from stricknani.services.audit import create_audit_log, record_deletion
+from stricknani.services.library_version import mark_library_changed
+from stricknani.services.yarn.listing import YARN_LIST_COLUMNS
 from stricknani.services.yarn.presentation import resolve_yarn_preview
 from stricknani.utils.files import (
     InvalidImageError,
@@ -35,6 +48,12 @@ from stricknani.utils.files import (
     save_uploaded_image,
 )
 from stricknani.utils.ocr import is_ocr_available, precompute_ocr_for_media_file
+from stricknani.web.conditional import (
+    etag_matches,
+    library_etag,
+    not_modified,
+    set_etag,
+)
 
 logger = logging.getLogger("stricknani.api.yarns")
 
@@ -129,18 +148,23 @@ def _apply_write_fields(yarn: Yarn, payload: YarnWriteRequest) -> None:
 
 @router.get("", response_model=YarnPage)
 async def list_yarns(
+    request: Request,
     page: int = Query(1, ge=1),
     favorite: bool | None = Query(None),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_api_token),
-) -> YarnPage:
+) -> Response:
     """List yarns for the current user, most recently updated first."""
+    etag = await library_etag(db, request, current_user.id)
+    if etag and etag_matches(request, etag):
+        return not_modified(etag)
+
     favorite_ids = await _favorite_yarn_ids(db, current_user.id)
 
     query = (
         select(Yarn)
         .where(Yarn.owner_id == current_user.id)
-        .options(selectinload(Yarn.photos))
+        .options(YARN_LIST_COLUMNS)
         .order_by(Yarn.updated_at.desc(), Yarn.id.desc())
     )
     if favorite is True:
@@ -167,18 +191,28 @@ async def list_yarns(
         )
         for yarn in yarns
     ]
-    return YarnPage(items=items, page=page, per_page=API_PAGE_SIZE, has_more=has_more)
+    response = ModelResponse(
+        YarnPage(items=items, page=page, per_page=API_PAGE_SIZE, has_more=has_more)
+    )
+    set_etag(response, etag)
+    return response
 
 
 @router.get("/{yarn_id}", response_model=YarnResponse)
 async def get_yarn(
+    request: Request,
     yarn_id: int,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_api_token),
-) -> YarnResponse:
+) -> Response:
+    etag = await library_etag(db, request, current_user.id)
+    if etag and etag_matches(request, etag):
+        return not_modified(etag)
     yarn = await _get_owned_yarn(db, yarn_id, current_user.id)
     favorite_ids = await _favorite_yarn_ids(db, current_user.id)
-    return _serialize_yarn(yarn, is_favorite=yarn.id in favorite_ids)
+    response = ModelResponse(_serialize_yarn(yarn, is_favorite=yarn.id in favorite_ids))
+    set_etag(response, etag)
+    return response
 
 
 @router.post("", response_model=YarnResponse, status_code=status.HTTP_201_CREATED)
@@ -264,6 +298,9 @@ async def delete_yarn(
         action="deleted",
         details={"name": yarn.name},
     )
+    await record_deletion(
+        db, owner_id=current_user.id, entity_type="yarn", entity_id=yarn.id
+    )
     await db.delete(yarn)
     await db.commit()
 
@@ -293,6 +330,7 @@ async def favorite_yarn(
         await db.execute(
             insert(user_favorite_yarns).values(user_id=current_user.id, yarn_id=yarn_id)
         )
+        mark_library_changed(db, current_user.id)
         await db.commit()
         yarn = await _get_owned_yarn(db, yarn_id, current_user.id)
     return _serialize_yarn(yarn, is_favorite=True)
@@ -313,6 +351,7 @@ async def unfavorite_yarn(
             user_favorite_yarns.c.yarn_id == yarn_id,
         )
     )
+    mark_library_changed(db, current_user.id)
     await db.commit()
     yarn = await _get_owned_yarn(db, yarn_id, current_user.id)
     return _serialize_yarn(yarn, is_favorite=False)
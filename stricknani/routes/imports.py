@@ -0,0 +1,106 @@
+"""Background import job routes (see :mod:`stricknani.importing.jobs`)."""
+
+import json
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from stricknani.importing.jobs import (
+    ImportJob,
+    JobWork,
+    TooManyImportJobsError,
+    import_jobs,
+)
+from stricknani.models import User
+from stricknani.routes.auth import require_auth_or_api_token
+
+router: APIRouter = APIRouter(prefix="/imports", tags=["imports"])
+
+# Seconds between keep-alive comments on an idle event stream, so proxies do
+# not close it while the import waits for the AI provider.
+KEEPALIVE_SECONDS = 15.0
+
+
+def submit_import_job(owner_id: int, kind: str, work: JobWork) -> JSONResponse:
+    """Queue an import as a job and answer ``202`` with where to follow it."""
+    try:
+        job = import_jobs.submit(owner_id, kind, work)
+    except TooManyImportJobsError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many imports are still running. Please wait for them.",
+        ) from exc
+    status_url = f"/imports/jobs/{job.id}"
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={
+            "job_id": job.id,
+            "status": job.status,
+            "status_url": status_url,
+            "events_url": f"{status_url}/events",
+        },
+        headers={"Location": status_url},
+    )
+
+
+def _get_job(job_id: str, current_user: User) -> ImportJob:
+    job = import_jobs.get(job_id, current_user.id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return job
+
+
+@router.get("/jobs/{job_id}")
+async def get_import_job(
+    job_id: str,
+    after: int = 0,
+    current_user: User = Depends(require_auth_or_api_token),
+) -> JSONResponse:
+    """Return an import job: status, events after the first ``after``, outcome."""
+    job = _get_job(job_id, current_user)
+    return JSONResponse(
+        content=job.to_dict(after=max(after, 0)),
+        headers={"Cache-Control": "no-store"},
+    )
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_import_job_events(
+    job_id: str,
+    request: Request,
+    current_user: User = Depends(require_auth_or_api_token),
+) -> StreamingResponse:
+    """Stream an import job's events as server-sent events until it finishes.
+
+    Each event's ``id`` is its position, so a reconnecting ``EventSource``
+    resumes after the ``Last-Event-ID`` it saw. The final event is ``done``
+    with the whole job, result or error included.
+    """
+    job = _get_job(job_id, current_user)
+    try:
+        seen = max(int(request.headers.get("last-event-id", "0")), 0)
+    except ValueError:
+        seen = 0
+
+    async def events() -> AsyncIterator[str]:
+        nonlocal seen
+        while True:
+            await job.wait(seen, KEEPALIVE_SECONDS)
+            if await request.is_disconnected():
+                return
+            if len(job.events) == seen and not job.finished:
+                yield ": keep-alive\n\n"
+                continue
+            for event in job.events[seen:]:
+                seen += 1
+                yield f"id: {seen}\nevent: progress\ndata: {json.dumps(event)}\n\n"
+            if job.finished and seen == len(job.events):
+                yield f"event: done\ndata: {json.dumps(job.to_dict(after=seen))}\n\n"
+                return
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
@@ -4,6 +4,7 @@ import asyncio
 import json
 import logging
 import shutil
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Annotated, Any
@@ -27,8 +28,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
 from stricknani.config import config
-from stricknani.database import get_db
+from stricknani.database import AsyncSessionLocal, get_db
 from stricknani.importing.fetch import FetchError, import_fetch_http_error
+from stricknani.importing.jobs import ImportJob
+from stricknani.importing.models import ContentType
+from stricknani.importing.parsing import ParseTimeoutError
 from stricknani.importing.ssrf import SSRFError
 from stricknani.models import (
     Attachment,
@@ -47,13 +51,17 @@ from stricknani.routes.auth import (
     require_auth,
     require_auth_or_api_token,
 )
+from stricknani.routes.imports import submit_import_job
 from stricknani.services.audit import (
     build_field_changes,
     create_audit_log,
     list_audit_logs,
+    record_deletion,
     serialize_audit_log,
 )
 from stricknani.services.images import get_image_dimensions
+from stricknani.services.library_version import mark_library_changed
+from stricknani.services.navigation import find_project_neighbours
 from stricknani.services.projects.attachments import (
     store_pending_project_import_attachment_bytes,
     store_project_attachment,
@@ -91,6 +99,7 @@ from stricknani.services.projects.import_workflows import (
     parse_yarn_ids,
     persist_remaining_import_tokens,
 )
+from stricknani.services.projects.listing import PROJECT_LIST_COLUMNS
 from stricknani.services.projects.steps import (
     create_step as service_create_step,
 )
@@ -109,6 +118,7 @@ from stricknani.services.projects.yarns import (
     load_owned_yarns,
     resolve_yarn_preview,
 )
+from stricknani.services.summaries import mark_project_summaries_stale
 from stricknani.utils.ai_provider import has_ai_api_key
 from stricknani.utils.files import (
     UploadTooLargeError,
@@ -121,7 +131,7 @@ from stricknani.utils.i18n import language_context
 from stricknani.utils.image_similarity import (
     SimilarityImage,
 )
-from stricknani.utils.import_trace import ImportTrace
+from stricknani.utils.import_trace import start_import_trace
 from stricknani.utils.importer import (
     filter_import_image_urls,
     is_garnstudio_url,
@@ -135,6 +145,12 @@ from stricknani.utils.wayback import (
     build_wayback_fallback_url,
     store_wayback_snapshot,
 )
+from stricknani.web.conditional import (
+    etag_matches,
+    library_etag,
+    not_modified,
+    set_etag,
+)
 from stricknani.web.templating import get_language, render_template, templates
 
 logger = logging.getLogger(__name__)
@@ -244,6 +260,10 @@ async def list_projects(
     if not current_user:
         return RedirectResponse(url="/login", status_code=status.HTTP_303_SEE_OTHER)
 
+    etag = await library_etag(db, request, current_user.id, html=True)
+    if etag and etag_matches(request, etag):
+        return not_modified(etag, html=True)
+
     if search:
         category_token, remaining = _extract_search_token(search, "cat:")
         if category_token:
@@ -285,10 +305,7 @@ async def list_projects(
 
     offset = (page - 1) * LIST_PAGE_SIZE
     query = (
-        query.options(
-            selectinload(Project.images).selectinload(Image.step),
-            selectinload(Project.yarns),
-        )
+        query.options(PROJECT_LIST_COLUMNS)
         .order_by(
             favorite_marker.is_(None),
             func.lower(Project.name),
@@ -318,14 +335,11 @@ async def list_projects(
         next_page_url = f"/projects/?{urlencode(params)}"
 
     def _serialize_project(project: Project) -> dict[str, object]:
-        # Get all title images (or first image if no title image set)
-        candidates = [img for img in project.images if img.is_title_image]
-        if not candidates and project.images:
-            candidates = [project.images[0]]
-
+        # Title images (or the first image), from the card summary
         preview_images = []
-        for img in candidates[:3]:
-            thumb_name = f"thumb_{Path(img.filename).stem}.jpg"
+        for img in project.card_image_list():
+            filename = str(img["filename"])
+            thumb_name = f"thumb_{Path(filename).stem}.jpg"
             thumb_path = (
                 config.MEDIA_ROOT
                 / "thumbnails"
@@ -336,16 +350,16 @@ async def list_projects(
 
             url = None
             if thumb_path.exists():
-                url = get_thumbnail_url(img.filename, project.id, subdir="projects")
-            file_path = config.MEDIA_ROOT / "projects" / str(project.id) / img.filename
+                url = get_thumbnail_url(filename, project.id, subdir="projects")
+            file_path = config.MEDIA_ROOT / "projects" / str(project.id) / filename
             if file_path.exists():
-                url = get_file_url(img.filename, project.id, subdir="projects")
+                url = get_file_url(filename, project.id, subdir="projects")
 
             if url:
                 preview_images.append(
                     {
                         "url": url,
-                        "alt": img.alt_text or project.name,
+                        "alt": img.get("alt_text") or project.name,
                     }
                 )
 
@@ -353,19 +367,14 @@ async def list_projects(
         thumbnail_url = preview_images[0]["url"] if preview_images else None
         image_alt = preview_images[0]["alt"] if preview_images else project.name
 
-        yarn_names = sorted(
-            {yarn.name for yarn in project.yarns if yarn.name},
-            key=str.casefold,
-        )
-
         return {
             "id": project.id,
             "name": project.name,
             "category": project.category,
             "created_at": project.created_at.isoformat(),
             "updated_at": project.updated_at.isoformat(),
-            "yarn_count": len(project.yarns),
-            "yarn_names": yarn_names,
+            "yarn_count": project.yarn_count,
+            "yarn_names": project.yarn_name_list(),
             "is_favorite": project.id in favorite_ids,
             "is_ai_enhanced": project.is_ai_enhanced,
             "thumbnail_url": thumbnail_url,
@@ -378,10 +387,11 @@ async def list_projects(
 
     # HTMX infinite scroll: subsequent pages return only the card fragment
     # (cards plus the next-page sentinel), swapped in-place after the last row.
+    response: Response
     if request.headers.get("HX-Request") and page > 1:
         language = get_language(request)
         with language_context(language):
-            return templates.TemplateResponse(
+            response = templates.TemplateResponse(
                 "projects/_cards_page.html",
                 {
                     "request": request,
@@ -390,12 +400,14 @@ async def list_projects(
                     "next_page_url": next_page_url,
                 },
             )
+        set_etag(response, etag, html=True)
+        return response
 
     # HTMX search/filter: return the reset list (grid + first page).
     if request.headers.get("HX-Request"):
         language = get_language(request)
         with language_context(language):
-            return templates.TemplateResponse(
+            response = templates.TemplateResponse(
                 "projects/_list_partial.html",
                 {
                     "request": request,
@@ -407,13 +419,17 @@ async def list_projects(
                     "next_page_url": next_page_url,
                 },
             )
+        set_etag(response, etag, html=True)
+        return response
 
     categories = await get_user_categories(db, current_user.id)
 
     if request.headers.get("accept") == "application/json":
-        return JSONResponse(projects_data)
+        response = JSONResponse(projects_data)
+        set_etag(response, etag, html=True)
+        return response
 
-    return await render_template(
+    response = await render_template(
         "projects/list.html",
         request,
         {
@@ -427,6 +443,8 @@ async def list_projects(
             "has_openai_key": config.FEATURE_AI_IMPORT_ENABLED and has_ai_api_key(),
         },
     )
+    set_etag(response, etag, html=True)
+    return response
 
 
 @router.get("/new", response_class=HTMLResponse)
@@ -469,6 +487,7 @@ async def import_pattern(
     attachment_ids: Annotated[list[int] | None, Form()] = None,
     use_ai: Annotated[bool, Form()] = False,
     project_id: Annotated[int | None, Form()] = None,
+    background: Annotated[bool, Form()] = False,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_auth_or_api_token),
 ) -> JSONResponse:
@@ -482,18 +501,95 @@ async def import_pattern(
         attachment_ids: IDs of existing attachments to import
         use_ai: If True, use AI-powered extraction (requires AI provider key)
         project_id: Optional project ID to import into
+        background: If True, run the import as a job and answer 202 with its
+            id (see :mod:`stricknani.importing.jobs`)
         db: Database session
         current_user: Authenticated user
     """
-    files = files or []
-    attachment_ids = attachment_ids or []
-
-    trace: ImportTrace | None = None
-    if config.IMPORT_TRACE_ENABLED:
-        trace = ImportTrace.create(
-            config.IMPORT_TRACE_DIR,
-            max_chars=config.IMPORT_TRACE_MAX_CHARS,
+    # Collect uploaded files (they are gone once the request is answered)
+    source_contents: list[dict[str, Any]] = []
+    for f in files or []:
+        try:
+            content = await read_upload_content(f)
+        except UploadTooLargeError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail="Uploaded file is too large",
+            ) from exc
+        source_contents.append(
+            {
+                "content": content,
+                "content_type": _import_content_type(f.content_type, f.filename),
+                "filename": f.filename,
+                "original_mime": f.content_type,
+            }
         )
+
+    if background:
+
+        async def work(job: ImportJob) -> dict[str, Any]:
+            async with AsyncSessionLocal() as job_db:
+                return await _import_pattern(
+                    import_type,
+                    url,
+                    text,
+                    source_contents,
+                    attachment_ids or [],
+                    use_ai,
+                    project_id,
+                    job_db,
+                    current_user,
+                    on_event=job.add_event,
+                )
+
+        return submit_import_job(current_user.id, "project", work)
+
+    data = await _import_pattern(
+        import_type,
+        url,
+        text,
+        source_contents,
+        attachment_ids or [],
+        use_ai,
+        project_id,
+        db,
+        current_user,
+    )
+    return JSONResponse(content=data)
+
+
+def _import_content_type(mime: str | None, filename: str | None) -> ContentType:
+    """Guess the import content type of an uploaded file or attachment."""
+    mime = mime or ""
+    filename = filename or ""
+    if mime.startswith("image/") or filename.lower().endswith(
+        (".jpg", ".jpeg", ".png", ".webp", ".gif")
+    ):
+        return ContentType.IMAGE
+    if mime == "application/pdf" or filename.lower().endswith(".pdf"):
+        return ContentType.PDF
+    return ContentType.TEXT
+
+
+async def _import_pattern(
+    import_type: str,
+    url: str | None,
+    text: str | None,
+    source_contents: list[dict[str, Any]],
+    attachment_ids: list[int],
+    use_ai: bool,
+    project_id: int | None,
+    db: AsyncSession,
+    current_user: User,
+    *,
+    on_event: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Run a pattern import for :func:`import_pattern` and return its JSON.
+
+    ``on_event`` receives the import trace events as they happen.
+    """
+    trace = start_import_trace(on_event)
+    if trace:
         trace.add_event(
             "request",
             {
@@ -506,40 +602,6 @@ async def import_pattern(
     try:
         content_text = ""
         source_url = None
-        source_contents: list[dict[str, Any]] = []  # Temporary storage
-
-        # Helper to simplify content type detection
-        from stricknani.importing.models import ContentType, RawContent
-
-        def get_content_type(mime: str | None, filename: str | None) -> ContentType:
-            mime = mime or ""
-            filename = filename or ""
-            if mime.startswith("image/") or filename.lower().endswith(
-                (".jpg", ".jpeg", ".png", ".webp", ".gif")
-            ):
-                return ContentType.IMAGE
-            if mime == "application/pdf" or filename.lower().endswith(".pdf"):
-                return ContentType.PDF
-            return ContentType.TEXT
-
-        # Collect uploaded files
-        for f in files or []:
-            try:
-                content = await read_upload_content(f)
-            except UploadTooLargeError as exc:
-                raise HTTPException(
-                    status_code=status.HTTP_413_CONTENT_TOO_LARGE,
-                    detail="Uploaded file is too large",
-                ) from exc
-            c_type = get_content_type(f.content_type, f.filename)
-            source_contents.append(
-                {
-                    "content": content,
-                    "content_type": c_type,
-                    "filename": f.filename,
-                    "original_mime": f.content_type,
-                }
-            )
 
         # Collect attachments
         if attachment_ids:
@@ -561,7 +623,9 @@ async def import_pattern(
                 )
                 if file_path.exists():
                     content = file_path.read_bytes()
-                    c_type = get_content_type(att.content_type, att.original_filename)
+                    c_type = _import_content_type(
+                        att.content_type, att.original_filename
+                    )
                     source_contents.append(
                         {
                             "content": content,
@@ -840,6 +904,7 @@ async def import_pattern(
                             "description",
                             "notes",
                             "steps",
+                            "import_warnings",
                         }
                     ):
                         ai_failed = True
@@ -895,7 +960,8 @@ async def import_pattern(
                         "ai_fallback": bool(data.get("ai_fallback")),
                     },
                 )
-                data["import_trace_id"] = trace.trace_id
+                if trace.persisted:
+                    data["import_trace_id"] = trace.trace_id
             data = trim_import_strings(data)
 
             existing_gallery_checksums: set[str] | None = None
@@ -937,13 +1003,18 @@ async def import_pattern(
                             step_images,
                             referer=source_url,
                         )
+            if trace:
+                trace.add_event(
+                    "images_filtered",
+                    {"images": len(data.get("image_urls") or [])},
+                )
 
-            return JSONResponse(content=data)
+            return data
 
         elif should_use_files:
             # File / Attachment Import Logic
             from stricknani.importing.extractors.ai import OPENAI_AVAILABLE, AIExtractor
-            from stricknani.importing.models import ContentType, RawContent
+            from stricknani.importing.models import RawContent
 
             if use_ai_enabled and not OPENAI_AVAILABLE:
                 # If user requested AI but it's not installed/configured
@@ -1023,6 +1094,7 @@ async def import_pattern(
                     "image_urls": [],
                     "link": None,
                     "is_ai_enhanced": True,
+                    "import_warnings": extracted.warnings,
                 }
 
                 # Handle PDF Pages from extras
@@ -1069,7 +1141,7 @@ async def import_pattern(
                     )
 
                 data = trim_import_strings(data)
-                return JSONResponse(content=data)
+                return data
 
             else:
                 # AI Disabled - Check content types
@@ -1091,7 +1163,7 @@ async def import_pattern(
                         "is_ai_enhanced": False,
                     }
                     data = trim_import_strings(data)
-                    return JSONResponse(content=data)
+                    return data
                 else:
                     # PDF/Image files require AI
                     raise HTTPException(
@@ -1109,7 +1181,7 @@ async def import_pattern(
                     OPENAI_AVAILABLE,
                     AIExtractor,
                 )
-                from stricknani.importing.models import ContentType, RawContent
+                from stricknani.importing.models import RawContent
 
                 if not OPENAI_AVAILABLE:
                     raise HTTPException(
@@ -1146,9 +1218,10 @@ async def import_pattern(
                     "image_urls": extracted.image_urls,
                     "link": None,
                     "is_ai_enhanced": True,
+                    "import_warnings": extracted.warnings,
                 }
                 data = trim_import_strings(data)
-                return JSONResponse(content=data)
+                return data
             else:
                 # Basic Parser fallback logic (replicated/simplified)
                 from stricknani.utils.importer import PatternImporter
@@ -1163,7 +1236,7 @@ async def import_pattern(
                     "is_ai_enhanced": False,
                 }
                 data = trim_import_strings(data)
-                return JSONResponse(content=data)
+                return data
 
         else:
             raise HTTPException(
@@ -1172,7 +1245,7 @@ async def import_pattern(
 
     except HTTPException:
         raise
-    except (FetchError, SSRFError) as e:
+    except (FetchError, SSRFError, ParseTimeoutError) as e:
         logger.warning("Import fetch failed: %s", e)
         if trace:
             trace.record_error("import_fetch_failure", e)
@@ -1186,7 +1259,7 @@ async def import_pattern(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=(
                 f"Failed to import: {str(e)}"
-                + (f" (trace: {trace.trace_id})" if trace else "")
+                + (f" (trace: {trace.trace_id})" if trace and trace.persisted else "")
             ),
         ) from e
     finally:
@@ -1508,38 +1581,21 @@ async def get_project(
             }
         )
 
-    favorite_rows = await db.execute(
+    favorite_row = await db.execute(
         select(user_favorites.c.project_id).where(
-            user_favorites.c.user_id == current_user.id
+            user_favorites.c.user_id == current_user.id,
+            user_favorites.c.project_id == project.id,
         )
     )
-    favorite_ids = {row[0] for row in favorite_rows}
-    is_favorite = project.id in favorite_ids
+    is_favorite = favorite_row.first() is not None
 
     # Swipe navigation: follow the same ordering as the list view (favorites first, then
     # name).
-    nav_rows = await db.execute(
-        select(Project.id, Project.name).where(Project.owner_id == current_user.id)
+    prev_id, next_id = await find_project_neighbours(
+        db, project, user_id=current_user.id, is_favorite=is_favorite
     )
-    nav_projects = [(row[0], row[1] or "") for row in nav_rows]
-    nav_projects.sort(
-        key=lambda item: (
-            item[0] not in favorite_ids,
-            item[1].casefold(),
-            item[0],
-        )
-    )
-    nav_ids = [item[0] for item in nav_projects]
-    swipe_prev_href = None
-    swipe_next_href = None
-    try:
-        idx = nav_ids.index(project.id)
-    except ValueError:
-        idx = -1
-    if idx > 0:
-        swipe_prev_href = f"/projects/{nav_ids[idx - 1]}"
-    if idx != -1 and idx < len(nav_ids) - 1:
-        swipe_next_href = f"/projects/{nav_ids[idx + 1]}"
+    swipe_prev_href = f"/projects/{prev_id}" if prev_id else None
+    swipe_next_href = f"/projects/{next_id}" if next_id else None
     exclusive_yarns = await get_exclusive_yarns(db, project)
 
     # Check for stale archive request (self-healing)
@@ -2186,6 +2242,8 @@ async def update_project(
             # doesn't trigger ORM cascades
             await db.execute(delete(Image).where(Image.step_id.in_(steps_to_delete)))
             await db.execute(delete(Step).where(Step.id.in_(steps_to_delete)))
+            mark_project_summaries_stale(db, project.id)
+            mark_library_changed(db, project.owner_id)
 
         # Update or create steps
         for step_data in steps_list:
@@ -2398,6 +2456,9 @@ async def delete_project(
             yarn_media_dir = config.MEDIA_ROOT / "yarns" / str(yarn.id)
             yarn_thumb_dir = config.MEDIA_ROOT / "thumbnails" / "yarns" / str(yarn.id)
             yarn_dirs_to_cleanup.append((yarn_media_dir, yarn_thumb_dir))
+            await record_deletion(
+                db, owner_id=current_user.id, entity_type="yarn", entity_id=yarn.id
+            )
             await db.delete(yarn)
 
     project_media_dir = config.MEDIA_ROOT / "projects" / str(project_id)
@@ -2417,6 +2478,9 @@ async def delete_project(
             "deleted_yarn_ids": [yarn.id for yarn in exclusive_yarns_to_delete],
         },
     )
+    await record_deletion(
+        db, owner_id=current_user.id, entity_type="project", entity_id=project.id
+    )
     await db.delete(project)
     await db.commit()
 
@@ -2508,6 +2572,7 @@ async def favorite_project(
             )
         )
         is_favorite = True
+    mark_library_changed(db, current_user.id)
     await db.commit()
 
     if request.headers.get("HX-Request"):
@@ -2547,6 +2612,7 @@ async def unfavorite_project(
             user_favorites.c.project_id == project_id,
         )
     )
+    mark_library_changed(db, current_user.id)
     await db.commit()
 
     if request.headers.get("HX-Request"):
@@ -2758,6 +2824,8 @@ async def promote_project_image(
         .where(Image.id == image_id, Image.project_id == project_id)
         .values(is_title_image=True)
     )
+    mark_project_summaries_stale(db, project_id)
+    mark_library_changed(db, current_user.id)
 
     await create_audit_log(
         db,
@@ -6,11 +6,12 @@ from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from stricknani.database import get_db
 from stricknani.models import Project, User, Yarn
 from stricknani.routes.auth import require_auth
+from stricknani.services.projects.listing import PROJECT_LIST_COLUMNS
+from stricknani.services.yarn.listing import YARN_LIST_COLUMNS
 from stricknani.utils.files import get_thumbnail_url
 from stricknani.web.templating import render_template
 
@@ -38,7 +39,7 @@ async def global_search(
             | Project.category.ilike(f"%{q}%")
             | Project.tags.ilike(f"%{q}%"),
         )
-        .options(selectinload(Project.images))
+        .options(PROJECT_LIST_COLUMNS)
         .limit(10)
     )
 
@@ -51,7 +52,7 @@ async def global_search(
             | Yarn.brand.ilike(f"%{q}%")
             | Yarn.colorway.ilike(f"%{q}%"),
         )
-        .options(selectinload(Yarn.photos))
+        .options(YARN_LIST_COLUMNS)
         .limit(10)
     )
 
@@ -64,14 +65,13 @@ async def global_search(
     results: list[dict[str, Any]] = []
 
     for p in projects:
-        # Find title image or first image
+        # Title image or first image, from the card summary
         thumb_url = None
-        title_img = next((img for img in p.images if img.is_title_image), None)
-        if not title_img and p.images:
-            title_img = p.images[0]
-
-        if title_img:
-            thumb_url = get_thumbnail_url(title_img.filename, p.id, subdir="projects")
+        card_images = p.card_image_list()
+        if card_images:
+            thumb_url = get_thumbnail_url(
+                card_images[0]["filename"], p.id, subdir="projects"
+            )
 
         results.append(
             {
@@ -87,9 +87,10 @@ async def global_search(
 
     for y in yarns:
         thumb_url = None
-        if y.photos:
-            primary = next((img for img in y.photos if img.is_primary), y.photos[0])
-            thumb_url = get_thumbnail_url(primary.filename, y.id, subdir="yarns")
+        if y.preview_photo_filename:
+            thumb_url = get_thumbnail_url(
+                y.preview_photo_filename, y.id, subdir="yarns"
+            )
 
         results.append(
             {
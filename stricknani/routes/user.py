@@ -144,7 +144,7 @@ async def create_qr_setup_token(
     db.add(ApiToken(user_id=current_user.id, name="QR setup", token_hash=token_hash))
     await db.commit()
 
-    scheme = "https" if _is_secure_request(request) else "http"
+    scheme = "https" if _is_secure_request(request.scope) else "http"
     host = request.headers.get("host") or request.url.netloc
     base_url = request_base_url(scheme, host)
     setup_uri = build_setup_uri(base_url, raw_token)
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Annotated, Any
 from urllib.parse import urlencode
@@ -27,15 +28,22 @@ from sqlalchemy.orm import selectinload
 from stricknani.config import config
 from stricknani.database import get_db
 from stricknani.importing.fetch import FetchError, import_fetch_http_error
+from stricknani.importing.jobs import ImportJob
+from stricknani.importing.parsing import ParseTimeoutError
 from stricknani.importing.ssrf import SSRFError
-from stricknani.models import Project, User, Yarn, YarnImage, user_favorite_yarns
+from stricknani.models import User, Yarn, YarnImage, user_favorite_yarns
 from stricknani.routes.auth import get_current_user, require_auth
+from stricknani.routes.imports import submit_import_job
 from stricknani.services.audit import (
     build_field_changes,
     create_audit_log,
     list_audit_logs,
+    record_deletion,
     serialize_audit_log,
 )
+from stricknani.services.library_version import mark_library_changed
+from stricknani.services.navigation import find_yarn_neighbours
+from stricknani.services.summaries import mark_yarn_summaries_stale
 from stricknani.services.yarn import (
     get_yarn_photo_dimensions,
     import_yarn_images_from_urls,
@@ -44,6 +52,10 @@ from stricknani.services.yarn import (
     serialize_yarn_cards,
     serialize_yarn_photos,
 )
+from stricknani.services.yarn.listing import (
+    YARN_DESCRIPTION_EXCERPT,
+    YARN_LIST_COLUMNS,
+)
 from stricknani.utils.ai_provider import has_ai_api_key
 from stricknani.utils.files import (
     InvalidImageError,
@@ -55,6 +67,7 @@ from stricknani.utils.files import (
     read_upload_content,
     save_uploaded_image,
 )
+from stricknani.utils.import_trace import start_import_trace
 from stricknani.utils.importer import (
     filter_import_image_urls,
     trim_import_strings,
@@ -72,6 +85,12 @@ from stricknani.utils.wayback import (
     build_wayback_fallback_url,
     store_wayback_snapshot,
 )
+from stricknani.web.conditional import (
+    etag_matches,
+    library_etag,
+    not_modified,
+    set_etag,
+)
 from stricknani.web.templating import render_template
 
 router: APIRouter = APIRouter(prefix="/yarn", tags=["yarn"])
@@ -140,9 +159,62 @@ async def import_yarn(
     file: UploadFile | None = File(default=None),
     files: Annotated[list[UploadFile] | None, File()] = None,
     use_ai: Annotated[bool, Form()] = False,
+    background: Annotated[bool, Form()] = False,
     current_user: User = Depends(require_auth),
 ) -> JSONResponse:
-    """Import yarn data from URL, file, or text."""
+    """Import yarn data from URL, file, or text.
+
+    With ``background`` set, the import runs as a job and the answer is a 202
+    with its id (see :mod:`stricknani.importing.jobs`).
+    """
+    selected_file = file
+    if files:
+        selected_file = files[0]
+
+    # Read the upload now: it is gone once the request is answered.
+    upload: tuple[bytes, str | None, str] | None = None
+    if selected_file is not None:
+        try:
+            content_bytes = await read_upload_content(selected_file)
+        except UploadTooLargeError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail="Uploaded file is too large",
+            ) from exc
+        upload = (
+            content_bytes,
+            selected_file.content_type,
+            selected_file.filename or "unknown",
+        )
+
+    if background:
+
+        async def work(job: ImportJob) -> dict[str, Any]:
+            return await _import_yarn(
+                import_type, url, text, upload, current_user, on_event=job.add_event
+            )
+
+        return submit_import_job(current_user.id, "yarn", work)
+
+    return JSONResponse(
+        content=await _import_yarn(import_type, url, text, upload, current_user)
+    )
+
+
+async def _import_yarn(
+    import_type: str,
+    url: str | None,
+    text: str | None,
+    upload: tuple[bytes, str | None, str] | None,
+    current_user: User,
+    *,
+    on_event: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Run a yarn import for :func:`import_yarn` and return its JSON.
+
+    ``upload`` is the uploaded file's content, MIME type and name.
+    ``on_event`` receives the import trace events as they happen.
+    """
     import logging
 
     from stricknani.utils.importer import (
@@ -153,15 +225,18 @@ async def import_yarn(
 
     logger = logging.getLogger(__name__)
 
+    trace = start_import_trace(on_event)
+    if trace:
+        trace.add_event(
+            "request",
+            {"import_type": import_type, "user_id": current_user.id, "kind": "yarn"},
+        )
+
     try:
         data: dict[str, Any] = {}
         source_url = None
 
-        selected_file = file
-        if files:
-            selected_file = files[0]
-
-        if import_type == "url" and selected_file is not None:
+        if import_type == "url" and upload is not None:
             import_type = "file"
 
         if import_type == "url":
@@ -204,24 +279,17 @@ async def import_yarn(
             else:
                 importer = PatternImporter(url)
 
+            if trace:
+                trace.add_event("source_url", {"url": source_url})
             data = await importer.fetch_and_parse()
 
         elif import_type == "file":
-            if not selected_file:
+            if upload is None:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="File is required",
                 )
-
-            # Read file content under the shared request-body cap.
-            try:
-                content_bytes = await read_upload_content(selected_file)
-            except UploadTooLargeError as exc:
-                raise HTTPException(
-                    status_code=status.HTTP_413_CONTENT_TOO_LARGE,
-                    detail="Uploaded file is too large",
-                ) from exc
-            filename = selected_file.filename or "unknown"
+            content_bytes, mime_type, filename = upload
 
             from stricknani.importing.extractors.ai import OPENAI_AVAILABLE, AIExtractor
             from stricknani.importing.models import ContentType, RawContent
@@ -235,12 +303,12 @@ async def import_yarn(
                 )
 
             content_type = ContentType.UNKNOWN
-            if selected_file.content_type:
-                if selected_file.content_type.startswith("image/"):
+            if mime_type:
+                if mime_type.startswith("image/"):
                     content_type = ContentType.IMAGE
-                elif selected_file.content_type == "application/pdf":
+                elif mime_type == "application/pdf":
                     content_type = ContentType.PDF
-                elif selected_file.content_type.startswith("text/"):
+                elif mime_type.startswith("text/"):
                     content_type = ContentType.TEXT
 
             if content_type == ContentType.UNKNOWN:
@@ -274,6 +342,7 @@ async def import_yarn(
                 "image_urls": [],  # Images handled separately
                 "link": None,
                 "is_ai_enhanced": True,
+                "import_warnings": extracted.warnings,
             }
 
             # Try to parse weight/length if available in extras or generic fields
@@ -314,6 +383,7 @@ async def import_yarn(
                     "notes": None,
                     "link": None,
                     "is_ai_enhanced": True,
+                    "import_warnings": extracted.warnings,
                 }
             else:
                 # Basic text fallback
@@ -330,6 +400,14 @@ async def import_yarn(
             )
 
         data = trim_import_strings(data)
+        if trace:
+            trace.add_event(
+                "import_result",
+                {
+                    "images": len(data.get("image_urls") or []),
+                    "is_ai_enhanced": bool(data.get("is_ai_enhanced")),
+                },
+            )
 
         # Map extracted data to yarn fields (normalization)
         recommended_needles = data.get("needles")
@@ -363,6 +441,7 @@ async def import_yarn(
             "image_urls": data.get("image_urls", [])[:5],
             "notes": data.get("notes") or data.get("comment"),
             "is_ai_enhanced": data.get("is_ai_enhanced", False),
+            "import_warnings": data.get("import_warnings", []),
         }
 
         image_urls = yarn_data.get("image_urls")
@@ -372,21 +451,32 @@ async def import_yarn(
                 referer=source_url,
                 limit=5,
             )
+            if trace:
+                trace.add_event(
+                    "images_filtered", {"images": len(yarn_data["image_urls"])}
+                )
 
-        return JSONResponse(content=yarn_data)
+        return yarn_data
 
     except HTTPException:
         raise
-    except (FetchError, SSRFError) as e:
+    except (FetchError, SSRFError, ParseTimeoutError) as e:
         logger.warning("Yarn import fetch failed: %s", e)
+        if trace:
+            trace.record_error("import_fetch_failure", e)
         error_status, detail = import_fetch_http_error(e)
         raise HTTPException(status_code=error_status, detail=detail) from e
     except Exception as e:
         logger.error(f"Yarn import failed: {e}", exc_info=True)
+        if trace:
+            trace.record_error("import_failure", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to import: {str(e)}",
         ) from e
+    finally:
+        if trace:
+            trace.save()
 
 
 @router.get("/search-suggestions")
@@ -429,22 +519,16 @@ async def list_yarns(
     if not current_user:
         return RedirectResponse(url="/login", status_code=status.HTTP_303_SEE_OTHER)
 
-    # Load the owner (with favorites eagerly loaded) as a mapped instance so
-    # serialize_yarn_cards can compute favorite state without mutating the
-    # injected auth dependency.
-    owner_result = await db.execute(
-        select(User)
-        .where(User.id == current_user.id)
-        .options(selectinload(User.favorite_yarns))
-    )
-    owner = owner_result.scalar_one()
+    etag = await library_etag(db, request, current_user.id, html=True)
+    if etag and etag_matches(request, etag):
+        return not_modified(etag, html=True)
 
     # Favorites-first ordering is pushed into SQL via a LEFT JOIN against the
     # favorites association so that ORDER BY and LIMIT/OFFSET pagination are
     # honoured by the database (no Python re-sort that would defeat both).
     favorite_marker = user_favorite_yarns.c.user_id
     query = (
-        select(Yarn)
+        select(Yarn, favorite_marker.isnot(None), YARN_DESCRIPTION_EXCERPT)
         .outerjoin(
             user_favorite_yarns,
             and_(
@@ -453,7 +537,7 @@ async def list_yarns(
             ),
         )
         .where(Yarn.owner_id == current_user.id)
-        .options(selectinload(Yarn.photos), selectinload(Yarn.projects))
+        .options(YARN_LIST_COLUMNS)
     )
 
     if search:
@@ -488,9 +572,12 @@ async def list_yarns(
     )
 
     result = await db.execute(query)
-    yarns = result.scalars().unique().all()
-    has_more = len(yarns) > LIST_PAGE_SIZE
-    yarns = yarns[:LIST_PAGE_SIZE]
+    rows = result.all()
+    has_more = len(rows) > LIST_PAGE_SIZE
+    rows = rows[:LIST_PAGE_SIZE]
+    yarns = [row[0] for row in rows]
+    favorite_ids = {row[0].id for row in rows if row[1]}
+    descriptions = {row[0].id: row[2] for row in rows}
 
     next_page_url: str | None = None
     if has_more:
@@ -502,12 +589,13 @@ async def list_yarns(
         params["page"] = str(page + 1)
         next_page_url = f"/yarn/?{urlencode(params)}"
 
-    yarn_cards = serialize_yarn_cards(yarns, owner)
+    yarn_cards = serialize_yarn_cards(yarns, favorite_ids, descriptions)
 
     # HTMX infinite scroll: subsequent pages return only the card fragment
     # (cards plus the next-page sentinel), swapped in-place after the last row.
+    response: Response
     if request.headers.get("HX-Request") and page > 1:
-        return await render_template(
+        response = await render_template(
             "yarn/_cards_page.html",
             request,
             {
@@ -516,10 +604,12 @@ async def list_yarns(
                 "next_page_url": next_page_url,
             },
         )
+        set_etag(response, etag, html=True)
+        return response
 
     # HTMX search/filter: return the reset list (grid + first page).
     if request.headers.get("HX-Request"):
-        return await render_template(
+        response = await render_template(
             "yarn/_list_partial.html",
             request,
             {
@@ -530,13 +620,17 @@ async def list_yarns(
                 "next_page_url": next_page_url,
             },
         )
+        set_etag(response, etag, html=True)
+        return response
 
     if request.headers.get("accept") == "application/json":
-        return JSONResponse(yarn_cards)
+        response = JSONResponse(yarn_cards)
+        set_etag(response, etag, html=True)
+        return response
 
     has_openai_key = config.FEATURE_AI_IMPORT_ENABLED and bool(has_ai_api_key())
 
-    return await render_template(
+    response = await render_template(
         "yarn/list.html",
         request,
         {
@@ -548,6 +642,8 @@ async def list_yarns(
             "has_openai_key": has_openai_key,
         },
     )
+    set_etag(response, etag, html=True)
+    return response
 
 
 @router.get("/new", response_class=HTMLResponse)
@@ -727,13 +823,12 @@ async def yarn_detail(
     if not current_user:
         return RedirectResponse(url="/login", status_code=status.HTTP_303_SEE_OTHER)
 
-    await db.refresh(current_user, ["favorite_yarns"])
     result = await db.execute(
         select(Yarn)
         .where(Yarn.id == yarn_id)
         .options(
             selectinload(Yarn.photos),
-            selectinload(Yarn.projects).selectinload(Project.images),
+            selectinload(Yarn.projects),
         )
     )
     yarn = result.scalar_one_or_none()
@@ -746,31 +841,21 @@ async def yarn_detail(
             status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized"
         )
 
-    favorite_ids = {entry.id for entry in current_user.favorite_yarns}
-    is_favorite = yarn.id in favorite_ids
-
-    nav_rows = await db.execute(
-        select(Yarn.id, Yarn.name).where(Yarn.owner_id == current_user.id)
-    )
-    nav_yarns = [(row[0], row[1] or "") for row in nav_rows]
-    nav_yarns.sort(
-        key=lambda item: (
-            item[0] not in favorite_ids,
-            item[1].casefold(),
-            item[0],
+    favorite_row = await db.execute(
+        select(user_favorite_yarns.c.yarn_id).where(
+            user_favorite_yarns.c.user_id == current_user.id,
+            user_favorite_yarns.c.yarn_id == yarn.id,
         )
     )
-    nav_ids = [item[0] for item in nav_yarns]
-    swipe_prev_href = None
-    swipe_next_href = None
-    try:
-        idx = nav_ids.index(yarn.id)
-    except ValueError:
-        idx = -1
-    if idx > 0:
-        swipe_prev_href = f"/yarn/{nav_ids[idx - 1]}"
-    if idx != -1 and idx < len(nav_ids) - 1:
-        swipe_next_href = f"/yarn/{nav_ids[idx + 1]}"
+    is_favorite = favorite_row.first() is not None
+
+    # Swipe navigation: same ordering as the list view (favorites first, then
+    # name).
+    prev_id, next_id = await find_yarn_neighbours(
+        db, yarn, user_id=current_user.id, is_favorite=is_favorite
+    )
+    swipe_prev_href = f"/yarn/{prev_id}" if prev_id else None
+    swipe_next_href = f"/yarn/{next_id}" if next_id else None
 
     # Check for stale archive request (self-healing)
     if (
@@ -855,7 +940,7 @@ async def edit_yarn(
         .where(Yarn.id == yarn_id)
         .options(
             selectinload(Yarn.photos),
-            selectinload(Yarn.projects).selectinload(Project.images),
+            selectinload(Yarn.projects),
         )
     )
     yarn = result.scalar_one_or_none()
@@ -916,7 +1001,7 @@ async def update_yarn(
         .where(Yarn.id == yarn_id)
         .options(
             selectinload(Yarn.photos),
-            selectinload(Yarn.projects).selectinload(Project.images),
+            selectinload(Yarn.projects),
         )
     )
     yarn = result.scalar_one_or_none()
@@ -1169,6 +1254,7 @@ async def toggle_favorite(
         )
         is_favorite = True
 
+    mark_library_changed(db, current_user.id)
     await db.commit()
 
     # Return partial for HTMX
@@ -1228,6 +1314,8 @@ async def promote_yarn_photo(
         .where(YarnImage.id == photo_id, YarnImage.yarn_id == yarn_id)
         .values(is_primary=True)
     )
+    mark_yarn_summaries_stale(db, yarn_id)
+    mark_library_changed(db, current_user.id)
 
     await create_audit_log(
         db,
@@ -1276,6 +1364,9 @@ async def delete_yarn(
             "photo_count": len(yarn.photos),
         },
     )
+    await record_deletion(
+        db, owner_id=current_user.id, entity_type="yarn", entity_id=yarn.id
+    )
     await db.delete(yarn)
     await db.commit()
     for filename in filenames:
@@ -24,8 +24,25 @@ from sqlalchemy.orm import selectinload
 
 from stricknani.config import config
 from stricknani.database import AsyncSessionLocal, init_db
+from stricknani.importing.batch import (
+    FAILED,
+    IMPORTED,
+    SKIPPED,
+    BatchImporter,
+    BatchKind,
+    BatchState,
+    read_batch_items,
+)
+from stricknani.importing.clients import import_http
+from stricknani.importing.parsing import parse_pool
 from stricknani.models import AuditLog, Project, Step, User, Yarn
-from stricknani.services.audit import create_audit_log, serialize_audit_log
+from stricknani.services.audit import (
+    compact_history,
+    create_audit_log,
+    record_deletion,
+    serialize_audit_log,
+)
+from stricknani.services.summaries import rebuild_card_summaries
 from stricknani.utils.ai_ingest import (
     DEFAULT_INSTRUCTIONS as AI_DEFAULT_INSTRUCTIONS,
 )
@@ -47,6 +64,8 @@ from stricknani.utils.project_import import (
     serialize_tags,
     sync_project_categories,
 )
+from stricknani.web.compression import precompress_static
+from stricknani.web.staticfiles import MANIFEST_NAME, build_static_manifest
 
 console = Console()
 error_console = Console(stderr=True)
@@ -435,6 +454,12 @@ async def delete_project(project_id: int, owner_email: str | None) -> None:
             action="deleted",
             details={"name": project.name, "source": "cli"},
         )
+        await record_deletion(
+            session,
+            owner_id=project.owner_id,
+            entity_type="project",
+            entity_id=project.id,
+        )
         await session.delete(project)
         await session.commit()
         output_ok(
@@ -662,6 +687,70 @@ async def list_audit_entries(
         )
 
 
+async def compact_audit_history(
+    *,
+    audit_log_days: int | None,
+    tombstone_days: int | None,
+) -> None:
+    """Prune audit log rows and sync tombstones past their retention window."""
+    await init_db()
+    async with AsyncSessionLocal() as session:
+        pruned = await compact_history(
+            session,
+            audit_log_days=audit_log_days,
+            tombstone_days=tombstone_days,
+        )
+    if not pruned:
+        output_ok(
+            "[yellow]No retention configured; nothing was pruned.[/yellow]",
+            {"pruned": pruned},
+        )
+        return
+    summary = ", ".join(f"{name}: {count}" for name, count in pruned.items())
+    output_ok(f"[green]Pruned[/green] {summary}", {"pruned": pruned})
+
+
+async def rebuild_summaries() -> None:
+    """Recompute the denormalized project and yarn card summaries."""
+    await init_db()
+    async with AsyncSessionLocal() as session:
+        rebuilt = await rebuild_card_summaries(session)
+    output_ok(
+        f"[green]Rebuilt card summaries[/green] for {rebuilt['projects']} "
+        f"projects and {rebuilt['yarns']} yarns",
+        {"rebuilt": rebuilt},
+    )
+
+
+def _static_dir(directory: Path | None) -> Path:
+    static_dir = directory or Path(__file__).parent.parent / "static"
+    if not static_dir.is_dir():
+        error_console.print(f"[red]Not a directory: {static_dir}[/red]")
+        sys.exit(1)
+    return static_dir
+
+
+def write_static_manifest(directory: Path | None) -> None:
+    """Write the content-hash manifest behind ``static_url()``."""
+    static_dir = _static_dir(directory)
+    manifest = build_static_manifest(static_dir)
+    output_ok(
+        f"[green]Hashed[/green] {len(manifest)} files into "
+        f"{static_dir / MANIFEST_NAME}",
+        {"hashed": len(manifest), "manifest": str(static_dir / MANIFEST_NAME)},
+    )
+
+
+def precompress_static_assets(directory: Path | None) -> None:
+    """Write ``.br``/``.gz`` siblings for the static text assets."""
+    static_dir = _static_dir(directory)
+    written = precompress_static(static_dir)
+    output_ok(
+        f"[green]Precompressed[/green] {written} files in {static_dir}",
+        {"written": written, "directory": str(static_dir)},
+    )
+
+
 async def delete_yarn(yarn_id: int, owner_email: str | None) -> None:
     """Delete a yarn."""
     await init_db()
@@ -693,6 +782,9 @@ async def delete_yarn(yarn_id: int, owner_email: str | None) -> None:
             action="deleted",
             details={"name": yarn.name, "source": "cli"},
         )
+        await record_deletion(
+            session, owner_id=yarn.owner_id, entity_type="yarn", entity_id=yarn.id
+        )
         await session.delete(yarn)
         await session.commit()
         output_ok(
@@ -837,6 +929,9 @@ async def import_project_url(
             except Exception as exc:
                 logger.warning("AI import failed, using basic parser: %s", exc)
 
+    for warning in data.get("import_warnings") or []:
+        error_console.print(f"[yellow]Warning:[/yellow] {warning}")
+
     if not owner_email:
         # Debug mode: just print the data
         output_json(data)
@@ -932,6 +1027,9 @@ async def import_yarn_url(
             except Exception as exc:
                 logger.warning("AI import failed, using basic parser: %s", exc)
 
+    for warning in data.get("import_warnings") or []:
+        error_console.print(f"[yellow]Warning:[/yellow] {warning}")
+
     if not owner_email:
         # Debug mode: just print the data
         output_json(data)
@@ -983,6 +1081,65 @@ async def import_yarn_url(
         )
 
 
+async def import_batch(
+    kind: BatchKind,
+    batch: str,
+    owner_email: str,
+    *,
+    state_file: str | None,
+    use_ai: bool,
+    import_images: bool,
+    concurrency: int | None,
+    per_host: int | None,
+    host_delay: float | None,
+) -> None:
+    """Import every URL or file path listed in ``batch`` (``-``: stdin)."""
+    if batch == "-":
+        items = read_batch_items(sys.stdin)
+    else:
+        items = read_batch_items(Path(batch).read_text(encoding="utf-8").splitlines())
+    if state_file is None and batch != "-":
+        state_file = f"{batch}.state"
+    state = BatchState(Path(state_file)) if state_file else None
+
+    await init_db()
+    async with AsyncSessionLocal() as session:
+        owner = await get_user_by_email(session, owner_email)
+    if not owner:
+        error_console.print(f"[red]User [cyan]{owner_email}[/cyan] not found.[/red]")
+        sys.exit(1)
+
+    def emit(outcome: dict[str, object]) -> None:
+        sys.stdout.write(json.dumps(outcome) + "\n")
+        sys.stdout.flush()
+
+    # One set of connection pools and parse workers for the whole batch.
+    await import_http.start()
+    await parse_pool.start()
+    try:
+        counts = await BatchImporter(
+            kind,
+            owner.id,
+            AsyncSessionLocal,
+            use_ai=use_ai,
+            import_images=import_images,
+            concurrency=concurrency,
+            per_host=per_host,
+            host_delay=host_delay,
+            state=state,
+        ).run(items, emit)
+    finally:
+        await parse_pool.close()
+        await import_http.close()
+
+    error_console.print(
+        f"Imported {counts[IMPORTED]}, failed {counts[FAILED]}, "
+        f"skipped {counts[SKIPPED]} of {len(items)} items."
+    )
+    if counts[FAILED]:
+        sys.exit(1)
+
+
 async def export_project_pdf(
     project_id: int,
     output_path: str,
@@ -1249,6 +1406,7 @@ async def ai_ingest(
     model: str | None,
     temperature: float | None,
     max_output_tokens: int,
+    use_cache: bool = True,
 ) -> None:
     if target not in ("project", "yarn"):
         raise ValueError("target must be 'project' or 'yarn'")
@@ -1279,10 +1437,30 @@ async def ai_ingest(
         model=model,
         temperature=temperature,
         max_output_tokens=max_output_tokens,
+        use_cache=use_cache,
     )
     output_json(data)
 
 
+def run_import_batch(kind: BatchKind, args: argparse.Namespace) -> None:
+    if not args.owner_email:
+        error_console.print("[red]--batch needs --owner-email.[/red]")
+        sys.exit(2)
+    asyncio.run(
+        import_batch(
+            kind,
+            args.batch,
+            args.owner_email,
+            state_file=args.state_file,
+            use_ai=not args.no_ai,
+            import_images=getattr(args, "import_images", False),
+            concurrency=args.concurrency,
+            per_host=args.per_host,
+            host_delay=args.host_delay,
+        )
+    )
+
+
 def main() -> None:
     raw_args = [arg for arg in sys.argv[1:] if arg not in ("--json", "--verbose")]
     raw_args = _normalize_entity_lookup_args(raw_args)
@@ -1363,10 +1541,9 @@ def main() -> None:
     project_add_parser.add_argument("--tags", help="Comma-separated tags")
     project_add_parser.add_argument("--link", help="Project link")
     project_import_parser = project_subparsers.add_parser(
-        "import", help="Import a project from a URL"
+        "import", help="Import a project from a URL, or a batch of URLs and files"
     )
     project_import_parser.add_argument("--owner-email", help="Owner email")
-    project_import_parser.add_argument("--url", required=True, help="URL to import")
     project_import_parser.add_argument(
         "--no-ai",
         action="store_true",
@@ -1450,15 +1627,50 @@ def main() -> None:
     yarn_add_parser.add_argument("--notes", help="Notes")
     yarn_add_parser.add_argument("--link", help="Link")
     yarn_import_parser = yarn_subparsers.add_parser(
-        "import", help="Import a yarn from a URL"
+        "import", help="Import a yarn from a URL, or a batch of URLs and files"
     )
     yarn_import_parser.add_argument("--owner-email", help="Owner email")
-    yarn_import_parser.add_argument("--url", required=True, help="URL to import")
     yarn_import_parser.add_argument(
         "--no-ai",
         action="store_true",
         help="Disable AI import even if configured",
     )
+    for import_parser in (project_import_parser, yarn_import_parser):
+        import_source = import_parser.add_mutually_exclusive_group(required=True)
+        import_source.add_argument("--url", help="URL to import")
+        import_source.add_argument(
+            "--batch",
+            metavar="FILE",
+            help=(
+                "File listing URLs or file paths to import, one per line "
+                "('-' reads stdin); prints one JSON line per item"
+            ),
+        )
+        import_parser.add_argument(
+            "--state-file",
+            help=(
+                "Batch progress file; items imported in an earlier run are "
+                "skipped (default: FILE.state)"
+            ),
+        )
+        import_parser.add_argument(
+            "--concurrency",
+            type=int,
+            help="Batch items imported at once (default: IMPORT_BATCH_CONCURRENCY)",
+        )
+        import_parser.add_argument(
+            "--per-host",
+            type=int,
+            help="Batch items from one host at once (default: IMPORT_BATCH_PER_HOST)",
+        )
+        import_parser.add_argument(
+            "--host-delay",
+            type=float,
+            help=(
+                "Seconds between batch item starts on one host "
+                "(default: IMPORT_BATCH_HOST_DELAY)"
+            ),
+        )
     yarn_delete_parser = yarn_subparsers.add_parser("delete", help="Delete a yarn")
     yarn_delete_parser.add_argument("--id", type=int, required=True, help="Yarn ID")
     yarn_delete_parser.add_argument(
@@ -1484,6 +1696,51 @@ def main() -> None:
         default=100,
         help="Maximum number of entries (default: 100)",
     )
+    audit_compact_parser = audit_subparsers.add_parser(
+        "compact", help="Prune audit logs and sync tombstones past retention"
+    )
+    audit_compact_parser.add_argument(
+        "--audit-log-days",
+        type=int,
+        help="Keep this many days of audit logs (default: AUDIT_LOG_RETENTION_DAYS)",
+    )
+    audit_compact_parser.add_argument(
+        "--tombstone-days",
+        type=int,
+        help=(
+            "Keep this many days of sync deletion tombstones "
+            "(default: SYNC_TOMBSTONE_RETENTION_DAYS)"
+        ),
+    )
+
+    # Card summaries
+    summaries_parser = subparsers.add_parser(
+        "summaries", help="Maintain denormalized project/yarn card summaries"
+    )
+    summaries_subparsers = summaries_parser.add_subparsers(
+        dest="summaries_command", required=True
+    )
+    summaries_subparsers.add_parser(
+        "rebuild", help="Recompute card summaries for all projects and yarns"
+    )
+
+    # Static assets
+    static_parser = subparsers.add_parser("static", help="Static asset build steps")
+    static_subparsers = static_parser.add_subparsers(
+        dest="static_command", required=True
+    )
+    static_manifest_parser = static_subparsers.add_parser(
+        "manifest", help="Write the content-hashed URL manifest for /static"
+    )
+    static_precompress_parser = static_subparsers.add_parser(
+        "precompress", help="Write .br/.gz siblings served by /static"
+    )
+    for static_command_parser in (static_manifest_parser, static_precompress_parser):
+        static_command_parser.add_argument(
+            "--directory",
+            type=Path,
+            help="Static directory (default: the installed stricknani/static)",
+        )
 
     # AI ingestion (CLI-first)
     ai_parser = subparsers.add_parser("ai", help="AI ingestion helpers (CLI-only)")
@@ -1553,6 +1810,11 @@ def main() -> None:
         default=8000,
         help="Max output tokens (default: 8000)",
     )
+    ai_ingest_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ask the provider again instead of reusing a cached result",
+    )
 
     # API interaction
     api_parser = subparsers.add_parser("api", help="Interact with the API")
@@ -1622,6 +1884,7 @@ def main() -> None:
                     model=args.model,
                     temperature=args.temperature,
                     max_output_tokens=args.max_output_tokens,
+                    use_cache=not args.no_cache,
                 )
             )
     elif args.command == "project":
@@ -1644,6 +1907,8 @@ def main() -> None:
                     args.link,
                 )
             )
+        elif project_command == "import" and args.batch:
+            run_import_batch("project", args)
         elif project_command == "import":
             asyncio.run(
                 import_project_url(
@@ -1706,6 +1971,8 @@ def main() -> None:
                     args.link,
                 )
             )
+        elif yarn_command == "import" and args.batch:
+            run_import_batch("yarn", args)
         elif yarn_command == "import":
             asyncio.run(
                 import_yarn_url(
@@ -1725,10 +1992,23 @@ def main() -> None:
                     limit=args.limit,
                 )
             )
+        elif args.audit_command == "compact":
+            asyncio.run(
+                compact_audit_history(
+                    audit_log_days=args.audit_log_days,
+                    tombstone_days=args.tombstone_days,
+                )
+            )
+    elif args.command == "summaries":
+        if args.summaries_command == "rebuild":
+            asyncio.run(rebuild_summaries())
+    elif args.command == "static":
+        if args.static_command == "manifest":
+            write_static_manifest(args.directory)
+        elif args.static_command == "precompress":
+            precompress_static_assets(args.directory)
 
     elif args.command == "alembic":
-        from pathlib import Path
-
         from alembic.config import main as alembic_main
 
         ini_path = Path(__file__).parent.parent / "alembic.ini"
@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from typing import Literal
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from stricknani.models import AuditLog
+from stricknani.config import config
+from stricknani.models import AuditLog, Deletion, RetentionCutoff
 
 AuditEntityType = Literal["project", "yarn"]
 
@@ -77,6 +78,88 @@ async def create_audit_log(
     return entry
 
 
+async def record_deletion(
+    db: AsyncSession,
+    *,
+    owner_id: int,
+    entity_type: AuditEntityType,
+    entity_id: int,
+) -> Deletion:
+    """Record a sync tombstone for a deleted entity inside the current transaction.
+
+    Call this next to ``db.delete(...)`` so the tombstone commits (or rolls
+    back) together with the deletion it describes.
+    """
+    tombstone = Deletion(
+        owner_id=owner_id,
+        entity_type=entity_type,
+        entity_id=entity_id,
+    )
+    db.add(tombstone)
+    await db.flush()
+    return tombstone
+
+
+async def get_retention_cutoff(db: AsyncSession, name: str) -> datetime | None:
+    """Return the last cutoff applied to ``name`` by :func:`compact_history`."""
+    entry = await db.get(RetentionCutoff, name)
+    return entry.cutoff if entry is not None else None
+
+
+async def _record_cutoff(
+    db: AsyncSession, *, name: str, cutoff: datetime, pruned_rows: int
+) -> None:
+    entry = await db.get(RetentionCutoff, name)
+    if entry is None:
+        db.add(RetentionCutoff(name=name, cutoff=cutoff, pruned_rows=pruned_rows))
+        return
+    # Never move a cutoff backwards: shortening the retention window later
+    # must not make already-pruned history look complete again.
+    if cutoff > entry.cutoff:
+        entry.cutoff = cutoff
+    entry.pruned_rows += pruned_rows
+    entry.updated_at = datetime.now(UTC).replace(tzinfo=None)
+
+
+async def compact_history(
+    db: AsyncSession,
+    *,
+    audit_log_days: int | None = None,
+    tombstone_days: int | None = None,
+    now: datetime | None = None,
+) -> dict[str, int]:
+    """Prune audit log rows and sync tombstones past their retention window.
+
+    ``None`` falls back to the configured retention (``AUDIT_LOG_RETENTION_DAYS``
+    / ``SYNC_TOMBSTONE_RETENTION_DAYS``); ``0`` keeps that table forever. Each
+    applied cutoff is recorded in ``retention_cutoffs`` so the sync endpoints
+    can tell when a client's ``since`` predates the retained history.
+    """
+    if audit_log_days is None:
+        audit_log_days = config.AUDIT_LOG_RETENTION_DAYS
+    if tombstone_days is None:
+        tombstone_days = config.SYNC_TOMBSTONE_RETENTION_DAYS
+    reference = (now or datetime.now(UTC)).astimezone(UTC).replace(tzinfo=None)
+
+    pruned: dict[str, int] = {}
+    if audit_log_days > 0:
+        cutoff = reference - timedelta(days=audit_log_days)
+        result = await db.execute(delete(AuditLog).where(AuditLog.created_at < cutoff))
+        pruned["audit_logs"] = int(getattr(result, "rowcount", 0) or 0)
+        await _record_cutoff(
+            db, name="audit_logs", cutoff=cutoff, pruned_rows=pruned["audit_logs"]
+        )
+    if tombstone_days > 0:
+        cutoff = reference - timedelta(days=tombstone_days)
+        result = await db.execute(delete(Deletion).where(Deletion.deleted_at < cutoff))
+        pruned["deletions"] = int(getattr(result, "rowcount", 0) or 0)
+        await _record_cutoff(
+            db, name="deletions", cutoff=cutoff, pruned_rows=pruned["deletions"]
+        )
+    await db.commit()
+    return pruned
+
+
 async def list_audit_logs(
     db: AsyncSession,
     *,
@@ -0,0 +1,96 @@
+"""Per-user library version for cheap HTTP revalidation.
+
+``User.library_version`` increases whenever something rendered on the user's
+list or detail pages (or returned by their API) changes: their projects,
+yarns, images, photos, steps, attachments, categories, favorites, or the user
+row itself. Routes turn it into an ETag and answer ``If-None-Match`` with a
+304 after a single primary-key lookup, before the list/detail queries run.
+
+Changes made through the ORM unit of work are picked up by flush hooks; the
+version is bumped once per owner in a ``before_commit`` hook. Bulk
+``update()``/``delete()``/``insert()`` statements bypass the unit of work, so
+code issuing them against these tables calls :func:`mark_library_changed`.
+"""
+
+from __future__ import annotations
+
+from typing import Any, cast
+
+from sqlalchemy import Table, event, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from stricknani.models.category import Category
+from stricknani.models.project import Attachment, Image, Project, Step
+from stricknani.models.user import User
+from stricknani.models.yarn import Yarn, YarnImage
+
+_CHANGED_KEY = "stricknani_library_changed"
+
+
+def _sync_session(db: AsyncSession | Session) -> Session:
+    return db.sync_session if isinstance(db, AsyncSession) else db
+
+
+def _changed(session: Session) -> set[int]:
+    changed: set[int] = session.info.setdefault(_CHANGED_KEY, set())
+    return changed
+
+
+def mark_library_changed(db: AsyncSession | Session, *owner_ids: int | None) -> None:
+    """Bump these users' library versions when the transaction commits."""
+    _changed(_sync_session(db)).update(uid for uid in owner_ids if uid)
+
+
+async def get_library_version(db: AsyncSession, user_id: int) -> int | None:
+    """Return the user's current library version (``None`` if unknown)."""
+    return (
+        await db.execute(select(User.library_version).where(User.id == user_id))
+    ).scalar_one_or_none()
+
+
+@event.listens_for(Session, "after_flush")
+def _note_changed_owners(session: Session, flush_context: Any) -> None:
+    owners: set[int] = set()
+    project_ids: set[int] = set()
+    yarn_ids: set[int] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Project | Yarn):
+            owners.add(obj.owner_id)
+        elif isinstance(obj, Image | Step | Attachment):
+            project_ids.add(obj.project_id)
+        elif isinstance(obj, YarnImage):
+            yarn_ids.add(obj.yarn_id)
+        elif isinstance(obj, Category):
+            owners.add(obj.user_id)
+        elif isinstance(obj, User):
+            owners.add(obj.id)
+    if project_ids:
+        owners.update(
+            session.execute(
+                select(Project.owner_id).where(Project.id.in_(project_ids))
+            ).scalars()
+        )
+    if yarn_ids:
+        owners.update(
+            session.execute(
+                select(Yarn.owner_id).where(Yarn.id.in_(yarn_ids))
+            ).scalars()
+        )
+    mark_library_changed(session, *owners)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_library_versions(session: Session) -> None:
+    session.flush()
+    owners = session.info.pop(_CHANGED_KEY, set())
+    if not owners:
+        return
+    # Core statement: the bump must not mark User rows dirty (and re-trigger
+    # the flush hook) or touch anything else on them.
+    users = cast(Table, User.__table__)
+    session.execute(
+        update(users)
+        .where(users.c.id.in_(sorted(owners)))
+        .values(library_version=users.c.library_version + 1)
+    )
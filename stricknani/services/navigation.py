@@ -0,0 +1,131 @@
+"""Prev/next neighbours for detail-page swipe navigation.
+
+Detail pages follow the list ordering: favorites first, then ``lower(name)``,
+then ``id``. Instead of loading and sorting the owner's whole library, the
+neighbours are found with bounded keyset ("seek") queries over the
+``(owner_id, lower(name), id)`` indexes on projects and yarns, one partition
+(favorites / everything else) at a time. That is two queries for the common
+case and at most four when the current row sits at a partition boundary.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Select, and_, exists, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from stricknani.models import Project, Yarn
+from stricknani.models.associations import user_favorite_yarns, user_favorites
+
+
+async def _seek(
+    db: AsyncSession,
+    query: Select[tuple[int]],
+    sort_name: Any,
+    sort_id: Any,
+    *,
+    forward: bool,
+    bound: tuple[Any, Any] | None,
+) -> int | None:
+    if bound is not None:
+        key, bound_key = tuple_(sort_name, sort_id), tuple_(*bound)
+        # The plain range on the name is redundant with the row-value
+        # comparison, but it is what lets SQLite seek into the index.
+        if forward:
+            query = query.where(sort_name >= bound[0], key > bound_key)
+        else:
+            query = query.where(sort_name <= bound[0], key < bound_key)
+    if forward:
+        query = query.order_by(sort_name.asc(), sort_id.asc())
+    else:
+        query = query.order_by(sort_name.desc(), sort_id.desc())
+    return (await db.execute(query.limit(1))).scalar_one_or_none()
+
+
+async def _find_neighbours(
+    db: AsyncSession,
+    model: type[Project] | type[Yarn],
+    favorite_column: Any,
+    *,
+    owner_id: int,
+    user_id: int,
+    current_id: int,
+    current_name: str,
+    is_favorite: bool,
+) -> tuple[int | None, int | None]:
+    favorites = favorite_column.table
+    sort_name = func.lower(model.name)
+
+    # Lower-case in SQL too, so the bound collates exactly like the index.
+    bound = (func.lower(literal(current_name)), current_id)
+
+    owned = select(model.id).where(model.owner_id == owner_id)
+    favorite_rows = owned.join(
+        favorites,
+        and_(favorite_column == model.id, favorites.c.user_id == user_id),
+    )
+    other_rows = owned.where(
+        ~exists().where(favorite_column == model.id, favorites.c.user_id == user_id)
+    )
+    same_partition = favorite_rows if is_favorite else other_rows
+
+    prev_id = await _seek(
+        db, same_partition, sort_name, model.id, forward=False, bound=bound
+    )
+    if prev_id is None and not is_favorite:
+        # First non-favorite: step back to the last favorite.
+        prev_id = await _seek(
+            db, favorite_rows, sort_name, model.id, forward=False, bound=None
+        )
+
+    next_id = await _seek(
+        db, same_partition, sort_name, model.id, forward=True, bound=bound
+    )
+    if next_id is None and is_favorite:
+        # Last favorite: continue with the first non-favorite.
+        next_id = await _seek(
+            db, other_rows, sort_name, model.id, forward=True, bound=None
+        )
+
+    return prev_id, next_id
+
+
+async def find_project_neighbours(
+    db: AsyncSession,
+    project: Project,
+    *,
+    user_id: int,
+    is_favorite: bool,
+) -> tuple[int | None, int | None]:
+    """Return the (previous, next) project ids in list order."""
+    return await _find_neighbours(
+        db,
+        Project,
+        user_favorites.c.project_id,
+        owner_id=project.owner_id,
+        user_id=user_id,
+        current_id=project.id,
+        current_name=project.name,
+        is_favorite=is_favorite,
+    )
+
+
+async def find_yarn_neighbours(
+    db: AsyncSession,
+    yarn: Yarn,
+    *,
+    user_id: int,
+    is_favorite: bool,
+) -> tuple[int | None, int | None]:
+    """Return the (previous, next) yarn ids in list order."""
+    return await _find_neighbours(
+        db,
+        Yarn,
+        user_favorite_yarns.c.yarn_id,
+        owner_id=yarn.owner_id,
+        user_id=user_id,
+        current_id=yarn.id,
+        current_name=yarn.name,
+        is_favorite=is_favorite,
+    )
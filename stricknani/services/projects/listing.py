@@ -0,0 +1,32 @@
+"""Lightweight loader options for project list views.
+
+Cards, the JSON list API and global search only need a handful of scalar
+columns plus the card summary maintained by
+:mod:`stricknani.services.summaries`. Loading whole ``Project`` rows would
+drag the description, notes, stitch sample and material TEXT blobs through
+the ORM for every card, which is noticeable for long imported patterns.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy.orm import load_only
+
+from stricknani.models import Project
+
+# Scalar columns rendered on project cards and list API items. Anything not
+# listed here raises on access instead of silently lazy-loading per row.
+PROJECT_LIST_COLUMNS = load_only(
+    Project.id,
+    Project.name,
+    Project.category,
+    Project.tags,
+    Project.is_ai_enhanced,
+    Project.created_at,
+    Project.updated_at,
+    Project.owner_id,
+    Project.card_images,
+    Project.image_count,
+    Project.yarn_count,
+    Project.yarn_names,
+    raiseload=True,
+)
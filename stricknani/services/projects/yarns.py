@@ -280,12 +280,13 @@ async def ensure_yarns_by_text(
 
 async def get_exclusive_yarns(db: AsyncSession, project: Project) -> list[YarnModel]:
     """Return yarns linked only to this project."""
-    exclusive = []
-    for yarn in project.yarns:
-        res = await db.execute(
-            select(func.count()).where(project_yarns.c.yarn_id == yarn.id)
-        )
-        count = res.scalar() or 0
-        if count == 1:
-            exclusive.append(yarn)
-    return exclusive
+    yarn_ids = [yarn.id for yarn in project.yarns]
+    if not yarn_ids:
+        return []
+    res = await db.execute(
+        select(project_yarns.c.yarn_id, func.count())
+        .where(project_yarns.c.yarn_id.in_(yarn_ids))
+        .group_by(project_yarns.c.yarn_id)
+    )
+    link_counts: dict[int, int] = dict(res.tuples().all())
+    return [yarn for yarn in project.yarns if link_counts.get(yarn.id) == 1]
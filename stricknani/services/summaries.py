@@ -0,0 +1,281 @@
+"""Denormalized card summaries for projects and yarns.
+
+Project and yarn cards render from a few summary columns (preview images,
+image/photo counts, linked yarn names and counts) so list queries are plain
+single-table scans. The columns are refreshed in the same transaction as the
+change that affects them:
+
+* flush hooks note which projects and yarns were touched through the ORM
+  (images, photos, yarn links, yarn renames and deletions), and
+* a ``before_commit`` hook recomputes those summaries from the database.
+
+Bulk ``update()``/``delete()`` statements bypass the unit of work, so code
+issuing them against images or photos calls
+:func:`mark_project_summaries_stale` / :func:`mark_yarn_summaries_stale`.
+``stricknani-cli summaries rebuild`` recomputes every row.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from collections.abc import Collection, Iterator, Sequence
+from typing import Any, cast
+
+from sqlalchemy import Table, bindparam, event, func, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+
+from stricknani.models.associations import project_yarns
+from stricknani.models.project import Image, Project
+from stricknani.models.yarn import Yarn, YarnImage
+
+# Project cards show a collage of up to this many title images.
+CARD_IMAGE_LIMIT = 3
+
+# Keep IN (...) lists well below SQLite's bound parameter limit.
+_CHUNK_SIZE = 500
+
+_STALE_KEY = "stricknani_stale_summaries"
+
+
+def _sync_session(db: AsyncSession | Session) -> Session:
+    return db.sync_session if isinstance(db, AsyncSession) else db
+
+
+def _stale(session: Session) -> tuple[set[int], set[int]]:
+    """Return the (project ids, yarn ids) waiting for a summary refresh."""
+    stale: tuple[set[int], set[int]] = session.info.setdefault(
+        _STALE_KEY, (set(), set())
+    )
+    return stale
+
+
+def mark_project_summaries_stale(
+    db: AsyncSession | Session, *project_ids: int | None
+) -> None:
+    """Refresh these projects' card summaries when the transaction commits."""
+    _stale(_sync_session(db))[0].update(pid for pid in project_ids if pid)
+
+
+def mark_yarn_summaries_stale(
+    db: AsyncSession | Session, *yarn_ids: int | None
+) -> None:
+    """Refresh these yarns' card summaries when the transaction commits."""
+    _stale(_sync_session(db))[1].update(yid for yid in yarn_ids if yid)
+
+
+def _chunks(ids: Collection[int]) -> Iterator[list[int]]:
+    ordered = sorted(ids)
+    for start in range(0, len(ordered), _CHUNK_SIZE):
+        yield ordered[start : start + _CHUNK_SIZE]
+
+
+def _store(
+    session: Session,
+    model: type[Project] | type[Yarn],
+    summaries: dict[int, dict[str, Any]],
+) -> None:
+    """Write summaries with one executemany and mirror them on loaded rows."""
+    if not summaries:
+        return
+    table = cast(Table, model.__table__)
+    session.execute(
+        update(table)
+        .where(table.c.id == bindparam("summary_id"))
+        # A summary refresh is not an edit: keep updated_at (and with it the
+        # sync deltas and "recently updated" ordering) untouched.
+        .values(updated_at=table.c.updated_at),
+        [{"summary_id": key, **values} for key, values in summaries.items()],
+    )
+    for key, values in summaries.items():
+        loaded = session.identity_map.get(identity_key(model, key))
+        if loaded is None:
+            continue
+        for name, value in values.items():
+            set_committed_value(loaded, name, value)
+
+
+def refresh_project_summaries(session: Session, project_ids: Collection[int]) -> None:
+    """Recompute card summaries for the given projects."""
+    for chunk in _chunks(project_ids):
+        images: dict[int, list[Any]] = defaultdict(list)
+        for row in session.execute(
+            select(
+                Image.project_id,
+                Image.id,
+                Image.filename,
+                Image.alt_text,
+                Image.is_title_image,
+            )
+            .where(Image.project_id.in_(chunk))
+            .order_by(Image.project_id, Image.id)
+        ):
+            images[row.project_id].append(row)
+
+        yarn_names: dict[int, list[str]] = defaultdict(list)
+        for project_id, name in session.execute(
+            select(project_yarns.c.project_id, Yarn.name)
+            .join(Yarn, Yarn.id == project_yarns.c.yarn_id)
+            .where(project_yarns.c.project_id.in_(chunk))
+        ):
+            yarn_names[project_id].append(name)
+
+        summaries: dict[int, dict[str, Any]] = {}
+        for project_id in chunk:
+            project_images = images.get(project_id, [])
+            candidates = [
+                img for img in project_images if img.is_title_image
+            ] or project_images[:1]
+            card_images = [
+                {"id": img.id, "filename": img.filename, "alt_text": img.alt_text}
+                for img in candidates[:CARD_IMAGE_LIMIT]
+            ]
+            names = yarn_names.get(project_id, [])
+            summaries[project_id] = {
+                "card_images": json.dumps(card_images) if card_images else None,
+                "image_count": len(project_images),
+                "yarn_count": len(names),
+                "yarn_names": json.dumps(
+                    sorted({name for name in names if name}, key=str.casefold)
+                )
+                if names
+                else None,
+            }
+        _store(session, Project, summaries)
+
+
+def refresh_yarn_summaries(session: Session, yarn_ids: Collection[int]) -> None:
+    """Recompute card summaries for the given yarns."""
+    for chunk in _chunks(yarn_ids):
+        photos: dict[int, list[Any]] = defaultdict(list)
+        for row in session.execute(
+            select(YarnImage.yarn_id, YarnImage.id, YarnImage.filename)
+            .where(YarnImage.yarn_id.in_(chunk))
+            .order_by(
+                YarnImage.yarn_id,
+                YarnImage.is_primary.desc(),
+                YarnImage.created_at.desc(),
+                YarnImage.id.desc(),
+            )
+        ):
+            photos[row.yarn_id].append(row)
+
+        project_counts: dict[int, int] = dict(
+            session.execute(
+                select(project_yarns.c.yarn_id, func.count())
+                .where(project_yarns.c.yarn_id.in_(chunk))
+                .group_by(project_yarns.c.yarn_id)
+            )
+            .tuples()
+            .all()
+        )
+
+        summaries: dict[int, dict[str, Any]] = {}
+        for yarn_id in chunk:
+            yarn_photos = photos.get(yarn_id, [])
+            preview = yarn_photos[0] if yarn_photos else None
+            summaries[yarn_id] = {
+                "preview_photo_id": preview.id if preview else None,
+                "preview_photo_filename": preview.filename if preview else None,
+                "photo_count": len(yarn_photos),
+                "project_count": project_counts.get(yarn_id, 0),
+            }
+        _store(session, Yarn, summaries)
+
+
+async def rebuild_card_summaries(db: AsyncSession) -> dict[str, int]:
+    """Recompute every project and yarn card summary and commit."""
+    project_ids: Sequence[int] = (await db.execute(select(Project.id))).scalars().all()
+    yarn_ids: Sequence[int] = (await db.execute(select(Yarn.id))).scalars().all()
+
+    def _rebuild(session: Session) -> None:
+        refresh_project_summaries(session, project_ids)
+        refresh_yarn_summaries(session, yarn_ids)
+
+    await db.run_sync(_rebuild)
+    await db.commit()
+    return {"projects": len(project_ids), "yarns": len(yarn_ids)}
+
+
+def _linked_ids(session: Session, column: Any, key: Any, ids: list[int]) -> list[int]:
+    if not ids:
+        return []
+    return list(session.execute(select(column).where(key.in_(ids))).scalars())
+
+
+@event.listens_for(Session, "before_flush")
+def _note_unlinked_by_deletes(
+    session: Session, flush_context: Any, instances: Any
+) -> None:
+    # Link rows disappear together with a deleted project or yarn, so look up
+    # the other side while they still exist.
+    deleted_projects = [obj.id for obj in session.deleted if isinstance(obj, Project)]
+    deleted_yarns = [obj.id for obj in session.deleted if isinstance(obj, Yarn)]
+    mark_yarn_summaries_stale(
+        session,
+        *_linked_ids(
+            session,
+            project_yarns.c.yarn_id,
+            project_yarns.c.project_id,
+            deleted_projects,
+        ),
+    )
+    mark_project_summaries_stale(
+        session,
+        *_linked_ids(
+            session,
+            project_yarns.c.project_id,
+            project_yarns.c.yarn_id,
+            deleted_yarns,
+        ),
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _note_touched(session: Session, flush_context: Any) -> None:
+    # new/dirty/deleted and attribute history still describe the flush here.
+    renamed_yarns: list[int] = []
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Image):
+            mark_project_summaries_stale(session, obj.project_id)
+        elif isinstance(obj, YarnImage):
+            mark_yarn_summaries_stale(session, obj.yarn_id)
+        elif isinstance(obj, Project):
+            links = inspect(obj).attrs.yarns.history
+            if links.added or links.deleted:
+                mark_project_summaries_stale(session, obj.id)
+                mark_yarn_summaries_stale(
+                    session, *(yarn.id for yarn in (*links.added, *links.deleted))
+                )
+        elif isinstance(obj, Yarn):
+            state = inspect(obj)
+            links = state.attrs.projects.history
+            if links.added or links.deleted:
+                mark_yarn_summaries_stale(session, obj.id)
+                mark_project_summaries_stale(
+                    session,
+                    *(project.id for project in (*links.added, *links.deleted)),
+                )
+            if state.attrs.name.history.has_changes():
+                renamed_yarns.append(obj.id)
+    mark_project_summaries_stale(
+        session,
+        *_linked_ids(
+            session, project_yarns.c.project_id, project_yarns.c.yarn_id, renamed_yarns
+        ),
+    )
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_stale(session: Session) -> None:
+    # Flush first so pending changes are both noted and visible to the
+    # summary queries; commit's own flush then finds the session clean.
+    session.flush()
+    project_ids, yarn_ids = session.info.pop(_STALE_KEY, (set(), set()))
+    if project_ids:
+        refresh_project_summaries(session, project_ids)
+    if yarn_ids:
+        refresh_yarn_summaries(session, yarn_ids)
@@ -0,0 +1,46 @@
+"""Lightweight loader options for yarn list views.
+
+The stash cards, the JSON list API and global search only need a handful of
+scalar columns plus the card summary maintained by
+:mod:`stricknani.services.summaries`. Notes and the full description stay
+in the database; cards get a short excerpt computed in SQL instead.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import func
+from sqlalchemy.orm import load_only
+
+from stricknani.models import Yarn
+
+# Cards clamp the description to two lines, so a few hundred characters
+# are plenty.
+YARN_DESCRIPTION_EXCERPT_CHARS = 300
+
+# Scalar columns rendered on yarn cards. Anything not listed here raises on
+# access instead of silently lazy-loading per row.
+YARN_LIST_COLUMNS = load_only(
+    Yarn.id,
+    Yarn.name,
+    Yarn.brand,
+    Yarn.colorway,
+    Yarn.dye_lot,
+    Yarn.fiber_content,
+    Yarn.weight_category,
+    Yarn.weight_grams,
+    Yarn.length_meters,
+    Yarn.is_ai_enhanced,
+    Yarn.created_at,
+    Yarn.updated_at,
+    Yarn.owner_id,
+    Yarn.preview_photo_id,
+    Yarn.preview_photo_filename,
+    Yarn.photo_count,
+    Yarn.project_count,
+    raiseload=True,
+)
+
+# Selected next to the entity: ``select(Yarn, YARN_DESCRIPTION_EXCERPT)``.
+YARN_DESCRIPTION_EXCERPT = func.substr(
+    Yarn.description, 1, YARN_DESCRIPTION_EXCERPT_CHARS
+).label("description_excerpt")
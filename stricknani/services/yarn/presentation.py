@@ -2,53 +2,51 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable, Mapping
 from pathlib import Path
 
 from PIL import Image as PilImage
 
 from stricknani.config import config
-from stricknani.models import Project, User, Yarn
+from stricknani.models import Project, Yarn
 from stricknani.utils.files import get_file_url, get_thumbnail_url
 
 
 def resolve_yarn_preview(yarn: Yarn) -> str | None:
-    """Return the thumbnail URL for the first photo, if any."""
-    if not yarn.photos:
+    """Return the thumbnail URL for the preview photo, if any."""
+    if not yarn.preview_photo_filename:
         return None
-    first = yarn.photos[0]
-    return get_thumbnail_url(first.filename, yarn.id, subdir="yarns")
+    return get_thumbnail_url(yarn.preview_photo_filename, yarn.id, subdir="yarns")
 
 
 def resolve_project_preview(project: Project) -> dict[str, str | None]:
     """Return preview image data for a project if any images exist."""
-    candidates = [img for img in project.images if img.is_title_image]
-    if not candidates and project.images:
-        candidates = [project.images[0]]
-    if not candidates:
+    card_images = project.card_image_list()
+    if not card_images:
         return {"preview_url": None, "preview_alt": None}
 
-    image = candidates[0]
-    thumb_name = f"thumb_{Path(image.filename).stem}.jpg"
+    image = card_images[0]
+    filename = str(image["filename"])
+    thumb_name = f"thumb_{Path(filename).stem}.jpg"
     thumb_path = (
         config.MEDIA_ROOT / "thumbnails" / "projects" / str(project.id) / thumb_name
     )
     url = None
     if thumb_path.exists():
         url = get_thumbnail_url(
-            image.filename,
+            filename,
             project.id,
             subdir="projects",
         )
-    file_path = config.MEDIA_ROOT / "projects" / str(project.id) / image.filename
+    file_path = config.MEDIA_ROOT / "projects" / str(project.id) / filename
     if file_path.exists():
         url = get_file_url(
-            image.filename,
+            filename,
             project.id,
             subdir="projects",
         )
 
-    return {"preview_url": url, "preview_alt": image.alt_text or project.name}
+    return {"preview_url": url, "preview_alt": image.get("alt_text") or project.name}
 
 
 def get_yarn_photo_dimensions(
@@ -101,13 +99,16 @@ def serialize_yarn_photos(yarn: Yarn) -> list[dict[str, object]]:
 
 def serialize_yarn_cards(
     yarns: Iterable[Yarn],
-    current_user: User | None = None,
+    favorite_ids: Collection[int] = (),
+    descriptions: Mapping[int, str | None] | None = None,
 ) -> list[dict[str, object]]:
-    """Prepare yarn entries for list rendering with preview URLs."""
-    favorites = set()
-    if current_user:
-        favorites = {y.id for y in current_user.favorite_yarns}
+    """Prepare yarn entries for list rendering with preview URLs.
 
+    Expects yarns loaded with ``YARN_LIST_COLUMNS``; ``descriptions`` maps
+    yarn ids to the excerpt selected alongside them (see
+    :mod:`stricknani.services.yarn.listing`).
+    """
+    descriptions = descriptions or {}
     return [
         {
             "yarn": {
@@ -120,12 +121,11 @@ def serialize_yarn_cards(
                 "weight_category": yarn.weight_category,
                 "weight_grams": yarn.weight_grams,
                 "length_meters": yarn.length_meters,
-                "description": yarn.description,
-                "notes": yarn.notes,
+                "description": descriptions.get(yarn.id),
                 "created_at": yarn.created_at.isoformat() if yarn.created_at else None,
                 "updated_at": yarn.updated_at.isoformat() if yarn.updated_at else None,
-                "project_count": len(yarn.projects),
-                "is_favorite": yarn.id in favorites,
+                "project_count": yarn.project_count,
+                "is_favorite": yarn.id in favorite_ids,
                 "is_ai_enhanced": yarn.is_ai_enhanced,
             },
             "preview_url": resolve_yarn_preview(yarn),
@@ -21,6 +21,13 @@
 		const fileInput = dialog.querySelector("[data-import-file-input]");
 		const submitBtn = dialog.querySelector("[data-import-submit]");
 		const fileListEl = dialog.querySelector("#importFileList");
+		const progressEl = dialog.querySelector("[data-import-progress]");
+		let stageLabels = {};
+		try {
+			stageLabels = JSON.parse(progressEl?.dataset.importStageLabels || "{}");
+		} catch {
+			stageLabels = {};
+		}
 
 		const filesToUpload = new Map();
 
@@ -181,6 +188,66 @@
 			});
 		}
 
+		function showProgress(event) {
+			const label = stageLabels[event?.name];
+			if (progressEl && label) {
+				progressEl.textContent = label;
+			}
+		}
+
+		function jobOutcome(job) {
+			if (job.status === "succeeded") {
+				return job.result;
+			}
+			throw new Error(job.error?.detail || "Unknown error");
+		}
+
+		async function pollImportJob(statusUrl) {
+			let seen = 0;
+			let job = null;
+			while (job?.status !== "succeeded" && job?.status !== "failed") {
+				if (job) {
+					await new Promise((resolve) => setTimeout(resolve, 1000));
+				}
+				const response = await fetch(`${statusUrl}?after=${seen}`, {
+					headers: { Accept: "application/json" },
+				});
+				if (!response.ok) {
+					throw new Error("Import job not found");
+				}
+				job = await response.json();
+				job.events.forEach(showProgress);
+				seen = job.event_count;
+			}
+			return jobOutcome(job);
+		}
+
+		// Follow a background import until it finishes: server-sent events
+		// where available, polling otherwise (or once the stream breaks).
+		function followImportJob(accepted) {
+			if (typeof EventSource === "undefined") {
+				return pollImportJob(accepted.status_url);
+			}
+			return new Promise((resolve, reject) => {
+				const source = new EventSource(accepted.events_url);
+				source.addEventListener("progress", (e) => {
+					showProgress(JSON.parse(e.data));
+				});
+				source.addEventListener("done", (e) => {
+					source.close();
+					try {
+						resolve(jobOutcome(JSON.parse(e.data)));
+					} catch (err) {
+						reject(err);
+					}
+				});
+				source.onerror = () => {
+					source.close();
+					pollImportJob(accepted.status_url).then(resolve, reject);
+				};
+			});
+		}
+
 		if (!form.dataset.importSubmitInitialized) {
 			form.dataset.importSubmitInitialized = "1";
 			form.addEventListener("submit", async (e) => {
@@ -221,6 +288,9 @@
 				if (loading) {
 					loading.hidden = false;
 				}
+				if (progressEl) {
+					progressEl.textContent = "";
+				}
 
 				try {
 					const response = await fetch(form.action, {
@@ -233,7 +303,10 @@
 						throw new Error(error.detail || "Unknown error");
 					}
 
-					const data = await response.json();
+					let data = await response.json();
+					if (response.status === 202) {
+						data = await followImportJob(data);
+					}
 					const populate = populateFnName ? window[populateFnName] : null;
 
 					if (typeof populate === "function") {
@@ -384,7 +384,11 @@ document.addEventListener("DOMContentLoaded", () => {
 
 			sessionStorage.removeItem("importedData");
 			window.unsavedChanges?.setDirty(true);
-			window.showToast?.("{{ _("Pattern data loaded - please review and save") }}", "success");
+			if (data.import_warnings?.length) {
+				window.showToast?.(data.import_warnings.join(" "), "warning");
+			} else {
+				window.showToast?.("{{ _("Pattern data loaded - please review and save") }}", "success");
+			}
 
 			setTimeout(() => {
 				const saveButton = document.querySelector('button[type="submit"]');
@@ -2959,7 +2963,11 @@ document.addEventListener("DOMContentLoaded", () => {
 				if (fileInput) fileInput.value = "";
 				if (typeof hideFilePreview === "function") hideFilePreview();
 
-				window.showToast?.("{{ _("Pattern imported successfully") }}", "success");
+				if (data.import_warnings?.length) {
+					window.showToast?.(data.import_warnings.join(" "), "warning");
+				} else {
+					window.showToast?.("{{ _("Pattern imported successfully") }}", "success");
+				}
 				window.unsavedChanges?.setDirty(true);
 
 				document
@@ -144,7 +144,11 @@ window.populateYarnForm = function (data) {
 	if (aiCheckboxMobile) aiCheckboxMobile.checked = isAiEnhanced;
 
 	window.unsavedChanges?.setDirty(true);
-	window.showToast?.("{{ _("Data imported successfully!") }}", "success");
+	if (data.import_warnings?.length) {
+		window.showToast?.(data.import_warnings.join(" "), "warning");
+	} else {
+		window.showToast?.("{{ _("Data imported successfully!") }}", "success");
+	}
 };
 
 function addPendingImageToGallery(url) {
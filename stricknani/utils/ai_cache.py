@@ -0,0 +1,173 @@
+"""On-disk cache of structured AI extraction results.
+
+An AI import takes 20-60 seconds and costs money, and people retry, preview
+and then import, or re-run ``stricknani-cli ai ingest`` on the same page, PDF
+or photos. :class:`~stricknani.importing.extractors.ai.AIExtractor`,
+:class:`~stricknani.utils.ai_importer.AIPatternImporter` and
+:func:`~stricknani.utils.ai_ingest.ingest_with_openai` keep the JSON the model
+returned here, in ``AI_CACHE_DIR``, and reuse it for an identical request:
+
+* entries are keyed by provider, model, a hash of the output schema, a hash
+  of the system prompt and a hash of the normalized request content (Unicode
+  NFC, line endings and runs of blanks folded), plus the sampling options;
+* only outputs that parsed as JSON are stored, never error fallbacks;
+* entries expire ``AI_CACHE_TTL`` seconds after they were stored, and the
+  least recently used are evicted beyond ``AI_CACHE_MAX_BYTES``.
+
+Callers pass ``use_cache=False`` (``--no-cache`` on the CLI) to skip the
+lookup and store a fresh result. The web routes and the CLI share the one
+cache, and :meth:`AIResultCache.stats` counts its hits and misses
+(``/admin/cache-stats``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any
+
+from stricknani.config import config
+from stricknani.utils.disk_cache import DirectoryCache
+
+_BLANKS = re.compile(r"[ \t\f\v]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def _normalize(value: Any) -> Any:
+    """Fold differences in the request that cannot change the model's answer."""
+    if isinstance(value, str):
+        text = unicodedata.normalize("NFC", value).replace("\r\n", "\n")
+        text = "\n".join(_BLANKS.sub(" ", line).strip() for line in text.split("\n"))
+        return _BLANK_LINES.sub("\n\n", text).strip()
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def _digest(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def ai_cache_key(
+    *,
+    provider: str,
+    model: str,
+    schema: Any,
+    system_prompt: str,
+    content: Any,
+    options: dict[str, Any] | None = None,
+) -> str:
+    """Hash everything about an AI request that can change its output.
+
+    ``content`` is the user message (a prompt string or the provider's list of
+    text and image parts) and ``options`` the sampling and API settings.
+    """
+    return _digest(
+        {
+            "provider": provider,
+            "model": model,
+            "schema": _digest(schema),
+            "system_prompt": _digest(system_prompt),
+            "content": _digest(_normalize(content)),
+            "options": options or {},
+        }
+    )
+
+
+class AIResultCache(DirectoryCache):
+    """JSON results in ``directory``, ``ttl`` seconds each, ``max_bytes`` in all.
+
+    Each entry is a ``<key>.json`` file holding when it was stored and the
+    output, kept as :class:`~stricknani.utils.disk_cache.DirectoryCache`
+    describes. A cache that cannot be read or written counts as a miss or an
+    unstored result, never as a failed extraction.
+    """
+
+    name = "AI"
+
+    def __init__(self, directory: Path, *, max_bytes: int, ttl: float) -> None:
+        super().__init__(directory, max_bytes=max_bytes)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    async def lookup(self, key: str, *, use_cache: bool = True) -> Any | None:
+        """Return the stored output for ``key`` unless bypassed with ``use_cache``."""
+        return await self.get(key) if use_cache else None
+
+    async def get(self, key: str) -> Any | None:
+        """Return the stored output for ``key``, or ``None`` on a miss."""
+        output = await self._in_thread("read", self._load, key)
+        with self._lock:
+            if output is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return output
+
+    async def put(self, key: str, output: Any) -> None:
+        """Store the output of the request ``key``."""
+        await self._in_thread("write", self._save, key, output)
+
+    def stats(self) -> dict[str, float]:
+        """Return hits, misses, stores, evictions, errors and the hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "errors": self.errors,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _load(self, key: str) -> Any | None:
+        (path,) = self._paths(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            stored_at = float(entry["stored_at"])
+            output = entry["output"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if time.time() - stored_at > self.ttl:
+            path.unlink(missing_ok=True)
+            return None
+        self._touch(key)
+        return output
+
+    def _save(self, key: str, output: Any) -> None:
+        data = json.dumps({"stored_at": time.time(), "output": output}).encode()
+        if len(data) > self.max_bytes:
+            return
+        (path,) = self._paths(key)
+        self._write(path, data)
+        with self._lock:
+            self.stores += 1
+        self._evict()
+
+
+def get_ai_cache() -> AIResultCache | None:
+    """Return the configured cache, or ``None`` if it is disabled."""
+    if (
+        config.AI_CACHE_DIR is None
+        or config.AI_CACHE_MAX_BYTES <= 0
+        or config.AI_CACHE_TTL <= 0
+    ):
+        return None
+    return AIResultCache.shared(
+        config.AI_CACHE_DIR,
+        max_bytes=config.AI_CACHE_MAX_BYTES,
+        ttl=config.AI_CACHE_TTL,
+    )
+
+
+__all__ = ["AIResultCache", "ai_cache_key", "get_ai_cache"]
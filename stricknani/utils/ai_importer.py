@@ -7,7 +7,6 @@ import re
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
-import httpx
 from bs4 import BeautifulSoup, Tag
 from sqlalchemy import Integer, String, Text
 
@@ -125,6 +124,11 @@ def _build_schema_from_model(model_class: type) -> dict[str, Any]:
             "link",  # Skip link as we set it manually from the URL
             "link_archive",
             "link_archive_requested_at",
+            # Card summaries are derived from images/links, never extracted.
+            "card_images",
+            "image_count",
+            "yarn_count",
+            "yarn_names",
         }:
             continue
 
@@ -348,8 +352,13 @@ class AIPatternImporter:
         timeout: int = 30,
         hints: dict[str, Any] | None = None,
         trace: "ImportTrace | None" = None,
+        use_cache: bool = True,
     ) -> None:
-        """Initialize with URL to import."""
+        """Initialize with URL to import.
+
+        ``use_cache=False`` asks the model again instead of reusing a cached
+        answer to an identical request (see :mod:`stricknani.utils.ai_cache`).
+        """
         self.url = url
         self.timeout = timeout
         self.provider = resolve_ai_provider()
@@ -358,6 +367,7 @@ class AIPatternImporter:
         self.model = get_default_ai_model(provider=self.provider, api_style="chat")
         self.hints = hints
         self.trace = trace
+        self.use_cache = use_cache
 
     async def fetch_and_parse(self) -> dict[str, Any]:
         """Fetch URL and extract pattern data using AI."""
@@ -367,57 +377,25 @@ class AIPatternImporter:
                 "Set AI_API_KEY or provider-specific API key environment variable."
             )
 
-        # Fetch the page
+        # Fetch the page through the shared import fetch: pooled, SSRF-checked
+        # on every redirect hop, and served from the HTTP cache when fresh.
         logger.info("Importing pattern with AI from %s", self.url)
-        async with httpx.AsyncClient(
-            timeout=self.timeout, follow_redirects=True, headers=IMPORT_HEADERS
-        ) as client:
-            response = await client.get(self.url)
-            response.raise_for_status()
-            logger.debug(
-                "AI import response %s %s",
-                response.status_code,
-                response.headers.get("content-type", ""),
-            )
-
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
-
-        # Get text content using Trafilatura if available
-        text_content = ""
-        if _is_garnstudio_url(self.url):
-            text_content = _extract_garnstudio_text(soup)
-        try:
-            import trafilatura
-
-            # Trafilatura needs the raw HTML string, which we have in response.text
-            if not text_content:
-                text_content = (
-                    trafilatura.extract(
-                        response.text,
-                        include_comments=False,
-                        include_tables=False,
-                        no_fallback=False,
-                    )
-                    or ""
-                )
-        except ImportError:
-            pass
+        from stricknani.importing import fetch
 
-        # Fallback to BeautifulSoup if Trafilatura fails or returns empty
-        if not text_content:
-            text_content = soup.get_text(separator="\n", strip=True)
+        response = await fetch.fetch_url(
+            self.url, timeout=self.timeout, headers=IMPORT_HEADERS, cache=True
+        )
+        logger.debug(
+            "AI import response %s %s",
+            response.status_code,
+            response.headers.get("content-type", ""),
+        )
 
-        # Limit text length to avoid token limits
-        if text_content and len(text_content) > 12000:
-            text_content = text_content[:12000]
+        from stricknani.importing.parsing import parse_pool
 
-        # Extract images
-        images = await self._extract_images(soup)
-        images = self._deduplicate_image_urls(images)
+        source = await parse_pool.run(extract_source, self.url, response.text)
+        text_content = source["text"]
+        images = source["image_urls"]
 
         logger.debug("AI import image URLs: %s", images[:5])
 
@@ -527,7 +505,7 @@ class AIPatternImporter:
 
         return deduplicated
 
-    async def _extract_images(self, soup: BeautifulSoup) -> list[str]:
+    def _extract_images(self, soup: BeautifulSoup) -> list[str]:
         """Extract image URLs from the page."""
         # Use a list of tuples (url, tag) to allow scoring based on tag attributes
         extracted: list[tuple[str, Any | None]] = []
@@ -803,10 +781,75 @@ class AIPatternImporter:
         image_urls: list[str],
         hints: dict[str, Any] | None,
     ) -> dict[str, Any]:
-        """Use OpenAI to extract pattern information."""
-        from stricknani.models import Project
+        """Use OpenAI to extract pattern information.
+
+        Text longer than ``AI_CHUNK_CHARS`` is split at section headers and the
+        parts are extracted concurrently and merged (see
+        :mod:`stricknani.importing.chunking`).
+        """
+        from stricknani.config import config
+        from stricknani.importing.chunking import (
+            failed_part_warning,
+            merge_chunk_results,
+            run_chunks,
+            split_text,
+        )
 
-        client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        chunks = split_text(text_content, config.AI_CHUNK_CHARS)
+
+        async def extract_chunk(index: int, chunk: str) -> dict[str, Any]:
+            return await self._ai_extract_chunk(
+                chunk, image_urls, hints, part=(index, len(chunks))
+            )
+
+        outcomes = await run_chunks(extract_chunk, chunks, config.AI_CHUNK_CONCURRENCY)
+        parts: list[dict[str, Any]] = []
+        warnings: list[str] = []
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(
+                    "AI extraction of part %s/%s failed",
+                    index + 1,
+                    len(chunks),
+                    exc_info=outcome,
+                )
+                if self.trace:
+                    self.trace.record_error("ai_extract", outcome)
+                warnings.append(failed_part_warning(index, len(chunks)))
+            else:
+                parts.append(outcome)
+
+        if parts:
+            merged = merge_chunk_results(parts)
+            if warnings:
+                merged["import_warnings"] = warnings
+            return merged
+
+        # Fallback to empty data if AI extraction fails
+        return {
+            "title": None,
+            "needles": None,
+            "yarn": None,
+            "description": (
+                f"Imported from {self.url}\n\n"
+                "(AI extraction failed - please fill in manually)"
+            ),
+            "notes": None,
+            "steps": [],
+        }
+
+    async def _ai_extract_chunk(
+        self,
+        text_content: str,
+        image_urls: list[str],
+        hints: dict[str, Any] | None,
+        *,
+        part: tuple[int, int] = (0, 1),
+    ) -> dict[str, Any]:
+        """Extract one part of the text, or reuse the cached answer for it."""
+        from stricknani.importing.chunking import chunk_prompt_note, token_usage
+        from stricknani.models import Project
+        from stricknani.utils.ai_cache import ai_cache_key, get_ai_cache
 
         # Build schema dynamically from Project model
         schema = _build_schema_from_model(Project)
@@ -818,47 +861,106 @@ class AIPatternImporter:
             image_urls=image_urls,
             source_url=self.url,
         )
+        index, total = part
+        trace_part = index + 1 if total > 1 else None
+        if total > 1:
+            user_prompt += f"\n\n{chunk_prompt_note(index, total)}"
         _log_ai_prompt(system_prompt, user_prompt)
         if self.trace:
-            self.trace.record_ai_prompt(system_prompt, user_prompt)
-
-        try:
-            response = await client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1,
+            self.trace.record_ai_prompt(system_prompt, user_prompt, part=trace_part)
+
+        cache = get_ai_cache()
+        cache_key = ai_cache_key(
+            provider=self.provider,
+            model=self.model,
+            schema=schema,
+            system_prompt=system_prompt,
+            content=user_prompt,
+            options={"api": "chat", "temperature": 0.1},
+        )
+        if cache is not None:
+            cached = await cache.lookup(cache_key, use_cache=self.use_cache)
+            if isinstance(cached, dict):
+                logger.info("Reusing cached AI extraction for %s", self.url)
+                if self.trace:
+                    self.trace.add_event(
+                        "ai_cache_hit", {"part": index + 1, "key": cache_key}
+                    )
+                return cached
+
+        client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        response = await client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.1,
+        )
+
+        raw_content = response.choices[0].message.content or ""
+        _log_ai_response(raw_content)
+        if self.trace:
+            self.trace.record_ai_response(raw_content, part=trace_part)
+        result = json_module.loads(raw_content or "{}")
+        if not isinstance(result, dict):
+            raise ValueError("AI returned JSON that is not an object")
+
+        usage = token_usage(response)
+        logger.info("AI extraction of part %s/%s used %s", index + 1, total, usage)
+        if self.trace:
+            self.trace.add_event(
+                "ai_chunk",
+                {"part": index + 1, "of": total, "chars": len(text_content), **usage},
+            )
+        if cache is not None:
+            await cache.put(cache_key, result)
+        return result
+
+
+def extract_source(url: str, html: str) -> dict[str, Any]:
+    """Extract the text and image URLs of a page for the AI model.
+
+    Runs in the import parse pool: page HTML in, ``{"text", "image_urls"}`` out.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Remove script and style elements
+    for script in soup(["script", "style", "nav", "footer", "header"]):
+        script.decompose()
+
+    # Get text content using Trafilatura if available
+    text_content = ""
+    if _is_garnstudio_url(url):
+        text_content = _extract_garnstudio_text(soup)
+    try:
+        import trafilatura
+
+        # Trafilatura needs the raw HTML string
+        if not text_content:
+            text_content = (
+                trafilatura.extract(
+                    html,
+                    include_comments=False,
+                    include_tables=False,
+                    no_fallback=False,
+                )
+                or ""
             )
+    except ImportError:
+        pass
+
+    # Fallback to BeautifulSoup if Trafilatura fails or returns empty
+    if not text_content:
+        text_content = soup.get_text(separator="\n", strip=True)
+
+    # Extract images
+    importer = AIPatternImporter(url)
+    images = importer._extract_images(soup)  # noqa: SLF001
+    images = importer._deduplicate_image_urls(images)  # noqa: SLF001
 
-            import json as json_parser
-
-            raw_content = response.choices[0].message.content or ""
-            _log_ai_response(raw_content)
-            if self.trace:
-                self.trace.record_ai_response(raw_content)
-            result: dict[str, Any] = json_parser.loads(raw_content or "{}")
-            return result
-
-        except Exception as exc:
-            logger.error("AI extraction failed", exc_info=True)
-            if self.trace:
-                self.trace.record_error("ai_extract", exc)
-
-            # Fallback to empty data if AI extraction fails
-            return {
-                "title": None,
-                "needles": None,
-                "yarn": None,
-                "description": (
-                    f"Imported from {self.url}\n\n"
-                    "(AI extraction failed - please fill in manually)"
-                ),
-                "notes": None,
-                "steps": [],
-            }
+    return {"text": text_content, "image_urls": images}
 
 
 def _log_ai_response(raw_content: str) -> None:
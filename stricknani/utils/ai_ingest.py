@@ -17,11 +17,13 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal, cast
 
-import httpx
 from bs4 import BeautifulSoup
 from sqlalchemy import Boolean, Integer, String, Text
 
+from stricknani.importing.clients import get_public_url, import_http
+from stricknani.importing.fetch import fetch_url
 from stricknani.models import Project, ProjectCategory, Yarn
+from stricknani.utils.ai_cache import ai_cache_key, get_ai_cache
 from stricknani.utils.ai_importer import (
     IMPORT_HEADERS,
     AIPatternImporter,
@@ -29,6 +31,7 @@ from stricknani.utils.ai_importer import (
     _is_garnstudio_url,
 )
 from stricknani.utils.ai_provider import (
+    AIProvider,
     get_ai_api_key,
     get_ai_base_url,
     get_default_ai_model,
@@ -133,6 +136,15 @@ def _model_to_openai_json_schema(
         "link_archive_requested_at",
         "link_archive_failed",
         "is_ai_enhanced",
+        # Card summaries are derived from images/links, never extracted.
+        "card_images",
+        "image_count",
+        "yarn_count",
+        "yarn_names",
+        "preview_photo_id",
+        "preview_photo_filename",
+        "photo_count",
+        "project_count",
     }
 
     for name, _annotation in inspect.get_annotations(model_class).items():
@@ -437,10 +449,10 @@ def _looks_like_diagram_url(url: str) -> bool:
 async def _fetch_image_data_url(url: str, *, timeout_s: int = 15) -> str | None:
     """Fetch an image and return a data: URL for OpenAI input_image."""
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout_s, follow_redirects=True
-        ) as client:
-            resp = await client.get(url, headers=IMPORT_HEADERS)
+        async with import_http.httpx_client() as client:
+            resp = await get_public_url(
+                client, url, headers=IMPORT_HEADERS, timeout=timeout_s
+            )
             resp.raise_for_status()
     except Exception:
         return None
@@ -458,13 +470,20 @@ async def _fetch_image_data_url(url: str, *, timeout_s: int = 15) -> str | None:
 
 
 async def extract_url(url: str, *, timeout_s: int = 30) -> URLExtraction:
-    async with httpx.AsyncClient(
-        timeout=timeout_s, follow_redirects=True, headers=IMPORT_HEADERS
-    ) as client:
-        response = await client.get(url)
-        response.raise_for_status()
+    from stricknani.importing.parsing import parse_pool
+
+    response = await fetch_url(
+        url, timeout=timeout_s, headers=IMPORT_HEADERS, cache=True
+    )
+    return URLExtraction(**await parse_pool.run(_extract_page, url, response.text))
+
 
-    soup = BeautifulSoup(response.text, "html.parser")
+def _extract_page(url: str, html: str) -> dict[str, Any]:
+    """Extract the text, images and yarn links of a page for the AI model.
+
+    Runs in the import parse pool: page HTML in, :class:`URLExtraction` fields out.
+    """
+    soup = BeautifulSoup(html, "html.parser")
     for script in soup(["script", "style", "nav", "footer", "header"]):
         script.decompose()
 
@@ -496,7 +515,7 @@ async def extract_url(url: str, *, timeout_s: int = 30) -> URLExtraction:
 
             text_content = (
                 trafilatura.extract(
-                    response.text,
+                    html,
                     include_comments=False,
                     include_tables=False,
                     no_fallback=False,
@@ -560,14 +579,14 @@ async def extract_url(url: str, *, timeout_s: int = 30) -> URLExtraction:
 
     # Reuse the existing (battle-tested) image extraction heuristics.
     tmp = AIPatternImporter(url)
-    images = await tmp._extract_images(soup)  # noqa: SLF001
+    images = tmp._extract_images(soup)  # noqa: SLF001
     images = tmp._deduplicate_image_urls(images)  # noqa: SLF001
 
-    return URLExtraction(
-        text=text_content,
-        image_urls=images[:30],
-        yarn_candidates=yarn_candidates,
-    )
+    return {
+        "text": text_content,
+        "image_urls": images[:30],
+        "yarn_candidates": yarn_candidates,
+    }
 
 
 def validate_minimally(data: object, schema: dict[str, Any]) -> dict[str, Any]:
@@ -594,114 +613,27 @@ def validate_minimally(data: object, schema: dict[str, Any]) -> dict[str, Any]:
     return cast(dict[str, Any], data)
 
 
-async def ingest_with_openai(
+async def _request_structured_output(
     *,
+    use_responses_api: bool,
+    provider: AIProvider,
+    api_key: str,
     target: AIIngestTarget,
     schema: dict[str, Any],
-    source_url: str | None = None,
-    source_text: str | None = None,
-    file_paths: list[Path] | None = None,
+    content: list[dict[str, Any]],
     instructions: str,
-    model: str | None,
+    model_name: str,
     temperature: float | None,
     max_output_tokens: int,
-) -> dict[str, Any]:
-    """Run an LLM extraction with an OpenAI-compatible provider."""
-    provider = resolve_ai_provider()
-    api_key = get_ai_api_key(provider=provider)
-    if not api_key:
-        raise ValueError("AI API key is not set for the configured provider")
-
+) -> Any:
+    """Ask the provider for JSON matching ``schema`` and return it decoded."""
     from openai import AsyncOpenAI, BadRequestError
 
-    content: list[dict[str, Any]] = []
-
-    if source_url:
-        extracted = await extract_url(source_url)
-        yarn_candidates = extracted.yarn_candidates
-
-        # Best-effort: attach likely diagram/legend images so the model can extract
-        # diagram text/legends for step 0.
-        diagram_urls = [u for u in extracted.image_urls if _looks_like_diagram_url(u)]
-        diagram_data_urls: list[str] = []
-        for u in diagram_urls[:3]:
-            data_url = await _fetch_image_data_url(u)
-            if data_url:
-                diagram_data_urls.append(data_url)
-
-        content.append(
-            {
-                "type": "input_text",
-                "text": (
-                    "Source: URL\n"
-                    f"URL: {source_url}\n\n"
-                    "Extracted text:\n"
-                    f"{extracted.text}\n\n"
-                    "Candidate image URLs:\n"
-                    + "\n".join(f"- {u}" for u in extracted.image_urls)
-                ),
-            }
-        )
-        for data_url in diagram_data_urls:
-            content.append(
-                {
-                    "type": "input_image",
-                    "detail": "high",
-                    "image_url": data_url,
-                }
-            )
-    elif source_text is not None:
-        yarn_candidates = None
-        content.append(
-            {
-                "type": "input_text",
-                "text": f"Source: text\n\n{source_text}",
-            }
-        )
-    elif file_paths:
-        yarn_candidates = None
-        content.append(
-            {
-                "type": "input_text",
-                "text": (
-                    "Source: files\n"
-                    "The following files are attached below:\n"
-                    + "\n".join(
-                        f"- {p.name} ({_guess_mime_type(p)})" for p in file_paths
-                    )
-                ),
-            }
-        )
-        for path in file_paths:
-            raw = path.read_bytes()
-            mime_type = _guess_mime_type(path)
-            if mime_type.startswith("image/"):
-                content.append(
-                    {
-                        "type": "input_image",
-                        "detail": "high",
-                        "image_url": _data_url(mime_type, raw),
-                    }
-                )
-            else:
-                content.append(
-                    {
-                        "type": "input_file",
-                        "filename": path.name,
-                        "file_data": base64.b64encode(raw).decode("ascii"),
-                    }
-                )
-    else:
-        raise ValueError("No source provided (url/text/file)")
-
-    model_name = model or get_default_ai_model(provider=provider, api_style="responses")
     client = AsyncOpenAI(
         api_key=api_key,
         base_url=get_ai_base_url(provider=provider),
     )
 
-    use_responses_api = provider in {"openai", "openrouter"}
-
     if use_responses_api:
         # The OpenAI SDK uses rich union types for `input`/`text`; keep call-sites
         # ergonomic and cast to satisfy strict type checking.
@@ -813,7 +745,153 @@ async def ingest_with_openai(
             raise ValueError("AI provider returned an empty response")
         parsed = json.loads(raw_text)
 
+    return parsed
+
+
+async def ingest_with_openai(
+    *,
+    target: AIIngestTarget,
+    schema: dict[str, Any],
+    source_url: str | None = None,
+    source_text: str | None = None,
+    file_paths: list[Path] | None = None,
+    instructions: str,
+    model: str | None,
+    temperature: float | None,
+    max_output_tokens: int,
+    use_cache: bool = True,
+) -> dict[str, Any]:
+    """Run an LLM extraction with an OpenAI-compatible provider.
+
+    Identical requests reuse the cached result unless ``use_cache`` is false
+    (see :mod:`stricknani.utils.ai_cache`).
+    """
+    provider = resolve_ai_provider()
+    api_key = get_ai_api_key(provider=provider)
+    if not api_key:
+        raise ValueError("AI API key is not set for the configured provider")
+
+    content: list[dict[str, Any]] = []
+
+    if source_url:
+        extracted = await extract_url(source_url)
+        yarn_candidates = extracted.yarn_candidates
+
+        # Best-effort: attach likely diagram/legend images so the model can extract
+        # diagram text/legends for step 0.
+        diagram_urls = [u for u in extracted.image_urls if _looks_like_diagram_url(u)]
+        diagram_data_urls: list[str] = []
+        for u in diagram_urls[:3]:
+            data_url = await _fetch_image_data_url(u)
+            if data_url:
+                diagram_data_urls.append(data_url)
+
+        content.append(
+            {
+                "type": "input_text",
+                "text": (
+                    "Source: URL\n"
+                    f"URL: {source_url}\n\n"
+                    "Extracted text:\n"
+                    f"{extracted.text}\n\n"
+                    "Candidate image URLs:\n"
+                    + "\n".join(f"- {u}" for u in extracted.image_urls)
+                ),
+            }
+        )
+        for data_url in diagram_data_urls:
+            content.append(
+                {
+                    "type": "input_image",
+                    "detail": "high",
+                    "image_url": data_url,
+                }
+            )
+    elif source_text is not None:
+        yarn_candidates = None
+        content.append(
+            {
+                "type": "input_text",
+                "text": f"Source: text\n\n{source_text}",
+            }
+        )
+    elif file_paths:
+        yarn_candidates = None
+        content.append(
+            {
+                "type": "input_text",
+                "text": (
+                    "Source: files\n"
+                    "The following files are attached below:\n"
+                    + "\n".join(
+                        f"- {p.name} ({_guess_mime_type(p)})" for p in file_paths
+                    )
+                ),
+            }
+        )
+        for path in file_paths:
+            raw = path.read_bytes()
+            mime_type = _guess_mime_type(path)
+            if mime_type.startswith("image/"):
+                content.append(
+                    {
+                        "type": "input_image",
+                        "detail": "high",
+                        "image_url": _data_url(mime_type, raw),
+                    }
+                )
+            else:
+                content.append(
+                    {
+                        "type": "input_file",
+                        "filename": path.name,
+                        "file_data": base64.b64encode(raw).decode("ascii"),
+                    }
+                )
+    else:
+        raise ValueError("No source provided (url/text/file)")
+
+    model_name = model or get_default_ai_model(provider=provider, api_style="responses")
+    use_responses_api = provider in {"openai", "openrouter"}
+
+    cache = get_ai_cache()
+    cache_key = ai_cache_key(
+        provider=provider,
+        model=model_name,
+        schema=schema,
+        system_prompt=instructions,
+        content=content,
+        options={
+            "api": "responses" if use_responses_api else "chat",
+            "temperature": temperature,
+            "max_output_tokens": max_output_tokens,
+        },
+    )
+    cached = (
+        await cache.lookup(cache_key, use_cache=use_cache)
+        if cache is not None
+        else None
+    )
+    if cached is not None:
+        logger.info("Reusing cached AI ingestion %s", cache_key[:12])
+        parsed = cached
+    else:
+        parsed = await _request_structured_output(
+            use_responses_api=use_responses_api,
+            provider=provider,
+            api_key=api_key,
+            target=target,
+            schema=schema,
+            content=content,
+            instructions=instructions,
+            model_name=model_name,
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+        )
+
     data = validate_minimally(parsed, schema)
+    if cache is not None and cached is None:
+        await cache.put(cache_key, parsed)
     if source_url and "link" in (schema.get("properties") or {}):
         if not data.get("link"):
             data["link"] = source_url
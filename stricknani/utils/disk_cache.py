@@ -0,0 +1,126 @@
+"""Directory-backed caches evicted least recently used first.
+
+:class:`~stricknani.importing.http_cache.HTTPCache` and
+:class:`~stricknani.utils.ai_cache.AIResultCache` keep each entry as files in
+one directory. :class:`DirectoryCache` is the file work they share:
+
+* an entry is a ``<key>.json`` file, plus one file per
+  :attr:`~DirectoryCache.extra_suffixes` next to it;
+* files are written to a temporary name and renamed into place, so a reader
+  never sees half an entry;
+* serving an entry touches its ``.json`` file, and that modification time is
+  the LRU order in which entries are evicted beyond ``max_bytes``;
+* the blocking file work runs in a thread, and is best effort: an unusable
+  directory is logged and counted in ``errors``, and the caller carries on as
+  if the entry were missing or not stored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import uuid
+from collections.abc import Callable, Hashable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, ClassVar, Self, cast
+
+logger = logging.getLogger("stricknani.imports")
+
+
+class DirectoryCache:
+    """Entries in ``directory``, at most ``max_bytes`` of them."""
+
+    #: Name of the cache in log messages.
+    name: ClassVar[str] = "disk"
+    #: Suffixes of the files an entry has besides ``<key>.json``.
+    extra_suffixes: ClassVar[tuple[str, ...]] = ()
+
+    def __init__(self, directory: Path, *, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.errors = 0
+
+    @classmethod
+    def shared(cls, directory: Path, **options: Any) -> Self:
+        """Return the one instance all callers share for these settings."""
+        # typeshed does not call classes Hashable, but they are.
+        factory = cast(Hashable, cls)
+        return cast(Self, _shared(factory, directory, tuple(sorted(options.items()))))
+
+    async def _in_thread(
+        self, action: str, func: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Run ``func(*args)`` in a thread; an ``OSError`` is logged as ``None``."""
+        try:
+            return await asyncio.to_thread(func, *args)
+        except OSError as exc:
+            with self._lock:
+                self.errors += 1
+            logger.warning(
+                "Could not %s %s cache in %s: %s",
+                action,
+                self.name,
+                self.directory,
+                exc,
+            )
+            return None
+
+    def _paths(self, key: str) -> tuple[Path, ...]:
+        return tuple(
+            self.directory / f"{key}{suffix}"
+            for suffix in (".json", *self.extra_suffixes)
+        )
+
+    def _write(self, path: Path, data: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def _touch(self, key: str) -> None:
+        try:
+            os.utime(self._paths(key)[0])
+        except OSError:
+            pass
+
+    def _remove(self, key: str) -> None:
+        for path in self._paths(key):
+            path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, int, str]] = []
+        total = 0
+        for meta_path in self.directory.glob("*.json"):
+            key = meta_path.stem
+            try:
+                last_used = meta_path.stat().st_mtime
+                size = sum(path.stat().st_size for path in self._paths(key))
+            except OSError:
+                continue
+            entries.append((last_used, size, key))
+            total += size
+        entries.sort()
+        for _, size, key in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+            with self._lock:
+                self.evictions += 1
+            logger.debug("Evicted %s cache entry %s", self.name, key)
+
+
+@lru_cache(maxsize=8)
+def _shared(
+    cls: Any, directory: Path, options: tuple[tuple[str, Any], ...]
+) -> DirectoryCache:
+    cache: DirectoryCache = cls(directory, **dict(options))
+    return cache
+
+
+__all__ = ["DirectoryCache"]
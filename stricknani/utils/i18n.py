@@ -2,9 +2,12 @@
 
 import os
 import tempfile
+import threading
+import time
 from collections.abc import Callable
 from contextlib import contextmanager, suppress
 from contextvars import ContextVar, Token
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -47,24 +50,30 @@ def _compile_catalog(po_path: Path, mo_path: Path) -> None:
         raise
 
 
-def get_translations(language: str) -> Translations | NullTranslations:
-    """Get translations for a specific language.
+def _catalog_paths(language: str) -> tuple[Path, Path, Path]:
+    """Return the ``.po`` source, packaged ``.mo`` and media-cache ``.mo``."""
+    translations_path = LOCALES_DIR / language / "LC_MESSAGES"
+    return (
+        translations_path / "messages.po",
+        translations_path / "messages.mo",
+        config.MEDIA_ROOT / "locales" / language / "LC_MESSAGES" / "messages.mo",
+    )
 
-    Args:
-        language: Language code (e.g., 'en', 'de')
 
-    Returns:
-        Translations object
-    """
-    if language not in config.SUPPORTED_LANGUAGES:
-        language = config.DEFAULT_LANGUAGE
+def _catalog_signature(language: str) -> tuple[int | None, ...]:
+    """Return the mtimes of a language's catalog files (``None`` if missing)."""
+    signature: list[int | None] = []
+    for path in _catalog_paths(language):
+        try:
+            signature.append(path.stat().st_mtime_ns)
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
 
-    translations_path = LOCALES_DIR / language / "LC_MESSAGES"
-    po_path = translations_path / "messages.po"
-    mo_path = translations_path / "messages.mo"
-    cache_path = (
-        config.MEDIA_ROOT / "locales" / language / "LC_MESSAGES" / "messages.mo"
-    )
+
+def _load_translations(language: str) -> Translations | NullTranslations:
+    """Compile the catalog if it is stale and load it from disk."""
+    po_path, mo_path, cache_path = _catalog_paths(language)
 
     if po_path.exists():
         should_compile = not mo_path.exists() and not cache_path.exists()
@@ -100,6 +109,69 @@ def get_translations(language: str) -> Translations | NullTranslations:
     return NullTranslations()
 
 
+@dataclass
+class _CachedCatalog:
+    translations: Translations | NullTranslations
+    signature: tuple[int | None, ...]
+    checked_at: float
+
+
+# Loaded catalogs per language, shared by every request in the process.
+_CATALOGS: dict[str, _CachedCatalog] = {}
+_CATALOGS_LOCK = threading.Lock()
+
+
+def get_translations(language: str) -> Translations | NullTranslations:
+    """Get translations for a specific language.
+
+    Catalogs are loaded once per process and reused. The ``.po``/``.mo``
+    mtimes are re-checked at most every ``TRANSLATIONS_RELOAD_INTERVAL``
+    seconds, and the catalog is recompiled/reloaded only when they changed.
+
+    Args:
+        language: Language code (e.g., 'en', 'de')
+
+    Returns:
+        Translations object
+    """
+    if language not in config.SUPPORTED_LANGUAGES:
+        language = config.DEFAULT_LANGUAGE
+
+    now = time.monotonic()
+    cached = _CATALOGS.get(language)
+    if cached is not None:
+        interval = config.TRANSLATIONS_RELOAD_INTERVAL
+        if interval <= 0 or now - cached.checked_at < interval:
+            return cached.translations
+        if _catalog_signature(language) == cached.signature:
+            cached.checked_at = now
+            return cached.translations
+
+    with _CATALOGS_LOCK:
+        # Another thread may have reloaded the catalog while we waited.
+        current = _CATALOGS.get(language)
+        if current is not None and current is not cached:
+            return current.translations
+        translations = _load_translations(language)
+        # Taken after loading, so a lazy compile does not trigger a reload.
+        _CATALOGS[language] = _CachedCatalog(
+            translations, _catalog_signature(language), now
+        )
+    return translations
+
+
+def preload_translations() -> None:
+    """Compile (if needed) and load every supported catalog up front."""
+    for language in config.SUPPORTED_LANGUAGES:
+        get_translations(language)
+
+
+def clear_translations_cache() -> None:
+    """Drop all loaded catalogs; the next lookup reloads them from disk."""
+    with _CATALOGS_LOCK:
+        _CATALOGS.clear()
+
+
 def gettext(message: str, language: str | None = None) -> str:
     """Translate a message.
 
@@ -221,6 +293,11 @@ def set_current_language(language: str) -> Token[str]:
     return _CURRENT_LANGUAGE.set(normalized)
 
 
+def get_current_language() -> str:
+    """Return the language active in the request-local context."""
+    return _CURRENT_LANGUAGE.get()
+
+
 def reset_current_language(token: Token[str]) -> None:
     """Reset language context to previous token."""
     _CURRENT_LANGUAGE.reset(token)
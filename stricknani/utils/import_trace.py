@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import json
 import traceback
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+from stricknani.config import config
+
 
 def _truncate(value: str, limit: int) -> tuple[str, bool]:
     if len(value) <= limit:
@@ -22,21 +25,43 @@ class ImportTrace:
     """Capture structured debug info for an import run."""
 
     trace_id: str
-    path: Path
+    path: Path | None
     max_chars: int
     data: dict[str, Any] = field(default_factory=dict)
+    # Called with every event as it is added (import jobs report progress).
+    listener: Callable[[dict[str, Any]], None] | None = None
 
     @classmethod
-    def create(cls, trace_dir: Path, *, max_chars: int) -> ImportTrace:
+    def create(
+        cls,
+        trace_dir: Path | None,
+        *,
+        max_chars: int,
+        listener: Callable[[dict[str, Any]], None] | None = None,
+    ) -> ImportTrace:
+        """Start a trace saved to ``trace_dir``, or kept in memory without one."""
         trace_id = uuid4().hex
-        trace_dir.mkdir(parents=True, exist_ok=True)
-        path = trace_dir / f"{trace_id}.json"
+        path = None
+        if trace_dir is not None:
+            trace_dir.mkdir(parents=True, exist_ok=True)
+            path = trace_dir / f"{trace_id}.json"
         data: dict[str, Any] = {
             "trace_id": trace_id,
             "created_at": datetime.now(UTC).isoformat(),
             "events": [],
         }
-        return cls(trace_id=trace_id, path=path, max_chars=max_chars, data=data)
+        return cls(
+            trace_id=trace_id,
+            path=path,
+            max_chars=max_chars,
+            data=data,
+            listener=listener,
+        )
+
+    @property
+    def persisted(self) -> bool:
+        """Whether :meth:`save` writes the trace to disk."""
+        return self.path is not None
 
     def add_event(self, name: str, payload: dict[str, Any]) -> None:
         event = {
@@ -45,6 +70,8 @@ class ImportTrace:
             "payload": payload,
         }
         self.data.setdefault("events", []).append(event)
+        if self.listener is not None:
+            self.listener(event)
 
     def record_text_blob(self, key: str, value: str | None) -> None:
         if value is None:
@@ -56,11 +83,23 @@ class ImportTrace:
             "length": len(value),
         }
 
-    def record_ai_prompt(self, system_prompt: str, user_prompt: str) -> None:
+    def _ai_record(self, part: int | None) -> dict[str, Any]:
+        """Return where the AI request of ``part`` (1-based) is recorded.
+
+        Requests for the parts of a long text run concurrently, so each part
+        gets its own record under ``ai.parts``; a single request is ``ai``.
+        """
+        record: dict[str, Any] = self.data.setdefault("ai", {})
+        if part is not None:
+            record = record.setdefault("parts", {}).setdefault(str(part), {})
+        return record
+
+    def record_ai_prompt(
+        self, system_prompt: str, user_prompt: str, *, part: int | None = None
+    ) -> None:
         system_value, system_truncated = _truncate(system_prompt, self.max_chars)
         user_value, user_truncated = _truncate(user_prompt, self.max_chars)
-        self.data.setdefault("ai", {})
-        self.data["ai"]["prompt"] = {
+        self._ai_record(part)["prompt"] = {
             "system": {
                 "value": system_value,
                 "truncated": system_truncated,
@@ -73,10 +112,9 @@ class ImportTrace:
             },
         }
 
-    def record_ai_response(self, raw_content: str) -> None:
+    def record_ai_response(self, raw_content: str, *, part: int | None = None) -> None:
         response_value, response_truncated = _truncate(raw_content, self.max_chars)
-        self.data.setdefault("ai", {})
-        self.data["ai"]["response"] = {
+        self._ai_record(part)["response"] = {
             "value": response_value,
             "truncated": response_truncated,
             "length": len(raw_content),
@@ -94,5 +132,24 @@ class ImportTrace:
         )
 
     def save(self) -> None:
+        if self.path is None:
+            return
         payload = json.dumps(self.data, indent=2, ensure_ascii=True)
         self.path.write_text(payload, encoding="utf-8")
+
+
+def start_import_trace(
+    listener: Callable[[dict[str, Any]], None] | None = None,
+) -> ImportTrace | None:
+    """Return the trace for a web import, if anything wants it.
+
+    The trace is saved to ``IMPORT_TRACE_DIR`` when ``IMPORT_TRACE_ENABLED`` is
+    set. Otherwise it is only created for a ``listener`` and kept in memory.
+    """
+    if not config.IMPORT_TRACE_ENABLED and listener is None:
+        return None
+    return ImportTrace.create(
+        config.IMPORT_TRACE_DIR if config.IMPORT_TRACE_ENABLED else None,
+        max_chars=config.IMPORT_TRACE_MAX_CHARS,
+        listener=listener,
+    )
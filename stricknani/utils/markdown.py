@@ -1,13 +1,18 @@
 """Markdown rendering utilities."""
 
+import hashlib
 import re
+import threading
 import xml.etree.ElementTree as etree
+from collections import OrderedDict
 
 import markdown as md
 import nh3
 from markdown.extensions import Extension
 from markdown.treeprocessors import Treeprocessor
 
+from stricknani.config import config
+
 
 class ImgLightboxTreeprocessor(Treeprocessor):
     """Add lightbox attributes and styling class to images."""
@@ -109,12 +114,88 @@ class ImgLightboxExtension(Extension):
         )
 
 
+# Tags and attributes that survive sanitization of rendered markdown.
+ALLOWED_TAGS = {
+    "p",
+    "br",
+    "strong",
+    "em",
+    "u",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "blockquote",
+    "code",
+    "pre",
+    "ul",
+    "ol",
+    "li",
+    "a",
+    "img",
+}
+ALLOWED_ATTRIBUTES = {
+    "a": {"href", "title"},
+    "img": {
+        "src",
+        "alt",
+        "title",
+        "class",
+        "data-sn-size",
+        "data-lightbox-group",
+        "data-lightbox-src",
+        "data-lightbox-alt",
+    },
+}
+
+_CacheKey = tuple[bytes, str, str | None]
+
+# Rendered HTML by (content hash, lightbox group, step info), least recently
+# used first. Detail pages re-render the same descriptions and step texts on
+# every view, so most lookups hit.
+_rendered: OrderedDict[_CacheKey, str] = OrderedDict()
+_rendered_lock = threading.Lock()
+
+# ``markdown.Markdown`` instances are reusable after ``reset()`` but not
+# thread-safe, so each thread keeps its own.
+_converters = threading.local()
+
+
+def _converter() -> md.Markdown:
+    converter: md.Markdown | None = getattr(_converters, "markdown", None)
+    if converter is None:
+        converter = md.Markdown(
+            extensions=["extra", "nl2br", ImgLightboxExtension()],
+        )
+        _converters.markdown = converter
+    return converter
+
+
+def _render(text: str, lightbox_group: str, step_info: str | None) -> str:
+    converter = _converter()
+    lightbox = converter.treeprocessors["img_lightbox"]
+    lightbox.group_name = lightbox_group
+    lightbox.step_info = step_info or None
+    try:
+        html = converter.convert(text)
+    finally:
+        converter.reset()
+    return nh3.clean(
+        html, tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES, link_rel=None
+    )
+
+
 def render_markdown(
     text: str, lightbox_group: str = "markdown", step_info: str | None = None
 ) -> str:
     """
     Render markdown text to sanitized HTML.
 
+    Results are cached in a bounded LRU (``MARKDOWN_CACHE_SIZE`` entries)
+    keyed by a hash of the text plus the lightbox group and step info.
+
     Args:
         text: Markdown text to render
         lightbox_group: Name of the lightbox group for images
@@ -123,50 +204,30 @@ def render_markdown(
     Returns:
         Sanitized HTML
     """
-    # Convert markdown to HTML
-    html = md.markdown(
-        text,
-        extensions=[
-            "extra",
-            "nl2br",
-            ImgLightboxExtension(group_name=lightbox_group, step_info=step_info),
-        ],
+    max_entries = config.MARKDOWN_CACHE_SIZE
+    if max_entries <= 0:
+        return _render(text, lightbox_group, step_info)
+
+    key = (
+        hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),
+        lightbox_group,
+        step_info,
     )
-
-    # Sanitize HTML
-    allowed_tags = {
-        "p",
-        "br",
-        "strong",
-        "em",
-        "u",
-        "h1",
-        "h2",
-        "h3",
-        "h4",
-        "h5",
-        "h6",
-        "blockquote",
-        "code",
-        "pre",
-        "ul",
-        "ol",
-        "li",
-        "a",
-        "img",
-    }
-    allowed_attrs = {
-        "a": {"href", "title"},
-        "img": {
-            "src",
-            "alt",
-            "title",
-            "class",
-            "data-sn-size",
-            "data-lightbox-group",
-            "data-lightbox-src",
-            "data-lightbox-alt",
-        },
-    }
-
-    return nh3.clean(html, tags=allowed_tags, attributes=allowed_attrs, link_rel=None)
+    with _rendered_lock:
+        html = _rendered.get(key)
+        if html is not None:
+            _rendered.move_to_end(key)
+            return html
+
+    html = _render(text, lightbox_group, step_info)
+    with _rendered_lock:
+        _rendered[key] = html
+        while len(_rendered) > max_entries:
+            _rendered.popitem(last=False)
+    return html
+
+
+def clear_markdown_cache() -> None:
+    """Forget all cached renders."""
+    with _rendered_lock:
+        _rendered.clear()
@@ -11,13 +11,13 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
-import httpx
 from PIL import Image as PilImage
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from stricknani.config import config
+from stricknani.importing.clients import get_public_url, import_http
 from stricknani.models import Category, Image, ImageType, Project, Yarn
 from stricknani.utils.files import create_thumbnail, delete_file, save_bytes
 from stricknani.utils.image_similarity import (
@@ -105,11 +105,15 @@ async def import_images_from_urls(
     db: AsyncSession,
     project: Project,
     image_urls: list[str],
-) -> None:
-    """Import images from URLs into the project's media directory."""
+) -> int:
+    """Import images from URLs into the project's media directory.
+
+    Returns:
+        The number of images added to the project.
+    """
 
     if not image_urls:
-        return
+        return 0
 
     logger = logging.getLogger("stricknani.cli")
     headers = {
@@ -122,14 +126,12 @@ async def import_images_from_urls(
 
     imported_similarities: list[_ImportedSimilarity] = []
 
-    async with httpx.AsyncClient(
-        timeout=20,
-        follow_redirects=True,
-        headers=headers,
-    ) as client:
+    async with import_http.httpx_client() as client:
         for index, image_url in enumerate(image_urls, 1):
             try:
-                response = await client.get(image_url)
+                response = await get_public_url(
+                    client, image_url, headers=headers, timeout=20
+                )
                 response.raise_for_status()
             except Exception as exc:
                 logger.warning("Failed to download image %s: %s", image_url, exc)
@@ -235,6 +237,8 @@ async def import_images_from_urls(
                 )
             )
 
+    return len(imported_similarities)
+
 
 async def link_yarns_by_name(
     db: AsyncSession, project: Project, yarn_names: list[str]
@@ -0,0 +1,97 @@
+"""Conditional GET (ETag / ``If-None-Match``) for library pages and the API.
+
+List and detail responses are derived from the owner's data, so a weak ETag
+is built from ``User.library_version`` (see
+:mod:`stricknani.services.library_version`) plus everything else the
+response varies on. Routes check it right after authentication and answer
+304 before running their queries or rendering::
+
+    etag = await library_etag(db, request, current_user.id, html=True)
+    if etag and etag_matches(request, etag):
+        return not_modified(etag, html=True)
+    ...
+    set_etag(response, etag, html=True)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import secrets
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response
+
+from stricknani.services.library_version import get_library_version
+from stricknani.web.templating import csrf_cookie_token, get_language
+
+# ETags do not survive a restart: a deploy can change templates, code or
+# config, so the first revalidation after one re-renders.
+_PROCESS_TOKEN = secrets.token_hex(8)
+
+# Browsers may store the response but must revalidate before every use.
+_CACHE_CONTROL = "private, no-cache"
+
+# HTMX requests get fragments and `Accept: application/json` gets JSON from
+# the same URL, so HTML responses must be stored separately per variant.
+_HTML_VARY = "HX-Request, HX-Target, Accept, Cookie"
+
+
+async def library_etag(
+    db: AsyncSession, request: Request, user_id: int, *, html: bool = False
+) -> str | None:
+    """Return a weak ETag for this user's view of ``request``.
+
+    For HTML pages the language, HTMX/Accept headers and the CSRF token
+    (embedded in forms) are part of the tag. ``None`` means the response
+    should not be validated: the user is gone, or the page is about to
+    issue a fresh CSRF token.
+    """
+    parts = [_PROCESS_TOKEN, str(user_id), request.url.path, request.url.query]
+    if html:
+        csrf_token = csrf_cookie_token(request)
+        if csrf_token is None:
+            return None
+        parts += [
+            get_language(request),
+            request.headers.get("HX-Request", ""),
+            request.headers.get("HX-Target", ""),
+            request.headers.get("accept", ""),
+            csrf_token,
+        ]
+    version = await get_library_version(db, user_id)
+    if version is None:
+        return None
+    parts.append(str(version))
+    digest = hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16)
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether ``If-None-Match`` already names ``etag`` (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in header.split(",")
+    )
+
+
+def _validator_headers(etag: str, *, html: bool) -> dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if html:
+        headers["Vary"] = _HTML_VARY
+    return headers
+
+
+def not_modified(etag: str, *, html: bool = False) -> Response:
+    """Return a bodiless 304 carrying the validator headers."""
+    return Response(status_code=304, headers=_validator_headers(etag, html=html))
+
+
+def set_etag(response: Response, etag: str | None, *, html: bool = False) -> None:
+    """Attach the validator headers to a successful response."""
+    if etag is not None:
+        response.headers.update(_validator_headers(etag, html=html))
@@ -0,0 +1,113 @@
+"""Rendered HTML fragment cache for list cards.
+
+Project and yarn cards (and global search rows) are re-rendered for every
+infinite-scroll page and every filter keystroke, although most of them did
+not change. Templates call ``render_card(kind, card)`` instead of inlining
+the card markup; the rendered HTML is kept in a bounded LRU keyed by
+
+* the card kind and the active language,
+* whether the request came from HTMX (the favorite toggle emits
+  out-of-band swaps then), and
+* a digest of the serialized card. The card dict carries the entity id,
+  ``updated_at`` and the favorite flag, plus the summary fields and preview
+  URLs that change without bumping ``updated_at``, so the digest acts as
+  the entity version.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from typing import Any
+
+from jinja2 import pass_context
+from jinja2.runtime import Context
+from markupsafe import Markup
+
+from stricknani.config import config
+from stricknani.utils.i18n import get_current_language
+
+# Card kind -> (template rendering one card, variable the template expects).
+CARD_TEMPLATES: dict[str, tuple[str, str]] = {
+    "project": ("projects/_card.html", "project"),
+    "yarn": ("yarn/_card.html", "card"),
+    "search_result": ("shared/_search_result.html", "result"),
+}
+
+
+class FragmentCache:
+    """Thread-safe LRU of rendered HTML fragments with hit/miss counters."""
+
+    def __init__(self, max_entries: Callable[[], int]) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, key: Hashable, render: Callable[[], str]) -> str:
+        """Return the cached fragment for ``key``, rendering it on a miss."""
+        max_entries = self._max_entries()
+        if max_entries <= 0:
+            return render()
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return html
+            self.misses += 1
+
+        html = render()
+        with self._lock:
+            self._entries[key] = html
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+        return html
+
+    def stats(self) -> dict[str, float]:
+        """Return entry count, hits, misses and hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        """Drop all fragments and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Disabled while templates are being edited with auto-reload.
+card_fragments = FragmentCache(
+    lambda: 0 if config.AUTO_RELOAD else config.CARD_FRAGMENT_CACHE_SIZE
+)
+
+
+def _card_version(card: Mapping[str, Any]) -> bytes:
+    payload = json.dumps(card, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+@pass_context
+def render_card(context: Context, kind: str, card: Mapping[str, Any]) -> Markup:
+    """Render one list card through :data:`card_fragments`."""
+    template_name, variable = CARD_TEMPLATES[kind]
+    request = context.get("request")
+    is_htmx = bool(request and request.headers.get("HX-Request") == "true")
+    key = (kind, get_current_language(), is_htmx, _card_version(card))
+
+    def _render() -> str:
+        template = context.environment.get_template(template_name)
+        return template.render(request=request, **{variable: card})
+
+    return Markup(card_fragments.get_or_render(key, _render))
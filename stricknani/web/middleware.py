@@ -1,15 +1,24 @@
-"""Security-related response middleware (T58, tightened to a nonce-based CSP in T71)."""
+"""Response middleware: security headers (T58, nonce-based CSP since T71),
+the access log and per-request SQL instrumentation.
+
+All of it is plain ASGI that edits headers in ``http.response.start``:
+``BaseHTTPMiddleware`` would add a ``call_next`` task and a body-streaming
+layer per middleware to every response, media streams included.
+"""
 
 from __future__ import annotations
 
+import logging
 import secrets
-from collections.abc import Awaitable, Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from stricknani.config import config
+from stricknani.database import QueryStats, track_queries
+
+query_logger = logging.getLogger("stricknani.sql")
+access_logger = logging.getLogger("stricknani.access")
 
 # Strict, nonce-based Content-Security-Policy (T71).
 #
@@ -48,44 +57,138 @@ def generate_csp_nonce() -> str:
     return secrets.token_urlsafe(16)
 
 
-def _is_secure_request(request: Request) -> bool:
+def _is_secure_request(scope: Scope) -> bool:
     """Best-effort detection of whether the request arrived over TLS.
 
     Honours ``X-Forwarded-Proto`` for deployments behind a TLS-terminating
     reverse proxy.
     """
-    if request.url.scheme == "https":
+    if scope.get("scheme") == "https":
         return True
-    forwarded = request.headers.get("x-forwarded-proto", "")
+    forwarded = Headers(scope=scope).get("x-forwarded-proto", "")
     return "https" in forwarded.lower().split(",")[0].strip()
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """Attach a baseline set of security response headers to every response."""
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate the nonce before calling the downstream app so route
-        # handlers/templates (which share this same `request` object) can
-        # read it back via `request.state.csp_nonce` while rendering.
+        # handlers/templates can read it back via `request.state.csp_nonce`
+        # (backed by `scope["state"]`) while rendering.
         nonce = generate_csp_nonce()
-        request.state.csp_nonce = nonce
-
-        response = await call_next(request)
-        headers = response.headers
-        headers.setdefault("X-Content-Type-Options", "nosniff")
-        headers.setdefault("X-Frame-Options", "DENY")
-        headers.setdefault("Referrer-Policy", "strict-origin-when-cross-origin")
-        headers.setdefault(
-            "Content-Security-Policy",
-            _CONTENT_SECURITY_POLICY_TEMPLATE.format(nonce=nonce),
-        )
+        scope.setdefault("state", {})["csp_nonce"] = nonce
         # Only advertise HSTS on real TLS connections in production; sending it
         # over plaintext or in DEBUG would be wrong (and could lock out local
         # http:// development).
-        if not config.DEBUG and _is_secure_request(request):
-            headers.setdefault("Strict-Transport-Security", _HSTS_VALUE)
-        return response
+        send_hsts = not config.DEBUG and _is_secure_request(scope)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.setdefault("X-Content-Type-Options", "nosniff")
+                headers.setdefault("X-Frame-Options", "DENY")
+                headers.setdefault("Referrer-Policy", "strict-origin-when-cross-origin")
+                # A 304 makes the browser reuse its stored body, whose inline
+                # scripts carry the stored response's nonce; a fresh policy
+                # would replace the stored one and block them.
+                if message["status"] != 304:
+                    headers.setdefault(
+                        "Content-Security-Policy",
+                        _CONTENT_SECURITY_POLICY_TEMPLATE.format(nonce=nonce),
+                    )
+                if send_hsts:
+                    headers.setdefault("Strict-Transport-Security", _HSTS_VALUE)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+class AccessLogMiddleware:
+    """Log one access-log line per request once its status is known."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_log(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                client = scope.get("client")
+                access_logger.info(
+                    '%s - "%s %s" %s',
+                    (client[0] if client else None) or "-",
+                    scope["method"],
+                    scope["path"],
+                    message["status"],
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_log)
+
+
+def _log_query_stats(scope: Scope, stats: QueryStats) -> None:
+    path = scope.get("path", "")
+    method = scope.get("method", "")
+    if stats.statements:
+        query_logger.debug(
+            "%s %s: %d SQL statements in %.1f ms",
+            method,
+            path,
+            stats.statements,
+            stats.duration * 1000,
+        )
+    for shape, count in stats.repeated_shapes(config.SQL_REPEATED_STATEMENT_THRESHOLD):
+        query_logger.warning(
+            "Possible N+1 on %s %s: statement ran %d times: %s",
+            method,
+            path,
+            count,
+            shape[:300],
+        )
+
+
+class QueryStatsMiddleware:
+    """Count SQL statements and database time per request.
+
+    Written as plain ASGI (rather than ``BaseHTTPMiddleware``) so it adds no
+    extra task or body-streaming layer to every response, media streams
+    included. Repeated statement shapes over
+    ``SQL_REPEATED_STATEMENT_THRESHOLD`` are logged as likely N+1 queries; in
+    DEBUG the totals are also exposed as ``X-DB-Query-Count`` and
+    ``X-DB-Query-Time`` (milliseconds) response headers. Statements issued
+    after the response has started (e.g. while streaming a body) are only
+    reflected in the log, not the headers.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_stats(message: Message) -> None:
+                if message["type"] == "http.response.start" and config.DEBUG:
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Query-Count"] = str(stats.statements)
+                    headers["X-DB-Query-Time"] = f"{stats.duration * 1000:.1f}"
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                _log_query_stats(scope, stats)
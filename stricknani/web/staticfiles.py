@@ -3,32 +3,193 @@
 User media (``/media``) is no longer served through a static-files mount at
 all; see ``stricknani.routes.media`` for the ownership-checked route that
 replaced it (T70).
+
+Templates link assets through ``static_url('js/app.js')``. Once a build has
+written the content-hash manifest (:func:`build_static_manifest`,
+``stricknani-cli static manifest``) that resolves to e.g.
+``/static/js/app.1f2e3d4c5b6a.js``, which is served from ``js/app.js`` and
+cached immutably; without a manifest it is the plain ``/static/js/app.js``.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import os
+from mimetypes import guess_type
+from pathlib import Path, PurePosixPath
+
 from fastapi.staticfiles import StaticFiles
-from starlette.responses import Response
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
 from starlette.types import Scope
 
-# Unlike /media (see stricknani.routes.media), files under /static are NOT
-# content-addressed -- app.js, app.css, the built Tailwind bundle, and the
-# vendored libraries all keep stable filenames across deploys/version bumps.
-# A long `immutable` Cache-Control would make browsers keep serving pre-deploy
-# bytes for up to a year. Cache for a short window and require revalidation
-# after that instead; Starlette's StaticFiles already sets ETag/Last-Modified,
-# so an unchanged file only costs a cheap conditional GET (304), not a full
-# re-download.
+from stricknani.web.compression import PRECOMPRESS_SUFFIXES, accepted_encodings
+
+logger = logging.getLogger(__name__)
+
+# Plain /static paths are NOT content-addressed -- app.js, app.css and the
+# vendored libraries keep stable filenames across deploys/version bumps, and
+# they stay reachable for JS module imports, CSS url()s, the service worker
+# and old cached pages. A long `immutable` Cache-Control would make browsers
+# keep serving pre-deploy bytes for up to a year. Cache for a short window
+# and require revalidation after that instead; Starlette's StaticFiles
+# already sets ETag/Last-Modified, so an unchanged file only costs a cheap
+# conditional GET (304), not a full re-download.
 _CACHE_CONTROL = "public, max-age=300, must-revalidate"
 
+# Hashed URLs change whenever the content does, so they never need to be
+# revalidated.
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+MANIFEST_NAME = "staticfiles.json"
+
+
+def _hashed_name(path: str, digest: str) -> str:
+    posix = PurePosixPath(path)
+    return str(posix.with_name(f"{posix.stem}.{digest}{posix.suffix}"))
+
+
+def build_static_manifest(directory: Path) -> dict[str, str]:
+    """Write ``MANIFEST_NAME`` mapping asset paths to content-hashed names.
+
+    Only the manifest is written; hashed names are resolved back to the
+    original files when served, so no asset is copied.
+    """
+    manifest: dict[str, str] = {}
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file() or path.suffix in {".br", ".gz"}:
+            continue
+        relative = path.relative_to(directory).as_posix()
+        if relative == MANIFEST_NAME:
+            continue
+        digest = hashlib.blake2b(path.read_bytes(), digest_size=6).hexdigest()
+        manifest[relative] = _hashed_name(relative, digest)
+    (directory / MANIFEST_NAME).write_text(
+        json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    return manifest
+
+
+class StaticManifest:
+    """The loaded asset manifest: original path <-> hashed path."""
+
+    def __init__(self) -> None:
+        self.hashed: dict[str, str] = {}
+        self.originals: dict[str, str] = {}
+
+    def load(self, directory: Path) -> int:
+        """Load ``MANIFEST_NAME`` from ``directory`` if a build wrote one."""
+        try:
+            data = json.loads((directory / MANIFEST_NAME).read_text("utf-8"))
+        except FileNotFoundError:
+            data = {}
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable static manifest", exc_info=True)
+            data = {}
+        self.hashed = {str(key): str(value) for key, value in data.items()}
+        self.originals = {value: key for key, value in self.hashed.items()}
+        return len(self.hashed)
+
+    def clear(self) -> None:
+        self.hashed = {}
+        self.originals = {}
+
+    def url(self, path: str) -> str:
+        path = path.lstrip("/")
+        return f"/static/{self.hashed.get(path, path)}"
+
+
+static_manifest = StaticManifest()
+
+
+def static_url(path: str) -> str:
+    """Return the URL of a ``/static`` asset (content-hashed when built)."""
+    return static_manifest.url(path)
+
+
+_SIBLING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def _precompressed_siblings(
+    path: str, mtime_ns: int
+) -> dict[str, tuple[str, os.stat_result]]:
+    """Return the ``.br``/``.gz`` siblings of ``path`` that are up to date.
+
+    Siblings older than the source (``mtime_ns``) were generated from its
+    previous contents and are skipped. They are looked up on every request,
+    so siblings that ``precompress_static`` writes or removes while the app
+    runs are picked up at once.
+    """
+    siblings: dict[str, tuple[str, os.stat_result]] = {}
+    for encoding, suffix in _SIBLING_SUFFIXES.items():
+        try:
+            stat_result = os.stat(path + suffix)
+        except OSError:
+            continue
+        if stat_result.st_mtime_ns >= mtime_ns:
+            siblings[encoding] = (path + suffix, stat_result)
+    return siblings
+
 
 class CachedStaticFiles(StaticFiles):
-    """Serve static files with short-lived, revalidated ``Cache-Control``."""
+    """Serve static files with short-lived, revalidated ``Cache-Control``.
+
+    Text assets with build-time ``.br``/``.gz`` siblings (see
+    ``stricknani.web.compression.precompress_static``) are served from the
+    best sibling the client accepts.
+    """
+
+    def file_response(
+        self,
+        full_path: os.PathLike[str] | str,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        path = os.fspath(full_path)
+        if os.path.splitext(path)[1].lower() not in PRECOMPRESS_SUFFIXES:
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        siblings = _precompressed_siblings(path, stat_result.st_mtime_ns)
+        request_headers = Headers(scope=scope)
+        encoding = next(
+            (
+                candidate
+                for candidate in accepted_encodings(
+                    request_headers.get("accept-encoding", "")
+                )
+                if candidate in siblings
+            ),
+            None,
+        )
+        response: Response
+        if encoding is None:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+        else:
+            sibling_path, sibling_stat = siblings[encoding]
+            response = FileResponse(
+                sibling_path,
+                status_code=status_code,
+                stat_result=sibling_stat,
+                media_type=guess_type(path)[0],
+                headers={"Content-Encoding": encoding},
+            )
+            if self.is_not_modified(response.headers, request_headers):
+                response = NotModifiedResponse(response.headers)
+        if siblings:
+            response.headers.add_vary_header("Accept-Encoding")
+        return response
 
     async def get_response(self, path: str, scope: Scope) -> Response:
-        response = await super().get_response(path, scope)
+        original = static_manifest.originals.get(PurePosixPath(path).as_posix())
+        response = await super().get_response(original or path, scope)
         # Only apply caching to real file responses (2xx). Error responses
         # (e.g. 404) should not be cached.
         if 200 <= response.status_code < 300:
-            response.headers["Cache-Control"] = _CACHE_CONTROL
+            response.headers["Cache-Control"] = (
+                _IMMUTABLE_CACHE_CONTROL if original else _CACHE_CONTROL
+            )
         return response
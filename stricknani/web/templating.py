@@ -6,6 +6,7 @@ side effects when routes only need rendering utilities.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -14,14 +15,23 @@ from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from fastapi_csrf_protect.flexible import CsrfProtect as FlexibleCsrfProtect
 from itsdangerous import BadData, SignatureExpired, URLSafeTimedSerializer
+from jinja2 import FileSystemBytecodeCache
 
 from stricknani.config import config
 from stricknani.utils.i18n import install_i18n, language_context
+from stricknani.web.fragments import render_card
+from stricknani.web.staticfiles import static_url
 
 templates_path = Path(__file__).resolve().parents[1] / "templates"
 templates = Jinja2Templates(directory=str(templates_path))
 templates.env.add_extension("jinja2.ext.do")
 install_i18n(templates.env)
+templates.env.globals["render_card"] = render_card
+templates.env.globals["static_url"] = static_url
+# Process-wide settings go in globals once; templates still see any value a
+# route passes explicitly in its context.
+templates.env.globals["auto_reload_enabled"] = config.AUTO_RELOAD
+templates.env.globals["feature_wayback_enabled"] = config.FEATURE_WAYBACK_ENABLED
 
 templates.env.globals["sentry_frontend_dsn"] = config.SENTRY_DSN_FRONTEND
 templates.env.globals["sentry_frontend_env"] = config.SENTRY_ENVIRONMENT
@@ -55,6 +65,24 @@ def category_color_filter(category_name: str | None) -> str:
 templates.env.filters["category_color"] = category_color_filter
 
 
+def enable_bytecode_cache(cache_dir: Path) -> None:
+    """Persist compiled template bytecode in ``cache_dir`` across restarts.
+
+    Jinja keys each entry on the template source checksum, so edited templates
+    are recompiled rather than served stale.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    templates.env.bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+
+
+def warm_templates() -> int:
+    """Load (and compile) every template up front; return how many."""
+    names = templates.env.list_templates(extensions=["html", "js"])
+    for name in names:
+        templates.env.get_template(name)
+    return len(names)
+
+
 def get_language(request: Request) -> str:
     """Resolve UI language from cookies/headers."""
     lang_cookie = request.cookies.get("language")
@@ -63,33 +91,70 @@ def get_language(request: Request) -> str:
 
     accept_language = request.headers.get("accept-language", "")
     if accept_language:
-        candidates: list[tuple[str, float]] = []
-        for part in accept_language.split(","):
-            raw = part.strip()
-            if not raw:
-                continue
-            pieces = [segment.strip() for segment in raw.split(";")]
-            lang_code = pieces[0].lower()
-            if "-" in lang_code:
-                lang_code = lang_code.split("-", 1)[0]
-            quality = 1.0
-            for segment in pieces[1:]:
-                if segment.startswith("q="):
-                    try:
-                        quality = float(segment[2:])
-                    except ValueError:
-                        quality = 0.0
-            candidates.append((lang_code, quality))
-        candidates.sort(key=lambda item: item[1], reverse=True)
-        for lang_code, _ in candidates:
-            if lang_code in config.SUPPORTED_LANGUAGES:
-                return lang_code
+        negotiated = _negotiate_language(accept_language)
+        if negotiated is not None:
+            return negotiated
 
     if "en" in config.SUPPORTED_LANGUAGES:
         return "en"
     return config.DEFAULT_LANGUAGE
 
 
+# Browsers send the same handful of Accept-Language values over and over.
+@lru_cache(maxsize=256)
+def _negotiate_language(accept_language: str) -> str | None:
+    """Return the best supported language in an ``Accept-Language`` header."""
+    candidates: list[tuple[str, float]] = []
+    for part in accept_language.split(","):
+        raw = part.strip()
+        if not raw:
+            continue
+        pieces = [segment.strip() for segment in raw.split(";")]
+        lang_code = pieces[0].lower()
+        if "-" in lang_code:
+            lang_code = lang_code.split("-", 1)[0]
+        quality = 1.0
+        for segment in pieces[1:]:
+            if segment.startswith("q="):
+                try:
+                    quality = float(segment[2:])
+                except ValueError:
+                    quality = 0.0
+        candidates.append((lang_code, quality))
+    candidates.sort(key=lambda item: item[1], reverse=True)
+    for lang_code, _ in candidates:
+        if lang_code in config.SUPPORTED_LANGUAGES:
+            return lang_code
+    return None
+
+
+# Reads its settings from the class attributes `load_config` sets in
+# `stricknani.main`, so one instance serves every render.
+_csrf = FlexibleCsrfProtect()
+
+
+@lru_cache(maxsize=1)
+def _csrf_serializer(secret_key: str) -> URLSafeTimedSerializer:
+    return URLSafeTimedSerializer(secret_key, salt="fastapi-csrf-token")
+
+
+def csrf_cookie_token(request: Request) -> str | None:
+    """Return the CSRF token carried by the request's signed cookie.
+
+    ``None`` when the cookie is missing, tampered with or expired; rendering
+    then issues a fresh token and cookie.
+    """
+    signed_token = request.cookies.get(_csrf._cookie_key)
+    if not signed_token:
+        return None
+    serializer = _csrf_serializer(config.CSRF_SECRET_KEY)
+    try:
+        token = serializer.loads(signed_token, max_age=_csrf._max_age)
+    except (BadData, SignatureExpired):
+        return None
+    return str(token)
+
+
 async def render_template(
     template_name: str,
     request: Request,
@@ -108,31 +173,15 @@ async def render_template(
         "is_dev_instance",
         request.url.hostname in {"localhost", "127.0.0.1"} or config.DEBUG,
     )
-    context.setdefault("auto_reload_enabled", config.AUTO_RELOAD)
-    context.setdefault("feature_wayback_enabled", config.FEATURE_WAYBACK_ENABLED)
     # Set by SecurityHeadersMiddleware (T71) before the route handler runs;
     # inline <script> tags must echo this back via nonce="{{ csp_nonce }}"
     # to satisfy the nonce-based script-src CSP directive.
     context.setdefault("csp_nonce", getattr(request.state, "csp_nonce", ""))
 
-    csrf = FlexibleCsrfProtect()
-    csrf_token: str | None = None
-    signed_token = request.cookies.get(csrf._cookie_key)
-    should_set_cookie = False
-    if signed_token:
-        serializer = URLSafeTimedSerializer(
-            config.CSRF_SECRET_KEY,
-            salt="fastapi-csrf-token",
-        )
-        try:
-            csrf_token = serializer.loads(signed_token, max_age=csrf._max_age)
-        except (BadData, SignatureExpired):
-            csrf_token = None
-            signed_token = None
-
-    if csrf_token is None or signed_token is None:
-        csrf_token, signed_token = csrf.generate_csrf_tokens()
-        should_set_cookie = True
+    csrf_token = csrf_cookie_token(request)
+    signed_token = None
+    if csrf_token is None:
+        csrf_token, signed_token = _csrf.generate_csrf_tokens()
 
     context["csrf_token"] = csrf_token
 
@@ -157,6 +206,6 @@ async def render_template(
             status_code=status_code,
         )
 
-    if should_set_cookie:
-        csrf.set_csrf_cookie(signed_token, response)
+    if signed_token is not None:
+        _csrf.set_csrf_cookie(signed_token, response)
     return response
@@ -1,5 +1,6 @@
 import socket
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from typing import Any
 
 import pytest
@@ -7,7 +8,8 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from stricknani.config import config
-from stricknani.database import get_db
+from stricknani.database import QueryStats, get_db, track_queries
+from stricknani.importing.ssrf import dns_cache
 from stricknani.main import app
 from stricknani.models import Base, Project, ProjectCategory, Step, User
 from stricknani.routes.auth import (
@@ -17,6 +19,7 @@ from stricknani.routes.auth import (
 )
 from stricknani.utils.auth import get_password_hash
 from stricknani.utils.rate_limit import reset_rate_limits
+from stricknani.web.fragments import card_fragments
 
 
 @pytest.fixture
@@ -32,7 +35,8 @@ def _hermetic_ssrf_dns(monkeypatch: pytest.MonkeyPatch) -> None:
     The SSRF guard (T52) resolves hostnames via ``socket.getaddrinfo`` before
     every import fetch. Stub it to a fixed public address so import-path tests
     that only mock HTTP don't require real DNS. Tests that assert DNS-based
-    blocking (``tests/test_ssrf.py``) override this in-test.
+    blocking (``tests/test_ssrf.py``) override this in-test; the SSRF DNS
+    cache is emptied so no test sees another test's answers.
     """
 
     def _public_getaddrinfo(*args: Any, **kwargs: Any) -> list[Any]:
@@ -47,6 +51,7 @@ def _hermetic_ssrf_dns(monkeypatch: pytest.MonkeyPatch) -> None:
         ]
 
     monkeypatch.setattr(socket, "getaddrinfo", _public_getaddrinfo)
+    dns_cache.clear()
 
 
 @pytest.fixture(autouse=True)
@@ -80,6 +85,53 @@ def _reset_rate_limits() -> Generator[None]:
         reset_rate_limits()
 
 
+@pytest.fixture(autouse=True)
+def _reset_card_fragments() -> Generator[None]:
+    """Start every test with an empty card fragment cache and counters."""
+    card_fragments.clear()
+    try:
+        yield
+    finally:
+        card_fragments.clear()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_ai_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    """Give every test its own AI result cache, so mocked replies never leak."""
+    monkeypatch.setattr(config, "AI_CACHE_DIR", tmp_path_factory.mktemp("ai-cache"))
+
+
+QueryBudget = Callable[..., AbstractContextManager[QueryStats]]
+
+
+@pytest.fixture
+def query_budget() -> QueryBudget:
+    """Assert an upper bound on the SQL statements a block executes.
+
+    Usage: ``with query_budget(8): await client.get("/projects")``. The budget
+    also fails when any single statement shape runs more than ``max_repeats``
+    times, which is how an N+1 query shows up regardless of the total.
+    """
+
+    @contextmanager
+    def _budget(max_statements: int, *, max_repeats: int = 3) -> Iterator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+        shapes = "\n".join(
+            f"  {count}x {shape}" for shape, count in stats.shapes.most_common()
+        )
+        assert stats.statements <= max_statements, (
+            f"expected at most {max_statements} SQL statements, "
+            f"ran {stats.statements}:\n{shapes}"
+        )
+        repeated = stats.repeated_shapes(max_repeats + 1)
+        assert not repeated, f"statement shapes repeated > {max_repeats}x:\n{shapes}"
+
+    return _budget
+
+
 @pytest.fixture
 async def test_client(
     tmp_path: Any,
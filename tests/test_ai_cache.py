@@ -0,0 +1,226 @@
+"""Tests for the on-disk cache of structured AI results."""
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from stricknani.importing.extractors import ExtractorError
+from stricknani.importing.extractors.ai import AIExtractor
+from stricknani.importing.models import ContentType, RawContent
+from stricknani.utils.ai_cache import AIResultCache, ai_cache_key, get_ai_cache
+from stricknani.utils.ai_importer import AIPatternImporter
+from stricknani.utils.ai_ingest import build_schema_for_target, ingest_with_openai
+
+
+def _key(content: str, **overrides: object) -> str:
+    request: dict[str, object] = {
+        "provider": "openai",
+        "model": "gpt-4o-mini",
+        "schema": {"type": "object"},
+        "system_prompt": "Extract the pattern.",
+        "content": content,
+        "options": {"temperature": 0.1},
+    }
+    request.update(overrides)
+    return ai_cache_key(**request)  # type: ignore[arg-type]
+
+
+def _completion(payload: dict[str, object]) -> MagicMock:
+    completion = MagicMock()
+    completion.choices = [MagicMock(message=MagicMock(content=json.dumps(payload)))]
+    return completion
+
+
+def test_key_ignores_whitespace_but_not_the_request() -> None:
+    key = _key("Cast on 40 sts.\n\n\n\nKnit  every row.")
+    assert key == _key("Cast on 40 sts.\r\n\r\n\r\nKnit every row.  ")
+    assert key != _key("Cast on 42 sts.\n\nKnit every row.")
+    assert key != _key("Cast on 40 sts.\n\nKnit every row.", model="gpt-4o")
+    assert key != _key("Cast on 40 sts.\n\nKnit every row.", options={})
+
+
+async def test_cache_hits_misses_and_bypass(tmp_path: Path) -> None:
+    cache = AIResultCache(tmp_path, max_bytes=1024 * 1024, ttl=60)
+
+    assert await cache.get("a") is None
+    await cache.put("a", {"name": "Hat"})
+    assert await cache.get("a") == {"name": "Hat"}
+    assert await cache.lookup("a", use_cache=False) is None
+
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "stores": 1,
+        "evictions": 0,
+        "errors": 0,
+        "hit_rate": 0.5,
+    }
+
+
+async def test_unusable_cache_dir_is_logged_and_counted(tmp_path: Path) -> None:
+    not_a_dir = tmp_path / "ai"
+    not_a_dir.write_text("")
+    cache = AIResultCache(not_a_dir, max_bytes=1024 * 1024, ttl=60)
+
+    await cache.put("a", {"name": "Hat"})
+    assert await cache.get("a") is None
+
+    assert cache.stats()["errors"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+async def test_cache_expires_and_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = AIResultCache(tmp_path, max_bytes=1024 * 1024, ttl=60)
+    await cache.put("old", {"name": "Old"})
+    entry = tmp_path / "old.json"
+    entry.write_text(json.dumps({"stored_at": time.time() - 61, "output": {}}))
+    assert await cache.get("old") is None
+    assert not entry.exists()
+
+    size = len(json.dumps({"stored_at": time.time(), "output": "x" * 100}))
+    cache = AIResultCache(tmp_path, max_bytes=size * 2 + 10, ttl=60)
+    await cache.put("first", "x" * 100)
+    await cache.put("second", "y" * 100)
+    past = time.time() - 10
+    os.utime(tmp_path / "second.json", (past, past))
+    assert await cache.get("first") is not None  # touched: "second" is older
+
+    await cache.put("third", "z" * 100)
+
+    assert sorted(path.stem for path in tmp_path.glob("*.json")) == [
+        "first",
+        "third",
+    ]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_empty_cache_dir_disables_the_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    from stricknani.config import config
+
+    assert get_ai_cache() is not None
+    monkeypatch.setattr(config, "AI_CACHE_DIR", None)
+    assert get_ai_cache() is None
+
+
+async def test_ai_extractor_reuses_cached_result() -> None:
+    raw = RawContent(
+        content="Cabled hat. Cast on 96 stitches.",
+        content_type=ContentType.TEXT,
+    )
+
+    with (
+        patch("stricknani.importing.extractors.ai.OPENAI_AVAILABLE", True),
+        patch("stricknani.importing.extractors.ai.AsyncOpenAI") as mock_openai_class,
+    ):
+        create = AsyncMock(return_value=_completion({"name": "Cabled Hat"}))
+        mock_openai_class.return_value.chat.completions.create = create
+
+        first = await AIExtractor(api_key="test-key").extract(raw)
+        second = await AIExtractor(api_key="test-key").extract(raw)
+        assert create.await_count == 1
+
+        await AIExtractor(api_key="test-key", use_cache=False).extract(raw)
+        assert create.await_count == 2
+
+    assert first.name == second.name == "Cabled Hat"
+
+
+async def test_ai_extractor_succeeds_without_a_writable_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from stricknani.config import config
+
+    not_a_dir = tmp_path / "ai"
+    not_a_dir.write_text("")
+    monkeypatch.setattr(config, "AI_CACHE_DIR", not_a_dir)
+    raw = RawContent(content="Striped socks.", content_type=ContentType.TEXT)
+
+    with (
+        patch("stricknani.importing.extractors.ai.OPENAI_AVAILABLE", True),
+        patch("stricknani.importing.extractors.ai.AsyncOpenAI") as mock_openai_class,
+    ):
+        create = AsyncMock(return_value=_completion({"name": "Socks"}))
+        mock_openai_class.return_value.chat.completions.create = create
+
+        result = await AIExtractor(api_key="test-key").extract(raw)
+
+    assert result.name == "Socks"
+    cache = get_ai_cache()
+    assert cache is not None
+    assert cache.stats()["errors"] == 1
+
+
+async def test_ai_extractor_does_not_cache_unusable_replies() -> None:
+    raw = RawContent(content="Lace shawl.", content_type=ContentType.TEXT)
+    broken = MagicMock()
+    broken.choices = [MagicMock(message=MagicMock(content="not json"))]
+
+    with (
+        patch("stricknani.importing.extractors.ai.OPENAI_AVAILABLE", True),
+        patch("stricknani.importing.extractors.ai.AsyncOpenAI") as mock_openai_class,
+    ):
+        create = AsyncMock(side_effect=[broken, _completion({"name": "Shawl"})])
+        mock_openai_class.return_value.chat.completions.create = create
+
+        with pytest.raises(ExtractorError):
+            await AIExtractor(api_key="test-key").extract(raw)
+        result = await AIExtractor(api_key="test-key").extract(raw)
+
+    assert result.name == "Shawl"
+    assert create.await_count == 2
+
+
+async def test_pattern_importer_caches_results_but_not_fallbacks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    with patch("stricknani.utils.ai_importer.AsyncOpenAI") as mock_openai_class:
+        create = AsyncMock(
+            side_effect=[RuntimeError("rate limited"), _completion({"title": "Hat"})]
+        )
+        mock_openai_class.return_value.chat.completions.create = create
+        importer = AIPatternImporter("https://example.com/hat")
+
+        fallback = await importer._ai_extract("Hat pattern", [], None)
+        assert fallback["title"] is None
+        assert (await importer._ai_extract("Hat pattern", [], None)) == {"title": "Hat"}
+        assert (await importer._ai_extract("Hat pattern", [], None)) == {"title": "Hat"}
+
+    assert create.await_count == 2
+
+
+async def test_ingest_reuses_cached_result(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    schema = build_schema_for_target("yarn")
+    payload = dict.fromkeys(schema["required"]) | {"name": "Merino"}
+    kwargs = {
+        "target": "yarn",
+        "schema": schema,
+        "source_url": None,
+        "source_text": "Merino, 50 g, 175 m.",
+        "file_paths": None,
+        "instructions": "Extract",
+        "model": "gpt-4o-mini",
+        "temperature": 0.1,
+        "max_output_tokens": 500,
+    }
+
+    with patch("openai.AsyncOpenAI") as mock_openai_class:
+        response = MagicMock(output_text=json.dumps(payload))
+        create = AsyncMock(return_value=response)
+        mock_openai_class.return_value.responses.create = create
+
+        first = await ingest_with_openai(**kwargs)  # type: ignore[arg-type]
+        second = await ingest_with_openai(**kwargs)  # type: ignore[arg-type]
+        assert create.await_count == 1
+
+        await ingest_with_openai(**kwargs, use_cache=False)  # type: ignore[arg-type]
+        assert create.await_count == 2
+
+    assert first == second
+    assert first["name"] == "Merino"
@@ -0,0 +1,278 @@
+"""Tests for extracting long pattern text in concurrent parts."""
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from stricknani.importing.chunking import merge_chunk_results, run_chunks, split_text
+from stricknani.importing.extractors.ai import AIExtractor
+from stricknani.importing.models import ContentType, ExtractedData, RawContent
+from stricknani.utils.ai_importer import IMPORT_HEADERS, AIPatternImporter
+from stricknani.utils.import_trace import ImportTrace
+
+
+def _pages(count: int, size: int = 900) -> str:
+    return "\n\n".join(
+        f"--- Page {n} ---\n" + f"Row {n}: knit to end. " * (size // 20)
+        for n in range(1, count + 1)
+    )
+
+
+def test_short_text_is_one_part() -> None:
+    assert split_text("  Cast on 40 stitches.\n", 100) == ["Cast on 40 stitches."]
+
+
+def test_split_keeps_pages_whole_and_in_order() -> None:
+    text = _pages(5)
+    chunks = split_text(text, 2000)
+
+    assert len(chunks) == 3
+    assert all(len(chunk) <= 2000 for chunk in chunks)
+    assert [chunk.split("\n", 1)[0] for chunk in chunks] == [
+        "--- Page 1 ---",
+        "--- Page 3 ---",
+        "--- Page 5 ---",
+    ]
+    assert " ".join(chunks).split() == text.split()
+
+
+def test_split_at_section_headers_and_oversized_sections() -> None:
+    text = (
+        "Intro.\n\nRÜCKENTEIL:\n"
+        + "k2, p2 " * 100
+        + "\n\n## Sleeves\n"
+        + "k1 " * 200
+        + "\n\nFINISHING\n"
+        + "weave in ends " * 300
+    )
+    chunks = split_text(text, 1000)
+
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    assert chunks[0].startswith("Intro.\n\nRÜCKENTEIL:")
+    assert chunks[1].startswith("## Sleeves")
+    assert chunks[2].startswith("FINISHING")
+    assert len(chunks) > 3
+
+
+def test_merge_is_in_part_order_and_keeps_repeated_steps() -> None:
+    ribbing = {"step_number": 1, "title": "Ribbing", "description": "K2, P2 5 cm"}
+    merged = merge_chunk_results(
+        [
+            {
+                "name": "Raglan",
+                "needles": None,
+                "description": "Top-down raglan.",
+                "steps": [
+                    ribbing,
+                    {"step_number": 2, "title": "Back", "description": "a"},
+                ],
+                "yarns": [{"name": "Merino"}],
+            },
+            {
+                "name": "Raglan (sizes M-XL)",
+                "needles": "4 mm",
+                "description": "Top-down  raglan.",
+                "steps": [
+                    # Repeated across the cut between the parts: taken once.
+                    {"step_number": 1, "title": "Back", "description": "a"},
+                    {**ribbing, "step_number": 2},
+                    {"step_number": 3, "title": "Front", "description": "b"},
+                ],
+                "yarns": [{"name": "Merino"}, {"name": "Mohair"}],
+            },
+            {"description": "Sizes M to XL.", "steps": []},
+        ]
+    )
+
+    assert merged == {
+        "name": "Raglan",
+        "needles": "4 mm",
+        "description": "Top-down raglan.\n\nSizes M to XL.",
+        "steps": [
+            {**ribbing, "step_number": 1},
+            {"step_number": 2, "title": "Back", "description": "a"},
+            {**ribbing, "step_number": 3},
+            {"step_number": 4, "title": "Front", "description": "b"},
+        ],
+        "yarns": [{"name": "Merino"}, {"name": "Mohair"}],
+    }
+
+
+async def test_run_chunks_caps_concurrency_and_keeps_order() -> None:
+    running = 0
+    peak = 0
+
+    async def extract(index: int, chunk: str) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - index))
+        running -= 1
+        if index == 2:
+            raise ValueError(chunk)
+        return chunk
+
+    results = await run_chunks(extract, ["a", "b", "c", "d", "e"], 2)
+
+    assert peak == 2
+    assert results[:2] == ["a", "b"]
+    assert isinstance(results[2], ValueError)
+    assert results[3:] == ["d", "e"]
+
+
+def _chat_reply(request: dict[str, Any]) -> MagicMock:
+    prompt = request["messages"][1]["content"]
+    page = prompt.split("--- Page ", 1)[1].split(" ", 1)[0]
+    payload = {
+        "name": "Long Pattern" if page == "1" else None,
+        "steps": [{"step_number": 1, "title": f"Page {page}", "description": page}],
+    }
+    completion = MagicMock()
+    completion.choices = [MagicMock(message=MagicMock(content=json.dumps(payload)))]
+    completion.usage = MagicMock(prompt_tokens=100, completion_tokens=20)
+    return completion
+
+
+async def test_ai_extractor_extracts_long_text_in_parts() -> None:
+    extractor = AIExtractor(api_key="test-key", chunk_chars=2000)
+    raw = RawContent(content=_pages(5), content_type=ContentType.TEXT)
+
+    with (
+        patch("stricknani.importing.extractors.ai.OPENAI_AVAILABLE", True),
+        patch("stricknani.importing.extractors.ai.AsyncOpenAI") as mock_openai_class,
+    ):
+        create = AsyncMock(side_effect=lambda **kwargs: _chat_reply(kwargs))
+        mock_openai_class.return_value.chat.completions.create = create
+
+        result = await extractor.extract(raw)
+
+    assert create.await_count == 3
+    assert "part 3 of 3" in create.await_args_list[2].kwargs["messages"][1]["content"]
+    assert result.name == "Long Pattern"
+    assert [(s.step_number, s.title) for s in result.steps] == [
+        (1, "Page 1"),
+        (2, "Page 3"),
+        (3, "Page 5"),
+    ]
+    assert [usage["chunk"] for usage in result.extras["ai_usage"]] == [1, 2, 3]
+    assert result.extras["ai_usage"][0]["prompt_tokens"] == 100
+    assert "total_tokens" not in result.extras["ai_usage"][0]
+
+
+async def test_ai_extractor_warns_about_failed_parts() -> None:
+    extractor = AIExtractor(api_key="test-key", chunk_chars=2000)
+    raw = RawContent(content=_pages(5), content_type=ContentType.TEXT)
+
+    def reply(**kwargs: Any) -> MagicMock:
+        if "--- Page 3 " in kwargs["messages"][1]["content"]:
+            raise RuntimeError("rate limited")
+        return _chat_reply(kwargs)
+
+    with (
+        patch("stricknani.importing.extractors.ai.OPENAI_AVAILABLE", True),
+        patch("stricknani.importing.extractors.ai.AsyncOpenAI") as mock_openai_class,
+    ):
+        create = AsyncMock(side_effect=reply)
+        mock_openai_class.return_value.chat.completions.create = create
+
+        result = await extractor.extract(raw)
+
+    assert [step.title for step in result.steps] == ["Page 1", "Page 5"]
+    assert result.warnings == [
+        "Part 2/3 of the pattern could not be extracted; its steps may be missing."
+    ]
+    assert result.extras["ai_usage"][1] == {"chunk": 2, "error": "rate limited"}
+
+
+async def test_ai_extractor_reads_all_text_of_unrendered_pdfs() -> None:
+    extractor = AIExtractor(api_key="test-key", chunk_chars=2000)
+    pdf = RawContent(
+        content=b"%PDF-1.4 fake",
+        content_type=ContentType.PDF,
+        metadata={"filename": "long.pdf"},
+    )
+    full_text = _pages(5)
+
+    with (
+        patch("stricknani.importing.extractors.ai.OPENAI_AVAILABLE", True),
+        patch("stricknani.importing.extractors.ai.AsyncOpenAI") as mock_openai_class,
+        patch(
+            "stricknani.importing.extractors.pdf.PDFExtractor.render_pages_as_images",
+            new=AsyncMock(return_value=[]),
+        ),
+        patch(
+            "stricknani.importing.extractors.pdf.PDFExtractor.extract",
+            new=AsyncMock(
+                return_value=ExtractedData(
+                    description=full_text[:2000], extras={"full_text": full_text}
+                )
+            ),
+        ),
+    ):
+        create = AsyncMock(side_effect=lambda **kwargs: _chat_reply(kwargs))
+        mock_openai_class.return_value.chat.completions.create = create
+
+        result = await extractor.extract(pdf)
+
+    assert [step.title for step in result.steps][-1] == "Page 5"
+
+
+async def test_pattern_importer_merges_parts_and_skips_failed_ones(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from stricknani.config import config
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(config, "AI_CHUNK_CHARS", 2000)
+
+    def reply(**kwargs: Any) -> MagicMock:
+        if "--- Page 3 " in kwargs["messages"][1]["content"]:
+            raise RuntimeError("rate limited")
+        return _chat_reply(kwargs)
+
+    with patch("stricknani.utils.ai_importer.AsyncOpenAI") as mock_openai_class:
+        create = AsyncMock(side_effect=reply)
+        mock_openai_class.return_value.chat.completions.create = create
+
+        trace = ImportTrace.create(None, max_chars=100_000)
+        importer = AIPatternImporter("https://example.com/long", trace=trace)
+        result = await importer._ai_extract(_pages(5), [], None)
+
+    assert create.await_count == 3
+    assert result["name"] == "Long Pattern"
+    assert [step["title"] for step in result["steps"]] == ["Page 1", "Page 5"]
+    assert result["import_warnings"] == [
+        "Part 2/3 of the pattern could not be extracted; its steps may be missing."
+    ]
+
+    parts = trace.data["ai"]["parts"]
+    assert sorted(parts) == ["1", "2", "3"]
+    assert "--- Page 3 " in parts["2"]["prompt"]["user"]["value"]
+    assert "response" not in parts["2"]
+    assert "Page 5" in parts["3"]["response"]["value"]
+
+
+async def test_pattern_importer_fetches_through_the_shared_import_fetch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    page = MagicMock(text=f"<html><body><p>{_pages(1)}</p></body></html>")
+
+    with (
+        patch(
+            "stricknani.importing.fetch.fetch_url", new=AsyncMock(return_value=page)
+        ) as fetch_url,
+        patch("stricknani.utils.ai_importer.AsyncOpenAI") as mock_openai_class,
+    ):
+        create = AsyncMock(side_effect=lambda **kwargs: _chat_reply(kwargs))
+        mock_openai_class.return_value.chat.completions.create = create
+
+        result = await AIPatternImporter("https://example.com/hat").fetch_and_parse()
+
+    fetch_url.assert_awaited_once_with(
+        "https://example.com/hat", timeout=30, headers=IMPORT_HEADERS, cache=True
+    )
+    assert result["name"] == "Long Pattern"
@@ -1,17 +1,19 @@
 """Tests for the delta-sync endpoints (SNA-3): projects, yarns, categories."""
 
 from collections.abc import AsyncGenerator
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from stricknani.config import config
 from stricknani.database import get_db
 from stricknani.main import app
-from stricknani.models import ApiToken, Base, User
+from stricknani.models import ApiToken, AuditLog, Base, Deletion, User
+from stricknani.services.audit import compact_history
 from stricknani.utils.auth import generate_api_token, get_password_hash
 
 ClientFixture = tuple[AsyncClient, async_sessionmaker[AsyncSession], int]
@@ -85,6 +87,34 @@ async def test_sync_projects_initial_full_sync(api_client: ClientFixture) -> Non
     assert "server_time" in body
 
 
+async def test_sync_serializes_like_the_response_model_path(
+    api_client: ClientFixture,
+) -> None:
+    """Sync and detail bypass FastAPI's output validation (ModelResponse);
+    their JSON must match what the validated ``response_model`` path of the
+    favorite endpoint returns for the same stored project."""
+    client, _session_factory, _user_id = api_client
+
+    created = await client.post(
+        "/api/v1/projects",
+        json={"name": "Äsche", "tags": ["wolle"], "steps": [{"title": "Anschlag"}]},
+    )
+    project_id = created.json()["id"]
+    favorited = await client.post(f"/api/v1/projects/{project_id}/favorite")
+    assert favorited.status_code == 200
+
+    synced = await client.get("/api/v1/sync/projects")
+    detail = await client.get(f"/api/v1/projects/{project_id}")
+    assert synced.headers["content-type"] == "application/json"
+    assert synced.json()["updated"] == [favorited.json()]
+    assert detail.json() == favorited.json()
+
+    schema = app.openapi()["paths"]["/api/v1/sync/projects"]["get"]
+    assert schema["responses"]["200"]["content"]["application/json"]["schema"][
+        "$ref"
+    ].endswith("/ProjectSyncResponse")
+
+
 async def test_sync_projects_paginates_with_an_opaque_cursor(
     api_client: ClientFixture,
 ) -> None:
@@ -301,10 +331,9 @@ async def test_sync_yarns_delta_and_deletion(api_client: ClientFixture) -> None:
 async def test_sync_projects_never_requires_full_resync_for_an_ancient_since(
     api_client: ClientFixture,
 ) -> None:
-    """An old `since` (predating any AuditLog row, e.g. a fresh account's
+    """An old `since` (predating any tombstone, e.g. a fresh account's
     first-ever sync) must not be confused with an unsafe gap in deletion
-    coverage - see sync.py's module docstring for why this field is
-    currently always False."""
+    coverage - only a recorded retention cutoff makes a delta unsafe."""
     client, _session_factory, _user_id = api_client
 
     create_response = await client.post(
@@ -322,6 +351,72 @@ async def test_sync_projects_never_requires_full_resync_for_an_ancient_since(
     assert body["deleted_ids"] == []
 
 
+async def test_sync_deletions_come_from_tombstones_not_audit_log(
+    api_client: ClientFixture,
+) -> None:
+    client, session_factory, user_id = api_client
+
+    project_id = (
+        await client.post("/api/v1/projects", json={"name": "Tombstoned"})
+    ).json()["id"]
+    baseline = (await client.get("/api/v1/sync/projects")).json()["server_time"]
+    await client.delete(f"/api/v1/projects/{project_id}")
+
+    async with session_factory() as session:
+        tombstones = (await session.execute(select(Deletion))).scalars().all()
+        assert [(t.owner_id, t.entity_type, t.entity_id) for t in tombstones] == [
+            (user_id, "project", project_id)
+        ]
+        # Audit history can be pruned without losing the deletion for sync.
+        await session.execute(delete(AuditLog))
+        await session.commit()
+
+    body = (
+        await client.get("/api/v1/sync/projects", params={"since": baseline})
+    ).json()
+    assert body["deleted_ids"] == [project_id]
+
+
+async def test_sync_requires_full_resync_before_tombstone_cutoff(
+    api_client: ClientFixture,
+) -> None:
+    client, session_factory, _user_id = api_client
+
+    project_id = (
+        await client.post("/api/v1/projects", json={"name": "Old Deletion"})
+    ).json()["id"]
+    before_delete = (await client.get("/api/v1/sync/projects")).json()["server_time"]
+    await client.delete(f"/api/v1/projects/{project_id}")
+
+    async with session_factory() as session:
+        pruned = await compact_history(
+            session,
+            audit_log_days=30,
+            tombstone_days=30,
+            now=datetime.now(UTC) + timedelta(days=31),
+        )
+        assert pruned == {"audit_logs": 2, "deletions": 1}
+        remaining = await session.scalar(select(func.count(Deletion.id)))
+        assert remaining == 0
+
+    stale = (
+        await client.get("/api/v1/sync/projects", params={"since": before_delete})
+    ).json()
+    assert stale["full_resync_required"] is True
+    paged = (
+        await client.get(
+            "/api/v1/sync/projects", params={"since": before_delete, "limit": 5}
+        )
+    ).json()
+    assert paged["full_resync_required"] is True
+
+    fresh_since = (datetime.now(UTC) + timedelta(days=32)).isoformat()
+    fresh = (
+        await client.get("/api/v1/sync/projects", params={"since": fresh_since})
+    ).json()
+    assert fresh["full_resync_required"] is False
+
+
 async def test_sync_categories_returns_full_list(api_client: ClientFixture) -> None:
     client, _session_factory, _user_id = api_client
 
@@ -560,3 +560,35 @@ async def test_cannot_access_another_users_project_or_yarn(
         headers={"Authorization": f"Bearer {other_raw_token}"},
     )
     assert other_delete.status_code == 404
+
+
+async def test_api_list_and_detail_revalidate(api_client: ClientFixture) -> None:
+    client, _session_factory, _user_id = api_client
+
+    created = await client.post("/api/v1/yarns", json={"name": "Merino"})
+    assert created.status_code == 201
+    yarn_id = created.json()["id"]
+
+    for url in ("/api/v1/yarns", f"/api/v1/yarns/{yarn_id}", "/api/v1/projects"):
+        response = await client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert "HX-Request" not in response.headers.get("vary", "")
+        revalidated = await client.get(url, headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304, url
+        assert revalidated.content == b""
+
+    etag = (await client.get("/api/v1/yarns")).headers["etag"]
+    favorite = await client.post(f"/api/v1/yarns/{yarn_id}/favorite")
+    assert favorite.status_code == 200
+    response = await client.get("/api/v1/yarns", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["items"][0]["is_favorite"] is True
+
+
+async def test_api_detail_wildcard_does_not_hide_missing_rows(
+    api_client: ClientFixture,
+) -> None:
+    client, _session_factory, _user_id = api_client
+    response = await client.get("/api/v1/projects/9999", headers={"If-None-Match": "*"})
+    assert response.status_code == 404
@@ -0,0 +1,131 @@
+"""Tests for the rendered card fragment cache."""
+
+import re
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import insert, select
+
+from stricknani.config import config
+from stricknani.main import app
+from stricknani.models import Project, Yarn, user_favorites
+from stricknani.routes.auth import get_current_user, require_auth
+from stricknani.web.fragments import card_fragments
+from tests.test_admin import AdminUser
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    TestClientFixture = tuple[
+        AsyncClient,
+        async_sessionmaker[AsyncSession],
+        int,
+        int,
+        int,
+    ]
+
+_CARD_RE = re.compile(
+    r'<div class="md3-feature-card group".*?data-card-context-menu', re.S
+)
+
+
+def _cards(html: str) -> list[str]:
+    return _CARD_RE.findall(html)
+
+
+async def test_project_cards_are_served_from_cache(
+    test_client: "TestClientFixture",
+) -> None:
+    client, session_factory, user_id, _, _ = test_client
+    async with session_factory() as db:
+        db.add_all([Project(name=f"Shawl {i}", owner_id=user_id) for i in range(3)])
+        await db.commit()
+
+    first = await client.get("/projects/")
+    assert card_fragments.stats()["misses"] == 4
+    second = await client.get("/projects/", headers={"HX-Request": "true"})
+    third = await client.get("/projects/", headers={"HX-Request": "true"})
+
+    assert _cards(first.text)
+    assert _cards(third.text) == _cards(second.text)
+    stats = card_fragments.stats()
+    assert stats["hits"] == 4
+    assert stats["entries"] == 8
+    assert stats["hit_rate"] == pytest.approx(4 / 12)
+
+
+async def test_cached_cards_match_uncached_render(
+    test_client: "TestClientFixture", monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client, session_factory, user_id, _, _ = test_client
+    async with session_factory() as db:
+        db.add(Yarn(name="Merino", brand="Drops", owner_id=user_id))
+        await db.commit()
+
+    await client.get("/yarn/")
+    cached = await client.get("/yarn/")
+    monkeypatch.setattr(config, "CARD_FRAGMENT_CACHE_SIZE", 0)
+    uncached = await client.get("/yarn/")
+
+    assert _cards(cached.text) == _cards(uncached.text)
+    assert "Merino" in _cards(cached.text)[0]
+
+
+async def test_card_changes_invalidate_fragments(
+    test_client: "TestClientFixture",
+) -> None:
+    client, session_factory, user_id, project_id, _ = test_client
+
+    await client.get("/projects/")
+    async with session_factory() as db:
+        project = (
+            await db.execute(select(Project).where(Project.id == project_id))
+        ).scalar_one()
+        project.name = "Renamed Cardigan"
+        await db.commit()
+    renamed = await client.get("/projects/")
+    assert "Renamed Cardigan" in _cards(renamed.text)[0]
+
+    async with session_factory() as db:
+        await db.execute(
+            insert(user_favorites).values(user_id=user_id, project_id=project_id)
+        )
+        await db.commit()
+    favorited = await client.get("/projects/")
+    assert "mdi-heart text-pink-500" in _cards(favorited.text)[0]
+
+    client.cookies.set("language", "de")
+    german = await client.get("/projects/")
+    assert _cards(german.text)[0] != _cards(favorited.text)[0]
+    assert card_fragments.stats()["hits"] == 0
+
+
+async def test_global_search_rows_use_cache(test_client: "TestClientFixture") -> None:
+    client, *_ = test_client
+
+    first = await client.get("/search/global", params={"q": "Sample"})
+    second = await client.get("/search/global", params={"q": "Sample"})
+
+    assert "/projects/" in first.text
+    assert first.text == second.text
+    assert card_fragments.stats()["hits"] == 1
+
+
+async def test_cache_stats_endpoint_requires_admin(
+    test_client: "TestClientFixture",
+) -> None:
+    client, _, user_id, _, _ = test_client
+
+    assert (await client.get("/admin/cache-stats")).status_code == 403
+
+    async def override_admin() -> AdminUser:
+        return AdminUser(user_id, "tester@example.com")
+
+    app.dependency_overrides[require_auth] = override_admin
+    app.dependency_overrides[get_current_user] = override_admin
+    await client.get("/projects/")
+
+    response = await client.get("/admin/cache-stats")
+    assert response.status_code == 200
+    assert response.json()["card_fragments"]["misses"] == 1
@@ -0,0 +1,223 @@
+"""Tests for the denormalized project/yarn card summaries."""
+
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import selectinload
+
+from stricknani.models import Image, ImageType, Project, Yarn, YarnImage
+from stricknani.services.summaries import (
+    mark_project_summaries_stale,
+    rebuild_card_summaries,
+)
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    TestClientFixture = tuple[
+        AsyncClient,
+        async_sessionmaker[AsyncSession],
+        int,
+        int,
+        int,
+    ]
+
+
+def _image(project_id: int, filename: str, *, title: bool = False) -> Image:
+    return Image(
+        filename=filename,
+        original_filename=filename,
+        alt_text=f"alt {filename}",
+        image_type=ImageType.PHOTO.value,
+        is_title_image=title,
+        project_id=project_id,
+    )
+
+
+async def _project(
+    session_factory: "async_sessionmaker[AsyncSession]", project_id: int
+) -> Project:
+    async with session_factory() as db:
+        return (
+            await db.execute(select(Project).where(Project.id == project_id))
+        ).scalar_one()
+
+
+async def _yarn(
+    session_factory: "async_sessionmaker[AsyncSession]", yarn_id: int
+) -> Yarn:
+    async with session_factory() as db:
+        return (await db.execute(select(Yarn).where(Yarn.id == yarn_id))).scalar_one()
+
+
+async def test_project_summary_tracks_images(test_client: "TestClientFixture") -> None:
+    _, session_factory, _, project_id, _ = test_client
+
+    async with session_factory() as db:
+        db.add_all(
+            [
+                _image(project_id, "a.jpg"),
+                _image(project_id, "b.jpg", title=True),
+                _image(project_id, "c.jpg", title=True),
+            ]
+        )
+        await db.commit()
+
+    project = await _project(session_factory, project_id)
+    assert project.image_count == 3
+    assert [img["filename"] for img in project.card_image_list()] == [
+        "b.jpg",
+        "c.jpg",
+    ]
+    assert project.card_image_list()[0]["alt_text"] == "alt b.jpg"
+
+    async with session_factory() as db:
+        for image in (await db.execute(select(Image))).scalars():
+            if image.filename != "a.jpg":
+                await db.delete(image)
+        await db.commit()
+
+    project = await _project(session_factory, project_id)
+    assert project.image_count == 1
+    # No title image left: the first image stands in.
+    assert [img["filename"] for img in project.card_image_list()] == ["a.jpg"]
+
+
+async def test_bulk_title_update_needs_explicit_mark(
+    test_client: "TestClientFixture",
+) -> None:
+    _, session_factory, _, project_id, _ = test_client
+
+    async with session_factory() as db:
+        db.add_all(
+            [_image(project_id, "a.jpg", title=True), _image(project_id, "b.jpg")]
+        )
+        await db.commit()
+
+    async with session_factory() as db:
+        await db.execute(
+            update(Image)
+            .where(Image.project_id == project_id)
+            .values(is_title_image=Image.filename == "b.jpg")
+        )
+        mark_project_summaries_stale(db, project_id)
+        await db.commit()
+
+    project = await _project(session_factory, project_id)
+    assert [img["filename"] for img in project.card_image_list()] == ["b.jpg"]
+
+
+async def test_yarn_links_renames_and_deletes_update_summaries(
+    test_client: "TestClientFixture",
+) -> None:
+    _, session_factory, user_id, project_id, _ = test_client
+
+    async with session_factory() as db:
+        project = (
+            await db.execute(
+                select(Project)
+                .where(Project.id == project_id)
+                .options(selectinload(Project.yarns))
+            )
+        ).scalar_one()
+        merino = Yarn(name="merino", owner_id=user_id)
+        alpaca = Yarn(name="Alpaca", owner_id=user_id)
+        project.yarns = [merino, alpaca]
+        await db.commit()
+        # Summaries are mirrored onto rows already loaded in the session.
+        assert project.yarn_count == 2
+        merino_id, alpaca_id = merino.id, alpaca.id
+
+    project = await _project(session_factory, project_id)
+    assert project.yarn_count == 2
+    assert project.yarn_name_list() == ["Alpaca", "merino"]
+    assert (await _yarn(session_factory, merino_id)).project_count == 1
+
+    async with session_factory() as db:
+        yarn = (await db.execute(select(Yarn).where(Yarn.id == merino_id))).scalar_one()
+        yarn.name = "Zephyr"
+        await db.commit()
+
+    project = await _project(session_factory, project_id)
+    assert project.yarn_name_list() == ["Alpaca", "Zephyr"]
+
+    async with session_factory() as db:
+        yarn = (await db.execute(select(Yarn).where(Yarn.id == alpaca_id))).scalar_one()
+        await db.delete(yarn)
+        await db.commit()
+
+    project = await _project(session_factory, project_id)
+    assert project.yarn_count == 1
+    assert project.yarn_name_list() == ["Zephyr"]
+
+
+async def test_yarn_summary_prefers_primary_photo(
+    test_client: "TestClientFixture",
+) -> None:
+    _, session_factory, user_id, _, _ = test_client
+
+    async with session_factory() as db:
+        yarn = Yarn(name="Sock", owner_id=user_id)
+        db.add(yarn)
+        await db.flush()
+        db.add_all(
+            [
+                YarnImage(
+                    filename="one.jpg", original_filename="one.jpg", yarn_id=yarn.id
+                ),
+                YarnImage(
+                    filename="two.jpg",
+                    original_filename="two.jpg",
+                    yarn_id=yarn.id,
+                    is_primary=True,
+                ),
+            ]
+        )
+        await db.commit()
+        yarn_id = yarn.id
+
+    yarn = await _yarn(session_factory, yarn_id)
+    assert yarn.photo_count == 2
+    assert yarn.preview_photo_filename == "two.jpg"
+
+
+async def test_summary_refresh_keeps_updated_at(
+    test_client: "TestClientFixture",
+) -> None:
+    _, session_factory, _, project_id, _ = test_client
+    before = (await _project(session_factory, project_id)).updated_at
+
+    async with session_factory() as db:
+        db.add(_image(project_id, "a.jpg"))
+        await db.commit()
+
+    project = await _project(session_factory, project_id)
+    assert project.image_count == 1
+    assert project.updated_at == before
+
+
+async def test_rebuild_card_summaries_repairs_drift(
+    test_client: "TestClientFixture",
+) -> None:
+    _, session_factory, _, project_id, _ = test_client
+
+    async with session_factory() as db:
+        db.add(_image(project_id, "a.jpg", title=True))
+        await db.commit()
+        await db.execute(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(image_count=42, card_images=None, updated_at=datetime(2020, 1, 1))
+        )
+        await db.commit()
+
+    async with session_factory() as db:
+        rebuilt = await rebuild_card_summaries(db)
+    assert rebuilt["projects"] == 1
+
+    project = await _project(session_factory, project_id)
+    assert project.image_count == 1
+    assert json.loads(project.card_images or "[]")[0]["filename"] == "a.jpg"
@@ -1,4 +1,7 @@
+import json
 import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 from httpx import AsyncClient
@@ -6,6 +9,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 import stricknani.utils.importer as importer
+from stricknani.config import config
 from stricknani.models import AuditLog, Project, ProjectCategory, Step, Yarn
 from stricknani.scripts import cli
 
@@ -196,6 +200,95 @@ async def test_cli_imports_project_url(
     assert [step.title for step in steps] == ["Cast on", "Knit"]
 
 
+@pytest.mark.asyncio
+async def test_cli_imports_batch_as_json_lines(
+    test_client: tuple[AsyncClient, async_sessionmaker[AsyncSession], int, int, int],
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: Path,
+) -> None:
+    _client, session_factory, _user_id, _project_id, _step_id = test_client
+
+    async def fake_init_db() -> None:
+        return None
+
+    monkeypatch.setattr(cli, "AsyncSessionLocal", session_factory)
+    monkeypatch.setattr(cli, "init_db", fake_init_db)
+    monkeypatch.setattr(config, "IMPORT_PARSE_WORKERS", 0)
+    batch = tmp_path / "patterns.txt"
+    batch.write_text("https://example.com/batch-pattern\n\n")
+    response = MagicMock(
+        text="<html><head><title>Batch Pattern</title></head></html>",
+        content=b"",
+        headers={"content-type": "text/html"},
+        status_code=200,
+    )
+
+    with patch("stricknani.importing.fetch.fetch_url", return_value=response):
+        await cli.import_batch(
+            "project",
+            str(batch),
+            "tester@example.com",
+            state_file=None,
+            use_ai=False,
+            import_images=False,
+            concurrency=None,
+            per_host=None,
+            host_delay=None,
+        )
+
+    [line] = capsys.readouterr().out.splitlines()
+    outcome = json.loads(line)
+    assert outcome["item"] == "https://example.com/batch-pattern"
+    assert outcome["status"] == "imported"
+    assert (tmp_path / "patterns.txt.state").exists()
+    async with session_factory() as session:
+        project = await session.get(Project, outcome["entity_id"])
+    assert project is not None
+    assert project.name == "Batch Pattern"
+
+
+def test_cli_project_import_batch_dispatches(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, object] = {}
+
+    async def fake_import_batch(
+        kind: str, batch: str, owner_email: str, **options: object
+    ) -> None:
+        captured.update(kind=kind, batch=batch, owner_email=owner_email, **options)
+
+    monkeypatch.setattr(cli, "import_batch", fake_import_batch)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "stricknani-cli",
+            "project",
+            "import",
+            "--batch",
+            "-",
+            "--owner-email",
+            "tester@example.com",
+            "--concurrency",
+            "8",
+            "--import-images",
+        ],
+    )
+
+    cli.main()
+
+    assert captured == {
+        "kind": "project",
+        "batch": "-",
+        "owner_email": "tester@example.com",
+        "state_file": None,
+        "use_ai": True,
+        "import_images": True,
+        "concurrency": 8,
+        "per_host": None,
+        "host_delay": None,
+    }
+
+
 @pytest.mark.asyncio
 async def test_cli_lists_audit_entries(
     test_client: tuple[AsyncClient, async_sessionmaker[AsyncSession], int, int, int],
@@ -353,6 +446,41 @@ def test_cli_audit_list_dispatches(monkeypatch: pytest.MonkeyPatch) -> None:
     assert captured["limit"] == 12
 
 
+def test_cli_audit_compact_dispatches(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, object] = {}
+
+    async def fake_compact_audit_history(
+        *,
+        audit_log_days: int | None,
+        tombstone_days: int | None,
+    ) -> None:
+        captured["audit_log_days"] = audit_log_days
+        captured["tombstone_days"] = tombstone_days
+
+    monkeypatch.setattr(cli, "compact_audit_history", fake_compact_audit_history)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["stricknani-cli", "audit", "compact", "--audit-log-days", "90"],
+    )
+    cli.main()
+
+    assert captured == {"audit_log_days": 90, "tombstone_days": None}
+
+
+def test_cli_summaries_rebuild_dispatches(monkeypatch: pytest.MonkeyPatch) -> None:
+    called: list[bool] = []
+
+    async def fake_rebuild_summaries() -> None:
+        called.append(True)
+
+    monkeypatch.setattr(cli, "rebuild_summaries", fake_rebuild_summaries)
+    monkeypatch.setattr(sys, "argv", ["stricknani-cli", "summaries", "rebuild"])
+    cli.main()
+
+    assert called == [True]
+
+
 def test_cli_api_projects_dispatches(monkeypatch: pytest.MonkeyPatch) -> None:
     captured: dict[str, object] = {}
 
@@ -0,0 +1,158 @@
+"""Tests for response compression and precompressed static assets."""
+
+import gzip
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import brotli
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Mount, Route
+
+from stricknani.web.compression import (
+    CompressionMiddleware,
+    accepted_encodings,
+    precompress_static,
+)
+from stricknani.web.staticfiles import CachedStaticFiles
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    TestClientFixture = tuple[
+        AsyncClient,
+        async_sessionmaker[AsyncSession],
+        int,
+        int,
+        int,
+    ]
+
+_SCRIPT = b"document.querySelectorAll('.card').forEach(() => {});\n" * 200
+
+
+def test_accepted_encodings_honours_quality() -> None:
+    assert accepted_encodings("gzip, deflate, br") == ["br", "gzip"]
+    assert accepted_encodings("br;q=0, gzip;q=0.5") == ["gzip"]
+    assert accepted_encodings("*") == ["br", "gzip"]
+    assert accepted_encodings("identity") == []
+
+
+async def test_html_pages_are_compressed(test_client: "TestClientFixture") -> None:
+    client, _, _, _, _ = test_client
+
+    response = await client.get("/projects/", headers={"Accept-Encoding": "br"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "br"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert "<html" in response.text
+
+    response = await client.get(
+        "/projects/", headers={"Accept-Encoding": "gzip, br;q=0"}
+    )
+    assert response.headers["content-encoding"] == "gzip"
+
+    response = await client.get("/projects/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert "Accept-Encoding" in response.headers["vary"]
+
+
+async def _compressed_app_get(
+    response: Response, accept_encoding: str = "gzip"
+) -> tuple[int, dict[str, str], bytes]:
+    async def endpoint(_request: object) -> Response:
+        return response
+
+    app = CompressionMiddleware(
+        Starlette(routes=[Route("/", endpoint)]), minimum_size=100
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        result = await client.get("/", headers={"Accept-Encoding": accept_encoding})
+    return result.status_code, dict(result.headers), result.content
+
+
+async def test_small_and_binary_responses_pass_through() -> None:
+    _, headers, body = await _compressed_app_get(PlainTextResponse("tiny"))
+    assert "content-encoding" not in headers
+    assert body == b"tiny"
+
+    png = b"\x89PNG" + b"\0" * 4096
+    _, headers, body = await _compressed_app_get(Response(png, media_type="image/png"))
+    assert "content-encoding" not in headers
+    assert "vary" not in headers
+    assert body == png
+
+    _, headers, _ = await _compressed_app_get(
+        Response(
+            gzip.compress(_SCRIPT),
+            media_type="text/javascript",
+            headers={"Content-Encoding": "gzip"},
+        )
+    )
+    assert headers["content-encoding"] == "gzip"
+
+
+def _static_client(directory: Path) -> AsyncClient:
+    app = Starlette(
+        routes=[Mount("/static", CachedStaticFiles(directory=str(directory)))]
+    )
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def test_static_serves_precompressed_siblings(tmp_path: Path) -> None:
+    source = tmp_path / "app.js"
+    source.write_bytes(_SCRIPT)
+    (tmp_path / "tiny.js").write_bytes(b"void 0;")
+
+    assert precompress_static(tmp_path) == 2
+    assert not (tmp_path / "tiny.js.br").exists()
+    assert brotli.decompress((tmp_path / "app.js.br").read_bytes()) == _SCRIPT
+    # Up-to-date siblings are left alone.
+    assert precompress_static(tmp_path) == 0
+
+    async with _static_client(tmp_path) as client:
+        response = await client.get(
+            "/static/app.js", headers={"Accept-Encoding": "gzip, br"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "br"
+        assert response.headers["content-type"].startswith("text/javascript")
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.content == _SCRIPT
+
+        revalidated = await client.get(
+            "/static/app.js",
+            headers={
+                "Accept-Encoding": "gzip, br",
+                "If-None-Match": response.headers["etag"],
+            },
+        )
+        assert revalidated.status_code == 304
+
+        plain = await client.get(
+            "/static/app.js", headers={"Accept-Encoding": "identity"}
+        )
+        assert "content-encoding" not in plain.headers
+        assert plain.headers["vary"] == "Accept-Encoding"
+        assert plain.headers["etag"] != response.headers["etag"]
+
+        # An edited source stops using siblings built from the old bytes.
+        source.write_bytes(_SCRIPT + b"// edited\n")
+        newer = (tmp_path / "app.js.br").stat().st_mtime_ns + 1_000_000_000
+        os.utime(source, ns=(newer, newer))
+        stale = await client.get("/static/app.js", headers={"Accept-Encoding": "br"})
+        assert "content-encoding" not in stale.headers
+        assert stale.content.endswith(b"// edited\n")
+
+        # Siblings written or removed while the app runs are seen at once.
+        source.write_bytes(_SCRIPT)
+        assert precompress_static(tmp_path) == 2
+        fresh = await client.get("/static/app.js", headers={"Accept-Encoding": "br"})
+        assert fresh.headers["content-encoding"] == "br"
+        (tmp_path / "app.js.br").unlink()
+        gone = await client.get("/static/app.js", headers={"Accept-Encoding": "br"})
+        assert gone.status_code == 200
+        assert "content-encoding" not in gone.headers
@@ -0,0 +1,130 @@
+"""Tests for ETag / If-None-Match revalidation of library lists and the API."""
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+
+from stricknani.models import Image, ImageType, Project, User, Yarn
+from tests.conftest import QueryBudget
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    TestClientFixture = tuple[
+        AsyncClient,
+        async_sessionmaker[AsyncSession],
+        int,
+        int,
+        int,
+    ]
+
+
+async def _etag(client: "AsyncClient", url: str, **headers: str) -> str:
+    response = await client.get(url, headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    assert response.headers["cache-control"] == "private, no-cache"
+    return etag
+
+
+async def test_project_list_revalidates(
+    test_client: "TestClientFixture", query_budget: QueryBudget
+) -> None:
+    client, _, _, _, _ = test_client
+
+    # The first visit issues the CSRF cookie the page embeds, so it carries
+    # no validator yet.
+    first = await client.get("/projects/")
+    assert first.status_code == 200
+    assert "etag" not in first.headers
+
+    etag = await _etag(client, "/projects/")
+    with query_budget(1):
+        response = await client.get("/projects/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert "HX-Request" in response.headers["vary"]
+    # The stored body's inline scripts carry the stored response's nonce.
+    assert "content-security-policy" not in response.headers
+
+
+async def test_html_etag_varies_with_fragment_and_language(
+    test_client: "TestClientFixture",
+) -> None:
+    client, _, _, _, _ = test_client
+    await client.get("/yarn/")
+
+    full = await _etag(client, "/yarn/")
+    partial = await _etag(client, "/yarn/", **{"HX-Request": "true"})
+    as_json = await _etag(client, "/yarn/", accept="application/json")
+    assert len({full, partial, as_json}) == 3
+
+    client.cookies.set("language", "en")
+    english = await _etag(client, "/yarn/")
+    client.cookies.set("language", "de")
+    assert await _etag(client, "/yarn/") != english
+
+
+async def test_library_changes_produce_new_etag(
+    test_client: "TestClientFixture",
+) -> None:
+    client, session_factory, _, project_id, _ = test_client
+    await client.get("/projects/")
+    etags = {await _etag(client, "/projects/")}
+
+    # Image rows change the card without touching projects.updated_at.
+    async with session_factory() as db:
+        db.add(
+            Image(
+                filename="a.jpg",
+                original_filename="a.jpg",
+                alt_text="a",
+                image_type=ImageType.PHOTO.value,
+                project_id=project_id,
+            )
+        )
+        await db.commit()
+    etags.add(await _etag(client, "/projects/"))
+
+    # Favorites are written with bulk statements.
+    response = await client.post(f"/projects/{project_id}/favorite")
+    assert response.status_code in {200, 303}
+    etags.add(await _etag(client, "/projects/"))
+
+    async with session_factory() as db:
+        project = (
+            await db.execute(select(Project).where(Project.id == project_id))
+        ).scalar_one()
+        project.name = "Renamed"
+        await db.commit()
+    etags.add(await _etag(client, "/projects/"))
+    assert len(etags) == 4
+
+
+async def test_yarn_changes_bump_only_the_owner(
+    test_client: "TestClientFixture",
+) -> None:
+    _, session_factory, user_id, _, _ = test_client
+
+    async def versions() -> dict[int, int]:
+        async with session_factory() as db:
+            rows = await db.execute(select(User.id, User.library_version))
+            return dict(rows.tuples().all())
+
+    async with session_factory() as db:
+        db.add(User(email="other@example.com", hashed_password="x"))
+        await db.commit()
+    before = await versions()
+
+    async with session_factory() as db:
+        db.add(Yarn(name="Merino", owner_id=user_id))
+        await db.commit()
+    after = await versions()
+
+    assert after[user_id] == before[user_id] + 1
+    assert [after[uid] for uid in after if uid != user_id] == [
+        before[uid] for uid in before if uid != user_id
+    ]
@@ -0,0 +1,126 @@
+"""Tests for prev/next swipe navigation on project and yarn detail pages."""
+
+import re
+from typing import TYPE_CHECKING
+
+from sqlalchemy import insert
+
+from stricknani.models import Project, Yarn, user_favorite_yarns, user_favorites
+from tests.conftest import QueryBudget
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    TestClientFixture = tuple[
+        AsyncClient,
+        async_sessionmaker[AsyncSession],
+        int,
+        int,
+        int,
+    ]
+
+_NAMES = ["beta", "Alpha", "delta", "Charlie", "alpha", "Echo"]
+_FAVORITES = {"delta", "alpha"}
+
+
+def _swipe_links(html: str) -> tuple[str | None, str | None]:
+    prev_match = re.search(r'data-swipe-prev-href="([^"]+)"', html)
+    next_match = re.search(r'data-swipe-next-href="([^"]+)"', html)
+    return (
+        prev_match.group(1) if prev_match else None,
+        next_match.group(1) if next_match else None,
+    )
+
+
+def _list_order(rows: list[tuple[int, str]], favorite_ids: set[int]) -> list[int]:
+    return [
+        row_id
+        for row_id, _name in sorted(
+            rows, key=lambda row: (row[0] not in favorite_ids, row[1].lower(), row[0])
+        )
+    ]
+
+
+async def test_project_detail_navigation_follows_list_order(
+    test_client: "TestClientFixture",
+) -> None:
+    client, session_factory, user_id, sample_id, _ = test_client
+
+    rows = [(sample_id, "Sample Project")]
+    favorite_ids: set[int] = set()
+    async with session_factory() as db:
+        for name in _NAMES:
+            project = Project(name=name, owner_id=user_id)
+            db.add(project)
+            await db.flush()
+            rows.append((project.id, name))
+            if name in _FAVORITES:
+                favorite_ids.add(project.id)
+                await db.execute(
+                    insert(user_favorites).values(
+                        user_id=user_id, project_id=project.id
+                    )
+                )
+        await db.commit()
+
+    order = _list_order(rows, favorite_ids)
+    for index, project_id in enumerate(order):
+        response = await client.get(f"/projects/{project_id}")
+        assert response.status_code == 200
+        expected_prev = f"/projects/{order[index - 1]}" if index > 0 else None
+        expected_next = (
+            f"/projects/{order[index + 1]}" if index < len(order) - 1 else None
+        )
+        assert _swipe_links(response.text) == (expected_prev, expected_next)
+
+
+async def test_yarn_detail_navigation_follows_list_order(
+    test_client: "TestClientFixture",
+) -> None:
+    client, session_factory, user_id, _, _ = test_client
+
+    rows: list[tuple[int, str]] = []
+    favorite_ids: set[int] = set()
+    async with session_factory() as db:
+        for name in _NAMES:
+            yarn = Yarn(name=name, owner_id=user_id)
+            db.add(yarn)
+            await db.flush()
+            rows.append((yarn.id, name))
+            if name in _FAVORITES:
+                favorite_ids.add(yarn.id)
+                await db.execute(
+                    insert(user_favorite_yarns).values(user_id=user_id, yarn_id=yarn.id)
+                )
+        await db.commit()
+
+    order = _list_order(rows, favorite_ids)
+    for index, yarn_id in enumerate(order):
+        response = await client.get(f"/yarn/{yarn_id}")
+        assert response.status_code == 200
+        expected_prev = f"/yarn/{order[index - 1]}" if index > 0 else None
+        expected_next = f"/yarn/{order[index + 1]}" if index < len(order) - 1 else None
+        assert _swipe_links(response.text) == (expected_prev, expected_next)
+
+
+async def test_detail_navigation_does_not_scale_with_library(
+    test_client: "TestClientFixture", query_budget: QueryBudget
+) -> None:
+    client, session_factory, user_id, _, _ = test_client
+
+    async with session_factory() as db:
+        db.add_all([Yarn(name=f"Yarn {i:03}", owner_id=user_id) for i in range(200)])
+        await db.commit()
+        middle = Yarn(name="Yarn 100b", owner_id=user_id)
+        db.add(middle)
+        await db.commit()
+        middle_id = middle.id
+
+    with query_budget(8) as stats:
+        response = await client.get(f"/yarn/{middle_id}")
+    assert response.status_code == 200
+    # Navigation rows are fetched one at a time, never the whole library.
+    assert all(
+        "LIMIT" in shape for shape in stats.shapes if "lower(yarns.name)" in shape
+    )
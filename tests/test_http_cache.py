@@ -0,0 +1,165 @@
+"""Tests for the on-disk HTTP cache behind ``fetch_url(cache=True)``."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from stricknani.config import config
+from stricknani.importing.fetch import FetchResponse, fetch_url
+from stricknani.importing.http_cache import HTTPCache
+
+URL = "https://www.garnstudio.com/pattern.php?id=1"
+
+
+class _FakeCurlResponse:
+    def __init__(
+        self, status_code: int, headers: dict[str, str], text: str = ""
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+        self.content = text.encode()
+        self.encoding = "utf-8"
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class _FakeCurlSession:
+    def __init__(self, responses: list[_FakeCurlResponse]) -> None:
+        self._responses = responses
+        self.requests: list[dict[str, str]] = []
+        self.curl_options: dict[Any, Any] = {}
+
+    async def __aenter__(self) -> _FakeCurlSession:
+        return self
+
+    async def __aexit__(self, *args: Any) -> bool:
+        return False
+
+    async def get(self, url: str, **kwargs: Any) -> _FakeCurlResponse:
+        self.requests.append(dict(kwargs.get("headers") or {}))
+        return self._responses.pop(0)
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(config, "IMPORT_HTTP_CACHE_DIR", tmp_path / "http")
+    monkeypatch.setattr(config, "IMPORT_HTTP_CACHE_MAX_BYTES", 1024 * 1024)
+    return tmp_path / "http"
+
+
+def _serve(monkeypatch: pytest.MonkeyPatch, *responses: _FakeCurlResponse) -> Any:
+    import curl_cffi.requests
+
+    session = _FakeCurlSession(list(responses))
+    monkeypatch.setattr(curl_cffi.requests, "AsyncSession", lambda *a, **k: session)
+    return session
+
+
+async def test_fresh_responses_are_served_without_a_request(
+    cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = _serve(
+        monkeypatch,
+        _FakeCurlResponse(200, {"Cache-Control": "max-age=600"}, "<h1>Mütze</h1>"),
+    )
+
+    first = await fetch_url(URL, cache=True)
+    second = await fetch_url(URL, cache=True)
+
+    assert len(session.requests) == 1
+    assert second.text == first.text == "<h1>Mütze</h1>"
+    assert second.content == first.content
+    assert list(cache_dir.glob("*.gz"))
+
+
+async def test_stale_responses_are_revalidated(
+    cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = _serve(
+        monkeypatch,
+        _FakeCurlResponse(200, {"Cache-Control": "no-cache", "ETag": '"v1"'}, "body"),
+        _FakeCurlResponse(304, {"ETag": '"v1"'}),
+        _FakeCurlResponse(200, {"ETag": '"v2"'}, "new body"),
+    )
+
+    assert (await fetch_url(URL, cache=True)).text == "body"
+    revalidated = await fetch_url(URL, cache=True)
+    changed = await fetch_url(URL, cache=True)
+
+    assert revalidated.status_code == 200
+    assert revalidated.text == "body"
+    assert changed.text == "new body"
+    assert session.requests == [
+        {},
+        {"If-None-Match": '"v1"'},
+        {"If-None-Match": '"v1"'},
+    ]
+
+
+async def test_uncacheable_responses_and_other_requests_are_not_cached(
+    cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = _serve(
+        monkeypatch,
+        _FakeCurlResponse(200, {"Cache-Control": "no-store"}, "a"),
+        _FakeCurlResponse(200, {"Cache-Control": "no-store"}, "b"),
+        _FakeCurlResponse(200, {"Cache-Control": "max-age=600"}, "c"),
+        _FakeCurlResponse(200, {"Cache-Control": "max-age=600"}, "d"),
+        _FakeCurlResponse(200, {"Cache-Control": "max-age=600"}, "e"),
+    )
+
+    assert (await fetch_url(URL, cache=True)).text == "a"
+    assert (await fetch_url(URL, cache=True)).text == "b"
+    assert (await fetch_url(URL)).text == "c"
+    assert (await fetch_url(URL, cache=True)).text == "d"
+    # Different request headers are a different cache entry.
+    german = await fetch_url(URL, cache=True, headers={"Accept-Language": "de"})
+    assert german.text == "e"
+    assert len(session.requests) == 5
+
+
+async def test_unusable_cache_dir_falls_back_to_uncached_fetches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    not_a_dir = tmp_path / "http"
+    not_a_dir.write_text("")
+    monkeypatch.setattr(config, "IMPORT_HTTP_CACHE_DIR", not_a_dir)
+    session = _serve(
+        monkeypatch,
+        _FakeCurlResponse(200, {"Cache-Control": "max-age=600"}, "a"),
+        _FakeCurlResponse(200, {"Cache-Control": "max-age=600"}, "b"),
+    )
+
+    assert (await fetch_url(URL, cache=True)).text == "a"
+    assert (await fetch_url(URL, cache=True)).text == "b"
+    assert len(session.requests) == 2
+
+
+async def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    cache = HTTPCache(tmp_path, max_bytes=3500)
+    page = os.urandom(900)  # incompressible: ~1 KiB per entry
+
+    def response() -> FetchResponse:
+        return FetchResponse(
+            text="",
+            content=page,
+            status_code=200,
+            headers={"cache-control": "max-age=600"},
+        )
+
+    for key in ("a", "b", "c"):
+        await cache.store(key, f"https://example.com/{key}", response())
+        # Distinct modification times, oldest first.
+        os.utime(tmp_path / f"{key}.json", (0, {"a": 1, "b": 2, "c": 3}[key]))
+    assert await cache.load("a") is not None  # now the most recently used
+
+    await cache.store("d", "https://example.com/d", response())
+
+    assert await cache.load("b") is None
+    assert {path.stem for path in tmp_path.glob("*.gz")} == {"a", "c", "d"}
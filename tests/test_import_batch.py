@@ -0,0 +1,180 @@
+"""Tests for bulk imports from a list of URLs and files."""
+
+import asyncio
+import json
+import time
+from itertools import pairwise
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from stricknani.importing.batch import (
+    BatchImporter,
+    BatchState,
+    HostLimiter,
+    read_batch_items,
+)
+from stricknani.importing.models import ExtractedData
+from stricknani.models import Project, Step, Yarn
+
+PATTERN_HTML = """
+<html>
+    <head><title>{name}</title></head>
+    <body>
+        <h1>{name}</h1>
+        <p>Needles: 5mm</p>
+        <div class="instructions"><p>Cast on 40 stitches.</p></div>
+    </body>
+</html>
+"""
+
+ClientFixture = tuple[AsyncClient, async_sessionmaker[AsyncSession], int, int, int]
+
+
+def _page(url: str, **kwargs: Any) -> MagicMock:
+    name = url.rsplit("/", 1)[-1].title()
+    html = PATTERN_HTML.format(name=name)
+    response = MagicMock()
+    response.text = html
+    response.content = html.encode()
+    response.encoding = "utf-8"
+    response.headers = {"content-type": "text/html"}
+    response.status_code = 200
+    return response
+
+
+def test_batch_items_skip_blanks_comments_and_repeats() -> None:
+    lines = [
+        "https://a.example/1\n",
+        "\n",
+        "# done later\n",
+        " patterns/x.pdf ",
+        "https://a.example/1",
+    ]
+    assert read_batch_items(lines) == ["https://a.example/1", "patterns/x.pdf"]
+
+
+async def test_batch_imports_projects_and_resumes(
+    test_client: ClientFixture, tmp_path: Path
+) -> None:
+    _client, session_factory, user_id, _project_id, _step_id = test_client
+    state_path = tmp_path / "batch.state"
+    items = [
+        "https://example.com/cabled-hat",
+        "https://example.org/lace-shawl",
+        str(tmp_path / "missing.pdf"),
+    ]
+    outcomes: list[dict[str, Any]] = []
+
+    with patch("stricknani.importing.fetch.fetch_url", side_effect=_page):
+        counts = await BatchImporter(
+            "project",
+            user_id,
+            session_factory,
+            host_delay=0,
+            state=BatchState(state_path),
+        ).run(items, outcomes.append)
+
+    assert counts == {"imported": 2, "failed": 1}
+    by_item = {outcome["item"]: outcome for outcome in outcomes}
+    assert by_item[items[2]]["status"] == "failed"
+    assert by_item[items[2]]["errors"]
+    hat = by_item[items[0]]
+    assert hat["status"] == "imported"
+    assert hat["entity_type"] == "project"
+    json.dumps(outcomes)
+
+    async with session_factory() as session:
+        project = await session.get(Project, hat["entity_id"])
+        assert project is not None
+        assert project.name == "Cabled-Hat"
+        assert project.link == items[0]
+        steps = (
+            await session.scalars(select(Step).where(Step.project_id == project.id))
+        ).all()
+        assert steps
+
+    # A second run skips what was imported and retries what failed.
+    outcomes.clear()
+    (tmp_path / "missing.pdf").write_text("still not a pdf")
+    with patch("stricknani.importing.fetch.fetch_url") as fetch:
+        counts = await BatchImporter(
+            "project", user_id, session_factory, state=BatchState(state_path)
+        ).run(items, outcomes.append)
+
+    fetch.assert_not_called()
+    assert counts == {"skipped": 2, "failed": 1}
+    assert [o["entity_id"] for o in outcomes if o["status"] == "skipped"] == [
+        by_item[items[0]]["entity_id"],
+        by_item[items[1]]["entity_id"],
+    ]
+    assert len(state_path.read_text().splitlines()) == 4
+
+
+async def test_batch_imports_yarns(test_client: ClientFixture) -> None:
+    _client, session_factory, user_id, _project_id, _step_id = test_client
+    outcomes: list[dict[str, Any]] = []
+
+    with patch("stricknani.importing.fetch.fetch_url", side_effect=_page):
+        await BatchImporter("yarn", user_id, session_factory, host_delay=0).run(
+            ["https://example.com/merino"], outcomes.append
+        )
+
+    [outcome] = outcomes
+    async with session_factory() as session:
+        yarn = await session.get(Yarn, outcome["entity_id"])
+    assert yarn is not None
+    assert yarn.name == "Merino"
+    assert yarn.owner_id == user_id
+
+
+async def test_batch_outcomes_carry_extraction_warnings(
+    test_client: ClientFixture,
+) -> None:
+    _client, session_factory, user_id, _project_id, _step_id = test_client
+    outcomes: list[dict[str, Any]] = []
+    warning = (
+        "Part 2/3 of the pattern could not be extracted; its steps may be missing."
+    )
+    extracted = ExtractedData(name="Long Pattern", warnings=[warning])
+
+    with (
+        patch("stricknani.importing.fetch.fetch_url", side_effect=_page),
+        patch(
+            "stricknani.importing.extractors.html.HTMLExtractor.extract",
+            new=AsyncMock(return_value=extracted),
+        ),
+    ):
+        await BatchImporter("project", user_id, session_factory, host_delay=0).run(
+            ["https://example.com/long-pattern"], outcomes.append
+        )
+
+    [outcome] = outcomes
+    assert outcome["status"] == "imported"
+    assert outcome["warnings"] == [warning]
+
+
+async def test_host_limiter_spaces_and_bounds_items_per_host() -> None:
+    limiter = HostLimiter(per_host=1, delay=0.05)
+    running: dict[str | None, int] = {}
+    peak: dict[str | None, int] = {}
+    starts: list[float] = []
+
+    async def item(host: str | None) -> None:
+        async with limiter.slot(host):
+            if host == "a.example":
+                starts.append(time.monotonic())
+            running[host] = running.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), running[host])
+            await asyncio.sleep(0.01)
+            running[host] -= 1
+
+    await asyncio.gather(*(item(host) for host in ["a.example"] * 3 + [None] * 3))
+
+    assert peak == {"a.example": 1, None: 3}
+    gaps = [later - earlier for earlier, later in pairwise(starts)]
+    assert min(gaps) >= 0.045
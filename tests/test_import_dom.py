@@ -0,0 +1,80 @@
+"""Tests for the parsed-page index the pattern importer queries."""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bs4 import BeautifulSoup
+
+from stricknani.config import config
+from stricknani.importing.dom import DocumentIndex, parse_html
+from stricknani.utils.importer import GarnstudioPatternImporter
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "garnstudio"
+FIXTURES = {
+    "pattern_3491.html": "https://www.garnstudio.com/pattern.php?id=3491&cid=9",
+    "pattern_9185.html": "https://www.garnstudio.com/pattern.php?id=9185&cid=9",
+    "yarn_drops-kid-silk.html": (
+        "https://www.garnstudio.com/yarn.php?show=drops-kid-silk&cid=9"
+    ),
+}
+
+
+@pytest.mark.parametrize("fixture", sorted(FIXTURES))
+def test_index_lookups_match_beautifulsoup(fixture: str) -> None:
+    soup = BeautifulSoup((FIXTURE_DIR / fixture).read_text("utf-8"), "lxml")
+    dom = DocumentIndex(soup)
+
+    material = re.compile(r"material_text(_print)?")
+    related = re.compile(r"instruction(s)?$", re.I)
+    assert dom.find_all("img") == soup.find_all("img")
+    assert dom.find_all(["h2", "h3", "p"]) == soup.find_all(["h2", "h3", "p"])
+    assert dom.find(id=material) is soup.find(id=material)
+    assert dom.find_all(["div", "section"], class_=related) == soup.find_all(
+        ["div", "section"], class_=related
+    )
+    assert dom.find("meta", attrs={"property": "og:image"}) is soup.find(
+        "meta", property="og:image"
+    )
+    assert dom.find_all("a", attrs={"href": re.compile(r"yarn\.php")}) == (
+        soup.find_all("a", href=re.compile(r"yarn\.php"))
+    )
+    selector = ".btn, .dropdown, #menu, nav, script"
+    assert dom.select(selector) == soup.select(selector)
+    assert dom.text("\n", strip=True) == soup.get_text("\n", strip=True)
+
+
+def test_removed_tags_drop_out_of_lookups() -> None:
+    soup = parse_html(
+        "<div class='row'><h3>Gauge:</h3><span class='btn'>Buy</span></div>"
+        "<div class='row'><b>Gauge</b> 22 sts</div>"
+    )
+    dom = DocumentIndex(soup)
+    assert len(dom.find_by_text(["gauge"], strip_colon=True)) == 2
+    assert "Buy" in dom.text()
+
+    dom.decompose(dom.find_all("div", class_="row")[0])
+
+    assert [tag.name for tag in dom.find_by_text(["gauge"], strip_colon=True)] == ["b"]
+    assert dom.find_all(class_="btn") == []
+    assert dom.text() == "Gauge 22 sts"
+
+
+async def _import(fixture: str, parser: str) -> dict[str, Any]:
+    response = MagicMock()
+    response.text = (FIXTURE_DIR / fixture).read_text(encoding="utf-8")
+    response.status_code = 200
+    with (
+        patch.object(config, "IMPORT_HTML_PARSER", parser),
+        patch("stricknani.importing.fetch.fetch_url", return_value=response),
+    ):
+        return await GarnstudioPatternImporter(FIXTURES[fixture]).fetch_and_parse()
+
+
+@pytest.mark.parametrize("fixture", sorted(FIXTURES))
+async def test_parsers_import_the_same_data(fixture: str) -> None:
+    assert await _import(fixture, "lxml") == await _import(fixture, "html.parser")
@@ -0,0 +1,128 @@
+"""Tests for the shared, pooled outbound HTTP clients used by imports."""
+
+from __future__ import annotations
+
+import socket
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+from curl_cffi import CurlInfo, CurlOpt
+
+from stricknani.importing.clients import (
+    ImportHTTPClients,
+    _PinnedNetworkBackend,
+    get_public_url,
+)
+from stricknani.importing.ssrf import SSRFError
+
+
+async def test_shared_clients_are_reused_until_closed() -> None:
+    clients = ImportHTTPClients()
+    await clients.start()
+    try:
+        async with clients.httpx_client() as first, clients.httpx_client() as second:
+            assert first is second
+            assert first.follow_redirects is False
+        async with clients.curl_session() as one, clients.curl_session() as other:
+            assert one is other
+    finally:
+        await clients.close()
+
+    assert not clients.started
+    async with clients.httpx_client() as first, clients.httpx_client() as second:
+        assert first is not second
+
+
+async def test_stats_count_new_and_reused_connections() -> None:
+    clients = ImportHTTPClients()
+    await clients.start()
+    try:
+        for connects in (1, 0, 0):
+            response: Any = SimpleNamespace(infos={CurlInfo.NUM_CONNECTS: connects})
+            clients.record_curl_response(response)
+
+        # httpcore reports each new connection through the request's trace hook.
+        for index in range(3):
+            request = httpx.Request("GET", "https://example.com/")
+            await clients._trace_httpx_request(request)
+            if index == 0:
+                trace = request.extensions["trace"]
+                await trace("connection.connect_tcp.started", {})
+                await trace("connection.connect_tcp.complete", {})
+    finally:
+        await clients.close()
+
+    stats = clients.stats()
+    assert stats["curl"] == {"requests": 3, "connections": 1, "reused": 2}
+    assert stats["httpx"] == {"requests": 3, "connections": 1, "reused": 2}
+
+
+async def test_get_public_url_validates_every_redirect_hop() -> None:
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        if request.url.path == "/start":
+            return httpx.Response(302, headers={"location": "/next"})
+        return httpx.Response(
+            302, headers={"location": "http://169.254.169.254/latest/meta-data/"}
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(SSRFError):
+            await get_public_url(client, "http://93.184.216.34/start")
+
+    assert requested == ["http://93.184.216.34/start", "http://93.184.216.34/next"]
+
+
+def _addrinfo(ip: str) -> list[tuple[Any, ...]]:
+    return [(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", (ip, 0))]
+
+
+class _RecordingBackend:
+    def __init__(self) -> None:
+        self.connected: list[tuple[str, int]] = []
+
+    async def connect_tcp(self, host: str, port: int, **kwargs: Any) -> Any:
+        self.connected.append((host, port))
+        return SimpleNamespace()
+
+
+async def test_httpx_connections_go_to_the_checked_address(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    backend = _PinnedNetworkBackend()
+    recorder = _RecordingBackend()
+    monkeypatch.setattr(backend, "_backend", recorder)
+
+    await backend.connect_tcp("shop.example.com", 443)
+    assert recorder.connected == [("93.184.216.34", 443)]
+
+    # A name that now resolves internal is refused before connecting.
+    monkeypatch.setattr(socket, "getaddrinfo", lambda *a, **k: _addrinfo("10.0.0.5"))
+    with pytest.raises(SSRFError):
+        await backend.connect_tcp("rebind.example.com", 443)
+    assert len(recorder.connected) == 1
+
+
+async def test_curl_pins_are_set_while_requests_are_in_flight() -> None:
+    clients = ImportHTTPClients()
+    session: Any = SimpleNamespace(curl_options={CurlOpt.MAXAGE_CONN: 60})
+
+    with clients.curl_pinned(session, "https://shop.example.com/a", "93.184.216.34"):
+        with clients.curl_pinned(session, "http://v6.example.com:8080/", "2001:db8::1"):
+            assert session.curl_options == {
+                CurlOpt.MAXAGE_CONN: 60,
+                CurlOpt.RESOLVE: [
+                    "shop.example.com:443:93.184.216.34",
+                    "v6.example.com:8080:[2001:db8::1]",
+                ],
+            }
+    # Nothing to pin with private hosts allowed or for IP-literal URLs.
+    with clients.curl_pinned(session, "https://other.example.com/", None):
+        with clients.curl_pinned(session, "http://93.184.216.34/", "93.184.216.34"):
+            pass
+
+    assert clients._curl_pins == {}
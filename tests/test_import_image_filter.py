@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from io import BytesIO
 from typing import Any
@@ -8,6 +9,8 @@ import httpx
 import pytest
 from PIL import Image as PilImage
 
+from stricknani.importing.images import downloader as downloader_module
+from stricknani.importing.images.downloader import ImageDownloader
 from stricknani.utils.files import compute_checksum
 from stricknani.utils.image_similarity import build_similarity_image
 from stricknani.utils.importer import filter_import_image_urls
@@ -51,7 +54,7 @@ class _FakeAsyncClient:
     async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
         return
 
-    def stream(self, method: str, url: str) -> _FakeStream:
+    def stream(self, method: str, url: str, **kwargs: Any) -> _FakeStream:
         if url not in self._url_to_payload:
             raise httpx.HTTPError("not found")
         content, content_type = self._url_to_payload[url]
@@ -169,3 +172,132 @@ async def test_filter_import_image_urls_prefers_larger_duplicate_variant(
     res = await filter_import_image_urls([small, large])
 
     assert res == [large]
+
+
+async def _public_address(url: str) -> str:
+    return "93.184.216.34"
+
+
+class _SlowAsyncClient(_FakeAsyncClient):
+    """Serves payloads after per-URL delays and records concurrency."""
+
+    def __init__(
+        self,
+        url_to_payload: dict[str, tuple[bytes, str]],
+        delays: dict[str, float],
+    ) -> None:
+        super().__init__(url_to_payload)
+        self._delays = delays
+        self.active: dict[str, int] = {}
+        self.peak = 0
+        self.peak_per_host: dict[str, int] = {}
+        self.started: list[str] = []
+        self.completed: list[str] = []
+
+    def stream(self, method: str, url: str, **kwargs: Any) -> Any:
+        client = self
+        inner = super().stream(method, url, **kwargs)
+        host = httpx.URL(url).host
+
+        class _Slow:
+            async def __aenter__(self) -> _FakeResponse:
+                client.started.append(url)
+                client.active[host] = client.active.get(host, 0) + 1
+                client.peak = max(client.peak, sum(client.active.values()))
+                client.peak_per_host[host] = max(
+                    client.peak_per_host.get(host, 0), client.active[host]
+                )
+                try:
+                    await asyncio.sleep(client._delays.get(url, 0))
+                finally:
+                    client.active[host] -= 1
+                client.completed.append(url)
+                return await inner.__aenter__()
+
+            async def __aexit__(self, *exc: Any) -> bool:
+                return await inner.__aexit__(*exc)
+
+        return _Slow()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_downloads_match_sequential_result(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    small = "https://a.example.com/small.png"
+    other = "https://b.example.com/other.png"
+    duplicate = "https://b.example.com/duplicate.png"
+    large = "https://a.example.com/large.png"
+    broken = "https://a.example.com/broken.png"
+    payload = {
+        small: (_png_bytes_size((255, 0, 0), (64, 64)), "image/png"),
+        other: (_jpeg_bytes((0, 0, 255)), "image/jpeg"),
+        duplicate: (_jpeg_bytes((0, 0, 255)), "image/jpeg"),
+        large: (_png_bytes_size((255, 0, 0), (128, 128)), "image/png"),
+        broken: (b"not an image", "image/png"),
+    }
+    urls = ["not a url", small, broken, large, other, duplicate]
+    monkeypatch.setattr(downloader_module, "resolve_public_url", _public_address)
+
+    async def download(
+        delays: dict[str, float], concurrency: int
+    ) -> tuple[Any, _SlowAsyncClient]:
+        client = _SlowAsyncClient(payload, delays)
+        monkeypatch.setattr(httpx, "AsyncClient", lambda **kwargs: client)
+        downloader = ImageDownloader(concurrency=concurrency, per_host_concurrency=2)
+        return await downloader.download_images(urls), client
+
+    sequential, _ = await download({}, concurrency=1)
+    # Later URLs finish first.
+    delays = {url: 0.05 - index * 0.01 for index, url in enumerate(urls)}
+    concurrent, client = await download(delays, concurrency=3)
+
+    assert [image.url for image in sequential.images] == [large, other]
+    assert [image.url for image in concurrent.images] == [large, other]
+    assert concurrent.skipped == sequential.skipped == [("not a url", "invalid URL")]
+    assert concurrent.errors == sequential.errors
+    assert client.completed[0] != small
+    assert client.peak == 3
+    assert max(client.peak_per_host.values()) == 2
+
+
+@pytest.mark.asyncio
+async def test_downloads_stop_once_limit_is_reached(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    urls = [f"https://example.com/{i}.png" for i in range(6)]
+    payload = {
+        url: (_png_bytes((i * 40, 0, 0)), "image/png") for i, url in enumerate(urls)
+    }
+    delays = {url: 0.0 if i < 2 else 5.0 for i, url in enumerate(urls)}
+    client = _SlowAsyncClient(payload, delays)
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kwargs: client)
+    monkeypatch.setattr(downloader_module, "resolve_public_url", _public_address)
+
+    result = await asyncio.wait_for(
+        ImageDownloader(concurrency=6).download_images(urls, limit=2), timeout=2
+    )
+
+    assert [image.url for image in result.images] == urls[:2]
+    assert client.completed == urls[:2]
+    assert sum(client.active.values()) == 0
+
+
+@pytest.mark.asyncio
+async def test_downloads_run_at_most_concurrency_ahead(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    urls = [f"https://example.com/{i}.png" for i in range(10)]
+    payload = {
+        url: (_png_bytes((i * 20, 0, 0)), "image/png") for i, url in enumerate(urls)
+    }
+    client = _SlowAsyncClient(payload, {})
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kwargs: client)
+    monkeypatch.setattr(downloader_module, "resolve_public_url", _public_address)
+
+    result = await ImageDownloader(concurrency=2).download_images(urls, limit=2)
+
+    assert [image.url for image in result.images] == urls[:2]
+    # URL 2 is started when URL 1 is taken; nothing after it ever is.
+    assert set(client.started) <= set(urls[:3])
+    assert client.peak <= 2
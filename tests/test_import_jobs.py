@@ -0,0 +1,158 @@
+"""Tests for background import jobs and their progress events."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from stricknani.config import config
+from stricknani.importing.jobs import ImportJob, ImportJobs, import_jobs
+
+PATTERN_HTML = """
+<html>
+    <head><title>Job Pattern</title></head>
+    <body>
+        <h1>Job Scarf</h1>
+        <p>Needles: 5mm</p>
+        <div class="instructions"><p>Cast on 40 stitches.</p></div>
+    </body>
+</html>
+"""
+
+
+@pytest.fixture(autouse=True)
+async def _close_import_jobs() -> AsyncIterator[None]:
+    """Cancel and forget the jobs a test left in the global registry."""
+    yield
+    await import_jobs.close()
+
+
+def _page(html: str = PATTERN_HTML) -> MagicMock:
+    response = MagicMock()
+    response.text = html
+    response.status_code = 200
+    return response
+
+
+async def _finished(client: Any, status_url: str) -> dict[str, Any]:
+    for _ in range(500):
+        job = (await client.get(status_url)).json()
+        if job["status"] in ("succeeded", "failed"):
+            return job  # type: ignore[no-any-return]
+        await asyncio.sleep(0.01)
+    raise AssertionError("import job did not finish")
+
+
+async def test_background_import_returns_the_synchronous_result(
+    test_client: Any,
+) -> None:
+    client, *_ = test_client
+    form = {"type": "url", "url": "https://example.com/pattern"}
+
+    with patch("stricknani.importing.fetch.fetch_url", return_value=_page()):
+        direct = await client.post("/projects/import", data=form)
+        accepted = await client.post(
+            "/projects/import", data={**form, "background": "true"}
+        )
+        assert accepted.status_code == 202
+        job = await _finished(client, accepted.json()["status_url"])
+
+    assert accepted.headers["Location"] == accepted.json()["status_url"]
+    assert job["status"] == "succeeded"
+    assert job["result"] == direct.json()
+    names = [event["name"] for event in job["events"]]
+    assert names[:2] == ["queued", "started"]
+    assert {"source_url", "basic_import", "import_result"} <= set(names)
+    assert names[-1] == "succeeded"
+
+
+async def test_job_events_stream_until_the_job_finishes(test_client: Any) -> None:
+    client, *_ = test_client
+
+    with patch("stricknani.importing.fetch.fetch_url", return_value=_page()):
+        accepted = (
+            await client.post(
+                "/yarn/import",
+                data={"url": "https://example.com/yarn", "background": "true"},
+            )
+        ).json()
+        stream = await client.get(accepted["events_url"])
+
+    assert stream.headers["content-type"].startswith("text/event-stream")
+    messages = [block for block in stream.text.split("\n\n") if block]
+    progress = [
+        json.loads(block.split("data: ", 1)[1])
+        for block in messages
+        if "event: progress" in block
+    ]
+    assert [event["name"] for event in progress][0] == "queued"
+    assert "id: 1\n" in messages[0]
+    assert messages[-1].startswith("event: done")
+    done = json.loads(messages[-1].split("data: ", 1)[1])
+    assert done["status"] == "succeeded"
+    assert done["result"]["name"] == "Job Scarf"
+
+    # Reconnecting with Last-Event-ID only replays what came after it.
+    resumed = await client.get(
+        accepted["events_url"], headers={"Last-Event-ID": str(len(progress) - 1)}
+    )
+    assert resumed.text.count("event: progress") == 1
+
+
+async def test_failed_imports_report_the_error(test_client: Any) -> None:
+    client, *_ = test_client
+
+    accepted = await client.post(
+        "/projects/import",
+        data={"type": "url", "url": "ftp://example.com", "background": "true"},
+    )
+    job = await _finished(client, accepted.json()["status_url"])
+
+    assert job["status"] == "failed"
+    assert job["result"] is None
+    assert job["error"] == {"status_code": 400, "detail": "Invalid URL format"}
+
+
+async def test_jobs_are_private_and_limited_per_user(
+    test_client: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client, *_ = test_client
+    assert (await client.get("/imports/jobs/unknown")).status_code == 404
+
+    async def work(job: ImportJob) -> dict[str, Any]:
+        return {}
+
+    job = import_jobs.submit(owner_id=-1, kind="project", work=work)
+    assert (await client.get(f"/imports/jobs/{job.id}")).status_code == 404
+
+    monkeypatch.setattr(config, "IMPORT_JOB_MAX_PENDING", 0)
+    response = await client.post(
+        "/projects/import", data={"type": "text", "text": "x", "background": "true"}
+    )
+    assert response.status_code == 429
+
+
+async def test_jobs_beyond_the_worker_limit_wait(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(config, "IMPORT_JOB_WORKERS", 1)
+    jobs = ImportJobs()
+    release = asyncio.Event()
+
+    async def slow(job: ImportJob) -> dict[str, Any]:
+        await release.wait()
+        return {"done": True}
+
+    first = jobs.submit(1, "project", slow)
+    second = jobs.submit(1, "project", slow)
+    await asyncio.sleep(0.01)
+    assert (first.status, second.status) == ("running", "queued")
+
+    release.set()
+    while not second.finished:
+        await asyncio.sleep(0.01)
+    assert first.result == second.result == {"done": True}
+    await jobs.close()
@@ -0,0 +1,78 @@
+"""Tests for the worker process pool that extracts imported pages."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+
+from stricknani.config import config
+from stricknani.importing.importer import GarnstudioPatternImporter, extract_pattern
+from stricknani.importing.parsing import ParsePool, ParseTimeoutError
+
+FIXTURE = Path(__file__).parent / "fixtures" / "garnstudio" / "pattern_3491.html"
+URL = "https://www.garnstudio.com/pattern.php?id=3491&cid=9"
+
+
+@pytest.fixture
+async def pool(monkeypatch: pytest.MonkeyPatch) -> AsyncGenerator[ParsePool]:
+    monkeypatch.setattr(config, "IMPORT_PARSE_WORKERS", 1)
+    monkeypatch.setattr(config, "IMPORT_PARSE_TIMEOUT", 30)
+    pool = ParsePool()
+    await pool.start()
+    yield pool
+    await pool.close()
+
+
+async def test_jobs_run_in_process_without_a_started_pool(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pool = ParsePool()
+    assert await pool.run(os.getpid) == os.getpid()
+
+    monkeypatch.setattr(config, "IMPORT_PARSE_WORKERS", 0)
+    await pool.start()
+    assert not pool.started
+    assert await pool.run(os.getpid) == os.getpid()
+
+
+async def test_pool_extracts_the_same_data_as_in_process(pool: ParsePool) -> None:
+    html = FIXTURE.read_text(encoding="utf-8")
+    args = (GarnstudioPatternImporter, URL, html, 10)
+
+    assert await pool.run(os.getpid) != os.getpid()
+    assert await pool.run(extract_pattern, *args) == extract_pattern(*args)
+
+
+async def test_timed_out_jobs_replace_the_workers(
+    pool: ParsePool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    worker = await pool.run(os.getpid)
+    monkeypatch.setattr(config, "IMPORT_PARSE_TIMEOUT", 0.5)
+
+    started = time.monotonic()
+    with pytest.raises(ParseTimeoutError):
+        await pool.run(time.sleep, 30)
+
+    assert time.monotonic() - started < 10
+    monkeypatch.setattr(config, "IMPORT_PARSE_TIMEOUT", 30)
+    assert await pool.run(os.getpid) != worker
+
+
+async def test_cancelled_jobs_are_dropped_before_they_start(pool: ParsePool) -> None:
+    worker = await pool.run(os.getpid)
+    running = asyncio.create_task(pool.run(time.sleep, 1))
+    queued = asyncio.create_task(pool.run(os.getpid))
+    await asyncio.sleep(0.2)
+
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    await running
+
+    # The busy worker was left alone.
+    assert await pool.run(os.getpid) == worker
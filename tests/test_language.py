@@ -1,12 +1,22 @@
 """Tests for language detection."""
 
+import os
+import shutil
+import time
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import pytest
 from babel.messages.pofile import read_po
+from itsdangerous import URLSafeTimedSerializer
+from jinja2 import ChoiceLoader, DictLoader
 from starlette.requests import Request
 
+from stricknani.config import config
 from stricknani.main import app
+from stricknani.utils import i18n
+from stricknani.web import templating
 from stricknani.web.templating import get_language, render_template, templates
 
 LOCALES_DIR = Path(__file__).resolve().parents[1] / "stricknani" / "locales"
@@ -136,3 +146,103 @@ async def test_login_signup_surface_renders_material_controls() -> None:
     assert "md3-auth-submit--success" in body
     main = body[body.index('<main id="main-content"') : body.index("</main>")]
     assert 'class="btn' not in main
+
+
+@pytest.fixture
+def isolated_catalogs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Path]:
+    """Serve catalogs from a private copy of the locales directory."""
+    locales = tmp_path / "locales"
+    shutil.copytree(LOCALES_DIR, locales)
+    monkeypatch.setattr(i18n, "LOCALES_DIR", locales)
+    monkeypatch.setattr(config, "MEDIA_ROOT", tmp_path / "media")
+    i18n.clear_translations_cache()
+    yield locales
+    i18n.clear_translations_cache()
+
+
+def test_translation_catalogs_are_loaded_once(
+    isolated_catalogs: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    loads: list[str] = []
+    load = i18n._load_translations
+
+    def _counting_load(language: str) -> object:
+        loads.append(language)
+        return load(language)
+
+    monkeypatch.setattr(i18n, "_load_translations", _counting_load)
+    monkeypatch.setattr(config, "TRANSLATIONS_RELOAD_INTERVAL", 0)
+
+    first = i18n.get_translations("de")
+    for _ in range(100):
+        assert i18n.get_translations("de") is first
+    assert i18n.gettext("Page Not Found", "de") == "Seite nicht gefunden"
+    assert loads == ["de"]
+
+
+def test_translation_catalog_reloads_when_po_changes(
+    isolated_catalogs: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config, "TRANSLATIONS_RELOAD_INTERVAL", 0.001)
+    first = i18n.get_translations("de")
+    assert first.gettext("Page Not Found") == "Seite nicht gefunden"
+
+    po_path = isolated_catalogs / "de" / "LC_MESSAGES" / "messages.po"
+    po_path.write_text(
+        po_path.read_text(encoding="utf-8").replace(
+            'msgstr "Seite nicht gefunden"', 'msgstr "Seite fehlt"'
+        ),
+        encoding="utf-8",
+    )
+    mtime = po_path.stat().st_mtime + 10
+    os.utime(po_path, (mtime, mtime))
+
+    # Unchanged files within the interval keep serving the cached catalog.
+    monkeypatch.setattr(config, "TRANSLATIONS_RELOAD_INTERVAL", 3600)
+    assert i18n.get_translations("de") is first
+
+    monkeypatch.setattr(config, "TRANSLATIONS_RELOAD_INTERVAL", 0.001)
+    time.sleep(0.01)
+    reloaded = i18n.get_translations("de")
+    assert reloaded is not first
+    assert reloaded.gettext("Page Not Found") == "Seite fehlt"
+
+
+@pytest.mark.asyncio
+async def test_render_template_reuses_per_request_helpers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Renders reuse the CSRF serializer and only set the cookie once."""
+    loader = templates.env.loader
+    assert loader is not None
+    monkeypatch.setattr(
+        templates.env,
+        "loader",
+        ChoiceLoader([DictLoader({"_empty.html": ""}), loader]),
+    )
+    first = await render_template(
+        "_empty.html", _make_request(), {"current_user": None}
+    )
+    cookie = first.headers["set-cookie"].split(";", 1)[0]
+    request = _make_request(
+        accept_language="de-DE,de;q=0.9,en;q=0.8", cookie=f"{cookie}; theme=dark"
+    )
+
+    serializers: list[str] = []
+
+    def _counting_serializer(*args: Any, **kwargs: Any) -> Any:
+        serializers.append("built")
+        return URLSafeTimedSerializer(*args, **kwargs)
+
+    monkeypatch.setattr(
+        "stricknani.web.templating.URLSafeTimedSerializer", _counting_serializer
+    )
+    templating._csrf_serializer.cache_clear()
+
+    for _ in range(3):
+        response = await render_template("_empty.html", request, {"current_user": None})
+
+    assert "set-cookie" not in response.headers
+    assert serializers == ["built"]
@@ -0,0 +1,71 @@
+"""Tests for the cached, pooled markdown renderer."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from stricknani.config import config
+from stricknani.utils import markdown
+from stricknani.utils.markdown import clear_markdown_cache, render_markdown
+
+IMAGE_TEXT = '![Swatch](/media/a.jpg "sn:size=md")\nline two'
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> Iterator[None]:
+    clear_markdown_cache()
+    yield
+    clear_markdown_cache()
+
+
+def test_render_markdown_sets_lightbox_attributes() -> None:
+    html = render_markdown(IMAGE_TEXT, "project-7", "Step 2")
+
+    assert 'data-lightbox-group="project-7"' in html
+    assert 'data-lightbox-alt="Swatch (Step 2)"' in html
+    assert 'data-sn-size="md"' in html
+    assert "<br" in html
+
+
+def test_cache_key_includes_lightbox_group_and_step_info(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    renders: list[str] = []
+    render = markdown._render
+
+    def _counting(text: str, group: str, step_info: str | None) -> str:
+        renders.append(group)
+        return render(text, group, step_info)
+
+    monkeypatch.setattr(markdown, "_render", _counting)
+
+    first = render_markdown(IMAGE_TEXT, "project-1")
+    assert render_markdown(IMAGE_TEXT, "project-1") == first
+    other = render_markdown(IMAGE_TEXT, "project-2")
+    assert 'data-lightbox-group="project-2"' in other
+    assert "Step 1" in render_markdown(IMAGE_TEXT, "project-1", "Step 1")
+    assert renders == ["project-1", "project-2", "project-1"]
+
+
+def test_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "MARKDOWN_CACHE_SIZE", 2)
+    for index in range(5):
+        render_markdown(f"text {index}")
+    assert len(markdown._rendered) == 2
+
+
+def test_reused_converter_does_not_leak_state() -> None:
+    with_footnote = render_markdown("Gauge[^1]\n\n[^1]: 22 stitches")
+    assert "22 stitches" in with_footnote
+
+    plain = render_markdown("Just **text**")
+    assert plain == "<p>Just <strong>text</strong></p>"
+    # Lightbox settings from a previous call do not stick either.
+    assert 'data-lightbox-group="markdown"' in render_markdown(IMAGE_TEXT)
+    assert "(Step" not in render_markdown(IMAGE_TEXT)
+
+
+def test_rendering_is_sanitized() -> None:
+    html = render_markdown("<script>alert(1)</script>[x](javascript:alert(1))")
+    assert "<script" not in html
+    assert "javascript:" not in html
@@ -0,0 +1,52 @@
+"""Tests for the plain-ASGI security-header and access-log middleware."""
+
+import logging
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+
+from stricknani.config import config
+from stricknani.web.middleware import AccessLogMiddleware, SecurityHeadersMiddleware
+
+
+async def _nonce(request: Request) -> Response:
+    return PlainTextResponse(request.state.csp_nonce)
+
+
+def _client() -> AsyncClient:
+    app = AccessLogMiddleware(
+        SecurityHeadersMiddleware(Starlette(routes=[Route("/", _nonce)]))
+    )
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+async def test_security_headers_and_request_nonce(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(config, "DEBUG", False)
+
+    async with _client() as client:
+        plain = await client.get("/")
+        forwarded = await client.get("/", headers={"X-Forwarded-Proto": "https"})
+
+    assert plain.headers["x-content-type-options"] == "nosniff"
+    assert plain.headers["x-frame-options"] == "DENY"
+    assert f"'nonce-{plain.text}'" in plain.headers["content-security-policy"]
+    assert "strict-transport-security" not in plain.headers
+    assert forwarded.headers["strict-transport-security"].startswith("max-age=")
+
+
+async def test_access_log_records_final_status(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr(logging.getLogger("stricknani.access"), "propagate", True)
+
+    with caplog.at_level(logging.INFO, logger="stricknani.access"):
+        async with _client() as client:
+            await client.get("/missing?q=1")
+
+    assert '127.0.0.1 - "GET /missing" 404' in caplog.messages
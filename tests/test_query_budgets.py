@@ -0,0 +1,223 @@
+"""SQL query budgets for the hottest read paths.
+
+Each test seeds several related rows per entity so that a query-per-item
+regression (N+1) blows the budget instead of hiding behind a tiny fixture.
+"""
+
+import logging
+from collections.abc import AsyncGenerator
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from stricknani.config import config
+from stricknani.database import statement_shape, track_queries
+from stricknani.main import app
+from stricknani.models import (
+    Image,
+    ImageType,
+    Project,
+    Step,
+    Yarn,
+    YarnImage,
+    project_yarns,
+    user_favorite_yarns,
+    user_favorites,
+)
+from stricknani.routes.auth import require_api_token, require_auth
+from tests.conftest import QueryBudget
+
+ClientFixture = tuple[AsyncClient, async_sessionmaker[AsyncSession], int, int, int]
+
+_ITEMS = 6
+
+
+@pytest.fixture
+async def seeded_client(
+    test_client: ClientFixture,
+) -> AsyncGenerator[tuple[AsyncClient, int]]:
+    client, session_factory, user_id, project_id, _step_id = test_client
+
+    async with session_factory() as session:
+        yarns = [Yarn(name=f"Yarn {i}", owner_id=user_id) for i in range(_ITEMS)]
+        projects = [
+            Project(name=f"Project {i}", owner_id=user_id, tags='["a", "b"]')
+            for i in range(_ITEMS)
+        ]
+        session.add_all([*yarns, *projects])
+        await session.flush()
+        for index, project in enumerate(projects):
+            step = Step(title="Step", step_number=1, project_id=project.id)
+            session.add(step)
+            await session.flush()
+            session.add_all(
+                [
+                    Image(
+                        filename=f"p{index}.jpg",
+                        original_filename="p.jpg",
+                        alt_text="",
+                        image_type=ImageType.PHOTO.value,
+                        is_title_image=True,
+                        project_id=project.id,
+                    ),
+                    Image(
+                        filename=f"s{index}.jpg",
+                        original_filename="s.jpg",
+                        alt_text="",
+                        image_type=ImageType.PHOTO.value,
+                        project_id=project.id,
+                        step_id=step.id,
+                    ),
+                ]
+            )
+            await session.execute(
+                insert(project_yarns).values(
+                    project_id=project.id, yarn_id=yarns[index].id
+                )
+            )
+        for index, yarn in enumerate(yarns):
+            session.add(
+                YarnImage(
+                    filename=f"y{index}.jpg",
+                    original_filename="y.jpg",
+                    yarn_id=yarn.id,
+                    is_primary=True,
+                )
+            )
+        await session.execute(
+            insert(user_favorites).values(user_id=user_id, project_id=project_id)
+        )
+        await session.execute(
+            insert(user_favorite_yarns).values(user_id=user_id, yarn_id=yarns[0].id)
+        )
+        await session.commit()
+        detail_project_id = projects[2].id
+
+    # `test_client` already authenticates cookie routes; reuse it for the
+    # bearer-only JSON API endpoints.
+    app.dependency_overrides[require_api_token] = app.dependency_overrides[require_auth]
+    yield client, detail_project_id
+
+
+async def test_project_list_query_budget(
+    seeded_client: tuple[AsyncClient, int], query_budget: QueryBudget
+) -> None:
+    client, _project_id = seeded_client
+    # The first visit backfills the user's categories, which also bumps
+    # their library version.
+    with query_budget(6):
+        response = await client.get("/projects/")
+    assert response.status_code == 200
+
+
+async def test_project_detail_query_budget(
+    seeded_client: tuple[AsyncClient, int], query_budget: QueryBudget
+) -> None:
+    client, project_id = seeded_client
+    with query_budget(13):
+        response = await client.get(f"/projects/{project_id}")
+    assert response.status_code == 200
+
+
+async def test_yarn_list_query_budget(
+    seeded_client: tuple[AsyncClient, int], query_budget: QueryBudget
+) -> None:
+    client, _project_id = seeded_client
+    with query_budget(1):
+        response = await client.get("/yarn/")
+    assert response.status_code == 200
+
+
+async def test_api_project_list_query_budget(
+    seeded_client: tuple[AsyncClient, int], query_budget: QueryBudget
+) -> None:
+    client, _project_id = seeded_client
+    # Library-version probe for the ETag, then the page itself.
+    with query_budget(3):
+        response = await client.get("/api/v1/projects")
+    assert response.status_code == 200
+
+
+async def test_sync_query_budget(
+    seeded_client: tuple[AsyncClient, int], query_budget: QueryBudget
+) -> None:
+    client, _project_id = seeded_client
+    with query_budget(7):
+        projects = await client.get("/api/v1/sync/projects")
+    assert projects.status_code == 200
+    with query_budget(4):
+        yarns = await client.get("/api/v1/sync/yarns")
+    assert yarns.status_code == 200
+
+
+async def test_list_views_skip_text_columns(
+    seeded_client: tuple[AsyncClient, int],
+) -> None:
+    client, _project_id = seeded_client
+    with track_queries() as stats:
+        for url in (
+            "/projects/",
+            "/yarn/",
+            "/api/v1/projects",
+            "/api/v1/yarns",
+            "/search/global?q=ar",
+        ):
+            response = await client.get(url)
+            assert response.status_code == 200, url
+
+    selected = "\n".join(
+        shape.split(" FROM ", 1)[0]
+        for shape in stats.shapes
+        if shape.startswith("SELECT")
+    )
+    for column in (
+        "projects.description",
+        "projects.notes",
+        "projects.stitch_sample",
+        "projects.other_materials",
+        "yarns.notes",
+    ):
+        assert column not in selected
+    # Yarn cards only get a SQL-side excerpt of the description.
+    assert "substr(yarns.description" in selected
+
+
+async def test_debug_mode_exposes_query_count_headers(
+    seeded_client: tuple[AsyncClient, int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client, _project_id = seeded_client
+
+    response = await client.get("/yarn/")
+    assert "X-DB-Query-Count" not in response.headers
+
+    monkeypatch.setattr(config, "DEBUG", True)
+    response = await client.get("/yarn/")
+    assert int(response.headers["X-DB-Query-Count"]) > 0
+    assert float(response.headers["X-DB-Query-Time"]) >= 0
+
+
+async def test_repeated_statement_shapes_are_logged(
+    seeded_client: tuple[AsyncClient, int],
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    client, _project_id = seeded_client
+    monkeypatch.setattr(config, "SQL_REPEATED_STATEMENT_THRESHOLD", 1)
+    sql_logger = logging.getLogger("stricknani.sql")
+    monkeypatch.setattr(sql_logger, "propagate", True)
+
+    with caplog.at_level(logging.WARNING, logger="stricknani.sql"):
+        await client.get("/yarn/")
+
+    assert any("Possible N+1 on GET /yarn/" in r.message for r in caplog.records)
+
+
+def test_statement_shape_collapses_in_lists() -> None:
+    assert statement_shape("SELECT a FROM t\n WHERE id IN (?, ?, ?)") == (
+        statement_shape("SELECT a FROM t WHERE id IN (?)")
+    )
+    assert statement_shape("SELECT a FROM t WHERE id IN (?, ?)") == (
+        "SELECT a FROM t WHERE id IN (?)"
+    )
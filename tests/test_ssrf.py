@@ -7,8 +7,13 @@ from typing import TYPE_CHECKING, Any
 
 import pytest
 
+from stricknani.config import config
 from stricknani.importing.fetch import FetchError, import_fetch_http_error
-from stricknani.importing.ssrf import SSRFError, validate_public_url
+from stricknani.importing.ssrf import (
+    SSRFError,
+    dns_cache,
+    resolve_public_url,
+)
 
 if TYPE_CHECKING:
     from httpx import AsyncClient
@@ -42,49 +47,49 @@ def _addrinfo(ip: str) -> list[tuple[Any, ...]]:
         "http://0.0.0.0/",
     ],
 )
-def test_validate_public_url_rejects_internal_ip_literals(url: str) -> None:
+async def test_resolve_public_url_rejects_internal_ip_literals(url: str) -> None:
     """IP literals pointing at internal ranges are rejected without DNS."""
     with pytest.raises(SSRFError):
-        validate_public_url(url)
+        await resolve_public_url(url)
 
 
-def test_validate_public_url_rejects_localhost(
+async def test_resolve_public_url_rejects_localhost(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """A hostname resolving to loopback is rejected."""
     monkeypatch.setattr(socket, "getaddrinfo", lambda *a, **k: _addrinfo("127.0.0.1"))
     with pytest.raises(SSRFError):
-        validate_public_url("http://localhost/admin")
+        await resolve_public_url("http://localhost/admin")
 
 
-def test_validate_public_url_rejects_public_host_resolving_internal(
+async def test_resolve_public_url_rejects_public_host_resolving_internal(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """A public-looking host that resolves to a private IP is rejected."""
     monkeypatch.setattr(socket, "getaddrinfo", lambda *a, **k: _addrinfo("10.1.2.3"))
     with pytest.raises(SSRFError):
-        validate_public_url("https://evil.example.com/")
+        await resolve_public_url("https://evil.example.com/")
 
 
-def test_validate_public_url_allows_public_host(
+async def test_resolve_public_url_allows_public_host(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """A host resolving to a public IP is allowed (deterministic, offline)."""
     monkeypatch.setattr(
         socket, "getaddrinfo", lambda *a, **k: _addrinfo("93.184.216.34")
     )
-    validate_public_url("https://example.com/pattern")
+    assert await resolve_public_url("https://example.com/pattern") == "93.184.216.34"
 
 
-def test_validate_public_url_rejects_non_http_scheme() -> None:
+async def test_resolve_public_url_rejects_non_http_scheme() -> None:
     """Only http/https schemes are permitted."""
     with pytest.raises(SSRFError):
-        validate_public_url("ftp://example.com/x")
+        await resolve_public_url("ftp://example.com/x")
     with pytest.raises(SSRFError):
-        validate_public_url("file:///etc/passwd")
+        await resolve_public_url("file:///etc/passwd")
 
 
-def test_validate_public_url_rejects_unresolvable_host(
+async def test_resolve_public_url_rejects_unresolvable_host(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """A host that cannot be resolved is rejected."""
@@ -94,12 +99,59 @@ def test_validate_public_url_rejects_unresolvable_host(
 
     monkeypatch.setattr(socket, "getaddrinfo", _boom)
     with pytest.raises(SSRFError):
-        validate_public_url("https://does-not-resolve.invalid/")
+        await resolve_public_url("https://does-not-resolve.invalid/")
 
 
-def test_validate_public_url_allow_private_bypass() -> None:
+async def test_resolve_public_url_allow_private_bypass() -> None:
     """The opt-out flag permits internal hosts."""
-    validate_public_url("http://127.0.0.1/", allow_private=True)
+    assert await resolve_public_url("http://127.0.0.1/", allow_private=True) is None
+
+
+# --- Async resolution and DNS cache -----------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_resolve_public_url_returns_checked_address_and_caches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Lookups are cached per host until the TTL runs out."""
+    lookups: list[str] = []
+
+    def _resolve(host: str, *args: Any, **kwargs: Any) -> list[tuple[Any, ...]]:
+        lookups.append(host)
+        return _addrinfo("93.184.216.34")
+
+    monkeypatch.setattr(socket, "getaddrinfo", _resolve)
+    hits, misses = dns_cache.hits, dns_cache.misses
+
+    assert await resolve_public_url("https://Example.com/a") == "93.184.216.34"
+    assert await resolve_public_url("https://example.com/b") == "93.184.216.34"
+    assert lookups == ["example.com"]
+    assert (dns_cache.hits - hits, dns_cache.misses - misses) == (1, 1)
+
+    monkeypatch.setattr(config, "IMPORT_DNS_CACHE_TTL", 0)
+    dns_cache.clear()
+    await resolve_public_url("https://example.com/c")
+    await resolve_public_url("https://example.com/d")
+    assert len(lookups) == 3
+
+
+@pytest.mark.asyncio
+async def test_resolve_public_url_rejects_internal_and_allows_private_opt_out(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The async guard rejects what the sync one does."""
+    monkeypatch.setattr(socket, "getaddrinfo", lambda *a, **k: _addrinfo("10.1.2.3"))
+
+    with pytest.raises(SSRFError):
+        await resolve_public_url("https://evil.example.com/")
+    with pytest.raises(SSRFError):
+        await resolve_public_url("http://[::1]/")
+    assert await resolve_public_url("http://93.184.216.34/") == "93.184.216.34"
+    assert (
+        await resolve_public_url("https://evil.example.com/", allow_private=True)
+        is None
+    )
 
 
 # --- fetch_url redirect re-validation --------------------------------------
@@ -123,6 +175,7 @@ class _FakeCurlSession:
     def __init__(self, responses: list[_FakeCurlResponse]) -> None:
         self._responses = responses
         self.requested: list[str] = []
+        self.curl_options: dict[Any, Any] = {}
 
     async def __aenter__(self) -> _FakeCurlSession:
         return self
@@ -8,10 +8,20 @@ serving pre-deploy bytes for up to a year, so CachedStaticFiles instead uses a
 short max-age with mandatory revalidation.
 """
 
+import json
+import re
+from collections.abc import Iterator
+from pathlib import Path
 from typing import Any
 
 import pytest
 
+from stricknani.web.staticfiles import (
+    MANIFEST_NAME,
+    build_static_manifest,
+    static_manifest,
+)
+
 
 @pytest.mark.asyncio
 async def test_static_assets_are_not_cached_immutably(test_client: Any) -> None:
@@ -21,3 +31,52 @@ async def test_static_assets_are_not_cached_immutably(test_client: Any) -> None:
     cache_control = response.headers["cache-control"]
     assert "immutable" not in cache_control
     assert "must-revalidate" in cache_control
+
+
+@pytest.fixture
+def hashed_app_js(tmp_path: Path) -> Iterator[str]:
+    """Load a manifest that content-hashes the real js/app.js."""
+    (tmp_path / MANIFEST_NAME).write_text(
+        json.dumps({"js/app.js": "js/app.0123456789ab.js"}), encoding="utf-8"
+    )
+    static_manifest.load(tmp_path)
+    yield "/static/js/app.0123456789ab.js"
+    static_manifest.clear()
+
+
+@pytest.mark.asyncio
+async def test_hashed_static_urls_are_immutable(
+    test_client: Any, hashed_app_js: str
+) -> None:
+    client, _, _, _, _ = test_client
+
+    page = await client.get("/projects/")
+    assert f'src="{hashed_app_js}"' in page.text
+
+    hashed = await client.get(hashed_app_js)
+    assert hashed.status_code == 200
+    assert "immutable" in hashed.headers["cache-control"]
+
+    plain = await client.get("/static/js/app.js")
+    assert plain.content == hashed.content
+    assert "immutable" not in plain.headers["cache-control"]
+
+    stale = await client.get("/static/js/app.ffffffffffff.js")
+    assert stale.status_code == 404
+
+    service_worker = await client.get("/sw.js")
+    assert f'"{hashed_app_js}"' in service_worker.text
+
+
+def test_build_static_manifest_hashes_content(tmp_path: Path) -> None:
+    (tmp_path / "js").mkdir()
+    (tmp_path / "js" / "lib.min.js").write_text("one", encoding="utf-8")
+    (tmp_path / "js" / "lib.min.js.br").write_bytes(b"compressed")
+
+    first = build_static_manifest(tmp_path)
+    assert list(first) == ["js/lib.min.js"]
+    assert re.fullmatch(r"js/lib\.min\.[0-9a-f]{12}\.js", first["js/lib.min.js"])
+    assert json.loads((tmp_path / MANIFEST_NAME).read_text("utf-8")) == first
+
+    (tmp_path / "js" / "lib.min.js").write_text("two", encoding="utf-8")
+    assert build_static_manifest(tmp_path) != first
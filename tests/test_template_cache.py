@@ -0,0 +1,56 @@
+"""Tests for template precompilation and the bytecode cache."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from stricknani.web.templating import (
+    enable_bytecode_cache,
+    templates,
+    templates_path,
+    warm_templates,
+)
+
+
+@pytest.fixture
+def isolated_template_env() -> Iterator[None]:
+    original = templates.env.bytecode_cache
+    templates.env.cache.clear()  # type: ignore[union-attr]
+    yield
+    templates.env.bytecode_cache = original
+    templates.env.cache.clear()  # type: ignore[union-attr]
+
+
+def test_warm_templates_compiles_every_template(
+    isolated_template_env: None, tmp_path: Path
+) -> None:
+    enable_bytecode_cache(tmp_path / "bytecode")
+
+    count = warm_templates()
+
+    on_disk = [p for p in templates_path.rglob("*") if p.suffix in {".html", ".js"}]
+    assert count == len(on_disk)
+    assert len(list((tmp_path / "bytecode").iterdir())) == count
+
+
+def test_bytecode_cache_is_reused_after_restart(
+    isolated_template_env: None, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    enable_bytecode_cache(tmp_path)
+    templates.env.get_template("errors/404.html")
+
+    # A fresh process: empty in-memory cache, bytecode still on disk.
+    templates.env.cache.clear()  # type: ignore[union-attr]
+    compiled: list[str] = []
+    compile_source = templates.env.compile
+
+    def _tracking_compile(source: str, name: str | None = None, *args, **kwargs):  # type: ignore[no-untyped-def]
+        compiled.append(name or "")
+        return compile_source(source, name, *args, **kwargs)
+
+    monkeypatch.setattr(templates.env, "compile", _tracking_compile)
+    template = templates.env.get_template("errors/404.html")
+
+    assert template.name == "errors/404.html"
+    assert compiled == []